@@ -5,6 +5,9 @@ import oftest.base_tests as base_tests
 import ofp
 import time
 from oftest.testutils import *
+import oftest.ofutils as ofutils
+from oftest.template import MessageTemplate
+from oftest.parse import parse_ipv6
 
 from ncclient import manager
 import ncclient
@@ -962,7 +965,7 @@ def add_vlan1_table_flow(ctrl, ports, vlan_id=1, ovid=2, set_vid=6, set_vrf=Fals
 
     return msgs
 
-def add_bridge_flow(ctrl, dst_mac, vlanid, group_id, send_barrier=False):
+def bridge_flow_create(dst_mac, vlanid, group_id):
     match = ofp.match()
     priority=500
     if dst_mac!=None:
@@ -983,6 +986,10 @@ def add_bridge_flow(ctrl, dst_mac, vlanid, group_id, send_barrier=False):
                 ],
             buffer_id=ofp.OFP_NO_BUFFER,
             priority=priority)
+    return request
+
+def add_bridge_flow(ctrl, dst_mac, vlanid, group_id, send_barrier=False):
+    request = bridge_flow_create(dst_mac, vlanid, group_id)
 
     logging.info("Inserting Brdige flow vlan %d, mac %s", vlanid, dst_mac)
     ctrl.message_send(request)
@@ -992,6 +999,32 @@ def add_bridge_flow(ctrl, dst_mac, vlanid, group_id, send_barrier=False):
 
     return request        
 
+def add_bridge_flows(ctrl, dst_macs, vlanid, group_id, send_barrier=False):
+    """
+    Add one bridge flow per MAC in dst_macs, all in the same VLAN and
+    group, encoded together into a single buffer
+
+    Unlike add_bridge_flow, every flow matches a MAC, so None is not
+    accepted in dst_macs. Returns the buffer sent.
+    """
+    if None in dst_macs:
+        raise ValueError("dst_macs contains None; use add_bridge_flow for the VLAN flow without a MAC")
+    if not dst_macs:
+        return ''
+    tmpl = MessageTemplate(bridge_flow_create(dst_macs[0], vlanid, group_id),
+                           {'mac': 'match.oxm_list[0].value'})
+    xid = ofutils.gen_xid()
+    buf = tmpl.pack_batch(mac=dst_macs,
+                          xid=[(xid + i) & 0xffffffff for i in range(len(dst_macs))])
+
+    logging.info("Inserting %d Brdige flows vlan %d", len(dst_macs), vlanid)
+    ctrl.message_send(buf)
+
+    if send_barrier:
+        do_barrier(ctrl)
+
+    return buf
+
 def add_overlay_bridge_flow(ctrl, dst_mac, vnid, group_id, is_group=True, send_barrier=False):
     match = ofp.match()
     if dst_mac!=None:
@@ -1055,7 +1088,7 @@ def add_termination_flow(ctrl, in_port, eth_type, dst_mac, vlanid, goto_table=No
 
     return request    
     
-def add_unicast_routing_flow(ctrl, eth_type, dst_ip, mask, action_group_id, vrf=0, send_barrier=False):
+def unicast_routing_flow_create(eth_type, dst_ip, mask, action_group_id, vrf=0):
     match = ofp.match()
     match.oxm_list.append(ofp.oxm.eth_type(eth_type))
     if vrf != 0:
@@ -1083,6 +1116,10 @@ def add_unicast_routing_flow(ctrl, eth_type, dst_ip, mask, action_group_id, vrf=
                 ],
             buffer_id=ofp.OFP_NO_BUFFER,
             priority=1) 
+    return request
+
+def add_unicast_routing_flow(ctrl, eth_type, dst_ip, mask, action_group_id, vrf=0, send_barrier=False):
+    request = unicast_routing_flow_create(eth_type, dst_ip, mask, action_group_id, vrf)
 
     logging.info("Inserting unicast routing flow eth_type %lx, dip %ld",eth_type, dst_ip)
     ctrl.message_send(request)
@@ -1092,6 +1129,32 @@ def add_unicast_routing_flow(ctrl, eth_type, dst_ip, mask, action_group_id, vrf=
 
     return request        
 
+def add_unicast_routing_flows(ctrl, eth_type, dst_ips, mask, action_group_id, vrf=0, send_barrier=False):
+    """
+    Add one unicast routing flow per destination in dst_ips, all with the
+    same mask, group and VRF, encoded together into a single buffer
+
+    Returns the buffer sent.
+    """
+    if not dst_ips:
+        return ''
+    request = unicast_routing_flow_create(eth_type, dst_ips[0], mask, action_group_id, vrf)
+    if eth_type != 0x800 and mask == 0:
+        dst_ips = [parse_ipv6(dst_ip) for dst_ip in dst_ips]
+    tmpl = MessageTemplate(request,
+                           {'dst': 'match.oxm_list[%d].value' % (len(request.match.oxm_list) - 1)})
+    xid = ofutils.gen_xid()
+    buf = tmpl.pack_batch(dst=dst_ips,
+                          xid=[(xid + i) & 0xffffffff for i in range(len(dst_ips))])
+
+    logging.info("Inserting %d unicast routing flows eth_type %lx", len(dst_ips), eth_type)
+    ctrl.message_send(buf)
+
+    if send_barrier:
+        do_barrier(ctrl)
+
+    return buf
+
 def add_mpls_flow(ctrl, action_group_id, label=100 ,ethertype=0x0800, bos=1, send_barrier=False):
     match = ofp.match()
     match.oxm_list.append(ofp.oxm.eth_type(0x8847))
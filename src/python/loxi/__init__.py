@@ -5,6 +5,10 @@
 # Automatically generated by LOXI from template toplevel_init.py
 # Do not modify
 
+import sys
+import threading
+import types
+
 version_names = {
     1: "1.0",
     2: "1.1",
@@ -39,6 +43,63 @@ def protocol(ver):
 
     raise ValueError
 
+_export_lock = threading.Lock()
+
+class _ProtocolModule(types.ModuleType):
+    """
+    A protocol package whose submodules are imported on first use
+
+    Most programs touch a handful of the generated modules, so importing
+    the package only loads the constants. The classes re-exported from
+    common (ofp.match, ofp.port_desc, ...) load common when first asked for.
+    """
+
+    def __getattr__(self, name):
+        # Only called for names that have not been loaded yet
+        if name.startswith('__'):
+            raise AttributeError(name)
+        d = self.__dict__
+        if name in d['_submodules']:
+            __import__(d['__name__'] + '.' + name)
+            return d[name]
+        if not d['_exported']:
+            # Other threads must not see the flag before the names
+            with _export_lock:
+                if not d['_exported']:
+                    exports = getattr(self, d['_exports'])
+                    d.update((k, v) for (k, v) in exports.__dict__.items()
+                             if not k.startswith('_'))
+                    d['_exported'] = True
+            if name in d:
+                return d[name]
+        raise AttributeError(name)
+
+    def __dir__(self):
+        return sorted(set(self.__dict__) | set(self._submodules))
+
+_protocol_modules = []
+
+def lazy_protocol(name, submodules, exports):
+    """
+    Replace the package being imported with one that loads its submodules
+    lazily
+
+    Called at the end of a protocol package's __init__.
+
+    @param name The package name
+    @param submodules Names of the submodules
+    @param exports The submodule whose public names the package re-exports
+    """
+    module = sys.modules[name]
+    lazy = _ProtocolModule(name, module.__doc__)
+    lazy.__dict__.update(module.__dict__)
+    lazy.__dict__.update(_submodules=frozenset(submodules),
+                         _exports=exports, _exported=False)
+    # Keep the original module alive; Python 2 clears the globals of a
+    # module when it is freed
+    _protocol_modules.append(module)
+    sys.modules[name] = lazy
+
 class ProtocolError(Exception):
     """
     Raised when failing to deserialize an invalid OpenFlow message.
@@ -58,6 +119,8 @@ class OFObject(object):
     """
     Superclass of all OpenFlow classes
     """
+    __slots__ = []
+
     def __init__(self, *args):
         raise NotImplementedError("cannot instantiate abstract class")
 
@@ -67,3 +130,68 @@ class OFObject(object):
     def show(self):
         import loxi.pp
         return loxi.pp.pp(self)
+
+    # Subclasses declare __slots__ for their fields, so copy and pickle go
+    # through these. Slots hidden by a subclass's class constant (e.g. a
+    # fixed type field) are skipped.
+    def __getstate__(self):
+        state = {}
+        for name in _instance_slots(type(self)):
+            try:
+                state[name] = getattr(self, name)
+            except AttributeError:
+                pass
+        return state
+
+    def __setstate__(self, state):
+        for (name, value) in state.items():
+            setattr(self, name, value)
+
+    # Equal objects have the same canonical packed form, so objects can be
+    # used as dict and set keys. An object that cannot be packed (e.g. a
+    # message without an xid) still hashes, only coarsely.
+    def __hash__(self):
+        try:
+            return hash(canonical_pack(self))
+        except Exception:
+            return hash(type(self))
+
+_canonical = threading.local()
+
+def canonical_pack(obj):
+    """
+    Pack an object in canonical form
+
+    Fields whose order does not affect equality (the OXMs of a match) are
+    packed sorted, so objects that compare equal pack to the same bytes.
+    The result is meant for hashing and comparison, not for the wire.
+    """
+    if getattr(_canonical, 'active', False):
+        return obj.pack()
+    _canonical.active = True
+    try:
+        return obj.pack()
+    finally:
+        _canonical.active = False
+
+def packing_canonical():
+    """
+    Return True while canonical_pack is running in this thread
+    """
+    return getattr(_canonical, 'active', False)
+
+_slot_cache = {}
+
+def _instance_slots(cls):
+    """
+    Names of the slots that hold instance state in objects of class cls
+    """
+    names = _slot_cache.get(cls)
+    if names is None:
+        names = []
+        for klass in cls.__mro__:
+            for name in klass.__dict__.get('__slots__', ()):
+                if getattr(cls, name) is klass.__dict__[name]:
+                    names.append(name)
+        _slot_cache[cls] = names
+    return names
@@ -11,6 +11,7 @@ and multipart transactions.
 
 import loxi
 import loxi.of14
+import loxi.generic_util
 import logging
 import time
 import socket
@@ -20,6 +21,7 @@ import select
 from threading import Condition, Lock, Thread
 
 DEFAULT_TIMEOUT = 1
+RECV_SIZE = 65536
 
 class TransactionError(Exception):
     def __str__(self):
@@ -40,7 +42,7 @@ class Connection(Thread):
         self.next_xid = 1
         self.wakeup_rd, self.wakeup_wr = os.pipe()
         self.finished = False
-        self.read_buffer = None
+        self.read_buffer = loxi.generic_util.MessageBuffer(2 * RECV_SIZE)
 
     def run(self):
         while not self.finished:
@@ -52,35 +54,15 @@ class Connection(Thread):
         self.logger.debug("Exited event loop")
 
     def process_read(self):
-        recvd = self.sock.recv(4096)
+        recvd = self.read_buffer.recv_from(self.sock, RECV_SIZE)
 
-        self.logger.debug("Received %d bytes", len(recvd))
-
-        buf = self.read_buffer
-        if buf:
-            buf += recvd
-        else:
-            buf = recvd
-
-        offset = 0
-        while offset < len(buf):
-            if offset + 8 > len(buf):
-                # Not enough data for the OpenFlow header
-                break
-
-            # Parse the header to get type
-            hdr_version, hdr_type, hdr_msglen, hdr_xid = loxi.of14.message.parse_header(buf[offset:])
+        self.logger.debug("Received %d bytes", recvd)
 
+        for hdr_version, hdr_type, hdr_msglen, hdr_xid, rawmsg in \
+                self.read_buffer.messages():
             # Use loxi to resolve ofp of matching version
             ofp = loxi.protocol(hdr_version)
 
-            # Extract the raw message bytes
-            if (offset + hdr_msglen) > len(buf):
-                # Not enough data for the body
-                break
-            rawmsg = buf[offset : offset + hdr_msglen]
-            offset += hdr_msglen
-
             msg = ofp.message.parse_message(rawmsg)
             if not msg:
                 self.logger.warn("Could not parse message")
@@ -93,10 +75,7 @@ class Connection(Thread):
                 self.rx.append(msg)
                 self.rx_cv.notify_all()
 
-        if offset == len(buf):
-            self.read_buffer = None
-        else:
-            self.read_buffer = buf[offset:]
+        if len(self.read_buffer):
             self.logger.debug("%d bytes remaining", len(self.read_buffer))
 
     def recv(self, predicate, timeout=DEFAULT_TIMEOUT):
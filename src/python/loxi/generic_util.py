@@ -31,6 +31,17 @@ def pad_to(alignment, length):
     """
     return "\x00" * ((length + alignment - 1)/alignment*alignment - length)
 
+_structs = {}
+
+def get_struct(fmt):
+    """
+    Return a cached, precompiled struct.Struct for the format string
+    """
+    st = _structs.get(fmt)
+    if st is None:
+        st = _structs[fmt] = struct.Struct(fmt)
+    return st
+
 class OFReader(object):
     """
     Cursor over a read-only buffer
@@ -56,7 +67,12 @@ class OFReader(object):
         self.offset = 0
 
     def read(self, fmt):
-        st = struct.Struct(fmt)
+        return self.read_struct(get_struct(fmt))
+
+    def read_struct(self, st):
+        """
+        Read the fields of a precompiled struct.Struct
+        """
         if self.offset + st.size > self.length:
             raise loxi.ProtocolError("Buffer too short")
         result = st.unpack_from(self.buf, self.start+self.offset)
@@ -70,7 +86,7 @@ class OFReader(object):
         return s
 
     def peek(self, fmt, offset=0):
-        st = struct.Struct(fmt)
+        st = get_struct(fmt)
         if self.offset + offset + st.size > self.length:
             raise loxi.ProtocolError("Buffer too short")
         result = st.unpack_from(self.buf, self.start + self.offset + offset)
@@ -98,3 +114,146 @@ class OFReader(object):
         reader.skip(rewind)
         self.offset += length - rewind
         return reader
+
+class MessageBuffer(object):
+    """
+    Receive buffer that frames a byte stream into OpenFlow messages
+
+    Data is received directly into a preallocated bytearray with
+    recv_into. Complete messages are copied out once each; the partial
+    message left at the end of a read is moved to the front of the buffer
+    only when the free space runs out, so reassembling a large message
+    from many small segments is linear in its size.
+
+    start: offset of the first unconsumed byte
+    end: offset after the last received byte
+    """
+    header = struct.Struct("!BBHL")
+
+    def __init__(self, size=65536):
+        self.buf = bytearray(size)
+        self.view = memoryview(self.buf)
+        self.start = 0
+        self.end = 0
+
+    def __len__(self):
+        return self.end - self.start
+
+    def reserve(self, size):
+        """
+        Make room for at least size more bytes after end
+        """
+        if len(self.buf) - self.end >= size:
+            return
+        pending = self.end - self.start
+        if pending + size > len(self.buf):
+            buf = bytearray(max(pending + size, 2 * len(self.buf)))
+            buf[:pending] = self.view[self.start:self.end]
+            self.buf = buf
+            self.view = memoryview(buf)
+        elif pending:
+            self.buf[:pending] = self.buf[self.start:self.end]
+        self.start = 0
+        self.end = pending
+
+    def recv_from(self, sock, size):
+        """
+        Receive up to size bytes from sock into the buffer
+
+        Returns the number of bytes received; 0 means the peer closed the
+        connection.
+        """
+        self.reserve(size)
+        count = sock.recv_into(self.view[self.end:], size)
+        self.end += count
+        return count
+
+    def feed(self, data):
+        """
+        Append already received data
+        """
+        self.reserve(len(data))
+        self.buf[self.end:self.end+len(data)] = data
+        self.end += len(data)
+
+    def messages(self):
+        """
+        Yield (version, type, length, xid, raw) for each complete message
+
+        raw is a string holding the whole message. Incomplete trailing
+        data stays buffered for the next read.
+        """
+        while self.end - self.start >= 8:
+            version, msg_type, length, xid = \
+                self.header.unpack_from(self.buf, self.start)
+            if length < 8:
+                raise loxi.ProtocolError("invalid message length %d" % length)
+            if self.end - self.start < length:
+                self.reserve(length - (self.end - self.start))
+                break
+            raw = self.view[self.start:self.start+length].tobytes()
+            self.start += length
+            yield (version, msg_type, length, xid, raw)
+        if self.start == self.end:
+            self.start = self.end = 0
+
+def flatten_subtypes(root):
+    """
+    Flatten the nested subtypes dicts below root into one dispatch table
+
+    Keys are the tuples of discriminator values leading from root to a
+    class. Values are (class, struct, offset), where struct and offset
+    locate the class's own discriminator, or struct is None for classes
+    without subtypes.
+    """
+    table = {}
+    def visit(cls, key):
+        if 'subtypes' in cls.__dict__:
+            fmt, offset = cls.subtype_field
+            table[key] = (cls, get_struct(fmt), offset)
+            for subtype, subclass in cls.subtypes.items():
+                visit(subclass, key + (subtype,))
+        else:
+            table[key] = (cls, None, 0)
+    visit(root, ())
+    return table
+
+def resolve_subtype(table, buf):
+    """
+    Find the most specific class for the object at the start of buf
+
+    Equivalent to following the subtypes chain in the unpack methods, but
+    with a single lookup per discriminator and no intermediate readers.
+    """
+    cls, st, offset = table[()]
+    key = ()
+    while st is not None:
+        if offset + st.size > len(buf):
+            raise loxi.ProtocolError("Buffer too short")
+        key += st.unpack_from(buf, offset)
+        entry = table.get(key)
+        if entry is None:
+            break
+        cls, st, offset = entry
+    return cls
+
+_oxm_header = struct.Struct("!L")
+
+def oxm_spans(buf):
+    """
+    Yield (type_len, start, end) for each OXM TLV in buf
+
+    Only the TLV headers are read; the length comes from the low byte of
+    type_len.
+    """
+    offset = 0
+    end = len(buf)
+    while offset < end:
+        if offset + 4 > end:
+            raise loxi.ProtocolError("Buffer too short")
+        (type_len,) = _oxm_header.unpack_from(buf, offset)
+        next_offset = offset + 4 + (type_len & 0xff)
+        if next_offset > end:
+            raise loxi.ProtocolError("Buffer too short")
+        yield (type_len, offset, next_offset)
+        offset = next_offset
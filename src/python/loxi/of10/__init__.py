@@ -6,10 +6,13 @@
 # Automatically generated by LOXI from template init.py
 # Do not modify
 
+import loxi
 import const
-import action
-import message
-import common
 from const import *
-from common import *
 from loxi import ProtocolError
+
+loxi.lazy_protocol(__name__, [
+    'action',
+    'message',
+    'common',
+], 'common')
@@ -14,8 +14,21 @@ import loxi.generic_util
 import sys
 ofp = sys.modules['loxi.of10']
 
+# Precompiled layouts of fixed-size field runs
+_struct_6xL = struct.Struct("!6xL")
+_struct_B3x = struct.Struct("!B3x")
+_struct_H2x = struct.Struct("!H2x")
+_struct_HH = struct.Struct("!HH")
+_struct_LH2x4x = struct.Struct("!LH2x4x")
+_struct_LL = struct.Struct("!LL")
+_struct_LL4x = struct.Struct("!LL4x")
+_struct_LLL = struct.Struct("!LLL")
+_struct_LLLLB3x = struct.Struct("!LLLLB3x")
+
 class action(loxi.OFObject):
+    __slots__ = ['type']
     subtypes = {}
+    subtype_field = ('!H', 0)
 
 
     def __init__(self, type=None):
@@ -42,8 +55,7 @@ class action(loxi.OFObject):
             return subclass.unpack(reader)
 
         obj = action()
-        obj.type = reader.read("!H")[0]
-        _len = reader.read("!H")[0]
+        obj.type, _len = reader.read_struct(_struct_HH)
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         reader.skip(4)
@@ -64,7 +76,9 @@ class action(loxi.OFObject):
 
 
 class experimenter(action):
+    __slots__ = ['experimenter', 'data']
     subtypes = {}
+    subtype_field = ('!L', 4)
 
     type = 65535
 
@@ -97,9 +111,8 @@ class experimenter(action):
             return subclass.unpack(reader)
 
         obj = experimenter()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.experimenter = reader.read("!L")[0]
@@ -125,7 +138,9 @@ class experimenter(action):
 action.subtypes[65535] = experimenter
 
 class bsn(experimenter):
+    __slots__ = ['subtype']
     subtypes = {}
+    subtype_field = ('!L', 8)
 
     type = 65535
     experimenter = 6035143
@@ -141,9 +156,7 @@ class bsn(experimenter):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append('\x00' * 4)
+        packed.append(_struct_LL4x.pack(self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -156,15 +169,12 @@ class bsn(experimenter):
             return subclass.unpack(reader)
 
         obj = bsn()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, obj.subtype = reader.read_struct(_struct_LL4x)
         assert(_experimenter == 6035143)
-        obj.subtype = reader.read("!L")[0]
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -183,6 +193,7 @@ class bsn(experimenter):
 experimenter.subtypes[6035143] = bsn
 
 class bsn_checksum(bsn):
+    __slots__ = ['checksum']
     type = 65535
     experimenter = 6035143
     subtype = 4
@@ -198,8 +209,7 @@ class bsn_checksum(bsn):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_struct_LL.pack(self.experimenter, self.subtype))
         packed.append(util.pack_checksum_128(self.checksum))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
@@ -208,14 +218,12 @@ class bsn_checksum(bsn):
     @staticmethod
     def unpack(reader):
         obj = bsn_checksum()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _subtype = reader.read_struct(_struct_LL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 4)
         obj.checksum = util.unpack_checksum_128(reader)
         return obj
@@ -238,6 +246,7 @@ class bsn_checksum(bsn):
 bsn.subtypes[4] = bsn_checksum
 
 class bsn_mirror(bsn):
+    __slots__ = ['dest_port', 'vlan_tag', 'copy_stage']
     type = 65535
     experimenter = 6035143
     subtype = 1
@@ -261,12 +270,7 @@ class bsn_mirror(bsn):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.dest_port))
-        packed.append(struct.pack("!L", self.vlan_tag))
-        packed.append(struct.pack("!B", self.copy_stage))
-        packed.append('\x00' * 3)
+        packed.append(_struct_LLLLB3x.pack(self.experimenter, self.subtype, self.dest_port, self.vlan_tag, self.copy_stage))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -274,19 +278,13 @@ class bsn_mirror(bsn):
     @staticmethod
     def unpack(reader):
         obj = bsn_mirror()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _subtype, obj.dest_port, obj.vlan_tag, obj.copy_stage = reader.read_struct(_struct_LLLLB3x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 1)
-        obj.dest_port = reader.read("!L")[0]
-        obj.vlan_tag = reader.read("!L")[0]
-        obj.copy_stage = reader.read("!B")[0]
-        reader.skip(3)
         return obj
 
     def __eq__(self, other):
@@ -315,6 +313,7 @@ class bsn_mirror(bsn):
 bsn.subtypes[1] = bsn_mirror
 
 class bsn_set_tunnel_dst(bsn):
+    __slots__ = ['dst']
     type = 65535
     experimenter = 6035143
     subtype = 2
@@ -330,9 +329,7 @@ class bsn_set_tunnel_dst(bsn):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.dst))
+        packed.append(_struct_LLL.pack(self.experimenter, self.subtype, self.dst))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -340,16 +337,13 @@ class bsn_set_tunnel_dst(bsn):
     @staticmethod
     def unpack(reader):
         obj = bsn_set_tunnel_dst()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _subtype, obj.dst = reader.read_struct(_struct_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 2)
-        obj.dst = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -370,6 +364,7 @@ class bsn_set_tunnel_dst(bsn):
 bsn.subtypes[2] = bsn_set_tunnel_dst
 
 class enqueue(action):
+    __slots__ = ['port', 'queue_id']
     type = 11
 
     def __init__(self, port=None, queue_id=None):
@@ -388,8 +383,7 @@ class enqueue(action):
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
         packed.append(util.pack_port_no(self.port))
-        packed.append('\x00' * 6)
-        packed.append(struct.pack("!L", self.queue_id))
+        packed.append(_struct_6xL.pack(self.queue_id))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -397,9 +391,8 @@ class enqueue(action):
     @staticmethod
     def unpack(reader):
         obj = enqueue()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 11)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.port = util.unpack_port_no(reader)
@@ -429,7 +422,9 @@ class enqueue(action):
 action.subtypes[11] = enqueue
 
 class nicira(experimenter):
+    __slots__ = ['subtype']
     subtypes = {}
+    subtype_field = ('!H', 8)
 
     type = 65535
     experimenter = 8992
@@ -445,10 +440,7 @@ class nicira(experimenter):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!H", self.subtype))
-        packed.append('\x00' * 2)
-        packed.append('\x00' * 4)
+        packed.append(_struct_LH2x4x.pack(self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -461,16 +453,12 @@ class nicira(experimenter):
             return subclass.unpack(reader)
 
         obj = nicira()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, obj.subtype = reader.read_struct(_struct_LH2x4x)
         assert(_experimenter == 8992)
-        obj.subtype = reader.read("!H")[0]
-        reader.skip(2)
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -489,6 +477,7 @@ class nicira(experimenter):
 experimenter.subtypes[8992] = nicira
 
 class nicira_dec_ttl(nicira):
+    __slots__ = []
     type = 65535
     experimenter = 8992
     subtype = 18
@@ -500,10 +489,7 @@ class nicira_dec_ttl(nicira):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!H", self.subtype))
-        packed.append('\x00' * 2)
-        packed.append('\x00' * 4)
+        packed.append(_struct_LH2x4x.pack(self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -511,17 +497,13 @@ class nicira_dec_ttl(nicira):
     @staticmethod
     def unpack(reader):
         obj = nicira_dec_ttl()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _subtype = reader.read_struct(_struct_LH2x4x)
         assert(_experimenter == 8992)
-        _subtype = reader.read("!H")[0]
         assert(_subtype == 18)
-        reader.skip(2)
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -539,6 +521,7 @@ class nicira_dec_ttl(nicira):
 nicira.subtypes[18] = nicira_dec_ttl
 
 class output(action):
+    __slots__ = ['port', 'max_len']
     type = 0
 
     def __init__(self, port=None, max_len=None):
@@ -565,9 +548,8 @@ class output(action):
     @staticmethod
     def unpack(reader):
         obj = output()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 0)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.port = util.unpack_port_no(reader)
@@ -596,6 +578,7 @@ class output(action):
 action.subtypes[0] = output
 
 class set_dl_dst(action):
+    __slots__ = ['dl_addr']
     type = 5
 
     def __init__(self, dl_addr=None):
@@ -618,9 +601,8 @@ class set_dl_dst(action):
     @staticmethod
     def unpack(reader):
         obj = set_dl_dst()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 5)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.dl_addr = list(reader.read('!6B'))
@@ -645,6 +627,7 @@ class set_dl_dst(action):
 action.subtypes[5] = set_dl_dst
 
 class set_dl_src(action):
+    __slots__ = ['dl_addr']
     type = 4
 
     def __init__(self, dl_addr=None):
@@ -667,9 +650,8 @@ class set_dl_src(action):
     @staticmethod
     def unpack(reader):
         obj = set_dl_src()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 4)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.dl_addr = list(reader.read('!6B'))
@@ -694,6 +676,7 @@ class set_dl_src(action):
 action.subtypes[4] = set_dl_src
 
 class set_nw_dst(action):
+    __slots__ = ['nw_addr']
     type = 7
 
     def __init__(self, nw_addr=None):
@@ -715,9 +698,8 @@ class set_nw_dst(action):
     @staticmethod
     def unpack(reader):
         obj = set_nw_dst()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 7)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.nw_addr = reader.read("!L")[0]
@@ -741,6 +723,7 @@ class set_nw_dst(action):
 action.subtypes[7] = set_nw_dst
 
 class set_nw_src(action):
+    __slots__ = ['nw_addr']
     type = 6
 
     def __init__(self, nw_addr=None):
@@ -762,9 +745,8 @@ class set_nw_src(action):
     @staticmethod
     def unpack(reader):
         obj = set_nw_src()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 6)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.nw_addr = reader.read("!L")[0]
@@ -788,6 +770,7 @@ class set_nw_src(action):
 action.subtypes[6] = set_nw_src
 
 class set_nw_tos(action):
+    __slots__ = ['nw_tos']
     type = 8
 
     def __init__(self, nw_tos=None):
@@ -801,8 +784,7 @@ class set_nw_tos(action):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!B", self.nw_tos))
-        packed.append('\x00' * 3)
+        packed.append(_struct_B3x.pack(self.nw_tos))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -810,9 +792,8 @@ class set_nw_tos(action):
     @staticmethod
     def unpack(reader):
         obj = set_nw_tos()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 8)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.nw_tos = reader.read("!B")[0]
@@ -837,6 +818,7 @@ class set_nw_tos(action):
 action.subtypes[8] = set_nw_tos
 
 class set_tp_dst(action):
+    __slots__ = ['tp_port']
     type = 10
 
     def __init__(self, tp_port=None):
@@ -850,8 +832,7 @@ class set_tp_dst(action):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!H", self.tp_port))
-        packed.append('\x00' * 2)
+        packed.append(_struct_H2x.pack(self.tp_port))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -859,9 +840,8 @@ class set_tp_dst(action):
     @staticmethod
     def unpack(reader):
         obj = set_tp_dst()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 10)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.tp_port = reader.read("!H")[0]
@@ -886,6 +866,7 @@ class set_tp_dst(action):
 action.subtypes[10] = set_tp_dst
 
 class set_tp_src(action):
+    __slots__ = ['tp_port']
     type = 9
 
     def __init__(self, tp_port=None):
@@ -899,8 +880,7 @@ class set_tp_src(action):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!H", self.tp_port))
-        packed.append('\x00' * 2)
+        packed.append(_struct_H2x.pack(self.tp_port))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -908,9 +888,8 @@ class set_tp_src(action):
     @staticmethod
     def unpack(reader):
         obj = set_tp_src()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 9)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.tp_port = reader.read("!H")[0]
@@ -935,6 +914,7 @@ class set_tp_src(action):
 action.subtypes[9] = set_tp_src
 
 class set_vlan_pcp(action):
+    __slots__ = ['vlan_pcp']
     type = 2
 
     def __init__(self, vlan_pcp=None):
@@ -948,8 +928,7 @@ class set_vlan_pcp(action):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!B", self.vlan_pcp))
-        packed.append('\x00' * 3)
+        packed.append(_struct_B3x.pack(self.vlan_pcp))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -957,9 +936,8 @@ class set_vlan_pcp(action):
     @staticmethod
     def unpack(reader):
         obj = set_vlan_pcp()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 2)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.vlan_pcp = reader.read("!B")[0]
@@ -984,6 +962,7 @@ class set_vlan_pcp(action):
 action.subtypes[2] = set_vlan_pcp
 
 class set_vlan_vid(action):
+    __slots__ = ['vlan_vid']
     type = 1
 
     def __init__(self, vlan_vid=None):
@@ -997,8 +976,7 @@ class set_vlan_vid(action):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!H", self.vlan_vid))
-        packed.append('\x00' * 2)
+        packed.append(_struct_H2x.pack(self.vlan_vid))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1006,9 +984,8 @@ class set_vlan_vid(action):
     @staticmethod
     def unpack(reader):
         obj = set_vlan_vid()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 1)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.vlan_vid = reader.read("!H")[0]
@@ -1033,6 +1010,7 @@ class set_vlan_vid(action):
 action.subtypes[1] = set_vlan_vid
 
 class strip_vlan(action):
+    __slots__ = []
     type = 3
 
     def __init__(self):
@@ -1050,9 +1028,8 @@ class strip_vlan(action):
     @staticmethod
     def unpack(reader):
         obj = strip_vlan()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 3)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         reader.skip(4)
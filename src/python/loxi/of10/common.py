@@ -14,7 +14,24 @@ import loxi.generic_util
 import sys
 ofp = sys.modules['loxi.of10']
 
+# Precompiled layouts of fixed-size field runs
+_struct_2xLQQQ = struct.Struct("!2xLQQQ")
+_struct_4xH6x = struct.Struct("!4xH6x")
+_struct_6xQQQQQQQQQQQQ = struct.Struct("!6xQQQQQQQQQQQQ")
+_struct_B1x = struct.Struct("!B1x")
+_struct_B3x = struct.Struct("!B3x")
+_struct_HB1xHBB2xLLHH = struct.Struct("!HB1xHBB2xLLHH")
+_struct_HH = struct.Struct("!HH")
+_struct_LH = struct.Struct("!LH")
+_struct_LHHHH = struct.Struct("!LHHHH")
+_struct_LL = struct.Struct("!LL")
+_struct_LLBB2xLL = struct.Struct("!LLBB2xLL")
+_struct_LLHHH6xQQQ = struct.Struct("!LLHHH6xQQQ")
+_struct_LLLLLL = struct.Struct("!LLLLLL")
+_struct_LLQQ = struct.Struct("!LLQQ")
+
 class bsn_interface(loxi.OFObject):
+    __slots__ = ['hw_addr', 'name', 'ipv4_addr', 'ipv4_netmask']
 
     def __init__(self, hw_addr=None, name=None, ipv4_addr=None, ipv4_netmask=None):
         if hw_addr != None:
@@ -40,8 +57,7 @@ class bsn_interface(loxi.OFObject):
         packed.append(struct.pack("!6B", *self.hw_addr))
         packed.append('\x00' * 2)
         packed.append(struct.pack("!16s", self.name))
-        packed.append(struct.pack("!L", self.ipv4_addr))
-        packed.append(struct.pack("!L", self.ipv4_netmask))
+        packed.append(_struct_LL.pack(self.ipv4_addr, self.ipv4_netmask))
         return ''.join(packed)
 
     @staticmethod
@@ -50,8 +66,7 @@ class bsn_interface(loxi.OFObject):
         obj.hw_addr = list(reader.read('!6B'))
         reader.skip(2)
         obj.name = reader.read("!16s")[0].rstrip("\x00")
-        obj.ipv4_addr = reader.read("!L")[0]
-        obj.ipv4_netmask = reader.read("!L")[0]
+        obj.ipv4_addr, obj.ipv4_netmask = reader.read_struct(_struct_LL)
         return obj
 
     def __eq__(self, other):
@@ -83,7 +98,9 @@ class bsn_interface(loxi.OFObject):
 
 
 class bsn_vport(loxi.OFObject):
+    __slots__ = ['type']
     subtypes = {}
+    subtype_field = ('!H', 0)
 
 
     def __init__(self, type=None):
@@ -109,8 +126,7 @@ class bsn_vport(loxi.OFObject):
             return subclass.unpack(reader)
 
         obj = bsn_vport()
-        obj.type = reader.read("!H")[0]
-        _length = reader.read("!H")[0]
+        obj.type, _length = reader.read_struct(_struct_HH)
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         return obj
@@ -130,6 +146,7 @@ class bsn_vport(loxi.OFObject):
 
 
 class bsn_vport_l2gre(bsn_vport):
+    __slots__ = ['flags', 'port_no', 'loopback_port_no', 'local_mac', 'nh_mac', 'src_ip', 'dst_ip', 'dscp', 'ttl', 'vpn', 'rate_limit', 'if_name']
     type = 1
 
     def __init__(self, flags=None, port_no=None, loopback_port_no=None, local_mac=None, nh_mac=None, src_ip=None, dst_ip=None, dscp=None, ttl=None, vpn=None, rate_limit=None, if_name=None):
@@ -192,13 +209,7 @@ class bsn_vport_l2gre(bsn_vport):
         packed.append(util.pack_port_no(self.loopback_port_no))
         packed.append(struct.pack("!6B", *self.local_mac))
         packed.append(struct.pack("!6B", *self.nh_mac))
-        packed.append(struct.pack("!L", self.src_ip))
-        packed.append(struct.pack("!L", self.dst_ip))
-        packed.append(struct.pack("!B", self.dscp))
-        packed.append(struct.pack("!B", self.ttl))
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!L", self.vpn))
-        packed.append(struct.pack("!L", self.rate_limit))
+        packed.append(_struct_LLBB2xLL.pack(self.src_ip, self.dst_ip, self.dscp, self.ttl, self.vpn, self.rate_limit))
         packed.append(struct.pack("!16s", self.if_name))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
@@ -207,9 +218,8 @@ class bsn_vport_l2gre(bsn_vport):
     @staticmethod
     def unpack(reader):
         obj = bsn_vport_l2gre()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.flags = reader.read("!L")[0]
@@ -217,13 +227,7 @@ class bsn_vport_l2gre(bsn_vport):
         obj.loopback_port_no = util.unpack_port_no(reader)
         obj.local_mac = list(reader.read('!6B'))
         obj.nh_mac = list(reader.read('!6B'))
-        obj.src_ip = reader.read("!L")[0]
-        obj.dst_ip = reader.read("!L")[0]
-        obj.dscp = reader.read("!B")[0]
-        obj.ttl = reader.read("!B")[0]
-        reader.skip(2)
-        obj.vpn = reader.read("!L")[0]
-        obj.rate_limit = reader.read("!L")[0]
+        obj.src_ip, obj.dst_ip, obj.dscp, obj.ttl, obj.vpn, obj.rate_limit = reader.read_struct(_struct_LLBB2xLL)
         obj.if_name = reader.read("!16s")[0].rstrip("\x00")
         return obj
 
@@ -289,6 +293,7 @@ class bsn_vport_l2gre(bsn_vport):
 bsn_vport.subtypes[1] = bsn_vport_l2gre
 
 class bsn_vport_q_in_q(bsn_vport):
+    __slots__ = ['port_no', 'ingress_tpid', 'ingress_vlan_id', 'egress_tpid', 'egress_vlan_id', 'if_name']
     type = 0
 
     def __init__(self, port_no=None, ingress_tpid=None, ingress_vlan_id=None, egress_tpid=None, egress_vlan_id=None, if_name=None):
@@ -322,11 +327,7 @@ class bsn_vport_q_in_q(bsn_vport):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.port_no))
-        packed.append(struct.pack("!H", self.ingress_tpid))
-        packed.append(struct.pack("!H", self.ingress_vlan_id))
-        packed.append(struct.pack("!H", self.egress_tpid))
-        packed.append(struct.pack("!H", self.egress_vlan_id))
+        packed.append(_struct_LHHHH.pack(self.port_no, self.ingress_tpid, self.ingress_vlan_id, self.egress_tpid, self.egress_vlan_id))
         packed.append(struct.pack("!16s", self.if_name))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
@@ -335,16 +336,11 @@ class bsn_vport_q_in_q(bsn_vport):
     @staticmethod
     def unpack(reader):
         obj = bsn_vport_q_in_q()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 0)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.port_no = reader.read("!L")[0]
-        obj.ingress_tpid = reader.read("!H")[0]
-        obj.ingress_vlan_id = reader.read("!H")[0]
-        obj.egress_tpid = reader.read("!H")[0]
-        obj.egress_vlan_id = reader.read("!H")[0]
+        obj.port_no, obj.ingress_tpid, obj.ingress_vlan_id, obj.egress_tpid, obj.egress_vlan_id = reader.read_struct(_struct_LHHHH)
         obj.if_name = reader.read("!16s")[0].rstrip("\x00")
         return obj
 
@@ -386,6 +382,7 @@ class bsn_vport_q_in_q(bsn_vport):
 bsn_vport.subtypes[0] = bsn_vport_q_in_q
 
 class flow_stats_entry(loxi.OFObject):
+    __slots__ = ['table_id', 'match', 'duration_sec', 'duration_nsec', 'priority', 'idle_timeout', 'hard_timeout', 'cookie', 'packet_count', 'byte_count', 'actions']
 
     def __init__(self, table_id=None, match=None, duration_sec=None, duration_nsec=None, priority=None, idle_timeout=None, hard_timeout=None, cookie=None, packet_count=None, byte_count=None, actions=None):
         if table_id != None:
@@ -437,18 +434,9 @@ class flow_stats_entry(loxi.OFObject):
     def pack(self):
         packed = []
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 0
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append('\x00' * 1)
+        packed.append(_struct_B1x.pack(self.table_id))
         packed.append(self.match.pack())
-        packed.append(struct.pack("!L", self.duration_sec))
-        packed.append(struct.pack("!L", self.duration_nsec))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append(struct.pack("!H", self.hard_timeout))
-        packed.append('\x00' * 6)
-        packed.append(struct.pack("!Q", self.cookie))
-        packed.append(struct.pack("!Q", self.packet_count))
-        packed.append(struct.pack("!Q", self.byte_count))
+        packed.append(_struct_LLHHH6xQQQ.pack(self.duration_sec, self.duration_nsec, self.priority, self.idle_timeout, self.hard_timeout, self.cookie, self.packet_count, self.byte_count))
         packed.append(loxi.generic_util.pack_list(self.actions))
         length = sum([len(x) for x in packed])
         packed[0] = struct.pack("!H", length)
@@ -463,15 +451,7 @@ class flow_stats_entry(loxi.OFObject):
         obj.table_id = reader.read("!B")[0]
         reader.skip(1)
         obj.match = ofp.match.unpack(reader)
-        obj.duration_sec = reader.read("!L")[0]
-        obj.duration_nsec = reader.read("!L")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.idle_timeout = reader.read("!H")[0]
-        obj.hard_timeout = reader.read("!H")[0]
-        reader.skip(6)
-        obj.cookie = reader.read("!Q")[0]
-        obj.packet_count = reader.read("!Q")[0]
-        obj.byte_count = reader.read("!Q")[0]
+        obj.duration_sec, obj.duration_nsec, obj.priority, obj.idle_timeout, obj.hard_timeout, obj.cookie, obj.packet_count, obj.byte_count = reader.read_struct(_struct_LLHHH6xQQQ)
         obj.actions = loxi.generic_util.unpack_list(reader, ofp.action.action.unpack)
         return obj
 
@@ -532,6 +512,7 @@ class flow_stats_entry(loxi.OFObject):
 
 
 class match_v1(loxi.OFObject):
+    __slots__ = ['wildcards', 'in_port', 'eth_src', 'eth_dst', 'vlan_vid', 'vlan_pcp', 'eth_type', 'ip_dscp', 'ip_proto', 'ipv4_src', 'ipv4_dst', 'tcp_src', 'tcp_dst']
 
     def __init__(self, wildcards=None, in_port=None, eth_src=None, eth_dst=None, vlan_vid=None, vlan_pcp=None, eth_type=None, ip_dscp=None, ip_proto=None, ipv4_src=None, ipv4_dst=None, tcp_src=None, tcp_dst=None):
         if wildcards != None:
@@ -594,17 +575,7 @@ class match_v1(loxi.OFObject):
         packed.append(util.pack_port_no(self.in_port))
         packed.append(struct.pack("!6B", *self.eth_src))
         packed.append(struct.pack("!6B", *self.eth_dst))
-        packed.append(struct.pack("!H", self.vlan_vid))
-        packed.append(struct.pack("!B", self.vlan_pcp))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!H", self.eth_type))
-        packed.append(struct.pack("!B", self.ip_dscp))
-        packed.append(struct.pack("!B", self.ip_proto))
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!L", self.ipv4_src))
-        packed.append(struct.pack("!L", self.ipv4_dst))
-        packed.append(struct.pack("!H", self.tcp_src))
-        packed.append(struct.pack("!H", self.tcp_dst))
+        packed.append(_struct_HB1xHBB2xLLHH.pack(self.vlan_vid, self.vlan_pcp, self.eth_type, self.ip_dscp, self.ip_proto, self.ipv4_src, self.ipv4_dst, self.tcp_src, self.tcp_dst))
         return ''.join(packed)
 
     @staticmethod
@@ -614,17 +585,7 @@ class match_v1(loxi.OFObject):
         obj.in_port = util.unpack_port_no(reader)
         obj.eth_src = list(reader.read('!6B'))
         obj.eth_dst = list(reader.read('!6B'))
-        obj.vlan_vid = reader.read("!H")[0]
-        obj.vlan_pcp = reader.read("!B")[0]
-        reader.skip(1)
-        obj.eth_type = reader.read("!H")[0]
-        obj.ip_dscp = reader.read("!B")[0]
-        obj.ip_proto = reader.read("!B")[0]
-        reader.skip(2)
-        obj.ipv4_src = reader.read("!L")[0]
-        obj.ipv4_dst = reader.read("!L")[0]
-        obj.tcp_src = reader.read("!H")[0]
-        obj.tcp_dst = reader.read("!H")[0]
+        obj.vlan_vid, obj.vlan_pcp, obj.eth_type, obj.ip_dscp, obj.ip_proto, obj.ipv4_src, obj.ipv4_dst, obj.tcp_src, obj.tcp_dst = reader.read_struct(_struct_HB1xHBB2xLLHH)
         return obj
 
     def __eq__(self, other):
@@ -692,6 +653,7 @@ class match_v1(loxi.OFObject):
 
 
 class packet_queue(loxi.OFObject):
+    __slots__ = ['queue_id', 'properties']
 
     def __init__(self, queue_id=None, properties=None):
         if queue_id != None:
@@ -717,8 +679,7 @@ class packet_queue(loxi.OFObject):
     @staticmethod
     def unpack(reader):
         obj = packet_queue()
-        obj.queue_id = reader.read("!L")[0]
-        _len = reader.read("!H")[0]
+        obj.queue_id, _len = reader.read_struct(_struct_LH)
         orig_reader = reader
         reader = orig_reader.slice(_len, 6)
         reader.skip(2)
@@ -746,6 +707,7 @@ class packet_queue(loxi.OFObject):
 
 
 class port_desc(loxi.OFObject):
+    __slots__ = ['port_no', 'hw_addr', 'name', 'config', 'state', 'curr', 'advertised', 'supported', 'peer']
 
     def __init__(self, port_no=None, hw_addr=None, name=None, config=None, state=None, curr=None, advertised=None, supported=None, peer=None):
         if port_no != None:
@@ -791,12 +753,7 @@ class port_desc(loxi.OFObject):
         packed.append(util.pack_port_no(self.port_no))
         packed.append(struct.pack("!6B", *self.hw_addr))
         packed.append(struct.pack("!16s", self.name))
-        packed.append(struct.pack("!L", self.config))
-        packed.append(struct.pack("!L", self.state))
-        packed.append(struct.pack("!L", self.curr))
-        packed.append(struct.pack("!L", self.advertised))
-        packed.append(struct.pack("!L", self.supported))
-        packed.append(struct.pack("!L", self.peer))
+        packed.append(_struct_LLLLLL.pack(self.config, self.state, self.curr, self.advertised, self.supported, self.peer))
         return ''.join(packed)
 
     @staticmethod
@@ -805,12 +762,7 @@ class port_desc(loxi.OFObject):
         obj.port_no = util.unpack_port_no(reader)
         obj.hw_addr = list(reader.read('!6B'))
         obj.name = reader.read("!16s")[0].rstrip("\x00")
-        obj.config = reader.read("!L")[0]
-        obj.state = reader.read("!L")[0]
-        obj.curr = reader.read("!L")[0]
-        obj.advertised = reader.read("!L")[0]
-        obj.supported = reader.read("!L")[0]
-        obj.peer = reader.read("!L")[0]
+        obj.config, obj.state, obj.curr, obj.advertised, obj.supported, obj.peer = reader.read_struct(_struct_LLLLLL)
         return obj
 
     def __eq__(self, other):
@@ -862,6 +814,7 @@ class port_desc(loxi.OFObject):
 
 
 class port_stats_entry(loxi.OFObject):
+    __slots__ = ['port_no', 'rx_packets', 'tx_packets', 'rx_bytes', 'tx_bytes', 'rx_dropped', 'tx_dropped', 'rx_errors', 'tx_errors', 'rx_frame_err', 'rx_over_err', 'rx_crc_err', 'collisions']
 
     def __init__(self, port_no=None, rx_packets=None, tx_packets=None, rx_bytes=None, tx_bytes=None, rx_dropped=None, tx_dropped=None, rx_errors=None, tx_errors=None, rx_frame_err=None, rx_over_err=None, rx_crc_err=None, collisions=None):
         if port_no != None:
@@ -921,38 +874,14 @@ class port_stats_entry(loxi.OFObject):
     def pack(self):
         packed = []
         packed.append(util.pack_port_no(self.port_no))
-        packed.append('\x00' * 6)
-        packed.append(struct.pack("!Q", self.rx_packets))
-        packed.append(struct.pack("!Q", self.tx_packets))
-        packed.append(struct.pack("!Q", self.rx_bytes))
-        packed.append(struct.pack("!Q", self.tx_bytes))
-        packed.append(struct.pack("!Q", self.rx_dropped))
-        packed.append(struct.pack("!Q", self.tx_dropped))
-        packed.append(struct.pack("!Q", self.rx_errors))
-        packed.append(struct.pack("!Q", self.tx_errors))
-        packed.append(struct.pack("!Q", self.rx_frame_err))
-        packed.append(struct.pack("!Q", self.rx_over_err))
-        packed.append(struct.pack("!Q", self.rx_crc_err))
-        packed.append(struct.pack("!Q", self.collisions))
+        packed.append(_struct_6xQQQQQQQQQQQQ.pack(self.rx_packets, self.tx_packets, self.rx_bytes, self.tx_bytes, self.rx_dropped, self.tx_dropped, self.rx_errors, self.tx_errors, self.rx_frame_err, self.rx_over_err, self.rx_crc_err, self.collisions))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = port_stats_entry()
         obj.port_no = util.unpack_port_no(reader)
-        reader.skip(6)
-        obj.rx_packets = reader.read("!Q")[0]
-        obj.tx_packets = reader.read("!Q")[0]
-        obj.rx_bytes = reader.read("!Q")[0]
-        obj.tx_bytes = reader.read("!Q")[0]
-        obj.rx_dropped = reader.read("!Q")[0]
-        obj.tx_dropped = reader.read("!Q")[0]
-        obj.rx_errors = reader.read("!Q")[0]
-        obj.tx_errors = reader.read("!Q")[0]
-        obj.rx_frame_err = reader.read("!Q")[0]
-        obj.rx_over_err = reader.read("!Q")[0]
-        obj.rx_crc_err = reader.read("!Q")[0]
-        obj.collisions = reader.read("!Q")[0]
+        obj.rx_packets, obj.tx_packets, obj.rx_bytes, obj.tx_bytes, obj.rx_dropped, obj.tx_dropped, obj.rx_errors, obj.tx_errors, obj.rx_frame_err, obj.rx_over_err, obj.rx_crc_err, obj.collisions = reader.read_struct(_struct_6xQQQQQQQQQQQQ)
         return obj
 
     def __eq__(self, other):
@@ -1020,7 +949,9 @@ class port_stats_entry(loxi.OFObject):
 
 
 class queue_prop(loxi.OFObject):
+    __slots__ = ['type']
     subtypes = {}
+    subtype_field = ('!H', 0)
 
 
     def __init__(self, type=None):
@@ -1047,8 +978,7 @@ class queue_prop(loxi.OFObject):
             return subclass.unpack(reader)
 
         obj = queue_prop()
-        obj.type = reader.read("!H")[0]
-        _len = reader.read("!H")[0]
+        obj.type, _len = reader.read_struct(_struct_HH)
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         reader.skip(4)
@@ -1069,6 +999,7 @@ class queue_prop(loxi.OFObject):
 
 
 class queue_prop_min_rate(queue_prop):
+    __slots__ = ['rate']
     type = 1
 
     def __init__(self, rate=None):
@@ -1082,9 +1013,7 @@ class queue_prop_min_rate(queue_prop):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!H", self.rate))
-        packed.append('\x00' * 6)
+        packed.append(_struct_4xH6x.pack(self.rate))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1092,9 +1021,8 @@ class queue_prop_min_rate(queue_prop):
     @staticmethod
     def unpack(reader):
         obj = queue_prop_min_rate()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 1)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         reader.skip(4)
@@ -1120,6 +1048,7 @@ class queue_prop_min_rate(queue_prop):
 queue_prop.subtypes[1] = queue_prop_min_rate
 
 class queue_stats_entry(loxi.OFObject):
+    __slots__ = ['port_no', 'queue_id', 'tx_bytes', 'tx_packets', 'tx_errors']
 
     def __init__(self, port_no=None, queue_id=None, tx_bytes=None, tx_packets=None, tx_errors=None):
         if port_no != None:
@@ -1147,22 +1076,14 @@ class queue_stats_entry(loxi.OFObject):
     def pack(self):
         packed = []
         packed.append(util.pack_port_no(self.port_no))
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!L", self.queue_id))
-        packed.append(struct.pack("!Q", self.tx_bytes))
-        packed.append(struct.pack("!Q", self.tx_packets))
-        packed.append(struct.pack("!Q", self.tx_errors))
+        packed.append(_struct_2xLQQQ.pack(self.queue_id, self.tx_bytes, self.tx_packets, self.tx_errors))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = queue_stats_entry()
         obj.port_no = util.unpack_port_no(reader)
-        reader.skip(2)
-        obj.queue_id = reader.read("!L")[0]
-        obj.tx_bytes = reader.read("!Q")[0]
-        obj.tx_packets = reader.read("!Q")[0]
-        obj.tx_errors = reader.read("!Q")[0]
+        obj.queue_id, obj.tx_bytes, obj.tx_packets, obj.tx_errors = reader.read_struct(_struct_2xLQQQ)
         return obj
 
     def __eq__(self, other):
@@ -1198,6 +1119,7 @@ class queue_stats_entry(loxi.OFObject):
 
 
 class table_stats_entry(loxi.OFObject):
+    __slots__ = ['table_id', 'name', 'wildcards', 'max_entries', 'active_count', 'lookup_count', 'matched_count']
 
     def __init__(self, table_id=None, name=None, wildcards=None, max_entries=None, active_count=None, lookup_count=None, matched_count=None):
         if table_id != None:
@@ -1232,14 +1154,10 @@ class table_stats_entry(loxi.OFObject):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append('\x00' * 3)
+        packed.append(_struct_B3x.pack(self.table_id))
         packed.append(struct.pack("!32s", self.name))
         packed.append(util.pack_wc_bmap(self.wildcards))
-        packed.append(struct.pack("!L", self.max_entries))
-        packed.append(struct.pack("!L", self.active_count))
-        packed.append(struct.pack("!Q", self.lookup_count))
-        packed.append(struct.pack("!Q", self.matched_count))
+        packed.append(_struct_LLQQ.pack(self.max_entries, self.active_count, self.lookup_count, self.matched_count))
         return ''.join(packed)
 
     @staticmethod
@@ -1249,10 +1167,7 @@ class table_stats_entry(loxi.OFObject):
         reader.skip(3)
         obj.name = reader.read("!32s")[0].rstrip("\x00")
         obj.wildcards = util.unpack_wc_bmap(reader)
-        obj.max_entries = reader.read("!L")[0]
-        obj.active_count = reader.read("!L")[0]
-        obj.lookup_count = reader.read("!Q")[0]
-        obj.matched_count = reader.read("!Q")[0]
+        obj.max_entries, obj.active_count, obj.lookup_count, obj.matched_count = reader.read_struct(_struct_LLQQ)
         return obj
 
     def __eq__(self, other):
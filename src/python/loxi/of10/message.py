@@ -14,8 +14,39 @@ import loxi.generic_util
 import sys
 ofp = sys.modules['loxi.of10']
 
+# Precompiled layouts of fixed-size field runs
+_struct_2xL = struct.Struct("!2xL")
+_struct_B1x = struct.Struct("!B1x")
+_struct_B3x = struct.Struct("!B3x")
+_struct_BB = struct.Struct("!BB")
+_struct_BBH = struct.Struct("!BBH")
+_struct_HHHL = struct.Struct("!HHHL")
+_struct_LB3xL = struct.Struct("!LB3xL")
+_struct_LB7x = struct.Struct("!LB7x")
+_struct_LH = struct.Struct("!LH")
+_struct_LHH = struct.Struct("!LHH")
+_struct_LHH4xLL = struct.Struct("!LHH4xLL")
+_struct_LHHL = struct.Struct("!LHHL")
+_struct_LHHQQL4x = struct.Struct("!LHHQQL4x")
+_struct_LL = struct.Struct("!LL")
+_struct_LLH = struct.Struct("!LLH")
+_struct_LLL = struct.Struct("!LLL")
+_struct_LLL4x = struct.Struct("!LLL4x")
+_struct_LLLB1xH4x = struct.Struct("!LLLB1xH4x")
+_struct_LLLB1xHHHQ = struct.Struct("!LLLB1xHHHQ")
+_struct_LLLB1xHL = struct.Struct("!LLLB1xHL")
+_struct_LLLB3x = struct.Struct("!LLLB3x")
+_struct_LLLB3xL = struct.Struct("!LLLB3xL")
+_struct_LLLB7x = struct.Struct("!LLLB7x")
+_struct_LLLL = struct.Struct("!LLLL")
+_struct_LLLLL = struct.Struct("!LLLLL")
+_struct_LQLB3xLL = struct.Struct("!LQLB3xLL")
+_struct_QHB1xLLH2xQQ = struct.Struct("!QHB1xLLH2xQQ")
+
 class message(loxi.OFObject):
+    __slots__ = ['type', 'xid']
     subtypes = {}
+    subtype_field = ('B', 1)
 
     version = 1
 
@@ -32,12 +63,11 @@ class message(loxi.OFObject):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         packed.append(struct.pack("!L", self.xid))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
@@ -48,10 +78,8 @@ class message(loxi.OFObject):
             return subclass.unpack(reader)
 
         obj = message()
-        _version = reader.read("!B")[0]
+        _version, obj.type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        obj.type = reader.read("!B")[0]
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.xid = reader.read("!L")[0]
@@ -78,7 +106,9 @@ class message(loxi.OFObject):
 
 
 class stats_reply(message):
+    __slots__ = ['stats_type', 'flags']
     subtypes = {}
+    subtype_field = ('!H', 8)
 
     version = 1
     type = 17
@@ -100,14 +130,11 @@ class stats_reply(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_struct_LHH.pack(self.xid, self.stats_type, self.flags))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
@@ -118,16 +145,12 @@ class stats_reply(message):
             return subclass.unpack(reader)
 
         obj = stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 17)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.stats_type = reader.read("!H")[0]
-        obj.flags = reader.read("!H")[0]
+        obj.xid, obj.stats_type, obj.flags = reader.read_struct(_struct_LHH)
         return obj
 
     def __eq__(self, other):
@@ -156,6 +179,7 @@ class stats_reply(message):
 message.subtypes[17] = stats_reply
 
 class aggregate_stats_reply(stats_reply):
+    __slots__ = ['packet_count', 'byte_count', 'flow_count']
     version = 1
     type = 17
     stats_type = 2
@@ -185,38 +209,23 @@ class aggregate_stats_reply(stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append(struct.pack("!Q", self.packet_count))
-        packed.append(struct.pack("!Q", self.byte_count))
-        packed.append(struct.pack("!L", self.flow_count))
-        packed.append('\x00' * 4)
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_struct_LHHQQL4x.pack(self.xid, self.stats_type, self.flags, self.packet_count, self.byte_count, self.flow_count))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = aggregate_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 17)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, obj.packet_count, obj.byte_count, obj.flow_count = reader.read_struct(_struct_LHHQQL4x)
         assert(_stats_type == 2)
-        obj.flags = reader.read("!H")[0]
-        obj.packet_count = reader.read("!Q")[0]
-        obj.byte_count = reader.read("!Q")[0]
-        obj.flow_count = reader.read("!L")[0]
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -256,7 +265,9 @@ class aggregate_stats_reply(stats_reply):
 stats_reply.subtypes[2] = aggregate_stats_reply
 
 class stats_request(message):
+    __slots__ = ['stats_type', 'flags']
     subtypes = {}
+    subtype_field = ('!H', 8)
 
     version = 1
     type = 16
@@ -278,14 +289,11 @@ class stats_request(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_struct_LHH.pack(self.xid, self.stats_type, self.flags))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
@@ -296,16 +304,12 @@ class stats_request(message):
             return subclass.unpack(reader)
 
         obj = stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 16)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.stats_type = reader.read("!H")[0]
-        obj.flags = reader.read("!H")[0]
+        obj.xid, obj.stats_type, obj.flags = reader.read_struct(_struct_LHH)
         return obj
 
     def __eq__(self, other):
@@ -334,6 +338,7 @@ class stats_request(message):
 message.subtypes[16] = stats_request
 
 class aggregate_stats_request(stats_request):
+    __slots__ = ['match', 'table_id', 'out_port']
     version = 1
     type = 16
     stats_type = 2
@@ -363,34 +368,26 @@ class aggregate_stats_request(stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_struct_LHH.pack(self.xid, self.stats_type, self.flags))
         packed.append(self.match.pack())
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append('\x00' * 1)
+        packed.append(_struct_B1x.pack(self.table_id))
         packed.append(util.pack_port_no(self.out_port))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = aggregate_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 16)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags = reader.read_struct(_struct_LHH)
         assert(_stats_type == 2)
-        obj.flags = reader.read("!H")[0]
         obj.match = ofp.match.unpack(reader)
         obj.table_id = reader.read("!B")[0]
         reader.skip(1)
@@ -434,7 +431,9 @@ class aggregate_stats_request(stats_request):
 stats_request.subtypes[2] = aggregate_stats_request
 
 class error_msg(message):
+    __slots__ = ['err_type']
     subtypes = {}
+    subtype_field = ('!H', 8)
 
     version = 1
     type = 1
@@ -452,13 +451,11 @@ class error_msg(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_struct_LH.pack(self.xid, self.err_type))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
@@ -469,15 +466,12 @@ class error_msg(message):
             return subclass.unpack(reader)
 
         obj = error_msg()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.err_type = reader.read("!H")[0]
+        obj.xid, obj.err_type = reader.read_struct(_struct_LH)
         return obj
 
     def __eq__(self, other):
@@ -502,6 +496,7 @@ class error_msg(message):
 message.subtypes[1] = error_msg
 
 class bad_action_error_msg(error_msg):
+    __slots__ = ['code', 'data']
     version = 1
     type = 1
     err_type = 2
@@ -523,31 +518,24 @@ class bad_action_error_msg(error_msg):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_struct_LHH.pack(self.xid, self.err_type, self.code))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bad_action_error_msg()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        obj.xid, _err_type, obj.code = reader.read_struct(_struct_LHH)
         assert(_err_type == 2)
-        obj.code = reader.read("!H")[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -580,6 +568,7 @@ class bad_action_error_msg(error_msg):
 error_msg.subtypes[2] = bad_action_error_msg
 
 class bad_request_error_msg(error_msg):
+    __slots__ = ['code', 'data']
     version = 1
     type = 1
     err_type = 1
@@ -601,31 +590,24 @@ class bad_request_error_msg(error_msg):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_struct_LHH.pack(self.xid, self.err_type, self.code))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bad_request_error_msg()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        obj.xid, _err_type, obj.code = reader.read_struct(_struct_LHH)
         assert(_err_type == 1)
-        obj.code = reader.read("!H")[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -658,6 +640,7 @@ class bad_request_error_msg(error_msg):
 error_msg.subtypes[1] = bad_request_error_msg
 
 class barrier_reply(message):
+    __slots__ = []
     version = 1
     type = 19
 
@@ -670,22 +653,19 @@ class barrier_reply(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         packed.append(struct.pack("!L", self.xid))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = barrier_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.xid = reader.read("!L")[0]
@@ -712,6 +692,7 @@ class barrier_reply(message):
 message.subtypes[19] = barrier_reply
 
 class barrier_request(message):
+    __slots__ = []
     version = 1
     type = 18
 
@@ -724,22 +705,19 @@ class barrier_request(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         packed.append(struct.pack("!L", self.xid))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = barrier_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.xid = reader.read("!L")[0]
@@ -766,7 +744,9 @@ class barrier_request(message):
 message.subtypes[18] = barrier_request
 
 class experimenter(message):
+    __slots__ = ['experimenter', 'data']
     subtypes = {}
+    subtype_field = ('!L', 8)
 
     version = 1
     type = 4
@@ -788,14 +768,12 @@ class experimenter(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_struct_LL.pack(self.xid, self.experimenter))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
@@ -806,15 +784,12 @@ class experimenter(message):
             return subclass.unpack(reader)
 
         obj = experimenter()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.experimenter = reader.read("!L")[0]
+        obj.xid, obj.experimenter = reader.read_struct(_struct_LL)
         obj.data = str(reader.read_all())
         return obj
 
@@ -844,7 +819,9 @@ class experimenter(message):
 message.subtypes[4] = experimenter
 
 class bsn_header(experimenter):
+    __slots__ = ['subtype']
     subtypes = {}
+    subtype_field = ('!L', 12)
 
     version = 1
     type = 4
@@ -863,14 +840,11 @@ class bsn_header(experimenter):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_struct_LLL.pack(self.xid, self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
@@ -881,17 +855,13 @@ class bsn_header(experimenter):
             return subclass.unpack(reader)
 
         obj = bsn_header()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, obj.subtype = reader.read_struct(_struct_LLL)
         assert(_experimenter == 6035143)
-        obj.subtype = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -916,6 +886,7 @@ class bsn_header(experimenter):
 experimenter.subtypes[6035143] = bsn_header
 
 class bsn_bw_clear_data_reply(bsn_header):
+    __slots__ = ['status']
     version = 1
     type = 4
     experimenter = 6035143
@@ -934,33 +905,24 @@ class bsn_bw_clear_data_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.status))
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_struct_LLLL.pack(self.xid, self.experimenter, self.subtype, self.status))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_bw_clear_data_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.status = reader.read_struct(_struct_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 22)
-        obj.status = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -988,6 +950,7 @@ class bsn_bw_clear_data_reply(bsn_header):
 bsn_header.subtypes[22] = bsn_bw_clear_data_reply
 
 class bsn_bw_clear_data_request(bsn_header):
+    __slots__ = []
     version = 1
     type = 4
     experimenter = 6035143
@@ -1002,30 +965,23 @@ class bsn_bw_clear_data_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_struct_LLL.pack(self.xid, self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_bw_clear_data_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype = reader.read_struct(_struct_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 21)
         return obj
 
@@ -1050,6 +1006,7 @@ class bsn_bw_clear_data_request(bsn_header):
 bsn_header.subtypes[21] = bsn_bw_clear_data_request
 
 class bsn_bw_enable_get_reply(bsn_header):
+    __slots__ = ['enabled']
     version = 1
     type = 4
     experimenter = 6035143
@@ -1068,33 +1025,24 @@ class bsn_bw_enable_get_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.enabled))
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_struct_LLLL.pack(self.xid, self.experimenter, self.subtype, self.enabled))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_bw_enable_get_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.enabled = reader.read_struct(_struct_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 20)
-        obj.enabled = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1122,6 +1070,7 @@ class bsn_bw_enable_get_reply(bsn_header):
 bsn_header.subtypes[20] = bsn_bw_enable_get_reply
 
 class bsn_bw_enable_get_request(bsn_header):
+    __slots__ = []
     version = 1
     type = 4
     experimenter = 6035143
@@ -1136,30 +1085,23 @@ class bsn_bw_enable_get_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_struct_LLL.pack(self.xid, self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_bw_enable_get_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype = reader.read_struct(_struct_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 19)
         return obj
 
@@ -1184,6 +1126,7 @@ class bsn_bw_enable_get_request(bsn_header):
 bsn_header.subtypes[19] = bsn_bw_enable_get_request
 
 class bsn_bw_enable_set_reply(bsn_header):
+    __slots__ = ['enable', 'status']
     version = 1
     type = 4
     experimenter = 6035143
@@ -1206,35 +1149,24 @@ class bsn_bw_enable_set_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.enable))
-        packed.append(struct.pack("!L", self.status))
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_struct_LLLLL.pack(self.xid, self.experimenter, self.subtype, self.enable, self.status))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_bw_enable_set_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.enable, obj.status = reader.read_struct(_struct_LLLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 23)
-        obj.enable = reader.read("!L")[0]
-        obj.status = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1266,6 +1198,7 @@ class bsn_bw_enable_set_reply(bsn_header):
 bsn_header.subtypes[23] = bsn_bw_enable_set_reply
 
 class bsn_bw_enable_set_request(bsn_header):
+    __slots__ = ['enable']
     version = 1
     type = 4
     experimenter = 6035143
@@ -1284,33 +1217,24 @@ class bsn_bw_enable_set_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.enable))
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_struct_LLLL.pack(self.xid, self.experimenter, self.subtype, self.enable))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_bw_enable_set_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.enable = reader.read_struct(_struct_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 18)
-        obj.enable = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1338,6 +1262,7 @@ class bsn_bw_enable_set_request(bsn_header):
 bsn_header.subtypes[18] = bsn_bw_enable_set_request
 
 class bsn_get_interfaces_reply(bsn_header):
+    __slots__ = ['interfaces']
     version = 1
     type = 4
     experimenter = 6035143
@@ -1356,31 +1281,24 @@ class bsn_get_interfaces_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_struct_LLL.pack(self.xid, self.experimenter, self.subtype))
         packed.append(loxi.generic_util.pack_list(self.interfaces))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_get_interfaces_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype = reader.read_struct(_struct_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 10)
         obj.interfaces = loxi.generic_util.unpack_list(reader, ofp.common.bsn_interface.unpack)
         return obj
@@ -1410,6 +1328,7 @@ class bsn_get_interfaces_reply(bsn_header):
 bsn_header.subtypes[10] = bsn_get_interfaces_reply
 
 class bsn_get_interfaces_request(bsn_header):
+    __slots__ = []
     version = 1
     type = 4
     experimenter = 6035143
@@ -1424,30 +1343,23 @@ class bsn_get_interfaces_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_struct_LLL.pack(self.xid, self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_get_interfaces_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype = reader.read_struct(_struct_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 9)
         return obj
 
@@ -1472,6 +1384,7 @@ class bsn_get_interfaces_request(bsn_header):
 bsn_header.subtypes[9] = bsn_get_interfaces_request
 
 class bsn_get_ip_mask_reply(bsn_header):
+    __slots__ = ['index', 'mask']
     version = 1
     type = 4
     experimenter = 6035143
@@ -1494,37 +1407,24 @@ class bsn_get_ip_mask_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!B", self.index))
-        packed.append('\x00' * 3)
-        packed.append(struct.pack("!L", self.mask))
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_struct_LLLB3xL.pack(self.xid, self.experimenter, self.subtype, self.index, self.mask))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_get_ip_mask_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.index, obj.mask = reader.read_struct(_struct_LLLB3xL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 2)
-        obj.index = reader.read("!B")[0]
-        reader.skip(3)
-        obj.mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1556,6 +1456,7 @@ class bsn_get_ip_mask_reply(bsn_header):
 bsn_header.subtypes[2] = bsn_get_ip_mask_reply
 
 class bsn_get_ip_mask_request(bsn_header):
+    __slots__ = ['index']
     version = 1
     type = 4
     experimenter = 6035143
@@ -1574,35 +1475,24 @@ class bsn_get_ip_mask_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!B", self.index))
-        packed.append('\x00' * 7)
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_struct_LLLB7x.pack(self.xid, self.experimenter, self.subtype, self.index))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_get_ip_mask_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.index = reader.read_struct(_struct_LLLB7x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 1)
-        obj.index = reader.read("!B")[0]
-        reader.skip(7)
         return obj
 
     def __eq__(self, other):
@@ -1630,6 +1520,7 @@ class bsn_get_ip_mask_request(bsn_header):
 bsn_header.subtypes[1] = bsn_get_ip_mask_request
 
 class bsn_get_l2_table_reply(bsn_header):
+    __slots__ = ['l2_table_enable', 'l2_table_priority']
     version = 1
     type = 4
     experimenter = 6035143
@@ -1652,39 +1543,24 @@ class bsn_get_l2_table_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!B", self.l2_table_enable))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!H", self.l2_table_priority))
-        packed.append('\x00' * 4)
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_struct_LLLB1xH4x.pack(self.xid, self.experimenter, self.subtype, self.l2_table_enable, self.l2_table_priority))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_get_l2_table_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.l2_table_enable, obj.l2_table_priority = reader.read_struct(_struct_LLLB1xH4x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 14)
-        obj.l2_table_enable = reader.read("!B")[0]
-        reader.skip(1)
-        obj.l2_table_priority = reader.read("!H")[0]
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -1716,6 +1592,7 @@ class bsn_get_l2_table_reply(bsn_header):
 bsn_header.subtypes[14] = bsn_get_l2_table_reply
 
 class bsn_get_l2_table_request(bsn_header):
+    __slots__ = []
     version = 1
     type = 4
     experimenter = 6035143
@@ -1730,30 +1607,23 @@ class bsn_get_l2_table_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_struct_LLL.pack(self.xid, self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_get_l2_table_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype = reader.read_struct(_struct_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 13)
         return obj
 
@@ -1778,6 +1648,7 @@ class bsn_get_l2_table_request(bsn_header):
 bsn_header.subtypes[13] = bsn_get_l2_table_request
 
 class bsn_get_mirroring_reply(bsn_header):
+    __slots__ = ['report_mirror_ports']
     version = 1
     type = 4
     experimenter = 6035143
@@ -1796,35 +1667,24 @@ class bsn_get_mirroring_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!B", self.report_mirror_ports))
-        packed.append('\x00' * 3)
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_struct_LLLB3x.pack(self.xid, self.experimenter, self.subtype, self.report_mirror_ports))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_get_mirroring_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.report_mirror_ports = reader.read_struct(_struct_LLLB3x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 5)
-        obj.report_mirror_ports = reader.read("!B")[0]
-        reader.skip(3)
         return obj
 
     def __eq__(self, other):
@@ -1852,6 +1712,7 @@ class bsn_get_mirroring_reply(bsn_header):
 bsn_header.subtypes[5] = bsn_get_mirroring_reply
 
 class bsn_get_mirroring_request(bsn_header):
+    __slots__ = ['report_mirror_ports']
     version = 1
     type = 4
     experimenter = 6035143
@@ -1870,35 +1731,24 @@ class bsn_get_mirroring_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!B", self.report_mirror_ports))
-        packed.append('\x00' * 3)
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_struct_LLLB3x.pack(self.xid, self.experimenter, self.subtype, self.report_mirror_ports))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_get_mirroring_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.report_mirror_ports = reader.read_struct(_struct_LLLB3x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 4)
-        obj.report_mirror_ports = reader.read("!B")[0]
-        reader.skip(3)
         return obj
 
     def __eq__(self, other):
@@ -1926,6 +1776,7 @@ class bsn_get_mirroring_request(bsn_header):
 bsn_header.subtypes[4] = bsn_get_mirroring_request
 
 class bsn_hybrid_get_reply(bsn_header):
+    __slots__ = ['hybrid_enable', 'hybrid_version']
     version = 1
     type = 4
     experimenter = 6035143
@@ -1948,39 +1799,24 @@ class bsn_hybrid_get_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!B", self.hybrid_enable))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!H", self.hybrid_version))
-        packed.append('\x00' * 4)
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_struct_LLLB1xH4x.pack(self.xid, self.experimenter, self.subtype, self.hybrid_enable, self.hybrid_version))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_hybrid_get_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.hybrid_enable, obj.hybrid_version = reader.read_struct(_struct_LLLB1xH4x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 28)
-        obj.hybrid_enable = reader.read("!B")[0]
-        reader.skip(1)
-        obj.hybrid_version = reader.read("!H")[0]
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -2012,6 +1848,7 @@ class bsn_hybrid_get_reply(bsn_header):
 bsn_header.subtypes[28] = bsn_hybrid_get_reply
 
 class bsn_hybrid_get_request(bsn_header):
+    __slots__ = []
     version = 1
     type = 4
     experimenter = 6035143
@@ -2026,30 +1863,23 @@ class bsn_hybrid_get_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_struct_LLL.pack(self.xid, self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_hybrid_get_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype = reader.read_struct(_struct_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 27)
         return obj
 
@@ -2074,6 +1904,7 @@ class bsn_hybrid_get_request(bsn_header):
 bsn_header.subtypes[27] = bsn_hybrid_get_request
 
 class bsn_pdu_rx_reply(bsn_header):
+    __slots__ = ['status', 'port_no', 'slot_num']
     version = 1
     type = 4
     experimenter = 6035143
@@ -2100,35 +1931,26 @@ class bsn_pdu_rx_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.status))
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_struct_LLLL.pack(self.xid, self.experimenter, self.subtype, self.status))
         packed.append(util.pack_port_no(self.port_no))
         packed.append(struct.pack("!B", self.slot_num))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_pdu_rx_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.status = reader.read_struct(_struct_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 34)
-        obj.status = reader.read("!L")[0]
         obj.port_no = util.unpack_port_no(reader)
         obj.slot_num = reader.read("!B")[0]
         return obj
@@ -2166,6 +1988,7 @@ class bsn_pdu_rx_reply(bsn_header):
 bsn_header.subtypes[34] = bsn_pdu_rx_reply
 
 class bsn_pdu_rx_request(bsn_header):
+    __slots__ = ['timeout_ms', 'port_no', 'slot_num']
     version = 1
     type = 4
     experimenter = 6035143
@@ -2196,37 +2019,27 @@ class bsn_pdu_rx_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.timeout_ms))
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_struct_LLLL.pack(self.xid, self.experimenter, self.subtype, self.timeout_ms))
         packed.append(util.pack_port_no(self.port_no))
-        packed.append(struct.pack("!B", self.slot_num))
-        packed.append('\x00' * 3)
+        packed.append(_struct_B3x.pack(self.slot_num))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_pdu_rx_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.timeout_ms = reader.read_struct(_struct_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 33)
-        obj.timeout_ms = reader.read("!L")[0]
         obj.port_no = util.unpack_port_no(reader)
         obj.slot_num = reader.read("!B")[0]
         reader.skip(3)
@@ -2270,6 +2083,7 @@ class bsn_pdu_rx_request(bsn_header):
 bsn_header.subtypes[33] = bsn_pdu_rx_request
 
 class bsn_pdu_rx_timeout(bsn_header):
+    __slots__ = ['port_no', 'slot_num']
     version = 1
     type = 4
     experimenter = 6035143
@@ -2292,32 +2106,25 @@ class bsn_pdu_rx_timeout(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_struct_LLL.pack(self.xid, self.experimenter, self.subtype))
         packed.append(util.pack_port_no(self.port_no))
         packed.append(struct.pack("!B", self.slot_num))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_pdu_rx_timeout()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype = reader.read_struct(_struct_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 35)
         obj.port_no = util.unpack_port_no(reader)
         obj.slot_num = reader.read("!B")[0]
@@ -2352,6 +2159,7 @@ class bsn_pdu_rx_timeout(bsn_header):
 bsn_header.subtypes[35] = bsn_pdu_rx_timeout
 
 class bsn_pdu_tx_reply(bsn_header):
+    __slots__ = ['status', 'port_no', 'slot_num']
     version = 1
     type = 4
     experimenter = 6035143
@@ -2378,35 +2186,26 @@ class bsn_pdu_tx_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.status))
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_struct_LLLL.pack(self.xid, self.experimenter, self.subtype, self.status))
         packed.append(util.pack_port_no(self.port_no))
         packed.append(struct.pack("!B", self.slot_num))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_pdu_tx_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.status = reader.read_struct(_struct_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 32)
-        obj.status = reader.read("!L")[0]
         obj.port_no = util.unpack_port_no(reader)
         obj.slot_num = reader.read("!B")[0]
         return obj
@@ -2444,6 +2243,7 @@ class bsn_pdu_tx_reply(bsn_header):
 bsn_header.subtypes[32] = bsn_pdu_tx_reply
 
 class bsn_pdu_tx_request(bsn_header):
+    __slots__ = ['tx_interval_ms', 'port_no', 'slot_num']
     version = 1
     type = 4
     experimenter = 6035143
@@ -2474,37 +2274,27 @@ class bsn_pdu_tx_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.tx_interval_ms))
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_struct_LLLL.pack(self.xid, self.experimenter, self.subtype, self.tx_interval_ms))
         packed.append(util.pack_port_no(self.port_no))
-        packed.append(struct.pack("!B", self.slot_num))
-        packed.append('\x00' * 3)
+        packed.append(_struct_B3x.pack(self.slot_num))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_pdu_tx_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.tx_interval_ms = reader.read_struct(_struct_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 31)
-        obj.tx_interval_ms = reader.read("!L")[0]
         obj.port_no = util.unpack_port_no(reader)
         obj.slot_num = reader.read("!B")[0]
         reader.skip(3)
@@ -2548,6 +2338,7 @@ class bsn_pdu_tx_request(bsn_header):
 bsn_header.subtypes[31] = bsn_pdu_tx_request
 
 class bsn_set_ip_mask(bsn_header):
+    __slots__ = ['index', 'mask']
     version = 1
     type = 4
     experimenter = 6035143
@@ -2570,37 +2361,24 @@ class bsn_set_ip_mask(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!B", self.index))
-        packed.append('\x00' * 3)
-        packed.append(struct.pack("!L", self.mask))
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_struct_LLLB3xL.pack(self.xid, self.experimenter, self.subtype, self.index, self.mask))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_set_ip_mask()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.index, obj.mask = reader.read_struct(_struct_LLLB3xL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 0)
-        obj.index = reader.read("!B")[0]
-        reader.skip(3)
-        obj.mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -2632,6 +2410,7 @@ class bsn_set_ip_mask(bsn_header):
 bsn_header.subtypes[0] = bsn_set_ip_mask
 
 class bsn_set_l2_table_reply(bsn_header):
+    __slots__ = ['l2_table_enable', 'l2_table_priority', 'status']
     version = 1
     type = 4
     experimenter = 6035143
@@ -2658,39 +2437,24 @@ class bsn_set_l2_table_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!B", self.l2_table_enable))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!H", self.l2_table_priority))
-        packed.append(struct.pack("!L", self.status))
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_struct_LLLB1xHL.pack(self.xid, self.experimenter, self.subtype, self.l2_table_enable, self.l2_table_priority, self.status))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_set_l2_table_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.l2_table_enable, obj.l2_table_priority, obj.status = reader.read_struct(_struct_LLLB1xHL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 24)
-        obj.l2_table_enable = reader.read("!B")[0]
-        reader.skip(1)
-        obj.l2_table_priority = reader.read("!H")[0]
-        obj.status = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -2726,6 +2490,7 @@ class bsn_set_l2_table_reply(bsn_header):
 bsn_header.subtypes[24] = bsn_set_l2_table_reply
 
 class bsn_set_l2_table_request(bsn_header):
+    __slots__ = ['l2_table_enable', 'l2_table_priority']
     version = 1
     type = 4
     experimenter = 6035143
@@ -2748,39 +2513,24 @@ class bsn_set_l2_table_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!B", self.l2_table_enable))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!H", self.l2_table_priority))
-        packed.append('\x00' * 4)
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_struct_LLLB1xH4x.pack(self.xid, self.experimenter, self.subtype, self.l2_table_enable, self.l2_table_priority))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_set_l2_table_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.l2_table_enable, obj.l2_table_priority = reader.read_struct(_struct_LLLB1xH4x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 12)
-        obj.l2_table_enable = reader.read("!B")[0]
-        reader.skip(1)
-        obj.l2_table_priority = reader.read("!H")[0]
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -2812,6 +2562,7 @@ class bsn_set_l2_table_request(bsn_header):
 bsn_header.subtypes[12] = bsn_set_l2_table_request
 
 class bsn_set_mirroring(bsn_header):
+    __slots__ = ['report_mirror_ports']
     version = 1
     type = 4
     experimenter = 6035143
@@ -2830,35 +2581,24 @@ class bsn_set_mirroring(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!B", self.report_mirror_ports))
-        packed.append('\x00' * 3)
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_struct_LLLB3x.pack(self.xid, self.experimenter, self.subtype, self.report_mirror_ports))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_set_mirroring()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.report_mirror_ports = reader.read_struct(_struct_LLLB3x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 3)
-        obj.report_mirror_ports = reader.read("!B")[0]
-        reader.skip(3)
         return obj
 
     def __eq__(self, other):
@@ -2886,6 +2626,7 @@ class bsn_set_mirroring(bsn_header):
 bsn_header.subtypes[3] = bsn_set_mirroring
 
 class bsn_set_pktin_suppression_reply(bsn_header):
+    __slots__ = ['status']
     version = 1
     type = 4
     experimenter = 6035143
@@ -2904,33 +2645,24 @@ class bsn_set_pktin_suppression_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.status))
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_struct_LLLL.pack(self.xid, self.experimenter, self.subtype, self.status))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_set_pktin_suppression_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.status = reader.read_struct(_struct_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 25)
-        obj.status = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -2958,6 +2690,7 @@ class bsn_set_pktin_suppression_reply(bsn_header):
 bsn_header.subtypes[25] = bsn_set_pktin_suppression_reply
 
 class bsn_set_pktin_suppression_request(bsn_header):
+    __slots__ = ['enabled', 'idle_timeout', 'hard_timeout', 'priority', 'cookie']
     version = 1
     type = 4
     experimenter = 6035143
@@ -2992,43 +2725,24 @@ class bsn_set_pktin_suppression_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!B", self.enabled))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append(struct.pack("!H", self.hard_timeout))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!Q", self.cookie))
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_struct_LLLB1xHHHQ.pack(self.xid, self.experimenter, self.subtype, self.enabled, self.idle_timeout, self.hard_timeout, self.priority, self.cookie))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_set_pktin_suppression_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.enabled, obj.idle_timeout, obj.hard_timeout, obj.priority, obj.cookie = reader.read_struct(_struct_LLLB1xHHHQ)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 11)
-        obj.enabled = reader.read("!B")[0]
-        reader.skip(1)
-        obj.idle_timeout = reader.read("!H")[0]
-        obj.hard_timeout = reader.read("!H")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.cookie = reader.read("!Q")[0]
         return obj
 
     def __eq__(self, other):
@@ -3072,6 +2786,7 @@ class bsn_set_pktin_suppression_request(bsn_header):
 bsn_header.subtypes[11] = bsn_set_pktin_suppression_request
 
 class bsn_shell_command(bsn_header):
+    __slots__ = ['service']
     version = 1
     type = 4
     experimenter = 6035143
@@ -3094,34 +2809,25 @@ class bsn_shell_command(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.service))
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_struct_LLLL.pack(self.xid, self.experimenter, self.subtype, self.service))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_shell_command()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.service = reader.read_struct(_struct_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 6)
-        obj.service = reader.read("!L")[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -3154,6 +2860,7 @@ class bsn_shell_command(bsn_header):
 bsn_header.subtypes[6] = bsn_shell_command
 
 class bsn_shell_output(bsn_header):
+    __slots__ = []
     version = 1
     type = 4
     experimenter = 6035143
@@ -3172,31 +2879,24 @@ class bsn_shell_output(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_struct_LLL.pack(self.xid, self.experimenter, self.subtype))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_shell_output()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype = reader.read_struct(_struct_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 7)
         obj.data = str(reader.read_all())
         return obj
@@ -3226,6 +2926,7 @@ class bsn_shell_output(bsn_header):
 bsn_header.subtypes[7] = bsn_shell_output
 
 class bsn_shell_status(bsn_header):
+    __slots__ = ['status']
     version = 1
     type = 4
     experimenter = 6035143
@@ -3244,33 +2945,24 @@ class bsn_shell_status(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.status))
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_struct_LLLL.pack(self.xid, self.experimenter, self.subtype, self.status))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_shell_status()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.status = reader.read_struct(_struct_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 8)
-        obj.status = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -3298,7 +2990,9 @@ class bsn_shell_status(bsn_header):
 bsn_header.subtypes[8] = bsn_shell_status
 
 class experimenter_stats_reply(stats_reply):
+    __slots__ = ['experimenter', 'data']
     subtypes = {}
+    subtype_field = ('!L', 12)
 
     version = 1
     type = 17
@@ -3325,16 +3019,12 @@ class experimenter_stats_reply(stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append(struct.pack("!L", self.experimenter))
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_struct_LHHL.pack(self.xid, self.stats_type, self.flags, self.experimenter))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
@@ -3345,18 +3035,13 @@ class experimenter_stats_reply(stats_reply):
             return subclass.unpack(reader)
 
         obj = experimenter_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 17)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, obj.experimenter = reader.read_struct(_struct_LHHL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        obj.experimenter = reader.read("!L")[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -3390,7 +3075,9 @@ class experimenter_stats_reply(stats_reply):
 stats_reply.subtypes[65535] = experimenter_stats_reply
 
 class bsn_stats_reply(experimenter_stats_reply):
+    __slots__ = ['subtype']
     subtypes = {}
+    subtype_field = ('!L', 20)
 
     version = 1
     type = 19
@@ -3414,17 +3101,11 @@ class bsn_stats_reply(experimenter_stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_struct_LHH4xLL.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
@@ -3435,21 +3116,14 @@ class bsn_stats_reply(experimenter_stats_reply):
             return subclass.unpack(reader)
 
         obj = bsn_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, obj.subtype = reader.read_struct(_struct_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        obj.subtype = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -3478,7 +3152,9 @@ class bsn_stats_reply(experimenter_stats_reply):
 experimenter_stats_reply.subtypes[6035143] = bsn_stats_reply
 
 class experimenter_stats_request(stats_request):
+    __slots__ = ['experimenter', 'data']
     subtypes = {}
+    subtype_field = ('!L', 12)
 
     version = 1
     type = 16
@@ -3505,16 +3181,12 @@ class experimenter_stats_request(stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append(struct.pack("!L", self.experimenter))
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_struct_LHHL.pack(self.xid, self.stats_type, self.flags, self.experimenter))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
@@ -3525,18 +3197,13 @@ class experimenter_stats_request(stats_request):
             return subclass.unpack(reader)
 
         obj = experimenter_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 16)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, obj.experimenter = reader.read_struct(_struct_LHHL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        obj.experimenter = reader.read("!L")[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -3570,7 +3237,9 @@ class experimenter_stats_request(stats_request):
 stats_request.subtypes[65535] = experimenter_stats_request
 
 class bsn_stats_request(experimenter_stats_request):
+    __slots__ = ['subtype']
     subtypes = {}
+    subtype_field = ('!L', 20)
 
     version = 1
     type = 18
@@ -3594,17 +3263,11 @@ class bsn_stats_request(experimenter_stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_struct_LHH4xLL.pack(self.xid, self.stats_type, self.flags, self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
@@ -3615,21 +3278,14 @@ class bsn_stats_request(experimenter_stats_request):
             return subclass.unpack(reader)
 
         obj = bsn_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, obj.subtype = reader.read_struct(_struct_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        obj.subtype = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -3658,6 +3314,7 @@ class bsn_stats_request(experimenter_stats_request):
 experimenter_stats_request.subtypes[6035143] = bsn_stats_request
 
 class bsn_virtual_port_create_reply(bsn_header):
+    __slots__ = ['status', 'vport_no']
     version = 1
     type = 4
     experimenter = 6035143
@@ -3680,35 +3337,24 @@ class bsn_virtual_port_create_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.status))
-        packed.append(struct.pack("!L", self.vport_no))
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_struct_LLLLL.pack(self.xid, self.experimenter, self.subtype, self.status, self.vport_no))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_virtual_port_create_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.status, obj.vport_no = reader.read_struct(_struct_LLLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 16)
-        obj.status = reader.read("!L")[0]
-        obj.vport_no = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -3740,6 +3386,7 @@ class bsn_virtual_port_create_reply(bsn_header):
 bsn_header.subtypes[16] = bsn_virtual_port_create_reply
 
 class bsn_virtual_port_create_request(bsn_header):
+    __slots__ = ['vport']
     version = 1
     type = 4
     experimenter = 6035143
@@ -3758,31 +3405,24 @@ class bsn_virtual_port_create_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_struct_LLL.pack(self.xid, self.experimenter, self.subtype))
         packed.append(self.vport.pack())
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_virtual_port_create_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype = reader.read_struct(_struct_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 15)
         obj.vport = ofp.bsn_vport.unpack(reader)
         return obj
@@ -3812,6 +3452,7 @@ class bsn_virtual_port_create_request(bsn_header):
 bsn_header.subtypes[15] = bsn_virtual_port_create_request
 
 class bsn_virtual_port_remove_reply(bsn_header):
+    __slots__ = ['status']
     version = 1
     type = 4
     experimenter = 6035143
@@ -3830,33 +3471,24 @@ class bsn_virtual_port_remove_reply(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.status))
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_struct_LLLL.pack(self.xid, self.experimenter, self.subtype, self.status))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_virtual_port_remove_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.status = reader.read_struct(_struct_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 26)
-        obj.status = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -3884,6 +3516,7 @@ class bsn_virtual_port_remove_reply(bsn_header):
 bsn_header.subtypes[26] = bsn_virtual_port_remove_reply
 
 class bsn_virtual_port_remove_request(bsn_header):
+    __slots__ = ['vport_no']
     version = 1
     type = 4
     experimenter = 6035143
@@ -3902,33 +3535,24 @@ class bsn_virtual_port_remove_request(bsn_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.vport_no))
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_struct_LLLL.pack(self.xid, self.experimenter, self.subtype, self.vport_no))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_virtual_port_remove_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.vport_no = reader.read_struct(_struct_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 17)
-        obj.vport_no = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -3956,6 +3580,7 @@ class bsn_virtual_port_remove_request(bsn_header):
 bsn_header.subtypes[17] = bsn_virtual_port_remove_request
 
 class desc_stats_reply(stats_reply):
+    __slots__ = ['mfr_desc', 'hw_desc', 'sw_desc', 'serial_num', 'dp_desc']
     version = 1
     type = 17
     stats_type = 0
@@ -3993,35 +3618,28 @@ class desc_stats_reply(stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_struct_LHH.pack(self.xid, self.stats_type, self.flags))
         packed.append(struct.pack("!256s", self.mfr_desc))
         packed.append(struct.pack("!256s", self.hw_desc))
         packed.append(struct.pack("!256s", self.sw_desc))
         packed.append(struct.pack("!32s", self.serial_num))
         packed.append(struct.pack("!256s", self.dp_desc))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = desc_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 17)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags = reader.read_struct(_struct_LHH)
         assert(_stats_type == 0)
-        obj.flags = reader.read("!H")[0]
         obj.mfr_desc = reader.read("!256s")[0].rstrip("\x00")
         obj.hw_desc = reader.read("!256s")[0].rstrip("\x00")
         obj.sw_desc = reader.read("!256s")[0].rstrip("\x00")
@@ -4074,6 +3692,7 @@ class desc_stats_reply(stats_reply):
 stats_reply.subtypes[0] = desc_stats_reply
 
 class desc_stats_request(stats_request):
+    __slots__ = []
     version = 1
     type = 16
     stats_type = 0
@@ -4091,30 +3710,23 @@ class desc_stats_request(stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_struct_LHH.pack(self.xid, self.stats_type, self.flags))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = desc_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 16)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags = reader.read_struct(_struct_LHH)
         assert(_stats_type == 0)
-        obj.flags = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -4142,6 +3754,7 @@ class desc_stats_request(stats_request):
 stats_request.subtypes[0] = desc_stats_request
 
 class echo_reply(message):
+    __slots__ = ['data']
     version = 1
     type = 3
 
@@ -4158,23 +3771,20 @@ class echo_reply(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         packed.append(struct.pack("!L", self.xid))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = echo_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 3)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.xid = reader.read("!L")[0]
@@ -4206,6 +3816,7 @@ class echo_reply(message):
 message.subtypes[3] = echo_reply
 
 class echo_request(message):
+    __slots__ = ['data']
     version = 1
     type = 2
 
@@ -4222,23 +3833,20 @@ class echo_request(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         packed.append(struct.pack("!L", self.xid))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = echo_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 2)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.xid = reader.read("!L")[0]
@@ -4270,6 +3878,7 @@ class echo_request(message):
 message.subtypes[2] = echo_request
 
 class features_reply(message):
+    __slots__ = ['datapath_id', 'n_buffers', 'n_tables', 'capabilities', 'actions', 'ports']
     version = 1
     type = 6
 
@@ -4306,38 +3915,23 @@ class features_reply(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!Q", self.datapath_id))
-        packed.append(struct.pack("!L", self.n_buffers))
-        packed.append(struct.pack("!B", self.n_tables))
-        packed.append('\x00' * 3)
-        packed.append(struct.pack("!L", self.capabilities))
-        packed.append(struct.pack("!L", self.actions))
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_struct_LQLB3xLL.pack(self.xid, self.datapath_id, self.n_buffers, self.n_tables, self.capabilities, self.actions))
         packed.append(loxi.generic_util.pack_list(self.ports))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = features_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 6)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.datapath_id = reader.read("!Q")[0]
-        obj.n_buffers = reader.read("!L")[0]
-        obj.n_tables = reader.read("!B")[0]
-        reader.skip(3)
-        obj.capabilities = reader.read("!L")[0]
-        obj.actions = reader.read("!L")[0]
+        obj.xid, obj.datapath_id, obj.n_buffers, obj.n_tables, obj.capabilities, obj.actions = reader.read_struct(_struct_LQLB3xLL)
         obj.ports = loxi.generic_util.unpack_list(reader, ofp.common.port_desc.unpack)
         return obj
 
@@ -4386,6 +3980,7 @@ class features_reply(message):
 message.subtypes[6] = features_reply
 
 class features_request(message):
+    __slots__ = []
     version = 1
     type = 5
 
@@ -4398,22 +3993,19 @@ class features_request(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         packed.append(struct.pack("!L", self.xid))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = features_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 5)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.xid = reader.read("!L")[0]
@@ -4440,7 +4032,9 @@ class features_request(message):
 message.subtypes[5] = features_request
 
 class flow_mod(message):
+    __slots__ = ['match', 'cookie', '_command', 'idle_timeout', 'hard_timeout', 'priority', 'buffer_id', 'out_port', 'flags', 'actions']
     subtypes = {}
+    subtype_field = ('!H', 56)
 
     version = 1
     type = 14
@@ -4494,22 +4088,18 @@ class flow_mod(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         packed.append(struct.pack("!L", self.xid))
         packed.append(self.match.pack())
         packed.append(struct.pack("!Q", self.cookie))
         packed.append(util.pack_fm_cmd(self._command))
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append(struct.pack("!H", self.hard_timeout))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!L", self.buffer_id))
+        packed.append(_struct_HHHL.pack(self.idle_timeout, self.hard_timeout, self.priority, self.buffer_id))
         packed.append(util.pack_port_no(self.out_port))
         packed.append(struct.pack("!H", self.flags))
         packed.append(loxi.generic_util.pack_list(self.actions))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
@@ -4520,21 +4110,16 @@ class flow_mod(message):
             return subclass.unpack(reader)
 
         obj = flow_mod()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 14)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.xid = reader.read("!L")[0]
         obj.match = ofp.match.unpack(reader)
         obj.cookie = reader.read("!Q")[0]
         obj._command = util.unpack_fm_cmd(reader)
-        obj.idle_timeout = reader.read("!H")[0]
-        obj.hard_timeout = reader.read("!H")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.buffer_id = reader.read("!L")[0]
+        obj.idle_timeout, obj.hard_timeout, obj.priority, obj.buffer_id = reader.read_struct(_struct_HHHL)
         obj.out_port = util.unpack_port_no(reader)
         obj.flags = reader.read("!H")[0]
         obj.actions = loxi.generic_util.unpack_list(reader, ofp.action.action.unpack)
@@ -4598,6 +4183,7 @@ class flow_mod(message):
 message.subtypes[14] = flow_mod
 
 class flow_add(flow_mod):
+    __slots__ = []
     version = 1
     type = 14
     _command = 0
@@ -4647,32 +4233,26 @@ class flow_add(flow_mod):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         packed.append(struct.pack("!L", self.xid))
         packed.append(self.match.pack())
         packed.append(struct.pack("!Q", self.cookie))
         packed.append(util.pack_fm_cmd(self._command))
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append(struct.pack("!H", self.hard_timeout))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!L", self.buffer_id))
+        packed.append(_struct_HHHL.pack(self.idle_timeout, self.hard_timeout, self.priority, self.buffer_id))
         packed.append(util.pack_port_no(self.out_port))
         packed.append(struct.pack("!H", self.flags))
         packed.append(loxi.generic_util.pack_list(self.actions))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = flow_add()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 14)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.xid = reader.read("!L")[0]
@@ -4680,10 +4260,7 @@ class flow_add(flow_mod):
         obj.cookie = reader.read("!Q")[0]
         __command = util.unpack_fm_cmd(reader)
         assert(__command == 0)
-        obj.idle_timeout = reader.read("!H")[0]
-        obj.hard_timeout = reader.read("!H")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.buffer_id = reader.read("!L")[0]
+        obj.idle_timeout, obj.hard_timeout, obj.priority, obj.buffer_id = reader.read_struct(_struct_HHHL)
         obj.out_port = util.unpack_port_no(reader)
         obj.flags = reader.read("!H")[0]
         obj.actions = loxi.generic_util.unpack_list(reader, ofp.action.action.unpack)
@@ -4746,6 +4323,7 @@ class flow_add(flow_mod):
 flow_mod.subtypes[0] = flow_add
 
 class flow_delete(flow_mod):
+    __slots__ = []
     version = 1
     type = 14
     _command = 3
@@ -4795,32 +4373,26 @@ class flow_delete(flow_mod):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         packed.append(struct.pack("!L", self.xid))
         packed.append(self.match.pack())
         packed.append(struct.pack("!Q", self.cookie))
         packed.append(util.pack_fm_cmd(self._command))
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append(struct.pack("!H", self.hard_timeout))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!L", self.buffer_id))
+        packed.append(_struct_HHHL.pack(self.idle_timeout, self.hard_timeout, self.priority, self.buffer_id))
         packed.append(util.pack_port_no(self.out_port))
         packed.append(struct.pack("!H", self.flags))
         packed.append(loxi.generic_util.pack_list(self.actions))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = flow_delete()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 14)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.xid = reader.read("!L")[0]
@@ -4828,10 +4400,7 @@ class flow_delete(flow_mod):
         obj.cookie = reader.read("!Q")[0]
         __command = util.unpack_fm_cmd(reader)
         assert(__command == 3)
-        obj.idle_timeout = reader.read("!H")[0]
-        obj.hard_timeout = reader.read("!H")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.buffer_id = reader.read("!L")[0]
+        obj.idle_timeout, obj.hard_timeout, obj.priority, obj.buffer_id = reader.read_struct(_struct_HHHL)
         obj.out_port = util.unpack_port_no(reader)
         obj.flags = reader.read("!H")[0]
         obj.actions = loxi.generic_util.unpack_list(reader, ofp.action.action.unpack)
@@ -4894,6 +4463,7 @@ class flow_delete(flow_mod):
 flow_mod.subtypes[3] = flow_delete
 
 class flow_delete_strict(flow_mod):
+    __slots__ = []
     version = 1
     type = 14
     _command = 4
@@ -4943,32 +4513,26 @@ class flow_delete_strict(flow_mod):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         packed.append(struct.pack("!L", self.xid))
         packed.append(self.match.pack())
         packed.append(struct.pack("!Q", self.cookie))
         packed.append(util.pack_fm_cmd(self._command))
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append(struct.pack("!H", self.hard_timeout))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!L", self.buffer_id))
+        packed.append(_struct_HHHL.pack(self.idle_timeout, self.hard_timeout, self.priority, self.buffer_id))
         packed.append(util.pack_port_no(self.out_port))
         packed.append(struct.pack("!H", self.flags))
         packed.append(loxi.generic_util.pack_list(self.actions))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = flow_delete_strict()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 14)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.xid = reader.read("!L")[0]
@@ -4976,10 +4540,7 @@ class flow_delete_strict(flow_mod):
         obj.cookie = reader.read("!Q")[0]
         __command = util.unpack_fm_cmd(reader)
         assert(__command == 4)
-        obj.idle_timeout = reader.read("!H")[0]
-        obj.hard_timeout = reader.read("!H")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.buffer_id = reader.read("!L")[0]
+        obj.idle_timeout, obj.hard_timeout, obj.priority, obj.buffer_id = reader.read_struct(_struct_HHHL)
         obj.out_port = util.unpack_port_no(reader)
         obj.flags = reader.read("!H")[0]
         obj.actions = loxi.generic_util.unpack_list(reader, ofp.action.action.unpack)
@@ -5042,6 +4603,7 @@ class flow_delete_strict(flow_mod):
 flow_mod.subtypes[4] = flow_delete_strict
 
 class flow_mod_failed_error_msg(error_msg):
+    __slots__ = ['code', 'data']
     version = 1
     type = 1
     err_type = 3
@@ -5063,31 +4625,24 @@ class flow_mod_failed_error_msg(error_msg):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_struct_LHH.pack(self.xid, self.err_type, self.code))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = flow_mod_failed_error_msg()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        obj.xid, _err_type, obj.code = reader.read_struct(_struct_LHH)
         assert(_err_type == 3)
-        obj.code = reader.read("!H")[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -5120,6 +4675,7 @@ class flow_mod_failed_error_msg(error_msg):
 error_msg.subtypes[3] = flow_mod_failed_error_msg
 
 class flow_modify(flow_mod):
+    __slots__ = []
     version = 1
     type = 14
     _command = 1
@@ -5169,32 +4725,26 @@ class flow_modify(flow_mod):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         packed.append(struct.pack("!L", self.xid))
         packed.append(self.match.pack())
         packed.append(struct.pack("!Q", self.cookie))
         packed.append(util.pack_fm_cmd(self._command))
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append(struct.pack("!H", self.hard_timeout))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!L", self.buffer_id))
+        packed.append(_struct_HHHL.pack(self.idle_timeout, self.hard_timeout, self.priority, self.buffer_id))
         packed.append(util.pack_port_no(self.out_port))
         packed.append(struct.pack("!H", self.flags))
         packed.append(loxi.generic_util.pack_list(self.actions))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = flow_modify()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 14)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.xid = reader.read("!L")[0]
@@ -5202,10 +4752,7 @@ class flow_modify(flow_mod):
         obj.cookie = reader.read("!Q")[0]
         __command = util.unpack_fm_cmd(reader)
         assert(__command == 1)
-        obj.idle_timeout = reader.read("!H")[0]
-        obj.hard_timeout = reader.read("!H")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.buffer_id = reader.read("!L")[0]
+        obj.idle_timeout, obj.hard_timeout, obj.priority, obj.buffer_id = reader.read_struct(_struct_HHHL)
         obj.out_port = util.unpack_port_no(reader)
         obj.flags = reader.read("!H")[0]
         obj.actions = loxi.generic_util.unpack_list(reader, ofp.action.action.unpack)
@@ -5268,6 +4815,7 @@ class flow_modify(flow_mod):
 flow_mod.subtypes[1] = flow_modify
 
 class flow_modify_strict(flow_mod):
+    __slots__ = []
     version = 1
     type = 14
     _command = 2
@@ -5317,32 +4865,26 @@ class flow_modify_strict(flow_mod):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         packed.append(struct.pack("!L", self.xid))
         packed.append(self.match.pack())
         packed.append(struct.pack("!Q", self.cookie))
         packed.append(util.pack_fm_cmd(self._command))
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append(struct.pack("!H", self.hard_timeout))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!L", self.buffer_id))
+        packed.append(_struct_HHHL.pack(self.idle_timeout, self.hard_timeout, self.priority, self.buffer_id))
         packed.append(util.pack_port_no(self.out_port))
         packed.append(struct.pack("!H", self.flags))
         packed.append(loxi.generic_util.pack_list(self.actions))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = flow_modify_strict()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 14)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.xid = reader.read("!L")[0]
@@ -5350,10 +4892,7 @@ class flow_modify_strict(flow_mod):
         obj.cookie = reader.read("!Q")[0]
         __command = util.unpack_fm_cmd(reader)
         assert(__command == 2)
-        obj.idle_timeout = reader.read("!H")[0]
-        obj.hard_timeout = reader.read("!H")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.buffer_id = reader.read("!L")[0]
+        obj.idle_timeout, obj.hard_timeout, obj.priority, obj.buffer_id = reader.read_struct(_struct_HHHL)
         obj.out_port = util.unpack_port_no(reader)
         obj.flags = reader.read("!H")[0]
         obj.actions = loxi.generic_util.unpack_list(reader, ofp.action.action.unpack)
@@ -5416,6 +4955,7 @@ class flow_modify_strict(flow_mod):
 flow_mod.subtypes[2] = flow_modify_strict
 
 class flow_removed(message):
+    __slots__ = ['match', 'cookie', 'priority', 'reason', 'duration_sec', 'duration_nsec', 'idle_timeout', 'packet_count', 'byte_count']
     version = 1
     type = 11
 
@@ -5464,47 +5004,26 @@ class flow_removed(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         packed.append(struct.pack("!L", self.xid))
         packed.append(self.match.pack())
-        packed.append(struct.pack("!Q", self.cookie))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!B", self.reason))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!L", self.duration_sec))
-        packed.append(struct.pack("!L", self.duration_nsec))
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!Q", self.packet_count))
-        packed.append(struct.pack("!Q", self.byte_count))
+        packed.append(_struct_QHB1xLLH2xQQ.pack(self.cookie, self.priority, self.reason, self.duration_sec, self.duration_nsec, self.idle_timeout, self.packet_count, self.byte_count))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = flow_removed()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 11)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.xid = reader.read("!L")[0]
         obj.match = ofp.match.unpack(reader)
-        obj.cookie = reader.read("!Q")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.reason = reader.read("!B")[0]
-        reader.skip(1)
-        obj.duration_sec = reader.read("!L")[0]
-        obj.duration_nsec = reader.read("!L")[0]
-        obj.idle_timeout = reader.read("!H")[0]
-        reader.skip(2)
-        obj.packet_count = reader.read("!Q")[0]
-        obj.byte_count = reader.read("!Q")[0]
+        obj.cookie, obj.priority, obj.reason, obj.duration_sec, obj.duration_nsec, obj.idle_timeout, obj.packet_count, obj.byte_count = reader.read_struct(_struct_QHB1xLLH2xQQ)
         return obj
 
     def __eq__(self, other):
@@ -5564,6 +5083,7 @@ class flow_removed(message):
 message.subtypes[11] = flow_removed
 
 class flow_stats_reply(stats_reply):
+    __slots__ = ['entries']
     version = 1
     type = 17
     stats_type = 1
@@ -5585,31 +5105,24 @@ class flow_stats_reply(stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_struct_LHH.pack(self.xid, self.stats_type, self.flags))
         packed.append(loxi.generic_util.pack_list(self.entries))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = flow_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 17)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags = reader.read_struct(_struct_LHH)
         assert(_stats_type == 1)
-        obj.flags = reader.read("!H")[0]
         obj.entries = loxi.generic_util.unpack_list(reader, ofp.common.flow_stats_entry.unpack)
         return obj
 
@@ -5642,6 +5155,7 @@ class flow_stats_reply(stats_reply):
 stats_reply.subtypes[1] = flow_stats_reply
 
 class flow_stats_request(stats_request):
+    __slots__ = ['match', 'table_id', 'out_port']
     version = 1
     type = 16
     stats_type = 1
@@ -5671,34 +5185,26 @@ class flow_stats_request(stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_struct_LHH.pack(self.xid, self.stats_type, self.flags))
         packed.append(self.match.pack())
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append('\x00' * 1)
+        packed.append(_struct_B1x.pack(self.table_id))
         packed.append(util.pack_port_no(self.out_port))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = flow_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 16)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags = reader.read_struct(_struct_LHH)
         assert(_stats_type == 1)
-        obj.flags = reader.read("!H")[0]
         obj.match = ofp.match.unpack(reader)
         obj.table_id = reader.read("!B")[0]
         reader.skip(1)
@@ -5742,6 +5248,7 @@ class flow_stats_request(stats_request):
 stats_request.subtypes[1] = flow_stats_request
 
 class get_config_reply(message):
+    __slots__ = ['flags', 'miss_send_len']
     version = 1
     type = 8
 
@@ -5762,29 +5269,22 @@ class get_config_reply(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append(struct.pack("!H", self.miss_send_len))
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_struct_LHH.pack(self.xid, self.flags, self.miss_send_len))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = get_config_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 8)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.flags = reader.read("!H")[0]
-        obj.miss_send_len = reader.read("!H")[0]
+        obj.xid, obj.flags, obj.miss_send_len = reader.read_struct(_struct_LHH)
         return obj
 
     def __eq__(self, other):
@@ -5816,6 +5316,7 @@ class get_config_reply(message):
 message.subtypes[8] = get_config_reply
 
 class get_config_request(message):
+    __slots__ = []
     version = 1
     type = 7
 
@@ -5828,22 +5329,19 @@ class get_config_request(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         packed.append(struct.pack("!L", self.xid))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = get_config_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 7)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.xid = reader.read("!L")[0]
@@ -5870,6 +5368,7 @@ class get_config_request(message):
 message.subtypes[7] = get_config_request
 
 class hello(message):
+    __slots__ = []
     version = 1
     type = 0
 
@@ -5882,22 +5381,19 @@ class hello(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         packed.append(struct.pack("!L", self.xid))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = hello()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 0)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.xid = reader.read("!L")[0]
@@ -5924,6 +5420,7 @@ class hello(message):
 message.subtypes[0] = hello
 
 class hello_failed_error_msg(error_msg):
+    __slots__ = ['code', 'data']
     version = 1
     type = 1
     err_type = 0
@@ -5945,31 +5442,24 @@ class hello_failed_error_msg(error_msg):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_struct_LHH.pack(self.xid, self.err_type, self.code))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = hello_failed_error_msg()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        obj.xid, _err_type, obj.code = reader.read_struct(_struct_LHH)
         assert(_err_type == 0)
-        obj.code = reader.read("!H")[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -6002,7 +5492,9 @@ class hello_failed_error_msg(error_msg):
 error_msg.subtypes[0] = hello_failed_error_msg
 
 class nicira_header(experimenter):
+    __slots__ = ['subtype']
     subtypes = {}
+    subtype_field = ('!L', 12)
 
     version = 1
     type = 4
@@ -6021,14 +5513,11 @@ class nicira_header(experimenter):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_struct_LLL.pack(self.xid, self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
@@ -6039,17 +5528,13 @@ class nicira_header(experimenter):
             return subclass.unpack(reader)
 
         obj = nicira_header()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, obj.subtype = reader.read_struct(_struct_LLL)
         assert(_experimenter == 8992)
-        obj.subtype = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -6074,6 +5559,7 @@ class nicira_header(experimenter):
 experimenter.subtypes[8992] = nicira_header
 
 class nicira_controller_role_reply(nicira_header):
+    __slots__ = ['role']
     version = 1
     type = 4
     experimenter = 8992
@@ -6092,33 +5578,24 @@ class nicira_controller_role_reply(nicira_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.role))
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_struct_LLLL.pack(self.xid, self.experimenter, self.subtype, self.role))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = nicira_controller_role_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.role = reader.read_struct(_struct_LLLL)
         assert(_experimenter == 8992)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 11)
-        obj.role = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -6146,6 +5623,7 @@ class nicira_controller_role_reply(nicira_header):
 nicira_header.subtypes[11] = nicira_controller_role_reply
 
 class nicira_controller_role_request(nicira_header):
+    __slots__ = ['role']
     version = 1
     type = 4
     experimenter = 8992
@@ -6164,33 +5642,24 @@ class nicira_controller_role_request(nicira_header):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.role))
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_struct_LLLL.pack(self.xid, self.experimenter, self.subtype, self.role))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = nicira_controller_role_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.role = reader.read_struct(_struct_LLLL)
         assert(_experimenter == 8992)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 10)
-        obj.role = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -6218,6 +5687,7 @@ class nicira_controller_role_request(nicira_header):
 nicira_header.subtypes[10] = nicira_controller_role_request
 
 class packet_in(message):
+    __slots__ = ['buffer_id', 'total_len', 'in_port', 'reason', 'data']
     version = 1
     type = 10
 
@@ -6250,33 +5720,25 @@ class packet_in(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.buffer_id))
-        packed.append(struct.pack("!H", self.total_len))
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_struct_LLH.pack(self.xid, self.buffer_id, self.total_len))
         packed.append(util.pack_port_no(self.in_port))
-        packed.append(struct.pack("!B", self.reason))
-        packed.append('\x00' * 1)
+        packed.append(_struct_B1x.pack(self.reason))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = packet_in()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 10)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.buffer_id = reader.read("!L")[0]
-        obj.total_len = reader.read("!H")[0]
+        obj.xid, obj.buffer_id, obj.total_len = reader.read_struct(_struct_LLH)
         obj.in_port = util.unpack_port_no(reader)
         obj.reason = reader.read("!B")[0]
         reader.skip(1)
@@ -6324,6 +5786,7 @@ class packet_in(message):
 message.subtypes[10] = packet_in
 
 class packet_out(message):
+    __slots__ = ['buffer_id', 'in_port', 'actions', 'data']
     version = 1
     type = 13
 
@@ -6352,32 +5815,27 @@ class packet_out(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.buffer_id))
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_struct_LL.pack(self.xid, self.buffer_id))
         packed.append(util.pack_port_no(self.in_port))
-        packed.append(struct.pack("!H", 0)) # placeholder for actions_len at index 6
+        packed.append(struct.pack("!H", 0)) # placeholder for actions_len at index 4
         packed.append(loxi.generic_util.pack_list(self.actions))
-        packed[6] = struct.pack("!H", len(packed[-1]))
+        packed[4] = struct.pack("!H", len(packed[-1]))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = packet_out()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 13)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.buffer_id = reader.read("!L")[0]
+        obj.xid, obj.buffer_id = reader.read_struct(_struct_LL)
         obj.in_port = util.unpack_port_no(reader)
         _actions_len = reader.read("!H")[0]
         obj.actions = loxi.generic_util.unpack_list(reader.slice(_actions_len), ofp.action.action.unpack)
@@ -6421,6 +5879,7 @@ class packet_out(message):
 message.subtypes[13] = packet_out
 
 class port_mod(message):
+    __slots__ = ['port_no', 'hw_addr', 'config', 'mask', 'advertise']
     version = 1
     type = 15
 
@@ -6453,37 +5912,28 @@ class port_mod(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         packed.append(struct.pack("!L", self.xid))
         packed.append(util.pack_port_no(self.port_no))
         packed.append(struct.pack("!6B", *self.hw_addr))
-        packed.append(struct.pack("!L", self.config))
-        packed.append(struct.pack("!L", self.mask))
-        packed.append(struct.pack("!L", self.advertise))
-        packed.append('\x00' * 4)
+        packed.append(_struct_LLL4x.pack(self.config, self.mask, self.advertise))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = port_mod()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 15)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.xid = reader.read("!L")[0]
         obj.port_no = util.unpack_port_no(reader)
         obj.hw_addr = list(reader.read('!6B'))
-        obj.config = reader.read("!L")[0]
-        obj.mask = reader.read("!L")[0]
-        obj.advertise = reader.read("!L")[0]
-        reader.skip(4)
+        obj.config, obj.mask, obj.advertise = reader.read_struct(_struct_LLL4x)
         return obj
 
     def __eq__(self, other):
@@ -6527,6 +5977,7 @@ class port_mod(message):
 message.subtypes[15] = port_mod
 
 class port_mod_failed_error_msg(error_msg):
+    __slots__ = ['code', 'data']
     version = 1
     type = 1
     err_type = 4
@@ -6548,31 +5999,24 @@ class port_mod_failed_error_msg(error_msg):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_struct_LHH.pack(self.xid, self.err_type, self.code))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = port_mod_failed_error_msg()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        obj.xid, _err_type, obj.code = reader.read_struct(_struct_LHH)
         assert(_err_type == 4)
-        obj.code = reader.read("!H")[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -6605,6 +6049,7 @@ class port_mod_failed_error_msg(error_msg):
 error_msg.subtypes[4] = port_mod_failed_error_msg
 
 class port_stats_reply(stats_reply):
+    __slots__ = ['entries']
     version = 1
     type = 17
     stats_type = 4
@@ -6626,31 +6071,24 @@ class port_stats_reply(stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_struct_LHH.pack(self.xid, self.stats_type, self.flags))
         packed.append(loxi.generic_util.pack_list(self.entries))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = port_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 17)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags = reader.read_struct(_struct_LHH)
         assert(_stats_type == 4)
-        obj.flags = reader.read("!H")[0]
         obj.entries = loxi.generic_util.unpack_list(reader, ofp.common.port_stats_entry.unpack)
         return obj
 
@@ -6683,6 +6121,7 @@ class port_stats_reply(stats_reply):
 stats_reply.subtypes[4] = port_stats_reply
 
 class port_stats_request(stats_request):
+    __slots__ = ['port_no']
     version = 1
     type = 16
     stats_type = 4
@@ -6704,32 +6143,25 @@ class port_stats_request(stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_struct_LHH.pack(self.xid, self.stats_type, self.flags))
         packed.append(util.pack_port_no(self.port_no))
         packed.append('\x00' * 6)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = port_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 16)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags = reader.read_struct(_struct_LHH)
         assert(_stats_type == 4)
-        obj.flags = reader.read("!H")[0]
         obj.port_no = util.unpack_port_no(reader)
         reader.skip(6)
         return obj
@@ -6763,6 +6195,7 @@ class port_stats_request(stats_request):
 stats_request.subtypes[4] = port_stats_request
 
 class port_status(message):
+    __slots__ = ['reason', 'desc']
     version = 1
     type = 12
 
@@ -6783,30 +6216,23 @@ class port_status(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!B", self.reason))
-        packed.append('\x00' * 7)
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_struct_LB7x.pack(self.xid, self.reason))
         packed.append(self.desc.pack())
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = port_status()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 12)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.reason = reader.read("!B")[0]
-        reader.skip(7)
+        obj.xid, obj.reason = reader.read_struct(_struct_LB7x)
         obj.desc = ofp.port_desc.unpack(reader)
         return obj
 
@@ -6839,6 +6265,7 @@ class port_status(message):
 message.subtypes[12] = port_status
 
 class queue_get_config_reply(message):
+    __slots__ = ['port', 'queues']
     version = 1
     type = 21
 
@@ -6859,25 +6286,22 @@ class queue_get_config_reply(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         packed.append(struct.pack("!L", self.xid))
         packed.append(util.pack_port_no(self.port))
         packed.append('\x00' * 6)
         packed.append(loxi.generic_util.pack_list(self.queues))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = queue_get_config_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 21)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.xid = reader.read("!L")[0]
@@ -6915,6 +6339,7 @@ class queue_get_config_reply(message):
 message.subtypes[21] = queue_get_config_reply
 
 class queue_get_config_request(message):
+    __slots__ = ['port']
     version = 1
     type = 20
 
@@ -6931,24 +6356,21 @@ class queue_get_config_request(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
         packed.append(struct.pack("!L", self.xid))
         packed.append(util.pack_port_no(self.port))
         packed.append('\x00' * 2)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = queue_get_config_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 20)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.xid = reader.read("!L")[0]
@@ -6981,6 +6403,7 @@ class queue_get_config_request(message):
 message.subtypes[20] = queue_get_config_request
 
 class queue_op_failed_error_msg(error_msg):
+    __slots__ = ['code', 'data']
     version = 1
     type = 1
     err_type = 5
@@ -7002,31 +6425,24 @@ class queue_op_failed_error_msg(error_msg):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_struct_LHH.pack(self.xid, self.err_type, self.code))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = queue_op_failed_error_msg()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        obj.xid, _err_type, obj.code = reader.read_struct(_struct_LHH)
         assert(_err_type == 5)
-        obj.code = reader.read("!H")[0]
         obj.data = str(reader.read_all())
         return obj
 
@@ -7059,6 +6475,7 @@ class queue_op_failed_error_msg(error_msg):
 error_msg.subtypes[5] = queue_op_failed_error_msg
 
 class queue_stats_reply(stats_reply):
+    __slots__ = ['entries']
     version = 1
     type = 17
     stats_type = 5
@@ -7080,31 +6497,24 @@ class queue_stats_reply(stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_struct_LHH.pack(self.xid, self.stats_type, self.flags))
         packed.append(loxi.generic_util.pack_list(self.entries))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = queue_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 17)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags = reader.read_struct(_struct_LHH)
         assert(_stats_type == 5)
-        obj.flags = reader.read("!H")[0]
         obj.entries = loxi.generic_util.unpack_list(reader, ofp.common.queue_stats_entry.unpack)
         return obj
 
@@ -7137,6 +6547,7 @@ class queue_stats_reply(stats_reply):
 stats_reply.subtypes[5] = queue_stats_reply
 
 class queue_stats_request(stats_request):
+    __slots__ = ['port_no', 'queue_id']
     version = 1
     type = 16
     stats_type = 5
@@ -7162,33 +6573,25 @@ class queue_stats_request(stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_struct_LHH.pack(self.xid, self.stats_type, self.flags))
         packed.append(util.pack_port_no(self.port_no))
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!L", self.queue_id))
+        packed.append(_struct_2xL.pack(self.queue_id))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = queue_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 16)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags = reader.read_struct(_struct_LHH)
         assert(_stats_type == 5)
-        obj.flags = reader.read("!H")[0]
         obj.port_no = util.unpack_port_no(reader)
         reader.skip(2)
         obj.queue_id = reader.read("!L")[0]
@@ -7227,6 +6630,7 @@ class queue_stats_request(stats_request):
 stats_request.subtypes[5] = queue_stats_request
 
 class set_config(message):
+    __slots__ = ['flags', 'miss_send_len']
     version = 1
     type = 9
 
@@ -7247,29 +6651,22 @@ class set_config(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append(struct.pack("!H", self.miss_send_len))
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_struct_LHH.pack(self.xid, self.flags, self.miss_send_len))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = set_config()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 9)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.flags = reader.read("!H")[0]
-        obj.miss_send_len = reader.read("!H")[0]
+        obj.xid, obj.flags, obj.miss_send_len = reader.read_struct(_struct_LHH)
         return obj
 
     def __eq__(self, other):
@@ -7301,6 +6698,7 @@ class set_config(message):
 message.subtypes[9] = set_config
 
 class table_mod(message):
+    __slots__ = ['table_id', 'config']
     version = 1
     type = 22
 
@@ -7321,31 +6719,22 @@ class table_mod(message):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append('\x00' * 3)
-        packed.append(struct.pack("!L", self.config))
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_struct_LB3xL.pack(self.xid, self.table_id, self.config))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = table_mod()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 22)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.table_id = reader.read("!B")[0]
-        reader.skip(3)
-        obj.config = reader.read("!L")[0]
+        obj.xid, obj.table_id, obj.config = reader.read_struct(_struct_LB3xL)
         return obj
 
     def __eq__(self, other):
@@ -7377,6 +6766,7 @@ class table_mod(message):
 message.subtypes[22] = table_mod
 
 class table_stats_reply(stats_reply):
+    __slots__ = ['entries']
     version = 1
     type = 17
     stats_type = 3
@@ -7398,31 +6788,24 @@ class table_stats_reply(stats_reply):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_struct_LHH.pack(self.xid, self.stats_type, self.flags))
         packed.append(loxi.generic_util.pack_list(self.entries))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = table_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 17)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags = reader.read_struct(_struct_LHH)
         assert(_stats_type == 3)
-        obj.flags = reader.read("!H")[0]
         obj.entries = loxi.generic_util.unpack_list(reader, ofp.common.table_stats_entry.unpack)
         return obj
 
@@ -7455,6 +6838,7 @@ class table_stats_reply(stats_reply):
 stats_reply.subtypes[3] = table_stats_reply
 
 class table_stats_request(stats_request):
+    __slots__ = []
     version = 1
     type = 16
     stats_type = 3
@@ -7472,30 +6856,23 @@ class table_stats_request(stats_request):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
+        packed.append(_struct_BB.pack(self.version, self.type))
+        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
+        packed.append(_struct_LHH.pack(self.xid, self.stats_type, self.flags))
         length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
+        packed[1] = struct.pack("!H", length)
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = table_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 16)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags = reader.read_struct(_struct_LHH)
         assert(_stats_type == 3)
-        obj.flags = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -7522,6 +6899,15 @@ class table_stats_request(stats_request):
 
 stats_request.subtypes[3] = table_stats_request
 
+# Flat dispatch table from (type, subtype, ...) to the message class
+_dispatch = loxi.generic_util.flatten_subtypes(message)
+
+def message_class(buf):
+    """
+    Return the most specific message class for the message in buf
+    """
+    return loxi.generic_util.resolve_subtype(_dispatch, buf)
+
 
 def parse_header(buf):
     if len(buf) < 8:
@@ -7534,4 +6920,4 @@ def parse_message(buf):
         raise loxi.ProtocolError("wrong OpenFlow version (expected %d, got %d)" % (ofp.OFP_VERSION, msg_ver))
     if len(buf) != msg_len:
         raise loxi.ProtocolError("incorrect message size")
-    return message.unpack(loxi.generic_util.OFReader(buf))
+    return message_class(buf).unpack(loxi.generic_util.OFReader(buf))
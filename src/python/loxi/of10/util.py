@@ -8,8 +8,6 @@
 import struct
 import loxi
 import const
-import common
-import action
 
 def pretty_mac(mac):
     return ':'.join(["%02x" % x for x in mac])
@@ -6,11 +6,14 @@
 # Automatically generated by LOXI from template init.py
 # Do not modify
 
+import loxi
 import const
-import action
-import message
-import instruction
-import common
 from const import *
-from common import *
 from loxi import ProtocolError
+
+loxi.lazy_protocol(__name__, [
+    'action',
+    'message',
+    'instruction',
+    'common',
+], 'common')
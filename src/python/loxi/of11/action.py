@@ -14,8 +14,21 @@ import loxi.generic_util
 import sys
 ofp = sys.modules['loxi.of11']
 
+# Precompiled layouts of fixed-size field runs
+_struct_B3x = struct.Struct("!B3x")
+_struct_H2x = struct.Struct("!H2x")
+_struct_H6x = struct.Struct("!H6x")
+_struct_HH = struct.Struct("!HH")
+_struct_LH2x4x = struct.Struct("!LH2x4x")
+_struct_LL = struct.Struct("!LL")
+_struct_LL4x = struct.Struct("!LL4x")
+_struct_LLL = struct.Struct("!LLL")
+_struct_LLLLB3x = struct.Struct("!LLLLB3x")
+
 class action(loxi.OFObject):
+    __slots__ = ['type']
     subtypes = {}
+    subtype_field = ('!H', 0)
 
 
     def __init__(self, type=None):
@@ -42,8 +55,7 @@ class action(loxi.OFObject):
             return subclass.unpack(reader)
 
         obj = action()
-        obj.type = reader.read("!H")[0]
-        _len = reader.read("!H")[0]
+        obj.type, _len = reader.read_struct(_struct_HH)
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         reader.skip(4)
@@ -64,7 +76,9 @@ class action(loxi.OFObject):
 
 
 class experimenter(action):
+    __slots__ = ['experimenter', 'data']
     subtypes = {}
+    subtype_field = ('!L', 4)
 
     type = 65535
 
@@ -97,9 +111,8 @@ class experimenter(action):
             return subclass.unpack(reader)
 
         obj = experimenter()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.experimenter = reader.read("!L")[0]
@@ -125,7 +138,9 @@ class experimenter(action):
 action.subtypes[65535] = experimenter
 
 class bsn(experimenter):
+    __slots__ = ['subtype']
     subtypes = {}
+    subtype_field = ('!L', 8)
 
     type = 65535
     experimenter = 6035143
@@ -141,9 +156,7 @@ class bsn(experimenter):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append('\x00' * 4)
+        packed.append(_struct_LL4x.pack(self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -156,15 +169,12 @@ class bsn(experimenter):
             return subclass.unpack(reader)
 
         obj = bsn()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, obj.subtype = reader.read_struct(_struct_LL4x)
         assert(_experimenter == 6035143)
-        obj.subtype = reader.read("!L")[0]
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -183,6 +193,7 @@ class bsn(experimenter):
 experimenter.subtypes[6035143] = bsn
 
 class bsn_checksum(bsn):
+    __slots__ = ['checksum']
     type = 65535
     experimenter = 6035143
     subtype = 4
@@ -198,8 +209,7 @@ class bsn_checksum(bsn):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_struct_LL.pack(self.experimenter, self.subtype))
         packed.append(util.pack_checksum_128(self.checksum))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
@@ -208,14 +218,12 @@ class bsn_checksum(bsn):
     @staticmethod
     def unpack(reader):
         obj = bsn_checksum()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _subtype = reader.read_struct(_struct_LL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 4)
         obj.checksum = util.unpack_checksum_128(reader)
         return obj
@@ -238,6 +246,7 @@ class bsn_checksum(bsn):
 bsn.subtypes[4] = bsn_checksum
 
 class bsn_mirror(bsn):
+    __slots__ = ['dest_port', 'vlan_tag', 'copy_stage']
     type = 65535
     experimenter = 6035143
     subtype = 1
@@ -261,12 +270,7 @@ class bsn_mirror(bsn):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.dest_port))
-        packed.append(struct.pack("!L", self.vlan_tag))
-        packed.append(struct.pack("!B", self.copy_stage))
-        packed.append('\x00' * 3)
+        packed.append(_struct_LLLLB3x.pack(self.experimenter, self.subtype, self.dest_port, self.vlan_tag, self.copy_stage))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -274,19 +278,13 @@ class bsn_mirror(bsn):
     @staticmethod
     def unpack(reader):
         obj = bsn_mirror()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _subtype, obj.dest_port, obj.vlan_tag, obj.copy_stage = reader.read_struct(_struct_LLLLB3x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 1)
-        obj.dest_port = reader.read("!L")[0]
-        obj.vlan_tag = reader.read("!L")[0]
-        obj.copy_stage = reader.read("!B")[0]
-        reader.skip(3)
         return obj
 
     def __eq__(self, other):
@@ -315,6 +313,7 @@ class bsn_mirror(bsn):
 bsn.subtypes[1] = bsn_mirror
 
 class bsn_set_tunnel_dst(bsn):
+    __slots__ = ['dst']
     type = 65535
     experimenter = 6035143
     subtype = 2
@@ -330,9 +329,7 @@ class bsn_set_tunnel_dst(bsn):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.dst))
+        packed.append(_struct_LLL.pack(self.experimenter, self.subtype, self.dst))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -340,16 +337,13 @@ class bsn_set_tunnel_dst(bsn):
     @staticmethod
     def unpack(reader):
         obj = bsn_set_tunnel_dst()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _subtype, obj.dst = reader.read_struct(_struct_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 2)
-        obj.dst = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -370,6 +364,7 @@ class bsn_set_tunnel_dst(bsn):
 bsn.subtypes[2] = bsn_set_tunnel_dst
 
 class copy_ttl_in(action):
+    __slots__ = []
     type = 12
 
     def __init__(self):
@@ -387,9 +382,8 @@ class copy_ttl_in(action):
     @staticmethod
     def unpack(reader):
         obj = copy_ttl_in()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 12)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         reader.skip(4)
@@ -410,6 +404,7 @@ class copy_ttl_in(action):
 action.subtypes[12] = copy_ttl_in
 
 class copy_ttl_out(action):
+    __slots__ = []
     type = 11
 
     def __init__(self):
@@ -427,9 +422,8 @@ class copy_ttl_out(action):
     @staticmethod
     def unpack(reader):
         obj = copy_ttl_out()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 11)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         reader.skip(4)
@@ -450,6 +444,7 @@ class copy_ttl_out(action):
 action.subtypes[11] = copy_ttl_out
 
 class dec_mpls_ttl(action):
+    __slots__ = []
     type = 16
 
     def __init__(self):
@@ -467,9 +462,8 @@ class dec_mpls_ttl(action):
     @staticmethod
     def unpack(reader):
         obj = dec_mpls_ttl()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 16)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         reader.skip(4)
@@ -490,6 +484,7 @@ class dec_mpls_ttl(action):
 action.subtypes[16] = dec_mpls_ttl
 
 class dec_nw_ttl(action):
+    __slots__ = []
     type = 24
 
     def __init__(self):
@@ -507,9 +502,8 @@ class dec_nw_ttl(action):
     @staticmethod
     def unpack(reader):
         obj = dec_nw_ttl()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 24)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         reader.skip(4)
@@ -530,6 +524,7 @@ class dec_nw_ttl(action):
 action.subtypes[24] = dec_nw_ttl
 
 class group(action):
+    __slots__ = ['group_id']
     type = 22
 
     def __init__(self, group_id=None):
@@ -551,9 +546,8 @@ class group(action):
     @staticmethod
     def unpack(reader):
         obj = group()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 22)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.group_id = reader.read("!L")[0]
@@ -577,7 +571,9 @@ class group(action):
 action.subtypes[22] = group
 
 class nicira(experimenter):
+    __slots__ = ['subtype']
     subtypes = {}
+    subtype_field = ('!H', 8)
 
     type = 65535
     experimenter = 8992
@@ -593,10 +589,7 @@ class nicira(experimenter):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!H", self.subtype))
-        packed.append('\x00' * 2)
-        packed.append('\x00' * 4)
+        packed.append(_struct_LH2x4x.pack(self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -609,16 +602,12 @@ class nicira(experimenter):
             return subclass.unpack(reader)
 
         obj = nicira()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, obj.subtype = reader.read_struct(_struct_LH2x4x)
         assert(_experimenter == 8992)
-        obj.subtype = reader.read("!H")[0]
-        reader.skip(2)
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -637,6 +626,7 @@ class nicira(experimenter):
 experimenter.subtypes[8992] = nicira
 
 class nicira_dec_ttl(nicira):
+    __slots__ = []
     type = 65535
     experimenter = 8992
     subtype = 18
@@ -648,10 +638,7 @@ class nicira_dec_ttl(nicira):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!H", self.subtype))
-        packed.append('\x00' * 2)
-        packed.append('\x00' * 4)
+        packed.append(_struct_LH2x4x.pack(self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -659,17 +646,13 @@ class nicira_dec_ttl(nicira):
     @staticmethod
     def unpack(reader):
         obj = nicira_dec_ttl()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _subtype = reader.read_struct(_struct_LH2x4x)
         assert(_experimenter == 8992)
-        _subtype = reader.read("!H")[0]
         assert(_subtype == 18)
-        reader.skip(2)
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -687,6 +670,7 @@ class nicira_dec_ttl(nicira):
 nicira.subtypes[18] = nicira_dec_ttl
 
 class output(action):
+    __slots__ = ['port', 'max_len']
     type = 0
 
     def __init__(self, port=None, max_len=None):
@@ -705,8 +689,7 @@ class output(action):
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
         packed.append(util.pack_port_no(self.port))
-        packed.append(struct.pack("!H", self.max_len))
-        packed.append('\x00' * 6)
+        packed.append(_struct_H6x.pack(self.max_len))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -714,9 +697,8 @@ class output(action):
     @staticmethod
     def unpack(reader):
         obj = output()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 0)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.port = util.unpack_port_no(reader)
@@ -746,6 +728,7 @@ class output(action):
 action.subtypes[0] = output
 
 class pop_mpls(action):
+    __slots__ = ['ethertype']
     type = 20
 
     def __init__(self, ethertype=None):
@@ -759,8 +742,7 @@ class pop_mpls(action):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!H", self.ethertype))
-        packed.append('\x00' * 2)
+        packed.append(_struct_H2x.pack(self.ethertype))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -768,9 +750,8 @@ class pop_mpls(action):
     @staticmethod
     def unpack(reader):
         obj = pop_mpls()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 20)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.ethertype = reader.read("!H")[0]
@@ -795,6 +776,7 @@ class pop_mpls(action):
 action.subtypes[20] = pop_mpls
 
 class pop_vlan(action):
+    __slots__ = []
     type = 18
 
     def __init__(self):
@@ -812,9 +794,8 @@ class pop_vlan(action):
     @staticmethod
     def unpack(reader):
         obj = pop_vlan()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 18)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         reader.skip(4)
@@ -835,6 +816,7 @@ class pop_vlan(action):
 action.subtypes[18] = pop_vlan
 
 class push_mpls(action):
+    __slots__ = ['ethertype']
     type = 19
 
     def __init__(self, ethertype=None):
@@ -848,8 +830,7 @@ class push_mpls(action):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!H", self.ethertype))
-        packed.append('\x00' * 2)
+        packed.append(_struct_H2x.pack(self.ethertype))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -857,9 +838,8 @@ class push_mpls(action):
     @staticmethod
     def unpack(reader):
         obj = push_mpls()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 19)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.ethertype = reader.read("!H")[0]
@@ -884,6 +864,7 @@ class push_mpls(action):
 action.subtypes[19] = push_mpls
 
 class push_vlan(action):
+    __slots__ = ['ethertype']
     type = 17
 
     def __init__(self, ethertype=None):
@@ -897,8 +878,7 @@ class push_vlan(action):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!H", self.ethertype))
-        packed.append('\x00' * 2)
+        packed.append(_struct_H2x.pack(self.ethertype))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -906,9 +886,8 @@ class push_vlan(action):
     @staticmethod
     def unpack(reader):
         obj = push_vlan()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 17)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.ethertype = reader.read("!H")[0]
@@ -933,6 +912,7 @@ class push_vlan(action):
 action.subtypes[17] = push_vlan
 
 class set_dl_dst(action):
+    __slots__ = ['dl_addr']
     type = 4
 
     def __init__(self, dl_addr=None):
@@ -955,9 +935,8 @@ class set_dl_dst(action):
     @staticmethod
     def unpack(reader):
         obj = set_dl_dst()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 4)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.dl_addr = list(reader.read('!6B'))
@@ -982,6 +961,7 @@ class set_dl_dst(action):
 action.subtypes[4] = set_dl_dst
 
 class set_dl_src(action):
+    __slots__ = ['dl_addr']
     type = 3
 
     def __init__(self, dl_addr=None):
@@ -1004,9 +984,8 @@ class set_dl_src(action):
     @staticmethod
     def unpack(reader):
         obj = set_dl_src()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 3)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.dl_addr = list(reader.read('!6B'))
@@ -1031,6 +1010,7 @@ class set_dl_src(action):
 action.subtypes[3] = set_dl_src
 
 class set_mpls_label(action):
+    __slots__ = ['mpls_label']
     type = 13
 
     def __init__(self, mpls_label=None):
@@ -1052,9 +1032,8 @@ class set_mpls_label(action):
     @staticmethod
     def unpack(reader):
         obj = set_mpls_label()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 13)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.mpls_label = reader.read("!L")[0]
@@ -1078,6 +1057,7 @@ class set_mpls_label(action):
 action.subtypes[13] = set_mpls_label
 
 class set_mpls_tc(action):
+    __slots__ = ['mpls_tc']
     type = 14
 
     def __init__(self, mpls_tc=None):
@@ -1091,8 +1071,7 @@ class set_mpls_tc(action):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!B", self.mpls_tc))
-        packed.append('\x00' * 3)
+        packed.append(_struct_B3x.pack(self.mpls_tc))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1100,9 +1079,8 @@ class set_mpls_tc(action):
     @staticmethod
     def unpack(reader):
         obj = set_mpls_tc()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 14)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.mpls_tc = reader.read("!B")[0]
@@ -1127,6 +1105,7 @@ class set_mpls_tc(action):
 action.subtypes[14] = set_mpls_tc
 
 class set_mpls_ttl(action):
+    __slots__ = ['mpls_ttl']
     type = 15
 
     def __init__(self, mpls_ttl=None):
@@ -1140,8 +1119,7 @@ class set_mpls_ttl(action):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!B", self.mpls_ttl))
-        packed.append('\x00' * 3)
+        packed.append(_struct_B3x.pack(self.mpls_ttl))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1149,9 +1127,8 @@ class set_mpls_ttl(action):
     @staticmethod
     def unpack(reader):
         obj = set_mpls_ttl()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 15)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.mpls_ttl = reader.read("!B")[0]
@@ -1176,6 +1153,7 @@ class set_mpls_ttl(action):
 action.subtypes[15] = set_mpls_ttl
 
 class set_nw_dst(action):
+    __slots__ = ['nw_addr']
     type = 6
 
     def __init__(self, nw_addr=None):
@@ -1197,9 +1175,8 @@ class set_nw_dst(action):
     @staticmethod
     def unpack(reader):
         obj = set_nw_dst()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 6)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.nw_addr = reader.read("!L")[0]
@@ -1223,6 +1200,7 @@ class set_nw_dst(action):
 action.subtypes[6] = set_nw_dst
 
 class set_nw_ecn(action):
+    __slots__ = ['nw_ecn']
     type = 8
 
     def __init__(self, nw_ecn=None):
@@ -1236,8 +1214,7 @@ class set_nw_ecn(action):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!B", self.nw_ecn))
-        packed.append('\x00' * 3)
+        packed.append(_struct_B3x.pack(self.nw_ecn))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1245,9 +1222,8 @@ class set_nw_ecn(action):
     @staticmethod
     def unpack(reader):
         obj = set_nw_ecn()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 8)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.nw_ecn = reader.read("!B")[0]
@@ -1272,6 +1248,7 @@ class set_nw_ecn(action):
 action.subtypes[8] = set_nw_ecn
 
 class set_nw_src(action):
+    __slots__ = ['nw_addr']
     type = 5
 
     def __init__(self, nw_addr=None):
@@ -1293,9 +1270,8 @@ class set_nw_src(action):
     @staticmethod
     def unpack(reader):
         obj = set_nw_src()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 5)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.nw_addr = reader.read("!L")[0]
@@ -1319,6 +1295,7 @@ class set_nw_src(action):
 action.subtypes[5] = set_nw_src
 
 class set_nw_tos(action):
+    __slots__ = ['nw_tos']
     type = 7
 
     def __init__(self, nw_tos=None):
@@ -1332,8 +1309,7 @@ class set_nw_tos(action):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!B", self.nw_tos))
-        packed.append('\x00' * 3)
+        packed.append(_struct_B3x.pack(self.nw_tos))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1341,9 +1317,8 @@ class set_nw_tos(action):
     @staticmethod
     def unpack(reader):
         obj = set_nw_tos()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 7)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.nw_tos = reader.read("!B")[0]
@@ -1368,6 +1343,7 @@ class set_nw_tos(action):
 action.subtypes[7] = set_nw_tos
 
 class set_nw_ttl(action):
+    __slots__ = ['nw_ttl']
     type = 23
 
     def __init__(self, nw_ttl=None):
@@ -1381,8 +1357,7 @@ class set_nw_ttl(action):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!B", self.nw_ttl))
-        packed.append('\x00' * 3)
+        packed.append(_struct_B3x.pack(self.nw_ttl))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1390,9 +1365,8 @@ class set_nw_ttl(action):
     @staticmethod
     def unpack(reader):
         obj = set_nw_ttl()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 23)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.nw_ttl = reader.read("!B")[0]
@@ -1417,6 +1391,7 @@ class set_nw_ttl(action):
 action.subtypes[23] = set_nw_ttl
 
 class set_queue(action):
+    __slots__ = ['queue_id']
     type = 21
 
     def __init__(self, queue_id=None):
@@ -1438,9 +1413,8 @@ class set_queue(action):
     @staticmethod
     def unpack(reader):
         obj = set_queue()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 21)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.queue_id = reader.read("!L")[0]
@@ -1464,6 +1438,7 @@ class set_queue(action):
 action.subtypes[21] = set_queue
 
 class set_tp_dst(action):
+    __slots__ = ['tp_port']
     type = 10
 
     def __init__(self, tp_port=None):
@@ -1477,8 +1452,7 @@ class set_tp_dst(action):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!H", self.tp_port))
-        packed.append('\x00' * 2)
+        packed.append(_struct_H2x.pack(self.tp_port))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1486,9 +1460,8 @@ class set_tp_dst(action):
     @staticmethod
     def unpack(reader):
         obj = set_tp_dst()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 10)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.tp_port = reader.read("!H")[0]
@@ -1513,6 +1486,7 @@ class set_tp_dst(action):
 action.subtypes[10] = set_tp_dst
 
 class set_tp_src(action):
+    __slots__ = ['tp_port']
     type = 9
 
     def __init__(self, tp_port=None):
@@ -1526,8 +1500,7 @@ class set_tp_src(action):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!H", self.tp_port))
-        packed.append('\x00' * 2)
+        packed.append(_struct_H2x.pack(self.tp_port))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1535,9 +1508,8 @@ class set_tp_src(action):
     @staticmethod
     def unpack(reader):
         obj = set_tp_src()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 9)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.tp_port = reader.read("!H")[0]
@@ -1562,6 +1534,7 @@ class set_tp_src(action):
 action.subtypes[9] = set_tp_src
 
 class set_vlan_pcp(action):
+    __slots__ = ['vlan_pcp']
     type = 2
 
     def __init__(self, vlan_pcp=None):
@@ -1575,8 +1548,7 @@ class set_vlan_pcp(action):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!B", self.vlan_pcp))
-        packed.append('\x00' * 3)
+        packed.append(_struct_B3x.pack(self.vlan_pcp))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1584,9 +1556,8 @@ class set_vlan_pcp(action):
     @staticmethod
     def unpack(reader):
         obj = set_vlan_pcp()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 2)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.vlan_pcp = reader.read("!B")[0]
@@ -1611,6 +1582,7 @@ class set_vlan_pcp(action):
 action.subtypes[2] = set_vlan_pcp
 
 class set_vlan_vid(action):
+    __slots__ = ['vlan_vid']
     type = 1
 
     def __init__(self, vlan_vid=None):
@@ -1624,8 +1596,7 @@ class set_vlan_vid(action):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!H", self.vlan_vid))
-        packed.append('\x00' * 2)
+        packed.append(_struct_H2x.pack(self.vlan_vid))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1633,9 +1604,8 @@ class set_vlan_vid(action):
     @staticmethod
     def unpack(reader):
         obj = set_vlan_vid()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 1)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.vlan_vid = reader.read("!H")[0]
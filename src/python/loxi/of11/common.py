@@ -14,7 +14,27 @@ import loxi.generic_util
 import sys
 ofp = sys.modules['loxi.of11']
 
+# Precompiled layouts of fixed-size field runs
+_struct_2xLL4xQQ = struct.Struct("!2xLL4xQQ")
+_struct_4xH6x = struct.Struct("!4xH6x")
+_struct_4xQQQQQQQQQQQQ = struct.Struct("!4xQQQQQQQQQQQQ")
+_struct_B1xL = struct.Struct("!B1xL")
+_struct_B1xLLHHH6xQQQ = struct.Struct("!B1xLLHHH6xQQQ")
+_struct_B7x = struct.Struct("!B7x")
+_struct_HB1xHBBLLLLHHLB3xQQ = struct.Struct("!HB1xHBBLLLLHHLB3xQQ")
+_struct_HH = struct.Struct("!HH")
+_struct_L4x = struct.Struct("!L4x")
+_struct_LH = struct.Struct("!LH")
+_struct_LHHHH = struct.Struct("!LHHHH")
+_struct_LL = struct.Struct("!LL")
+_struct_LLBB2xLL = struct.Struct("!LLBB2xLL")
+_struct_LLLLLLLL = struct.Struct("!LLLLLLLL")
+_struct_LLLLLLQQ = struct.Struct("!LLLLLLQQ")
+_struct_LQQQ = struct.Struct("!LQQQ")
+_struct_QQ = struct.Struct("!QQ")
+
 class bsn_interface(loxi.OFObject):
+    __slots__ = ['hw_addr', 'name', 'ipv4_addr', 'ipv4_netmask']
 
     def __init__(self, hw_addr=None, name=None, ipv4_addr=None, ipv4_netmask=None):
         if hw_addr != None:
@@ -40,8 +60,7 @@ class bsn_interface(loxi.OFObject):
         packed.append(struct.pack("!6B", *self.hw_addr))
         packed.append('\x00' * 2)
         packed.append(struct.pack("!16s", self.name))
-        packed.append(struct.pack("!L", self.ipv4_addr))
-        packed.append(struct.pack("!L", self.ipv4_netmask))
+        packed.append(_struct_LL.pack(self.ipv4_addr, self.ipv4_netmask))
         return ''.join(packed)
 
     @staticmethod
@@ -50,8 +69,7 @@ class bsn_interface(loxi.OFObject):
         obj.hw_addr = list(reader.read('!6B'))
         reader.skip(2)
         obj.name = reader.read("!16s")[0].rstrip("\x00")
-        obj.ipv4_addr = reader.read("!L")[0]
-        obj.ipv4_netmask = reader.read("!L")[0]
+        obj.ipv4_addr, obj.ipv4_netmask = reader.read_struct(_struct_LL)
         return obj
 
     def __eq__(self, other):
@@ -83,7 +101,9 @@ class bsn_interface(loxi.OFObject):
 
 
 class bsn_vport(loxi.OFObject):
+    __slots__ = ['type']
     subtypes = {}
+    subtype_field = ('!H', 0)
 
 
     def __init__(self, type=None):
@@ -109,8 +129,7 @@ class bsn_vport(loxi.OFObject):
             return subclass.unpack(reader)
 
         obj = bsn_vport()
-        obj.type = reader.read("!H")[0]
-        _length = reader.read("!H")[0]
+        obj.type, _length = reader.read_struct(_struct_HH)
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         return obj
@@ -130,6 +149,7 @@ class bsn_vport(loxi.OFObject):
 
 
 class bsn_vport_l2gre(bsn_vport):
+    __slots__ = ['flags', 'port_no', 'loopback_port_no', 'local_mac', 'nh_mac', 'src_ip', 'dst_ip', 'dscp', 'ttl', 'vpn', 'rate_limit', 'if_name']
     type = 1
 
     def __init__(self, flags=None, port_no=None, loopback_port_no=None, local_mac=None, nh_mac=None, src_ip=None, dst_ip=None, dscp=None, ttl=None, vpn=None, rate_limit=None, if_name=None):
@@ -192,13 +212,7 @@ class bsn_vport_l2gre(bsn_vport):
         packed.append(util.pack_port_no(self.loopback_port_no))
         packed.append(struct.pack("!6B", *self.local_mac))
         packed.append(struct.pack("!6B", *self.nh_mac))
-        packed.append(struct.pack("!L", self.src_ip))
-        packed.append(struct.pack("!L", self.dst_ip))
-        packed.append(struct.pack("!B", self.dscp))
-        packed.append(struct.pack("!B", self.ttl))
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!L", self.vpn))
-        packed.append(struct.pack("!L", self.rate_limit))
+        packed.append(_struct_LLBB2xLL.pack(self.src_ip, self.dst_ip, self.dscp, self.ttl, self.vpn, self.rate_limit))
         packed.append(struct.pack("!16s", self.if_name))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
@@ -207,9 +221,8 @@ class bsn_vport_l2gre(bsn_vport):
     @staticmethod
     def unpack(reader):
         obj = bsn_vport_l2gre()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.flags = reader.read("!L")[0]
@@ -217,13 +230,7 @@ class bsn_vport_l2gre(bsn_vport):
         obj.loopback_port_no = util.unpack_port_no(reader)
         obj.local_mac = list(reader.read('!6B'))
         obj.nh_mac = list(reader.read('!6B'))
-        obj.src_ip = reader.read("!L")[0]
-        obj.dst_ip = reader.read("!L")[0]
-        obj.dscp = reader.read("!B")[0]
-        obj.ttl = reader.read("!B")[0]
-        reader.skip(2)
-        obj.vpn = reader.read("!L")[0]
-        obj.rate_limit = reader.read("!L")[0]
+        obj.src_ip, obj.dst_ip, obj.dscp, obj.ttl, obj.vpn, obj.rate_limit = reader.read_struct(_struct_LLBB2xLL)
         obj.if_name = reader.read("!16s")[0].rstrip("\x00")
         return obj
 
@@ -289,6 +296,7 @@ class bsn_vport_l2gre(bsn_vport):
 bsn_vport.subtypes[1] = bsn_vport_l2gre
 
 class bsn_vport_q_in_q(bsn_vport):
+    __slots__ = ['port_no', 'ingress_tpid', 'ingress_vlan_id', 'egress_tpid', 'egress_vlan_id', 'if_name']
     type = 0
 
     def __init__(self, port_no=None, ingress_tpid=None, ingress_vlan_id=None, egress_tpid=None, egress_vlan_id=None, if_name=None):
@@ -322,11 +330,7 @@ class bsn_vport_q_in_q(bsn_vport):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.port_no))
-        packed.append(struct.pack("!H", self.ingress_tpid))
-        packed.append(struct.pack("!H", self.ingress_vlan_id))
-        packed.append(struct.pack("!H", self.egress_tpid))
-        packed.append(struct.pack("!H", self.egress_vlan_id))
+        packed.append(_struct_LHHHH.pack(self.port_no, self.ingress_tpid, self.ingress_vlan_id, self.egress_tpid, self.egress_vlan_id))
         packed.append(struct.pack("!16s", self.if_name))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
@@ -335,16 +339,11 @@ class bsn_vport_q_in_q(bsn_vport):
     @staticmethod
     def unpack(reader):
         obj = bsn_vport_q_in_q()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 0)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.port_no = reader.read("!L")[0]
-        obj.ingress_tpid = reader.read("!H")[0]
-        obj.ingress_vlan_id = reader.read("!H")[0]
-        obj.egress_tpid = reader.read("!H")[0]
-        obj.egress_vlan_id = reader.read("!H")[0]
+        obj.port_no, obj.ingress_tpid, obj.ingress_vlan_id, obj.egress_tpid, obj.egress_vlan_id = reader.read_struct(_struct_LHHHH)
         obj.if_name = reader.read("!16s")[0].rstrip("\x00")
         return obj
 
@@ -386,6 +385,7 @@ class bsn_vport_q_in_q(bsn_vport):
 bsn_vport.subtypes[0] = bsn_vport_q_in_q
 
 class bucket(loxi.OFObject):
+    __slots__ = ['weight', 'watch_port', 'watch_group', 'actions']
 
     def __init__(self, weight=None, watch_port=None, watch_group=None, actions=None):
         if weight != None:
@@ -411,8 +411,7 @@ class bucket(loxi.OFObject):
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 0
         packed.append(struct.pack("!H", self.weight))
         packed.append(util.pack_port_no(self.watch_port))
-        packed.append(struct.pack("!L", self.watch_group))
-        packed.append('\x00' * 4)
+        packed.append(_struct_L4x.pack(self.watch_group))
         packed.append(loxi.generic_util.pack_list(self.actions))
         length = sum([len(x) for x in packed])
         packed[0] = struct.pack("!H", length)
@@ -460,6 +459,7 @@ class bucket(loxi.OFObject):
 
 
 class bucket_counter(loxi.OFObject):
+    __slots__ = ['packet_count', 'byte_count']
 
     def __init__(self, packet_count=None, byte_count=None):
         if packet_count != None:
@@ -474,15 +474,13 @@ class bucket_counter(loxi.OFObject):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!Q", self.packet_count))
-        packed.append(struct.pack("!Q", self.byte_count))
+        packed.append(_struct_QQ.pack(self.packet_count, self.byte_count))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bucket_counter()
-        obj.packet_count = reader.read("!Q")[0]
-        obj.byte_count = reader.read("!Q")[0]
+        obj.packet_count, obj.byte_count = reader.read_struct(_struct_QQ)
         return obj
 
     def __eq__(self, other):
@@ -506,6 +504,7 @@ class bucket_counter(loxi.OFObject):
 
 
 class flow_stats_entry(loxi.OFObject):
+    __slots__ = ['table_id', 'duration_sec', 'duration_nsec', 'priority', 'idle_timeout', 'hard_timeout', 'cookie', 'packet_count', 'byte_count', 'match', 'instructions']
 
     def __init__(self, table_id=None, duration_sec=None, duration_nsec=None, priority=None, idle_timeout=None, hard_timeout=None, cookie=None, packet_count=None, byte_count=None, match=None, instructions=None):
         if table_id != None:
@@ -557,17 +556,7 @@ class flow_stats_entry(loxi.OFObject):
     def pack(self):
         packed = []
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 0
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!L", self.duration_sec))
-        packed.append(struct.pack("!L", self.duration_nsec))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append(struct.pack("!H", self.hard_timeout))
-        packed.append('\x00' * 6)
-        packed.append(struct.pack("!Q", self.cookie))
-        packed.append(struct.pack("!Q", self.packet_count))
-        packed.append(struct.pack("!Q", self.byte_count))
+        packed.append(_struct_B1xLLHHH6xQQQ.pack(self.table_id, self.duration_sec, self.duration_nsec, self.priority, self.idle_timeout, self.hard_timeout, self.cookie, self.packet_count, self.byte_count))
         packed.append(self.match.pack())
         packed.append(loxi.generic_util.pack_list(self.instructions))
         length = sum([len(x) for x in packed])
@@ -580,17 +569,7 @@ class flow_stats_entry(loxi.OFObject):
         _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 2)
-        obj.table_id = reader.read("!B")[0]
-        reader.skip(1)
-        obj.duration_sec = reader.read("!L")[0]
-        obj.duration_nsec = reader.read("!L")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.idle_timeout = reader.read("!H")[0]
-        obj.hard_timeout = reader.read("!H")[0]
-        reader.skip(6)
-        obj.cookie = reader.read("!Q")[0]
-        obj.packet_count = reader.read("!Q")[0]
-        obj.byte_count = reader.read("!Q")[0]
+        obj.table_id, obj.duration_sec, obj.duration_nsec, obj.priority, obj.idle_timeout, obj.hard_timeout, obj.cookie, obj.packet_count, obj.byte_count = reader.read_struct(_struct_B1xLLHHH6xQQQ)
         obj.match = ofp.match.unpack(reader)
         obj.instructions = loxi.generic_util.unpack_list(reader, ofp.instruction.instruction.unpack)
         return obj
@@ -652,6 +631,7 @@ class flow_stats_entry(loxi.OFObject):
 
 
 class group_desc_stats_entry(loxi.OFObject):
+    __slots__ = ['group_type', 'group_id', 'buckets']
 
     def __init__(self, group_type=None, group_id=None, buckets=None):
         if group_type != None:
@@ -671,9 +651,7 @@ class group_desc_stats_entry(loxi.OFObject):
     def pack(self):
         packed = []
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 0
-        packed.append(struct.pack("!B", self.group_type))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!L", self.group_id))
+        packed.append(_struct_B1xL.pack(self.group_type, self.group_id))
         packed.append(loxi.generic_util.pack_list(self.buckets))
         length = sum([len(x) for x in packed])
         packed[0] = struct.pack("!H", length)
@@ -685,9 +663,7 @@ class group_desc_stats_entry(loxi.OFObject):
         _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 2)
-        obj.group_type = reader.read("!B")[0]
-        reader.skip(1)
-        obj.group_id = reader.read("!L")[0]
+        obj.group_type, obj.group_id = reader.read_struct(_struct_B1xL)
         obj.buckets = loxi.generic_util.unpack_list(reader, ofp.common.bucket.unpack)
         return obj
 
@@ -716,6 +692,7 @@ class group_desc_stats_entry(loxi.OFObject):
 
 
 class group_stats_entry(loxi.OFObject):
+    __slots__ = ['group_id', 'ref_count', 'packet_count', 'byte_count', 'bucket_stats']
 
     def __init__(self, group_id=None, ref_count=None, packet_count=None, byte_count=None, bucket_stats=None):
         if group_id != None:
@@ -743,12 +720,7 @@ class group_stats_entry(loxi.OFObject):
     def pack(self):
         packed = []
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 0
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!L", self.group_id))
-        packed.append(struct.pack("!L", self.ref_count))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!Q", self.packet_count))
-        packed.append(struct.pack("!Q", self.byte_count))
+        packed.append(_struct_2xLL4xQQ.pack(self.group_id, self.ref_count, self.packet_count, self.byte_count))
         packed.append(loxi.generic_util.pack_list(self.bucket_stats))
         length = sum([len(x) for x in packed])
         packed[0] = struct.pack("!H", length)
@@ -760,12 +732,7 @@ class group_stats_entry(loxi.OFObject):
         _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 2)
-        reader.skip(2)
-        obj.group_id = reader.read("!L")[0]
-        obj.ref_count = reader.read("!L")[0]
-        reader.skip(4)
-        obj.packet_count = reader.read("!Q")[0]
-        obj.byte_count = reader.read("!Q")[0]
+        obj.group_id, obj.ref_count, obj.packet_count, obj.byte_count = reader.read_struct(_struct_2xLL4xQQ)
         obj.bucket_stats = loxi.generic_util.unpack_list(reader, ofp.common.bucket_counter.unpack)
         return obj
 
@@ -802,6 +769,7 @@ class group_stats_entry(loxi.OFObject):
 
 
 class match_v2(loxi.OFObject):
+    __slots__ = ['in_port', 'wildcards', 'eth_src', 'eth_src_mask', 'eth_dst', 'eth_dst_mask', 'vlan_vid', 'vlan_pcp', 'eth_type', 'ip_dscp', 'ip_proto', 'ipv4_src', 'ipv4_src_mask', 'ipv4_dst', 'ipv4_dst_mask', 'tcp_src', 'tcp_dst', 'mpls_label', 'mpls_tc', 'metadata', 'metadata_mask']
     type = 0
 
     def __init__(self, in_port=None, wildcards=None, eth_src=None, eth_src_mask=None, eth_dst=None, eth_dst_mask=None, vlan_vid=None, vlan_pcp=None, eth_type=None, ip_dscp=None, ip_proto=None, ipv4_src=None, ipv4_src_mask=None, ipv4_dst=None, ipv4_dst_mask=None, tcp_src=None, tcp_dst=None, mpls_label=None, mpls_tc=None, metadata=None, metadata_mask=None):
@@ -901,23 +869,7 @@ class match_v2(loxi.OFObject):
         packed.append(struct.pack("!6B", *self.eth_src_mask))
         packed.append(struct.pack("!6B", *self.eth_dst))
         packed.append(struct.pack("!6B", *self.eth_dst_mask))
-        packed.append(struct.pack("!H", self.vlan_vid))
-        packed.append(struct.pack("!B", self.vlan_pcp))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!H", self.eth_type))
-        packed.append(struct.pack("!B", self.ip_dscp))
-        packed.append(struct.pack("!B", self.ip_proto))
-        packed.append(struct.pack("!L", self.ipv4_src))
-        packed.append(struct.pack("!L", self.ipv4_src_mask))
-        packed.append(struct.pack("!L", self.ipv4_dst))
-        packed.append(struct.pack("!L", self.ipv4_dst_mask))
-        packed.append(struct.pack("!H", self.tcp_src))
-        packed.append(struct.pack("!H", self.tcp_dst))
-        packed.append(struct.pack("!L", self.mpls_label))
-        packed.append(struct.pack("!B", self.mpls_tc))
-        packed.append('\x00' * 3)
-        packed.append(struct.pack("!Q", self.metadata))
-        packed.append(struct.pack("!Q", self.metadata_mask))
+        packed.append(_struct_HB1xHBBLLLLHHLB3xQQ.pack(self.vlan_vid, self.vlan_pcp, self.eth_type, self.ip_dscp, self.ip_proto, self.ipv4_src, self.ipv4_src_mask, self.ipv4_dst, self.ipv4_dst_mask, self.tcp_src, self.tcp_dst, self.mpls_label, self.mpls_tc, self.metadata, self.metadata_mask))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -925,9 +877,8 @@ class match_v2(loxi.OFObject):
     @staticmethod
     def unpack(reader):
         obj = match_v2()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 0)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.in_port = util.unpack_port_no(reader)
@@ -936,23 +887,7 @@ class match_v2(loxi.OFObject):
         obj.eth_src_mask = list(reader.read('!6B'))
         obj.eth_dst = list(reader.read('!6B'))
         obj.eth_dst_mask = list(reader.read('!6B'))
-        obj.vlan_vid = reader.read("!H")[0]
-        obj.vlan_pcp = reader.read("!B")[0]
-        reader.skip(1)
-        obj.eth_type = reader.read("!H")[0]
-        obj.ip_dscp = reader.read("!B")[0]
-        obj.ip_proto = reader.read("!B")[0]
-        obj.ipv4_src = reader.read("!L")[0]
-        obj.ipv4_src_mask = reader.read("!L")[0]
-        obj.ipv4_dst = reader.read("!L")[0]
-        obj.ipv4_dst_mask = reader.read("!L")[0]
-        obj.tcp_src = reader.read("!H")[0]
-        obj.tcp_dst = reader.read("!H")[0]
-        obj.mpls_label = reader.read("!L")[0]
-        obj.mpls_tc = reader.read("!B")[0]
-        reader.skip(3)
-        obj.metadata = reader.read("!Q")[0]
-        obj.metadata_mask = reader.read("!Q")[0]
+        obj.vlan_vid, obj.vlan_pcp, obj.eth_type, obj.ip_dscp, obj.ip_proto, obj.ipv4_src, obj.ipv4_src_mask, obj.ipv4_dst, obj.ipv4_dst_mask, obj.tcp_src, obj.tcp_dst, obj.mpls_label, obj.mpls_tc, obj.metadata, obj.metadata_mask = reader.read_struct(_struct_HB1xHBBLLLLHHLB3xQQ)
         return obj
 
     def __eq__(self, other):
@@ -1052,6 +987,7 @@ class match_v2(loxi.OFObject):
 
 
 class packet_queue(loxi.OFObject):
+    __slots__ = ['queue_id', 'properties']
 
     def __init__(self, queue_id=None, properties=None):
         if queue_id != None:
@@ -1077,8 +1013,7 @@ class packet_queue(loxi.OFObject):
     @staticmethod
     def unpack(reader):
         obj = packet_queue()
-        obj.queue_id = reader.read("!L")[0]
-        _len = reader.read("!H")[0]
+        obj.queue_id, _len = reader.read_struct(_struct_LH)
         orig_reader = reader
         reader = orig_reader.slice(_len, 6)
         reader.skip(2)
@@ -1106,6 +1041,7 @@ class packet_queue(loxi.OFObject):
 
 
 class port_desc(loxi.OFObject):
+    __slots__ = ['port_no', 'hw_addr', 'name', 'config', 'state', 'curr', 'advertised', 'supported', 'peer', 'curr_speed', 'max_speed']
 
     def __init__(self, port_no=None, hw_addr=None, name=None, config=None, state=None, curr=None, advertised=None, supported=None, peer=None, curr_speed=None, max_speed=None):
         if port_no != None:
@@ -1161,14 +1097,7 @@ class port_desc(loxi.OFObject):
         packed.append(struct.pack("!6B", *self.hw_addr))
         packed.append('\x00' * 2)
         packed.append(struct.pack("!16s", self.name))
-        packed.append(struct.pack("!L", self.config))
-        packed.append(struct.pack("!L", self.state))
-        packed.append(struct.pack("!L", self.curr))
-        packed.append(struct.pack("!L", self.advertised))
-        packed.append(struct.pack("!L", self.supported))
-        packed.append(struct.pack("!L", self.peer))
-        packed.append(struct.pack("!L", self.curr_speed))
-        packed.append(struct.pack("!L", self.max_speed))
+        packed.append(_struct_LLLLLLLL.pack(self.config, self.state, self.curr, self.advertised, self.supported, self.peer, self.curr_speed, self.max_speed))
         return ''.join(packed)
 
     @staticmethod
@@ -1179,14 +1108,7 @@ class port_desc(loxi.OFObject):
         obj.hw_addr = list(reader.read('!6B'))
         reader.skip(2)
         obj.name = reader.read("!16s")[0].rstrip("\x00")
-        obj.config = reader.read("!L")[0]
-        obj.state = reader.read("!L")[0]
-        obj.curr = reader.read("!L")[0]
-        obj.advertised = reader.read("!L")[0]
-        obj.supported = reader.read("!L")[0]
-        obj.peer = reader.read("!L")[0]
-        obj.curr_speed = reader.read("!L")[0]
-        obj.max_speed = reader.read("!L")[0]
+        obj.config, obj.state, obj.curr, obj.advertised, obj.supported, obj.peer, obj.curr_speed, obj.max_speed = reader.read_struct(_struct_LLLLLLLL)
         return obj
 
     def __eq__(self, other):
@@ -1246,6 +1168,7 @@ class port_desc(loxi.OFObject):
 
 
 class port_stats_entry(loxi.OFObject):
+    __slots__ = ['port_no', 'rx_packets', 'tx_packets', 'rx_bytes', 'tx_bytes', 'rx_dropped', 'tx_dropped', 'rx_errors', 'tx_errors', 'rx_frame_err', 'rx_over_err', 'rx_crc_err', 'collisions']
 
     def __init__(self, port_no=None, rx_packets=None, tx_packets=None, rx_bytes=None, tx_bytes=None, rx_dropped=None, tx_dropped=None, rx_errors=None, tx_errors=None, rx_frame_err=None, rx_over_err=None, rx_crc_err=None, collisions=None):
         if port_no != None:
@@ -1305,38 +1228,14 @@ class port_stats_entry(loxi.OFObject):
     def pack(self):
         packed = []
         packed.append(util.pack_port_no(self.port_no))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!Q", self.rx_packets))
-        packed.append(struct.pack("!Q", self.tx_packets))
-        packed.append(struct.pack("!Q", self.rx_bytes))
-        packed.append(struct.pack("!Q", self.tx_bytes))
-        packed.append(struct.pack("!Q", self.rx_dropped))
-        packed.append(struct.pack("!Q", self.tx_dropped))
-        packed.append(struct.pack("!Q", self.rx_errors))
-        packed.append(struct.pack("!Q", self.tx_errors))
-        packed.append(struct.pack("!Q", self.rx_frame_err))
-        packed.append(struct.pack("!Q", self.rx_over_err))
-        packed.append(struct.pack("!Q", self.rx_crc_err))
-        packed.append(struct.pack("!Q", self.collisions))
+        packed.append(_struct_4xQQQQQQQQQQQQ.pack(self.rx_packets, self.tx_packets, self.rx_bytes, self.tx_bytes, self.rx_dropped, self.tx_dropped, self.rx_errors, self.tx_errors, self.rx_frame_err, self.rx_over_err, self.rx_crc_err, self.collisions))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = port_stats_entry()
         obj.port_no = util.unpack_port_no(reader)
-        reader.skip(4)
-        obj.rx_packets = reader.read("!Q")[0]
-        obj.tx_packets = reader.read("!Q")[0]
-        obj.rx_bytes = reader.read("!Q")[0]
-        obj.tx_bytes = reader.read("!Q")[0]
-        obj.rx_dropped = reader.read("!Q")[0]
-        obj.tx_dropped = reader.read("!Q")[0]
-        obj.rx_errors = reader.read("!Q")[0]
-        obj.tx_errors = reader.read("!Q")[0]
-        obj.rx_frame_err = reader.read("!Q")[0]
-        obj.rx_over_err = reader.read("!Q")[0]
-        obj.rx_crc_err = reader.read("!Q")[0]
-        obj.collisions = reader.read("!Q")[0]
+        obj.rx_packets, obj.tx_packets, obj.rx_bytes, obj.tx_bytes, obj.rx_dropped, obj.tx_dropped, obj.rx_errors, obj.tx_errors, obj.rx_frame_err, obj.rx_over_err, obj.rx_crc_err, obj.collisions = reader.read_struct(_struct_4xQQQQQQQQQQQQ)
         return obj
 
     def __eq__(self, other):
@@ -1404,7 +1303,9 @@ class port_stats_entry(loxi.OFObject):
 
 
 class queue_prop(loxi.OFObject):
+    __slots__ = ['type']
     subtypes = {}
+    subtype_field = ('!H', 0)
 
 
     def __init__(self, type=None):
@@ -1431,8 +1332,7 @@ class queue_prop(loxi.OFObject):
             return subclass.unpack(reader)
 
         obj = queue_prop()
-        obj.type = reader.read("!H")[0]
-        _len = reader.read("!H")[0]
+        obj.type, _len = reader.read_struct(_struct_HH)
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         reader.skip(4)
@@ -1453,6 +1353,7 @@ class queue_prop(loxi.OFObject):
 
 
 class queue_prop_min_rate(queue_prop):
+    __slots__ = ['rate']
     type = 1
 
     def __init__(self, rate=None):
@@ -1466,9 +1367,7 @@ class queue_prop_min_rate(queue_prop):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!H", self.rate))
-        packed.append('\x00' * 6)
+        packed.append(_struct_4xH6x.pack(self.rate))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1476,9 +1375,8 @@ class queue_prop_min_rate(queue_prop):
     @staticmethod
     def unpack(reader):
         obj = queue_prop_min_rate()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 1)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         reader.skip(4)
@@ -1504,6 +1402,7 @@ class queue_prop_min_rate(queue_prop):
 queue_prop.subtypes[1] = queue_prop_min_rate
 
 class queue_stats_entry(loxi.OFObject):
+    __slots__ = ['port_no', 'queue_id', 'tx_bytes', 'tx_packets', 'tx_errors']
 
     def __init__(self, port_no=None, queue_id=None, tx_bytes=None, tx_packets=None, tx_errors=None):
         if port_no != None:
@@ -1531,20 +1430,14 @@ class queue_stats_entry(loxi.OFObject):
     def pack(self):
         packed = []
         packed.append(util.pack_port_no(self.port_no))
-        packed.append(struct.pack("!L", self.queue_id))
-        packed.append(struct.pack("!Q", self.tx_bytes))
-        packed.append(struct.pack("!Q", self.tx_packets))
-        packed.append(struct.pack("!Q", self.tx_errors))
+        packed.append(_struct_LQQQ.pack(self.queue_id, self.tx_bytes, self.tx_packets, self.tx_errors))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = queue_stats_entry()
         obj.port_no = util.unpack_port_no(reader)
-        obj.queue_id = reader.read("!L")[0]
-        obj.tx_bytes = reader.read("!Q")[0]
-        obj.tx_packets = reader.read("!Q")[0]
-        obj.tx_errors = reader.read("!Q")[0]
+        obj.queue_id, obj.tx_bytes, obj.tx_packets, obj.tx_errors = reader.read_struct(_struct_LQQQ)
         return obj
 
     def __eq__(self, other):
@@ -1580,6 +1473,7 @@ class queue_stats_entry(loxi.OFObject):
 
 
 class table_stats_entry(loxi.OFObject):
+    __slots__ = ['table_id', 'name', 'wildcards', 'match', 'instructions', 'write_actions', 'apply_actions', 'config', 'max_entries', 'active_count', 'lookup_count', 'matched_count']
 
     def __init__(self, table_id=None, name=None, wildcards=None, match=None, instructions=None, write_actions=None, apply_actions=None, config=None, max_entries=None, active_count=None, lookup_count=None, matched_count=None):
         if table_id != None:
@@ -1634,19 +1528,11 @@ class table_stats_entry(loxi.OFObject):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append('\x00' * 7)
+        packed.append(_struct_B7x.pack(self.table_id))
         packed.append(struct.pack("!32s", self.name))
         packed.append(util.pack_wc_bmap(self.wildcards))
         packed.append(util.pack_match_bmap(self.match))
-        packed.append(struct.pack("!L", self.instructions))
-        packed.append(struct.pack("!L", self.write_actions))
-        packed.append(struct.pack("!L", self.apply_actions))
-        packed.append(struct.pack("!L", self.config))
-        packed.append(struct.pack("!L", self.max_entries))
-        packed.append(struct.pack("!L", self.active_count))
-        packed.append(struct.pack("!Q", self.lookup_count))
-        packed.append(struct.pack("!Q", self.matched_count))
+        packed.append(_struct_LLLLLLQQ.pack(self.instructions, self.write_actions, self.apply_actions, self.config, self.max_entries, self.active_count, self.lookup_count, self.matched_count))
         return ''.join(packed)
 
     @staticmethod
@@ -1657,14 +1543,7 @@ class table_stats_entry(loxi.OFObject):
         obj.name = reader.read("!32s")[0].rstrip("\x00")
         obj.wildcards = util.unpack_wc_bmap(reader)
         obj.match = util.unpack_match_bmap(reader)
-        obj.instructions = reader.read("!L")[0]
-        obj.write_actions = reader.read("!L")[0]
-        obj.apply_actions = reader.read("!L")[0]
-        obj.config = reader.read("!L")[0]
-        obj.max_entries = reader.read("!L")[0]
-        obj.active_count = reader.read("!L")[0]
-        obj.lookup_count = reader.read("!Q")[0]
-        obj.matched_count = reader.read("!Q")[0]
+        obj.instructions, obj.write_actions, obj.apply_actions, obj.config, obj.max_entries, obj.active_count, obj.lookup_count, obj.matched_count = reader.read_struct(_struct_LLLLLLQQ)
         return obj
 
     def __eq__(self, other):
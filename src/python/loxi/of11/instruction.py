@@ -14,8 +14,15 @@ import loxi.generic_util
 import sys
 ofp = sys.modules['loxi.of11']
 
+# Precompiled layouts of fixed-size field runs
+_struct_4xQQ = struct.Struct("!4xQQ")
+_struct_B3x = struct.Struct("!B3x")
+_struct_HH = struct.Struct("!HH")
+
 class instruction(loxi.OFObject):
+    __slots__ = ['type']
     subtypes = {}
+    subtype_field = ('!H', 0)
 
 
     def __init__(self, type=None):
@@ -42,8 +49,7 @@ class instruction(loxi.OFObject):
             return subclass.unpack(reader)
 
         obj = instruction()
-        obj.type = reader.read("!H")[0]
-        _len = reader.read("!H")[0]
+        obj.type, _len = reader.read_struct(_struct_HH)
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         reader.skip(4)
@@ -64,6 +70,7 @@ class instruction(loxi.OFObject):
 
 
 class apply_actions(instruction):
+    __slots__ = ['actions']
     type = 4
 
     def __init__(self, actions=None):
@@ -86,9 +93,8 @@ class apply_actions(instruction):
     @staticmethod
     def unpack(reader):
         obj = apply_actions()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 4)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         reader.skip(4)
@@ -113,6 +119,7 @@ class apply_actions(instruction):
 instruction.subtypes[4] = apply_actions
 
 class clear_actions(instruction):
+    __slots__ = []
     type = 5
 
     def __init__(self):
@@ -130,9 +137,8 @@ class clear_actions(instruction):
     @staticmethod
     def unpack(reader):
         obj = clear_actions()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 5)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         reader.skip(4)
@@ -153,7 +159,9 @@ class clear_actions(instruction):
 instruction.subtypes[5] = clear_actions
 
 class experimenter(instruction):
+    __slots__ = ['experimenter', 'data']
     subtypes = {}
+    subtype_field = ('!L', 4)
 
     type = 65535
 
@@ -186,9 +194,8 @@ class experimenter(instruction):
             return subclass.unpack(reader)
 
         obj = experimenter()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.experimenter = reader.read("!L")[0]
@@ -214,6 +221,7 @@ class experimenter(instruction):
 instruction.subtypes[65535] = experimenter
 
 class goto_table(instruction):
+    __slots__ = ['table_id']
     type = 1
 
     def __init__(self, table_id=None):
@@ -227,8 +235,7 @@ class goto_table(instruction):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append('\x00' * 3)
+        packed.append(_struct_B3x.pack(self.table_id))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -236,9 +243,8 @@ class goto_table(instruction):
     @staticmethod
     def unpack(reader):
         obj = goto_table()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 1)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.table_id = reader.read("!B")[0]
@@ -263,6 +269,7 @@ class goto_table(instruction):
 instruction.subtypes[1] = goto_table
 
 class write_actions(instruction):
+    __slots__ = ['actions']
     type = 3
 
     def __init__(self, actions=None):
@@ -285,9 +292,8 @@ class write_actions(instruction):
     @staticmethod
     def unpack(reader):
         obj = write_actions()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 3)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         reader.skip(4)
@@ -312,6 +318,7 @@ class write_actions(instruction):
 instruction.subtypes[3] = write_actions
 
 class write_metadata(instruction):
+    __slots__ = ['metadata', 'metadata_mask']
     type = 2
 
     def __init__(self, metadata=None, metadata_mask=None):
@@ -329,9 +336,7 @@ class write_metadata(instruction):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!Q", self.metadata))
-        packed.append(struct.pack("!Q", self.metadata_mask))
+        packed.append(_struct_4xQQ.pack(self.metadata, self.metadata_mask))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -339,14 +344,11 @@ class write_metadata(instruction):
     @staticmethod
     def unpack(reader):
         obj = write_metadata()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 2)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        reader.skip(4)
-        obj.metadata = reader.read("!Q")[0]
-        obj.metadata_mask = reader.read("!Q")[0]
+        obj.metadata, obj.metadata_mask = reader.read_struct(_struct_4xQQ)
         return obj
 
     def __eq__(self, other):
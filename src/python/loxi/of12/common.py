@@ -14,7 +14,26 @@ import loxi.generic_util
 import sys
 ofp = sys.modules['loxi.of12']
 
+# Precompiled layouts of fixed-size field runs
+_struct_2xLL4xQQ = struct.Struct("!2xLL4xQQ")
+_struct_4xH6x = struct.Struct("!4xH6x")
+_struct_4xL4x = struct.Struct("!4xL4x")
+_struct_4xQQQQQQQQQQQQ = struct.Struct("!4xQQQQQQQQQQQQ")
+_struct_B1xL = struct.Struct("!B1xL")
+_struct_B1xLLHHH6xQQQ = struct.Struct("!B1xLLHHH6xQQQ")
+_struct_B7x = struct.Struct("!B7x")
+_struct_HH = struct.Struct("!HH")
+_struct_L4x = struct.Struct("!L4x")
+_struct_LHHHH = struct.Struct("!LHHHH")
+_struct_LL = struct.Struct("!LL")
+_struct_LLBB2xLL = struct.Struct("!LLBB2xLL")
+_struct_LLLLLLLL = struct.Struct("!LLLLLLLL")
+_struct_LLQQQQLLLLQQ = struct.Struct("!LLQQQQLLLLQQ")
+_struct_LQQQ = struct.Struct("!LQQQ")
+_struct_QQ = struct.Struct("!QQ")
+
 class bsn_interface(loxi.OFObject):
+    __slots__ = ['hw_addr', 'name', 'ipv4_addr', 'ipv4_netmask']
 
     def __init__(self, hw_addr=None, name=None, ipv4_addr=None, ipv4_netmask=None):
         if hw_addr != None:
@@ -40,8 +59,7 @@ class bsn_interface(loxi.OFObject):
         packed.append(struct.pack("!6B", *self.hw_addr))
         packed.append('\x00' * 2)
         packed.append(struct.pack("!16s", self.name))
-        packed.append(struct.pack("!L", self.ipv4_addr))
-        packed.append(struct.pack("!L", self.ipv4_netmask))
+        packed.append(_struct_LL.pack(self.ipv4_addr, self.ipv4_netmask))
         return ''.join(packed)
 
     @staticmethod
@@ -50,8 +68,7 @@ class bsn_interface(loxi.OFObject):
         obj.hw_addr = list(reader.read('!6B'))
         reader.skip(2)
         obj.name = reader.read("!16s")[0].rstrip("\x00")
-        obj.ipv4_addr = reader.read("!L")[0]
-        obj.ipv4_netmask = reader.read("!L")[0]
+        obj.ipv4_addr, obj.ipv4_netmask = reader.read_struct(_struct_LL)
         return obj
 
     def __eq__(self, other):
@@ -83,7 +100,9 @@ class bsn_interface(loxi.OFObject):
 
 
 class bsn_vport(loxi.OFObject):
+    __slots__ = ['type']
     subtypes = {}
+    subtype_field = ('!H', 0)
 
 
     def __init__(self, type=None):
@@ -109,8 +128,7 @@ class bsn_vport(loxi.OFObject):
             return subclass.unpack(reader)
 
         obj = bsn_vport()
-        obj.type = reader.read("!H")[0]
-        _length = reader.read("!H")[0]
+        obj.type, _length = reader.read_struct(_struct_HH)
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         return obj
@@ -130,6 +148,7 @@ class bsn_vport(loxi.OFObject):
 
 
 class bsn_vport_l2gre(bsn_vport):
+    __slots__ = ['flags', 'port_no', 'loopback_port_no', 'local_mac', 'nh_mac', 'src_ip', 'dst_ip', 'dscp', 'ttl', 'vpn', 'rate_limit', 'if_name']
     type = 1
 
     def __init__(self, flags=None, port_no=None, loopback_port_no=None, local_mac=None, nh_mac=None, src_ip=None, dst_ip=None, dscp=None, ttl=None, vpn=None, rate_limit=None, if_name=None):
@@ -192,13 +211,7 @@ class bsn_vport_l2gre(bsn_vport):
         packed.append(util.pack_port_no(self.loopback_port_no))
         packed.append(struct.pack("!6B", *self.local_mac))
         packed.append(struct.pack("!6B", *self.nh_mac))
-        packed.append(struct.pack("!L", self.src_ip))
-        packed.append(struct.pack("!L", self.dst_ip))
-        packed.append(struct.pack("!B", self.dscp))
-        packed.append(struct.pack("!B", self.ttl))
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!L", self.vpn))
-        packed.append(struct.pack("!L", self.rate_limit))
+        packed.append(_struct_LLBB2xLL.pack(self.src_ip, self.dst_ip, self.dscp, self.ttl, self.vpn, self.rate_limit))
         packed.append(struct.pack("!16s", self.if_name))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
@@ -207,9 +220,8 @@ class bsn_vport_l2gre(bsn_vport):
     @staticmethod
     def unpack(reader):
         obj = bsn_vport_l2gre()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.flags = reader.read("!L")[0]
@@ -217,13 +229,7 @@ class bsn_vport_l2gre(bsn_vport):
         obj.loopback_port_no = util.unpack_port_no(reader)
         obj.local_mac = list(reader.read('!6B'))
         obj.nh_mac = list(reader.read('!6B'))
-        obj.src_ip = reader.read("!L")[0]
-        obj.dst_ip = reader.read("!L")[0]
-        obj.dscp = reader.read("!B")[0]
-        obj.ttl = reader.read("!B")[0]
-        reader.skip(2)
-        obj.vpn = reader.read("!L")[0]
-        obj.rate_limit = reader.read("!L")[0]
+        obj.src_ip, obj.dst_ip, obj.dscp, obj.ttl, obj.vpn, obj.rate_limit = reader.read_struct(_struct_LLBB2xLL)
         obj.if_name = reader.read("!16s")[0].rstrip("\x00")
         return obj
 
@@ -289,6 +295,7 @@ class bsn_vport_l2gre(bsn_vport):
 bsn_vport.subtypes[1] = bsn_vport_l2gre
 
 class bsn_vport_q_in_q(bsn_vport):
+    __slots__ = ['port_no', 'ingress_tpid', 'ingress_vlan_id', 'egress_tpid', 'egress_vlan_id', 'if_name']
     type = 0
 
     def __init__(self, port_no=None, ingress_tpid=None, ingress_vlan_id=None, egress_tpid=None, egress_vlan_id=None, if_name=None):
@@ -322,11 +329,7 @@ class bsn_vport_q_in_q(bsn_vport):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.port_no))
-        packed.append(struct.pack("!H", self.ingress_tpid))
-        packed.append(struct.pack("!H", self.ingress_vlan_id))
-        packed.append(struct.pack("!H", self.egress_tpid))
-        packed.append(struct.pack("!H", self.egress_vlan_id))
+        packed.append(_struct_LHHHH.pack(self.port_no, self.ingress_tpid, self.ingress_vlan_id, self.egress_tpid, self.egress_vlan_id))
         packed.append(struct.pack("!16s", self.if_name))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
@@ -335,16 +338,11 @@ class bsn_vport_q_in_q(bsn_vport):
     @staticmethod
     def unpack(reader):
         obj = bsn_vport_q_in_q()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 0)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.port_no = reader.read("!L")[0]
-        obj.ingress_tpid = reader.read("!H")[0]
-        obj.ingress_vlan_id = reader.read("!H")[0]
-        obj.egress_tpid = reader.read("!H")[0]
-        obj.egress_vlan_id = reader.read("!H")[0]
+        obj.port_no, obj.ingress_tpid, obj.ingress_vlan_id, obj.egress_tpid, obj.egress_vlan_id = reader.read_struct(_struct_LHHHH)
         obj.if_name = reader.read("!16s")[0].rstrip("\x00")
         return obj
 
@@ -386,6 +384,7 @@ class bsn_vport_q_in_q(bsn_vport):
 bsn_vport.subtypes[0] = bsn_vport_q_in_q
 
 class bucket(loxi.OFObject):
+    __slots__ = ['weight', 'watch_port', 'watch_group', 'actions']
 
     def __init__(self, weight=None, watch_port=None, watch_group=None, actions=None):
         if weight != None:
@@ -411,8 +410,7 @@ class bucket(loxi.OFObject):
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 0
         packed.append(struct.pack("!H", self.weight))
         packed.append(util.pack_port_no(self.watch_port))
-        packed.append(struct.pack("!L", self.watch_group))
-        packed.append('\x00' * 4)
+        packed.append(_struct_L4x.pack(self.watch_group))
         packed.append(loxi.generic_util.pack_list(self.actions))
         length = sum([len(x) for x in packed])
         packed[0] = struct.pack("!H", length)
@@ -460,6 +458,7 @@ class bucket(loxi.OFObject):
 
 
 class bucket_counter(loxi.OFObject):
+    __slots__ = ['packet_count', 'byte_count']
 
     def __init__(self, packet_count=None, byte_count=None):
         if packet_count != None:
@@ -474,15 +473,13 @@ class bucket_counter(loxi.OFObject):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!Q", self.packet_count))
-        packed.append(struct.pack("!Q", self.byte_count))
+        packed.append(_struct_QQ.pack(self.packet_count, self.byte_count))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bucket_counter()
-        obj.packet_count = reader.read("!Q")[0]
-        obj.byte_count = reader.read("!Q")[0]
+        obj.packet_count, obj.byte_count = reader.read_struct(_struct_QQ)
         return obj
 
     def __eq__(self, other):
@@ -506,6 +503,7 @@ class bucket_counter(loxi.OFObject):
 
 
 class flow_stats_entry(loxi.OFObject):
+    __slots__ = ['table_id', 'duration_sec', 'duration_nsec', 'priority', 'idle_timeout', 'hard_timeout', 'cookie', 'packet_count', 'byte_count', 'match', 'instructions']
 
     def __init__(self, table_id=None, duration_sec=None, duration_nsec=None, priority=None, idle_timeout=None, hard_timeout=None, cookie=None, packet_count=None, byte_count=None, match=None, instructions=None):
         if table_id != None:
@@ -557,17 +555,7 @@ class flow_stats_entry(loxi.OFObject):
     def pack(self):
         packed = []
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 0
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!L", self.duration_sec))
-        packed.append(struct.pack("!L", self.duration_nsec))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append(struct.pack("!H", self.hard_timeout))
-        packed.append('\x00' * 6)
-        packed.append(struct.pack("!Q", self.cookie))
-        packed.append(struct.pack("!Q", self.packet_count))
-        packed.append(struct.pack("!Q", self.byte_count))
+        packed.append(_struct_B1xLLHHH6xQQQ.pack(self.table_id, self.duration_sec, self.duration_nsec, self.priority, self.idle_timeout, self.hard_timeout, self.cookie, self.packet_count, self.byte_count))
         packed.append(self.match.pack())
         packed.append(loxi.generic_util.pack_list(self.instructions))
         length = sum([len(x) for x in packed])
@@ -580,17 +568,7 @@ class flow_stats_entry(loxi.OFObject):
         _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 2)
-        obj.table_id = reader.read("!B")[0]
-        reader.skip(1)
-        obj.duration_sec = reader.read("!L")[0]
-        obj.duration_nsec = reader.read("!L")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.idle_timeout = reader.read("!H")[0]
-        obj.hard_timeout = reader.read("!H")[0]
-        reader.skip(6)
-        obj.cookie = reader.read("!Q")[0]
-        obj.packet_count = reader.read("!Q")[0]
-        obj.byte_count = reader.read("!Q")[0]
+        obj.table_id, obj.duration_sec, obj.duration_nsec, obj.priority, obj.idle_timeout, obj.hard_timeout, obj.cookie, obj.packet_count, obj.byte_count = reader.read_struct(_struct_B1xLLHHH6xQQQ)
         obj.match = ofp.match.unpack(reader)
         obj.instructions = loxi.generic_util.unpack_list(reader, ofp.instruction.instruction.unpack)
         return obj
@@ -652,6 +630,7 @@ class flow_stats_entry(loxi.OFObject):
 
 
 class group_desc_stats_entry(loxi.OFObject):
+    __slots__ = ['group_type', 'group_id', 'buckets']
 
     def __init__(self, group_type=None, group_id=None, buckets=None):
         if group_type != None:
@@ -671,9 +650,7 @@ class group_desc_stats_entry(loxi.OFObject):
     def pack(self):
         packed = []
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 0
-        packed.append(struct.pack("!B", self.group_type))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!L", self.group_id))
+        packed.append(_struct_B1xL.pack(self.group_type, self.group_id))
         packed.append(loxi.generic_util.pack_list(self.buckets))
         length = sum([len(x) for x in packed])
         packed[0] = struct.pack("!H", length)
@@ -685,9 +662,7 @@ class group_desc_stats_entry(loxi.OFObject):
         _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 2)
-        obj.group_type = reader.read("!B")[0]
-        reader.skip(1)
-        obj.group_id = reader.read("!L")[0]
+        obj.group_type, obj.group_id = reader.read_struct(_struct_B1xL)
         obj.buckets = loxi.generic_util.unpack_list(reader, ofp.common.bucket.unpack)
         return obj
 
@@ -716,6 +691,7 @@ class group_desc_stats_entry(loxi.OFObject):
 
 
 class group_stats_entry(loxi.OFObject):
+    __slots__ = ['group_id', 'ref_count', 'packet_count', 'byte_count', 'bucket_stats']
 
     def __init__(self, group_id=None, ref_count=None, packet_count=None, byte_count=None, bucket_stats=None):
         if group_id != None:
@@ -743,12 +719,7 @@ class group_stats_entry(loxi.OFObject):
     def pack(self):
         packed = []
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 0
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!L", self.group_id))
-        packed.append(struct.pack("!L", self.ref_count))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!Q", self.packet_count))
-        packed.append(struct.pack("!Q", self.byte_count))
+        packed.append(_struct_2xLL4xQQ.pack(self.group_id, self.ref_count, self.packet_count, self.byte_count))
         packed.append(loxi.generic_util.pack_list(self.bucket_stats))
         length = sum([len(x) for x in packed])
         packed[0] = struct.pack("!H", length)
@@ -760,12 +731,7 @@ class group_stats_entry(loxi.OFObject):
         _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 2)
-        reader.skip(2)
-        obj.group_id = reader.read("!L")[0]
-        obj.ref_count = reader.read("!L")[0]
-        reader.skip(4)
-        obj.packet_count = reader.read("!Q")[0]
-        obj.byte_count = reader.read("!Q")[0]
+        obj.group_id, obj.ref_count, obj.packet_count, obj.byte_count = reader.read_struct(_struct_2xLL4xQQ)
         obj.bucket_stats = loxi.generic_util.unpack_list(reader, ofp.common.bucket_counter.unpack)
         return obj
 
@@ -802,6 +768,7 @@ class group_stats_entry(loxi.OFObject):
 
 
 class match_v3(loxi.OFObject):
+    __slots__ = ['_oxm_list', '_oxm_raw', '_oxm_index', '_oxm_key']
     type = 1
 
     def __init__(self, oxm_list=None):
@@ -811,11 +778,78 @@ class match_v3(loxi.OFObject):
             self.oxm_list = []
         return
 
+    # A parsed match keeps its OXM TLVs as raw bytes; the list of oxm
+    # objects is only decoded when oxm_list is first accessed.
+    @property
+    def oxm_list(self):
+        if self._oxm_list is None:
+            reader = loxi.generic_util.OFReader(self._oxm_raw)
+            self._oxm_list = loxi.generic_util.unpack_list(reader, ofp.oxm.oxm.unpack)
+            self._oxm_raw = None
+            self._oxm_index = None
+            self._oxm_key = None
+        return self._oxm_list
+
+    @oxm_list.setter
+    def oxm_list(self, value):
+        self._oxm_list = value
+        self._oxm_raw = None
+        self._oxm_index = None
+        self._oxm_key = None
+
+    def get(self, oxm_class):
+        """
+        Return the first OXM of the given class, or None
+
+        An undecoded match only decodes the requested TLV.
+        """
+        if self._oxm_list is not None:
+            for oxm in self._oxm_list:
+                if type(oxm) == oxm_class:
+                    return oxm
+            return None
+        if self._oxm_index is None:
+            self._oxm_index = {}
+            for (type_len, start, end) in loxi.generic_util.oxm_spans(self._oxm_raw):
+                self._oxm_index.setdefault(type_len, (start, end))
+        span = self._oxm_index.get(oxm_class.type_len)
+        if span is None:
+            return None
+        (start, end) = span
+        oxm = ofp.oxm.oxm.unpack(loxi.generic_util.OFReader(self._oxm_raw, start, end - start))
+        if type(oxm) != oxm_class:
+            return None
+        return oxm
+
+    def canonical(self):
+        """
+        Return the OXM TLVs sorted and concatenated
+
+        Two matches with the same fields in any order have the same
+        canonical form. It is cached (along with its hash) while the match
+        is undecoded and so cannot change.
+        """
+        if self._oxm_list is None:
+            if self._oxm_key is None:
+                raw = self._oxm_raw
+                tlvs = [raw[start:end] for (_, start, end) in loxi.generic_util.oxm_spans(raw)]
+                tlvs.sort()
+                self._oxm_key = ''.join(tlvs)
+            return self._oxm_key
+        tlvs = [x.pack() for x in self._oxm_list]
+        tlvs.sort()
+        return ''.join(tlvs)
+
     def pack(self):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(loxi.generic_util.pack_list(self.oxm_list))
+        if loxi.packing_canonical():
+            packed.append(self.canonical())
+        elif self._oxm_list is None:
+            packed.append(self._oxm_raw)
+        else:
+            packed.append(loxi.generic_util.pack_list(self._oxm_list))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         packed.append(loxi.generic_util.pad_to(8, length))
@@ -824,20 +858,24 @@ class match_v3(loxi.OFObject):
     @staticmethod
     def unpack(reader):
         obj = match_v3()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.oxm_list = loxi.generic_util.unpack_list(reader, ofp.oxm.oxm.unpack)
+        obj._oxm_list = None
+        obj._oxm_raw = reader.read_all()
+        obj._oxm_key = None
         orig_reader.skip_align()
         return obj
 
     def __eq__(self, other):
         if type(self) != type(other): return False
-        if self.oxm_list != other.oxm_list: return False
+        if self.canonical() != other.canonical(): return False
         return True
 
+    def __hash__(self):
+        return hash(self.canonical())
+
     def pretty_print(self, q):
         q.text("match_v3 {")
         with q.group():
@@ -850,6 +888,7 @@ class match_v3(loxi.OFObject):
 
 
 class packet_queue(loxi.OFObject):
+    __slots__ = ['queue_id', 'port', 'properties']
 
     def __init__(self, queue_id=None, port=None, properties=None):
         if queue_id != None:
@@ -914,6 +953,7 @@ class packet_queue(loxi.OFObject):
 
 
 class port_desc(loxi.OFObject):
+    __slots__ = ['port_no', 'hw_addr', 'name', 'config', 'state', 'curr', 'advertised', 'supported', 'peer', 'curr_speed', 'max_speed']
 
     def __init__(self, port_no=None, hw_addr=None, name=None, config=None, state=None, curr=None, advertised=None, supported=None, peer=None, curr_speed=None, max_speed=None):
         if port_no != None:
@@ -969,14 +1009,7 @@ class port_desc(loxi.OFObject):
         packed.append(struct.pack("!6B", *self.hw_addr))
         packed.append('\x00' * 2)
         packed.append(struct.pack("!16s", self.name))
-        packed.append(struct.pack("!L", self.config))
-        packed.append(struct.pack("!L", self.state))
-        packed.append(struct.pack("!L", self.curr))
-        packed.append(struct.pack("!L", self.advertised))
-        packed.append(struct.pack("!L", self.supported))
-        packed.append(struct.pack("!L", self.peer))
-        packed.append(struct.pack("!L", self.curr_speed))
-        packed.append(struct.pack("!L", self.max_speed))
+        packed.append(_struct_LLLLLLLL.pack(self.config, self.state, self.curr, self.advertised, self.supported, self.peer, self.curr_speed, self.max_speed))
         return ''.join(packed)
 
     @staticmethod
@@ -987,14 +1020,7 @@ class port_desc(loxi.OFObject):
         obj.hw_addr = list(reader.read('!6B'))
         reader.skip(2)
         obj.name = reader.read("!16s")[0].rstrip("\x00")
-        obj.config = reader.read("!L")[0]
-        obj.state = reader.read("!L")[0]
-        obj.curr = reader.read("!L")[0]
-        obj.advertised = reader.read("!L")[0]
-        obj.supported = reader.read("!L")[0]
-        obj.peer = reader.read("!L")[0]
-        obj.curr_speed = reader.read("!L")[0]
-        obj.max_speed = reader.read("!L")[0]
+        obj.config, obj.state, obj.curr, obj.advertised, obj.supported, obj.peer, obj.curr_speed, obj.max_speed = reader.read_struct(_struct_LLLLLLLL)
         return obj
 
     def __eq__(self, other):
@@ -1054,6 +1080,7 @@ class port_desc(loxi.OFObject):
 
 
 class port_stats_entry(loxi.OFObject):
+    __slots__ = ['port_no', 'rx_packets', 'tx_packets', 'rx_bytes', 'tx_bytes', 'rx_dropped', 'tx_dropped', 'rx_errors', 'tx_errors', 'rx_frame_err', 'rx_over_err', 'rx_crc_err', 'collisions']
 
     def __init__(self, port_no=None, rx_packets=None, tx_packets=None, rx_bytes=None, tx_bytes=None, rx_dropped=None, tx_dropped=None, rx_errors=None, tx_errors=None, rx_frame_err=None, rx_over_err=None, rx_crc_err=None, collisions=None):
         if port_no != None:
@@ -1113,38 +1140,14 @@ class port_stats_entry(loxi.OFObject):
     def pack(self):
         packed = []
         packed.append(util.pack_port_no(self.port_no))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!Q", self.rx_packets))
-        packed.append(struct.pack("!Q", self.tx_packets))
-        packed.append(struct.pack("!Q", self.rx_bytes))
-        packed.append(struct.pack("!Q", self.tx_bytes))
-        packed.append(struct.pack("!Q", self.rx_dropped))
-        packed.append(struct.pack("!Q", self.tx_dropped))
-        packed.append(struct.pack("!Q", self.rx_errors))
-        packed.append(struct.pack("!Q", self.tx_errors))
-        packed.append(struct.pack("!Q", self.rx_frame_err))
-        packed.append(struct.pack("!Q", self.rx_over_err))
-        packed.append(struct.pack("!Q", self.rx_crc_err))
-        packed.append(struct.pack("!Q", self.collisions))
+        packed.append(_struct_4xQQQQQQQQQQQQ.pack(self.rx_packets, self.tx_packets, self.rx_bytes, self.tx_bytes, self.rx_dropped, self.tx_dropped, self.rx_errors, self.tx_errors, self.rx_frame_err, self.rx_over_err, self.rx_crc_err, self.collisions))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = port_stats_entry()
         obj.port_no = util.unpack_port_no(reader)
-        reader.skip(4)
-        obj.rx_packets = reader.read("!Q")[0]
-        obj.tx_packets = reader.read("!Q")[0]
-        obj.rx_bytes = reader.read("!Q")[0]
-        obj.tx_bytes = reader.read("!Q")[0]
-        obj.rx_dropped = reader.read("!Q")[0]
-        obj.tx_dropped = reader.read("!Q")[0]
-        obj.rx_errors = reader.read("!Q")[0]
-        obj.tx_errors = reader.read("!Q")[0]
-        obj.rx_frame_err = reader.read("!Q")[0]
-        obj.rx_over_err = reader.read("!Q")[0]
-        obj.rx_crc_err = reader.read("!Q")[0]
-        obj.collisions = reader.read("!Q")[0]
+        obj.rx_packets, obj.tx_packets, obj.rx_bytes, obj.tx_bytes, obj.rx_dropped, obj.tx_dropped, obj.rx_errors, obj.tx_errors, obj.rx_frame_err, obj.rx_over_err, obj.rx_crc_err, obj.collisions = reader.read_struct(_struct_4xQQQQQQQQQQQQ)
         return obj
 
     def __eq__(self, other):
@@ -1212,7 +1215,9 @@ class port_stats_entry(loxi.OFObject):
 
 
 class queue_prop(loxi.OFObject):
+    __slots__ = ['type']
     subtypes = {}
+    subtype_field = ('!H', 0)
 
 
     def __init__(self, type=None):
@@ -1239,8 +1244,7 @@ class queue_prop(loxi.OFObject):
             return subclass.unpack(reader)
 
         obj = queue_prop()
-        obj.type = reader.read("!H")[0]
-        _len = reader.read("!H")[0]
+        obj.type, _len = reader.read_struct(_struct_HH)
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         reader.skip(4)
@@ -1261,7 +1265,9 @@ class queue_prop(loxi.OFObject):
 
 
 class queue_prop_experimenter(queue_prop):
+    __slots__ = ['experimenter', 'data']
     subtypes = {}
+    subtype_field = ('!L', 8)
 
     type = 65535
 
@@ -1280,9 +1286,7 @@ class queue_prop_experimenter(queue_prop):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append('\x00' * 4)
+        packed.append(_struct_4xL4x.pack(self.experimenter))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
@@ -1296,9 +1300,8 @@ class queue_prop_experimenter(queue_prop):
             return subclass.unpack(reader)
 
         obj = queue_prop_experimenter()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         reader.skip(4)
@@ -1326,6 +1329,7 @@ class queue_prop_experimenter(queue_prop):
 queue_prop.subtypes[65535] = queue_prop_experimenter
 
 class queue_prop_max_rate(queue_prop):
+    __slots__ = ['rate']
     type = 2
 
     def __init__(self, rate=None):
@@ -1339,9 +1343,7 @@ class queue_prop_max_rate(queue_prop):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!H", self.rate))
-        packed.append('\x00' * 6)
+        packed.append(_struct_4xH6x.pack(self.rate))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1349,9 +1351,8 @@ class queue_prop_max_rate(queue_prop):
     @staticmethod
     def unpack(reader):
         obj = queue_prop_max_rate()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 2)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         reader.skip(4)
@@ -1377,6 +1378,7 @@ class queue_prop_max_rate(queue_prop):
 queue_prop.subtypes[2] = queue_prop_max_rate
 
 class queue_prop_min_rate(queue_prop):
+    __slots__ = ['rate']
     type = 1
 
     def __init__(self, rate=None):
@@ -1390,9 +1392,7 @@ class queue_prop_min_rate(queue_prop):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!H", self.rate))
-        packed.append('\x00' * 6)
+        packed.append(_struct_4xH6x.pack(self.rate))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1400,9 +1400,8 @@ class queue_prop_min_rate(queue_prop):
     @staticmethod
     def unpack(reader):
         obj = queue_prop_min_rate()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 1)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         reader.skip(4)
@@ -1428,6 +1427,7 @@ class queue_prop_min_rate(queue_prop):
 queue_prop.subtypes[1] = queue_prop_min_rate
 
 class queue_stats_entry(loxi.OFObject):
+    __slots__ = ['port_no', 'queue_id', 'tx_bytes', 'tx_packets', 'tx_errors']
 
     def __init__(self, port_no=None, queue_id=None, tx_bytes=None, tx_packets=None, tx_errors=None):
         if port_no != None:
@@ -1455,20 +1455,14 @@ class queue_stats_entry(loxi.OFObject):
     def pack(self):
         packed = []
         packed.append(util.pack_port_no(self.port_no))
-        packed.append(struct.pack("!L", self.queue_id))
-        packed.append(struct.pack("!Q", self.tx_bytes))
-        packed.append(struct.pack("!Q", self.tx_packets))
-        packed.append(struct.pack("!Q", self.tx_errors))
+        packed.append(_struct_LQQQ.pack(self.queue_id, self.tx_bytes, self.tx_packets, self.tx_errors))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = queue_stats_entry()
         obj.port_no = util.unpack_port_no(reader)
-        obj.queue_id = reader.read("!L")[0]
-        obj.tx_bytes = reader.read("!Q")[0]
-        obj.tx_packets = reader.read("!Q")[0]
-        obj.tx_errors = reader.read("!Q")[0]
+        obj.queue_id, obj.tx_bytes, obj.tx_packets, obj.tx_errors = reader.read_struct(_struct_LQQQ)
         return obj
 
     def __eq__(self, other):
@@ -1504,6 +1498,7 @@ class queue_stats_entry(loxi.OFObject):
 
 
 class table_stats_entry(loxi.OFObject):
+    __slots__ = ['table_id', 'name', 'match', 'wildcards', 'write_actions', 'apply_actions', 'write_setfields', 'apply_setfields', 'metadata_match', 'metadata_write', 'instructions', 'config', 'max_entries', 'active_count', 'lookup_count', 'matched_count']
 
     def __init__(self, table_id=None, name=None, match=None, wildcards=None, write_actions=None, apply_actions=None, write_setfields=None, apply_setfields=None, metadata_match=None, metadata_write=None, instructions=None, config=None, max_entries=None, active_count=None, lookup_count=None, matched_count=None):
         if table_id != None:
@@ -1574,23 +1569,11 @@ class table_stats_entry(loxi.OFObject):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append('\x00' * 7)
+        packed.append(_struct_B7x.pack(self.table_id))
         packed.append(struct.pack("!32s", self.name))
         packed.append(util.pack_match_bmap(self.match))
         packed.append(util.pack_wc_bmap(self.wildcards))
-        packed.append(struct.pack("!L", self.write_actions))
-        packed.append(struct.pack("!L", self.apply_actions))
-        packed.append(struct.pack("!Q", self.write_setfields))
-        packed.append(struct.pack("!Q", self.apply_setfields))
-        packed.append(struct.pack("!Q", self.metadata_match))
-        packed.append(struct.pack("!Q", self.metadata_write))
-        packed.append(struct.pack("!L", self.instructions))
-        packed.append(struct.pack("!L", self.config))
-        packed.append(struct.pack("!L", self.max_entries))
-        packed.append(struct.pack("!L", self.active_count))
-        packed.append(struct.pack("!Q", self.lookup_count))
-        packed.append(struct.pack("!Q", self.matched_count))
+        packed.append(_struct_LLQQQQLLLLQQ.pack(self.write_actions, self.apply_actions, self.write_setfields, self.apply_setfields, self.metadata_match, self.metadata_write, self.instructions, self.config, self.max_entries, self.active_count, self.lookup_count, self.matched_count))
         return ''.join(packed)
 
     @staticmethod
@@ -1601,18 +1584,7 @@ class table_stats_entry(loxi.OFObject):
         obj.name = reader.read("!32s")[0].rstrip("\x00")
         obj.match = util.unpack_match_bmap(reader)
         obj.wildcards = util.unpack_wc_bmap(reader)
-        obj.write_actions = reader.read("!L")[0]
-        obj.apply_actions = reader.read("!L")[0]
-        obj.write_setfields = reader.read("!Q")[0]
-        obj.apply_setfields = reader.read("!Q")[0]
-        obj.metadata_match = reader.read("!Q")[0]
-        obj.metadata_write = reader.read("!Q")[0]
-        obj.instructions = reader.read("!L")[0]
-        obj.config = reader.read("!L")[0]
-        obj.max_entries = reader.read("!L")[0]
-        obj.active_count = reader.read("!L")[0]
-        obj.lookup_count = reader.read("!Q")[0]
-        obj.matched_count = reader.read("!Q")[0]
+        obj.write_actions, obj.apply_actions, obj.write_setfields, obj.apply_setfields, obj.metadata_match, obj.metadata_write, obj.instructions, obj.config, obj.max_entries, obj.active_count, obj.lookup_count, obj.matched_count = reader.read_struct(_struct_LLQQQQLLLLQQ)
         return obj
 
     def __eq__(self, other):
@@ -14,8 +14,20 @@ import loxi.generic_util
 import sys
 ofp = sys.modules['loxi.of12']
 
+# Precompiled layouts of fixed-size field runs
+_struct_LB = struct.Struct("!LB")
+_struct_LBB = struct.Struct("!LBB")
+_struct_LH = struct.Struct("!LH")
+_struct_LHH = struct.Struct("!LHH")
+_struct_LL = struct.Struct("!LL")
+_struct_LLL = struct.Struct("!LLL")
+_struct_LQ = struct.Struct("!LQ")
+_struct_LQQ = struct.Struct("!LQQ")
+
 class oxm(loxi.OFObject):
+    __slots__ = ['type_len']
     subtypes = {}
+    subtype_field = ('!L', 0)
 
 
     def __init__(self, type_len=None):
@@ -56,6 +68,7 @@ class oxm(loxi.OFObject):
 
 
 class arp_op(oxm):
+    __slots__ = ['value']
     type_len = 2147494402
 
     def __init__(self, value=None):
@@ -67,16 +80,14 @@ class arp_op(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_struct_LH.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = arp_op()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LH)
         assert(_type_len == 2147494402)
-        obj.value = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -97,6 +108,7 @@ class arp_op(oxm):
 oxm.subtypes[2147494402] = arp_op
 
 class arp_op_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147494660
 
     def __init__(self, value=None, value_mask=None):
@@ -112,18 +124,14 @@ class arp_op_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        packed.append(struct.pack("!H", self.value_mask))
+        packed.append(_struct_LHH.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = arp_op_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LHH)
         assert(_type_len == 2147494660)
-        obj.value = reader.read("!H")[0]
-        obj.value_mask = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -148,6 +156,7 @@ class arp_op_masked(oxm):
 oxm.subtypes[2147494660] = arp_op_masked
 
 class arp_sha(oxm):
+    __slots__ = ['value']
     type_len = 2147495942
 
     def __init__(self, value=None):
@@ -189,6 +198,7 @@ class arp_sha(oxm):
 oxm.subtypes[2147495942] = arp_sha
 
 class arp_sha_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147496204
 
     def __init__(self, value=None, value_mask=None):
@@ -240,6 +250,7 @@ class arp_sha_masked(oxm):
 oxm.subtypes[2147496204] = arp_sha_masked
 
 class arp_spa(oxm):
+    __slots__ = ['value']
     type_len = 2147494916
 
     def __init__(self, value=None):
@@ -251,16 +262,14 @@ class arp_spa(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_struct_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = arp_spa()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 2147494916)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -281,6 +290,7 @@ class arp_spa(oxm):
 oxm.subtypes[2147494916] = arp_spa
 
 class arp_spa_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147495176
 
     def __init__(self, value=None, value_mask=None):
@@ -296,18 +306,14 @@ class arp_spa_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_struct_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = arp_spa_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 2147495176)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -332,6 +338,7 @@ class arp_spa_masked(oxm):
 oxm.subtypes[2147495176] = arp_spa_masked
 
 class arp_tha(oxm):
+    __slots__ = ['value']
     type_len = 2147496454
 
     def __init__(self, value=None):
@@ -373,6 +380,7 @@ class arp_tha(oxm):
 oxm.subtypes[2147496454] = arp_tha
 
 class arp_tha_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147496716
 
     def __init__(self, value=None, value_mask=None):
@@ -424,6 +432,7 @@ class arp_tha_masked(oxm):
 oxm.subtypes[2147496716] = arp_tha_masked
 
 class arp_tpa(oxm):
+    __slots__ = ['value']
     type_len = 2147495428
 
     def __init__(self, value=None):
@@ -435,16 +444,14 @@ class arp_tpa(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_struct_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = arp_tpa()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 2147495428)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -465,6 +472,7 @@ class arp_tpa(oxm):
 oxm.subtypes[2147495428] = arp_tpa
 
 class arp_tpa_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147495688
 
     def __init__(self, value=None, value_mask=None):
@@ -480,18 +488,14 @@ class arp_tpa_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_struct_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = arp_tpa_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 2147495688)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -516,6 +520,7 @@ class arp_tpa_masked(oxm):
 oxm.subtypes[2147495688] = arp_tpa_masked
 
 class bsn_egr_port_group_id(oxm):
+    __slots__ = ['value']
     type_len = 200196
 
     def __init__(self, value=None):
@@ -527,16 +532,14 @@ class bsn_egr_port_group_id(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_struct_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_egr_port_group_id()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 200196)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -557,6 +560,7 @@ class bsn_egr_port_group_id(oxm):
 oxm.subtypes[200196] = bsn_egr_port_group_id
 
 class bsn_egr_port_group_id_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 200456
 
     def __init__(self, value=None, value_mask=None):
@@ -572,18 +576,14 @@ class bsn_egr_port_group_id_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_struct_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_egr_port_group_id_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 200456)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -608,6 +608,7 @@ class bsn_egr_port_group_id_masked(oxm):
 oxm.subtypes[200456] = bsn_egr_port_group_id_masked
 
 class bsn_global_vrf_allowed(oxm):
+    __slots__ = ['value']
     type_len = 198145
 
     def __init__(self, value=None):
@@ -619,16 +620,14 @@ class bsn_global_vrf_allowed(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
+        packed.append(_struct_LB.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_global_vrf_allowed()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LB)
         assert(_type_len == 198145)
-        obj.value = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -649,6 +648,7 @@ class bsn_global_vrf_allowed(oxm):
 oxm.subtypes[198145] = bsn_global_vrf_allowed
 
 class bsn_global_vrf_allowed_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 198402
 
     def __init__(self, value=None, value_mask=None):
@@ -664,18 +664,14 @@ class bsn_global_vrf_allowed_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        packed.append(struct.pack("!B", self.value_mask))
+        packed.append(_struct_LBB.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_global_vrf_allowed_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LBB)
         assert(_type_len == 198402)
-        obj.value = reader.read("!B")[0]
-        obj.value_mask = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -700,6 +696,7 @@ class bsn_global_vrf_allowed_masked(oxm):
 oxm.subtypes[198402] = bsn_global_vrf_allowed_masked
 
 class bsn_in_ports_128(oxm):
+    __slots__ = ['value']
     type_len = 196624
 
     def __init__(self, value=None):
@@ -741,6 +738,7 @@ class bsn_in_ports_128(oxm):
 oxm.subtypes[196624] = bsn_in_ports_128
 
 class bsn_in_ports_128_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 196896
 
     def __init__(self, value=None, value_mask=None):
@@ -792,6 +790,7 @@ class bsn_in_ports_128_masked(oxm):
 oxm.subtypes[196896] = bsn_in_ports_128_masked
 
 class bsn_in_ports_512(oxm):
+    __slots__ = ['value']
     type_len = 206400
 
     def __init__(self, value=None):
@@ -833,6 +832,7 @@ class bsn_in_ports_512(oxm):
 oxm.subtypes[206400] = bsn_in_ports_512
 
 class bsn_in_ports_512_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 206720
 
     def __init__(self, value=None, value_mask=None):
@@ -884,6 +884,7 @@ class bsn_in_ports_512_masked(oxm):
 oxm.subtypes[206720] = bsn_in_ports_512_masked
 
 class bsn_ingress_port_group_id(oxm):
+    __slots__ = ['value']
     type_len = 206852
 
     def __init__(self, value=None):
@@ -895,16 +896,14 @@ class bsn_ingress_port_group_id(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_struct_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_ingress_port_group_id()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 206852)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -925,6 +924,7 @@ class bsn_ingress_port_group_id(oxm):
 oxm.subtypes[206852] = bsn_ingress_port_group_id
 
 class bsn_ingress_port_group_id_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 207112
 
     def __init__(self, value=None, value_mask=None):
@@ -940,18 +940,14 @@ class bsn_ingress_port_group_id_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_struct_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_ingress_port_group_id_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 207112)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -976,6 +972,7 @@ class bsn_ingress_port_group_id_masked(oxm):
 oxm.subtypes[207112] = bsn_ingress_port_group_id_masked
 
 class bsn_l2_cache_hit(oxm):
+    __slots__ = ['value']
     type_len = 205825
 
     def __init__(self, value=None):
@@ -987,16 +984,14 @@ class bsn_l2_cache_hit(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
+        packed.append(_struct_LB.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_l2_cache_hit()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LB)
         assert(_type_len == 205825)
-        obj.value = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -1017,6 +1012,7 @@ class bsn_l2_cache_hit(oxm):
 oxm.subtypes[205825] = bsn_l2_cache_hit
 
 class bsn_l2_cache_hit_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 206082
 
     def __init__(self, value=None, value_mask=None):
@@ -1032,18 +1028,14 @@ class bsn_l2_cache_hit_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        packed.append(struct.pack("!B", self.value_mask))
+        packed.append(_struct_LBB.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_l2_cache_hit_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LBB)
         assert(_type_len == 206082)
-        obj.value = reader.read("!B")[0]
-        obj.value_mask = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -1068,6 +1060,7 @@ class bsn_l2_cache_hit_masked(oxm):
 oxm.subtypes[206082] = bsn_l2_cache_hit_masked
 
 class bsn_l3_dst_class_id(oxm):
+    __slots__ = ['value']
     type_len = 199684
 
     def __init__(self, value=None):
@@ -1079,16 +1072,14 @@ class bsn_l3_dst_class_id(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_struct_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_l3_dst_class_id()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 199684)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1109,6 +1100,7 @@ class bsn_l3_dst_class_id(oxm):
 oxm.subtypes[199684] = bsn_l3_dst_class_id
 
 class bsn_l3_dst_class_id_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 199944
 
     def __init__(self, value=None, value_mask=None):
@@ -1124,18 +1116,14 @@ class bsn_l3_dst_class_id_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_struct_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_l3_dst_class_id_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 199944)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1160,6 +1148,7 @@ class bsn_l3_dst_class_id_masked(oxm):
 oxm.subtypes[199944] = bsn_l3_dst_class_id_masked
 
 class bsn_l3_interface_class_id(oxm):
+    __slots__ = ['value']
     type_len = 198660
 
     def __init__(self, value=None):
@@ -1171,16 +1160,14 @@ class bsn_l3_interface_class_id(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_struct_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_l3_interface_class_id()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 198660)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1201,6 +1188,7 @@ class bsn_l3_interface_class_id(oxm):
 oxm.subtypes[198660] = bsn_l3_interface_class_id
 
 class bsn_l3_interface_class_id_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 198920
 
     def __init__(self, value=None, value_mask=None):
@@ -1216,18 +1204,14 @@ class bsn_l3_interface_class_id_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_struct_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_l3_interface_class_id_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 198920)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1252,6 +1236,7 @@ class bsn_l3_interface_class_id_masked(oxm):
 oxm.subtypes[198920] = bsn_l3_interface_class_id_masked
 
 class bsn_l3_src_class_id(oxm):
+    __slots__ = ['value']
     type_len = 199172
 
     def __init__(self, value=None):
@@ -1263,16 +1248,14 @@ class bsn_l3_src_class_id(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_struct_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_l3_src_class_id()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 199172)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1293,6 +1276,7 @@ class bsn_l3_src_class_id(oxm):
 oxm.subtypes[199172] = bsn_l3_src_class_id
 
 class bsn_l3_src_class_id_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 199432
 
     def __init__(self, value=None, value_mask=None):
@@ -1308,18 +1292,14 @@ class bsn_l3_src_class_id_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_struct_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_l3_src_class_id_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 199432)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1344,6 +1324,7 @@ class bsn_l3_src_class_id_masked(oxm):
 oxm.subtypes[199432] = bsn_l3_src_class_id_masked
 
 class bsn_lag_id(oxm):
+    __slots__ = ['value']
     type_len = 197124
 
     def __init__(self, value=None):
@@ -1355,16 +1336,14 @@ class bsn_lag_id(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_struct_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_lag_id()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 197124)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1385,6 +1364,7 @@ class bsn_lag_id(oxm):
 oxm.subtypes[197124] = bsn_lag_id
 
 class bsn_lag_id_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 197384
 
     def __init__(self, value=None, value_mask=None):
@@ -1400,18 +1380,14 @@ class bsn_lag_id_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_struct_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_lag_id_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 197384)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1436,6 +1412,7 @@ class bsn_lag_id_masked(oxm):
 oxm.subtypes[197384] = bsn_lag_id_masked
 
 class bsn_tcp_flags(oxm):
+    __slots__ = ['value']
     type_len = 204802
 
     def __init__(self, value=None):
@@ -1447,16 +1424,14 @@ class bsn_tcp_flags(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_struct_LH.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_tcp_flags()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LH)
         assert(_type_len == 204802)
-        obj.value = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -1477,6 +1452,7 @@ class bsn_tcp_flags(oxm):
 oxm.subtypes[204802] = bsn_tcp_flags
 
 class bsn_tcp_flags_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 205060
 
     def __init__(self, value=None, value_mask=None):
@@ -1492,18 +1468,14 @@ class bsn_tcp_flags_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        packed.append(struct.pack("!H", self.value_mask))
+        packed.append(_struct_LHH.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_tcp_flags_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LHH)
         assert(_type_len == 205060)
-        obj.value = reader.read("!H")[0]
-        obj.value_mask = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -1528,6 +1500,7 @@ class bsn_tcp_flags_masked(oxm):
 oxm.subtypes[205060] = bsn_tcp_flags_masked
 
 class bsn_udf0(oxm):
+    __slots__ = ['value']
     type_len = 200708
 
     def __init__(self, value=None):
@@ -1539,16 +1512,14 @@ class bsn_udf0(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_struct_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf0()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 200708)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1569,6 +1540,7 @@ class bsn_udf0(oxm):
 oxm.subtypes[200708] = bsn_udf0
 
 class bsn_udf0_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 200968
 
     def __init__(self, value=None, value_mask=None):
@@ -1584,18 +1556,14 @@ class bsn_udf0_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_struct_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf0_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 200968)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1620,6 +1588,7 @@ class bsn_udf0_masked(oxm):
 oxm.subtypes[200968] = bsn_udf0_masked
 
 class bsn_udf1(oxm):
+    __slots__ = ['value']
     type_len = 201220
 
     def __init__(self, value=None):
@@ -1631,16 +1600,14 @@ class bsn_udf1(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_struct_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf1()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 201220)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1661,6 +1628,7 @@ class bsn_udf1(oxm):
 oxm.subtypes[201220] = bsn_udf1
 
 class bsn_udf1_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 201480
 
     def __init__(self, value=None, value_mask=None):
@@ -1676,18 +1644,14 @@ class bsn_udf1_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_struct_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf1_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 201480)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1712,6 +1676,7 @@ class bsn_udf1_masked(oxm):
 oxm.subtypes[201480] = bsn_udf1_masked
 
 class bsn_udf2(oxm):
+    __slots__ = ['value']
     type_len = 201732
 
     def __init__(self, value=None):
@@ -1723,16 +1688,14 @@ class bsn_udf2(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_struct_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf2()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 201732)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1753,6 +1716,7 @@ class bsn_udf2(oxm):
 oxm.subtypes[201732] = bsn_udf2
 
 class bsn_udf2_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 201992
 
     def __init__(self, value=None, value_mask=None):
@@ -1768,18 +1732,14 @@ class bsn_udf2_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_struct_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf2_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 201992)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1804,6 +1764,7 @@ class bsn_udf2_masked(oxm):
 oxm.subtypes[201992] = bsn_udf2_masked
 
 class bsn_udf3(oxm):
+    __slots__ = ['value']
     type_len = 202244
 
     def __init__(self, value=None):
@@ -1815,16 +1776,14 @@ class bsn_udf3(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_struct_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf3()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 202244)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1845,6 +1804,7 @@ class bsn_udf3(oxm):
 oxm.subtypes[202244] = bsn_udf3
 
 class bsn_udf3_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 202504
 
     def __init__(self, value=None, value_mask=None):
@@ -1860,18 +1820,14 @@ class bsn_udf3_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_struct_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf3_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 202504)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1896,6 +1852,7 @@ class bsn_udf3_masked(oxm):
 oxm.subtypes[202504] = bsn_udf3_masked
 
 class bsn_udf4(oxm):
+    __slots__ = ['value']
     type_len = 202756
 
     def __init__(self, value=None):
@@ -1907,16 +1864,14 @@ class bsn_udf4(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_struct_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf4()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 202756)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1937,6 +1892,7 @@ class bsn_udf4(oxm):
 oxm.subtypes[202756] = bsn_udf4
 
 class bsn_udf4_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 203016
 
     def __init__(self, value=None, value_mask=None):
@@ -1952,18 +1908,14 @@ class bsn_udf4_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_struct_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf4_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 203016)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1988,6 +1940,7 @@ class bsn_udf4_masked(oxm):
 oxm.subtypes[203016] = bsn_udf4_masked
 
 class bsn_udf5(oxm):
+    __slots__ = ['value']
     type_len = 203268
 
     def __init__(self, value=None):
@@ -1999,16 +1952,14 @@ class bsn_udf5(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_struct_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf5()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 203268)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -2029,6 +1980,7 @@ class bsn_udf5(oxm):
 oxm.subtypes[203268] = bsn_udf5
 
 class bsn_udf5_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 203528
 
     def __init__(self, value=None, value_mask=None):
@@ -2044,18 +1996,14 @@ class bsn_udf5_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_struct_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf5_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 203528)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -2080,6 +2028,7 @@ class bsn_udf5_masked(oxm):
 oxm.subtypes[203528] = bsn_udf5_masked
 
 class bsn_udf6(oxm):
+    __slots__ = ['value']
     type_len = 203780
 
     def __init__(self, value=None):
@@ -2091,16 +2040,14 @@ class bsn_udf6(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_struct_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf6()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 203780)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -2121,6 +2068,7 @@ class bsn_udf6(oxm):
 oxm.subtypes[203780] = bsn_udf6
 
 class bsn_udf6_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 204040
 
     def __init__(self, value=None, value_mask=None):
@@ -2136,18 +2084,14 @@ class bsn_udf6_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_struct_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf6_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 204040)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -2172,6 +2116,7 @@ class bsn_udf6_masked(oxm):
 oxm.subtypes[204040] = bsn_udf6_masked
 
 class bsn_udf7(oxm):
+    __slots__ = ['value']
     type_len = 204292
 
     def __init__(self, value=None):
@@ -2183,16 +2128,14 @@ class bsn_udf7(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_struct_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf7()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 204292)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -2213,6 +2156,7 @@ class bsn_udf7(oxm):
 oxm.subtypes[204292] = bsn_udf7
 
 class bsn_udf7_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 204552
 
     def __init__(self, value=None, value_mask=None):
@@ -2228,18 +2172,14 @@ class bsn_udf7_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_struct_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf7_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 204552)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -2264,6 +2204,7 @@ class bsn_udf7_masked(oxm):
 oxm.subtypes[204552] = bsn_udf7_masked
 
 class bsn_vlan_xlate_port_group_id(oxm):
+    __slots__ = ['value']
     type_len = 205316
 
     def __init__(self, value=None):
@@ -2275,16 +2216,14 @@ class bsn_vlan_xlate_port_group_id(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_struct_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_vlan_xlate_port_group_id()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 205316)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -2305,6 +2244,7 @@ class bsn_vlan_xlate_port_group_id(oxm):
 oxm.subtypes[205316] = bsn_vlan_xlate_port_group_id
 
 class bsn_vlan_xlate_port_group_id_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 205576
 
     def __init__(self, value=None, value_mask=None):
@@ -2320,18 +2260,14 @@ class bsn_vlan_xlate_port_group_id_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_struct_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_vlan_xlate_port_group_id_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 205576)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -2356,6 +2292,7 @@ class bsn_vlan_xlate_port_group_id_masked(oxm):
 oxm.subtypes[205576] = bsn_vlan_xlate_port_group_id_masked
 
 class bsn_vrf(oxm):
+    __slots__ = ['value']
     type_len = 197636
 
     def __init__(self, value=None):
@@ -2367,16 +2304,14 @@ class bsn_vrf(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_struct_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_vrf()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 197636)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -2397,6 +2332,7 @@ class bsn_vrf(oxm):
 oxm.subtypes[197636] = bsn_vrf
 
 class bsn_vrf_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 197896
 
     def __init__(self, value=None, value_mask=None):
@@ -2412,18 +2348,14 @@ class bsn_vrf_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_struct_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_vrf_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 197896)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -2448,6 +2380,7 @@ class bsn_vrf_masked(oxm):
 oxm.subtypes[197896] = bsn_vrf_masked
 
 class eth_dst(oxm):
+    __slots__ = ['value']
     type_len = 2147485190
 
     def __init__(self, value=None):
@@ -2489,6 +2422,7 @@ class eth_dst(oxm):
 oxm.subtypes[2147485190] = eth_dst
 
 class eth_dst_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147485452
 
     def __init__(self, value=None, value_mask=None):
@@ -2540,6 +2474,7 @@ class eth_dst_masked(oxm):
 oxm.subtypes[2147485452] = eth_dst_masked
 
 class eth_src(oxm):
+    __slots__ = ['value']
     type_len = 2147485702
 
     def __init__(self, value=None):
@@ -2581,6 +2516,7 @@ class eth_src(oxm):
 oxm.subtypes[2147485702] = eth_src
 
 class eth_src_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147485964
 
     def __init__(self, value=None, value_mask=None):
@@ -2632,6 +2568,7 @@ class eth_src_masked(oxm):
 oxm.subtypes[2147485964] = eth_src_masked
 
 class eth_type(oxm):
+    __slots__ = ['value']
     type_len = 2147486210
 
     def __init__(self, value=None):
@@ -2643,16 +2580,14 @@ class eth_type(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_struct_LH.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = eth_type()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LH)
         assert(_type_len == 2147486210)
-        obj.value = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -2673,6 +2608,7 @@ class eth_type(oxm):
 oxm.subtypes[2147486210] = eth_type
 
 class eth_type_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147486468
 
     def __init__(self, value=None, value_mask=None):
@@ -2688,18 +2624,14 @@ class eth_type_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        packed.append(struct.pack("!H", self.value_mask))
+        packed.append(_struct_LHH.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = eth_type_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LHH)
         assert(_type_len == 2147486468)
-        obj.value = reader.read("!H")[0]
-        obj.value_mask = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -2724,6 +2656,7 @@ class eth_type_masked(oxm):
 oxm.subtypes[2147486468] = eth_type_masked
 
 class icmpv4_code(oxm):
+    __slots__ = ['value']
     type_len = 2147493889
 
     def __init__(self, value=None):
@@ -2735,16 +2668,14 @@ class icmpv4_code(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
+        packed.append(_struct_LB.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = icmpv4_code()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LB)
         assert(_type_len == 2147493889)
-        obj.value = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -2765,6 +2696,7 @@ class icmpv4_code(oxm):
 oxm.subtypes[2147493889] = icmpv4_code
 
 class icmpv4_code_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147494146
 
     def __init__(self, value=None, value_mask=None):
@@ -2780,18 +2712,14 @@ class icmpv4_code_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        packed.append(struct.pack("!B", self.value_mask))
+        packed.append(_struct_LBB.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = icmpv4_code_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LBB)
         assert(_type_len == 2147494146)
-        obj.value = reader.read("!B")[0]
-        obj.value_mask = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -2816,6 +2744,7 @@ class icmpv4_code_masked(oxm):
 oxm.subtypes[2147494146] = icmpv4_code_masked
 
 class icmpv4_type(oxm):
+    __slots__ = ['value']
     type_len = 2147493377
 
     def __init__(self, value=None):
@@ -2827,16 +2756,14 @@ class icmpv4_type(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
+        packed.append(_struct_LB.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = icmpv4_type()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LB)
         assert(_type_len == 2147493377)
-        obj.value = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -2857,6 +2784,7 @@ class icmpv4_type(oxm):
 oxm.subtypes[2147493377] = icmpv4_type
 
 class icmpv4_type_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147493634
 
     def __init__(self, value=None, value_mask=None):
@@ -2872,18 +2800,14 @@ class icmpv4_type_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        packed.append(struct.pack("!B", self.value_mask))
+        packed.append(_struct_LBB.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = icmpv4_type_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LBB)
         assert(_type_len == 2147493634)
-        obj.value = reader.read("!B")[0]
-        obj.value_mask = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -2908,6 +2832,7 @@ class icmpv4_type_masked(oxm):
 oxm.subtypes[2147493634] = icmpv4_type_masked
 
 class icmpv6_code(oxm):
+    __slots__ = ['value']
     type_len = 2147499009
 
     def __init__(self, value=None):
@@ -2919,16 +2844,14 @@ class icmpv6_code(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
+        packed.append(_struct_LB.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = icmpv6_code()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LB)
         assert(_type_len == 2147499009)
-        obj.value = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -2949,6 +2872,7 @@ class icmpv6_code(oxm):
 oxm.subtypes[2147499009] = icmpv6_code
 
 class icmpv6_code_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147499266
 
     def __init__(self, value=None, value_mask=None):
@@ -2964,18 +2888,14 @@ class icmpv6_code_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        packed.append(struct.pack("!B", self.value_mask))
+        packed.append(_struct_LBB.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = icmpv6_code_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LBB)
         assert(_type_len == 2147499266)
-        obj.value = reader.read("!B")[0]
-        obj.value_mask = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -3000,6 +2920,7 @@ class icmpv6_code_masked(oxm):
 oxm.subtypes[2147499266] = icmpv6_code_masked
 
 class icmpv6_type(oxm):
+    __slots__ = ['value']
     type_len = 2147498497
 
     def __init__(self, value=None):
@@ -3011,16 +2932,14 @@ class icmpv6_type(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
+        packed.append(_struct_LB.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = icmpv6_type()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LB)
         assert(_type_len == 2147498497)
-        obj.value = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -3041,6 +2960,7 @@ class icmpv6_type(oxm):
 oxm.subtypes[2147498497] = icmpv6_type
 
 class icmpv6_type_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147498754
 
     def __init__(self, value=None, value_mask=None):
@@ -3056,18 +2976,14 @@ class icmpv6_type_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        packed.append(struct.pack("!B", self.value_mask))
+        packed.append(_struct_LBB.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = icmpv6_type_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LBB)
         assert(_type_len == 2147498754)
-        obj.value = reader.read("!B")[0]
-        obj.value_mask = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -3092,6 +3008,7 @@ class icmpv6_type_masked(oxm):
 oxm.subtypes[2147498754] = icmpv6_type_masked
 
 class in_phy_port(oxm):
+    __slots__ = ['value']
     type_len = 2147484164
 
     def __init__(self, value=None):
@@ -3133,6 +3050,7 @@ class in_phy_port(oxm):
 oxm.subtypes[2147484164] = in_phy_port
 
 class in_phy_port_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147484424
 
     def __init__(self, value=None, value_mask=None):
@@ -3184,6 +3102,7 @@ class in_phy_port_masked(oxm):
 oxm.subtypes[2147484424] = in_phy_port_masked
 
 class in_port(oxm):
+    __slots__ = ['value']
     type_len = 2147483652
 
     def __init__(self, value=None):
@@ -3225,6 +3144,7 @@ class in_port(oxm):
 oxm.subtypes[2147483652] = in_port
 
 class in_port_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147483912
 
     def __init__(self, value=None, value_mask=None):
@@ -3276,6 +3196,7 @@ class in_port_masked(oxm):
 oxm.subtypes[2147483912] = in_port_masked
 
 class ip_dscp(oxm):
+    __slots__ = ['value']
     type_len = 2147487745
 
     def __init__(self, value=None):
@@ -3287,16 +3208,14 @@ class ip_dscp(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
+        packed.append(_struct_LB.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ip_dscp()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LB)
         assert(_type_len == 2147487745)
-        obj.value = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -3317,6 +3236,7 @@ class ip_dscp(oxm):
 oxm.subtypes[2147487745] = ip_dscp
 
 class ip_dscp_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147488002
 
     def __init__(self, value=None, value_mask=None):
@@ -3332,18 +3252,14 @@ class ip_dscp_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        packed.append(struct.pack("!B", self.value_mask))
+        packed.append(_struct_LBB.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ip_dscp_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LBB)
         assert(_type_len == 2147488002)
-        obj.value = reader.read("!B")[0]
-        obj.value_mask = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -3368,6 +3284,7 @@ class ip_dscp_masked(oxm):
 oxm.subtypes[2147488002] = ip_dscp_masked
 
 class ip_ecn(oxm):
+    __slots__ = ['value']
     type_len = 2147488257
 
     def __init__(self, value=None):
@@ -3379,16 +3296,14 @@ class ip_ecn(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
+        packed.append(_struct_LB.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ip_ecn()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LB)
         assert(_type_len == 2147488257)
-        obj.value = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -3409,6 +3324,7 @@ class ip_ecn(oxm):
 oxm.subtypes[2147488257] = ip_ecn
 
 class ip_ecn_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147488514
 
     def __init__(self, value=None, value_mask=None):
@@ -3424,18 +3340,14 @@ class ip_ecn_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        packed.append(struct.pack("!B", self.value_mask))
+        packed.append(_struct_LBB.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ip_ecn_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LBB)
         assert(_type_len == 2147488514)
-        obj.value = reader.read("!B")[0]
-        obj.value_mask = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -3460,6 +3372,7 @@ class ip_ecn_masked(oxm):
 oxm.subtypes[2147488514] = ip_ecn_masked
 
 class ip_proto(oxm):
+    __slots__ = ['value']
     type_len = 2147488769
 
     def __init__(self, value=None):
@@ -3471,16 +3384,14 @@ class ip_proto(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
+        packed.append(_struct_LB.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ip_proto()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LB)
         assert(_type_len == 2147488769)
-        obj.value = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -3501,6 +3412,7 @@ class ip_proto(oxm):
 oxm.subtypes[2147488769] = ip_proto
 
 class ip_proto_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147489026
 
     def __init__(self, value=None, value_mask=None):
@@ -3516,18 +3428,14 @@ class ip_proto_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        packed.append(struct.pack("!B", self.value_mask))
+        packed.append(_struct_LBB.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ip_proto_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LBB)
         assert(_type_len == 2147489026)
-        obj.value = reader.read("!B")[0]
-        obj.value_mask = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -3552,6 +3460,7 @@ class ip_proto_masked(oxm):
 oxm.subtypes[2147489026] = ip_proto_masked
 
 class ipv4_dst(oxm):
+    __slots__ = ['value']
     type_len = 2147489796
 
     def __init__(self, value=None):
@@ -3563,16 +3472,14 @@ class ipv4_dst(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_struct_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ipv4_dst()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 2147489796)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -3593,6 +3500,7 @@ class ipv4_dst(oxm):
 oxm.subtypes[2147489796] = ipv4_dst
 
 class ipv4_dst_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147490056
 
     def __init__(self, value=None, value_mask=None):
@@ -3608,18 +3516,14 @@ class ipv4_dst_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_struct_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ipv4_dst_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 2147490056)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -3644,6 +3548,7 @@ class ipv4_dst_masked(oxm):
 oxm.subtypes[2147490056] = ipv4_dst_masked
 
 class ipv4_src(oxm):
+    __slots__ = ['value']
     type_len = 2147489284
 
     def __init__(self, value=None):
@@ -3655,16 +3560,14 @@ class ipv4_src(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_struct_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ipv4_src()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 2147489284)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -3685,6 +3588,7 @@ class ipv4_src(oxm):
 oxm.subtypes[2147489284] = ipv4_src
 
 class ipv4_src_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147489544
 
     def __init__(self, value=None, value_mask=None):
@@ -3700,18 +3604,14 @@ class ipv4_src_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_struct_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ipv4_src_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 2147489544)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -3736,6 +3636,7 @@ class ipv4_src_masked(oxm):
 oxm.subtypes[2147489544] = ipv4_src_masked
 
 class ipv6_dst(oxm):
+    __slots__ = ['value']
     type_len = 2147497488
 
     def __init__(self, value=None):
@@ -3777,6 +3678,7 @@ class ipv6_dst(oxm):
 oxm.subtypes[2147497488] = ipv6_dst
 
 class ipv6_dst_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147497760
 
     def __init__(self, value=None, value_mask=None):
@@ -3828,6 +3730,7 @@ class ipv6_dst_masked(oxm):
 oxm.subtypes[2147497760] = ipv6_dst_masked
 
 class ipv6_flabel(oxm):
+    __slots__ = ['value']
     type_len = 2147497988
 
     def __init__(self, value=None):
@@ -3839,16 +3742,14 @@ class ipv6_flabel(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_struct_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ipv6_flabel()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 2147497988)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -3869,6 +3770,7 @@ class ipv6_flabel(oxm):
 oxm.subtypes[2147497988] = ipv6_flabel
 
 class ipv6_flabel_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147498248
 
     def __init__(self, value=None, value_mask=None):
@@ -3884,18 +3786,14 @@ class ipv6_flabel_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_struct_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ipv6_flabel_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 2147498248)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -3920,6 +3818,7 @@ class ipv6_flabel_masked(oxm):
 oxm.subtypes[2147498248] = ipv6_flabel_masked
 
 class ipv6_nd_sll(oxm):
+    __slots__ = ['value']
     type_len = 2147500038
 
     def __init__(self, value=None):
@@ -3961,6 +3860,7 @@ class ipv6_nd_sll(oxm):
 oxm.subtypes[2147500038] = ipv6_nd_sll
 
 class ipv6_nd_sll_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147500300
 
     def __init__(self, value=None, value_mask=None):
@@ -4012,6 +3912,7 @@ class ipv6_nd_sll_masked(oxm):
 oxm.subtypes[2147500300] = ipv6_nd_sll_masked
 
 class ipv6_nd_target(oxm):
+    __slots__ = ['value']
     type_len = 2147499536
 
     def __init__(self, value=None):
@@ -4053,6 +3954,7 @@ class ipv6_nd_target(oxm):
 oxm.subtypes[2147499536] = ipv6_nd_target
 
 class ipv6_nd_target_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147499808
 
     def __init__(self, value=None, value_mask=None):
@@ -4104,6 +4006,7 @@ class ipv6_nd_target_masked(oxm):
 oxm.subtypes[2147499808] = ipv6_nd_target_masked
 
 class ipv6_nd_tll(oxm):
+    __slots__ = ['value']
     type_len = 2147500550
 
     def __init__(self, value=None):
@@ -4145,6 +4048,7 @@ class ipv6_nd_tll(oxm):
 oxm.subtypes[2147500550] = ipv6_nd_tll
 
 class ipv6_nd_tll_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147500812
 
     def __init__(self, value=None, value_mask=None):
@@ -4196,6 +4100,7 @@ class ipv6_nd_tll_masked(oxm):
 oxm.subtypes[2147500812] = ipv6_nd_tll_masked
 
 class ipv6_src(oxm):
+    __slots__ = ['value']
     type_len = 2147496976
 
     def __init__(self, value=None):
@@ -4237,6 +4142,7 @@ class ipv6_src(oxm):
 oxm.subtypes[2147496976] = ipv6_src
 
 class ipv6_src_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147497248
 
     def __init__(self, value=None, value_mask=None):
@@ -4288,6 +4194,7 @@ class ipv6_src_masked(oxm):
 oxm.subtypes[2147497248] = ipv6_src_masked
 
 class metadata(oxm):
+    __slots__ = ['value']
     type_len = 2147484680
 
     def __init__(self, value=None):
@@ -4299,16 +4206,14 @@ class metadata(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!Q", self.value))
+        packed.append(_struct_LQ.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = metadata()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LQ)
         assert(_type_len == 2147484680)
-        obj.value = reader.read("!Q")[0]
         return obj
 
     def __eq__(self, other):
@@ -4329,6 +4234,7 @@ class metadata(oxm):
 oxm.subtypes[2147484680] = metadata
 
 class metadata_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147484944
 
     def __init__(self, value=None, value_mask=None):
@@ -4344,18 +4250,14 @@ class metadata_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!Q", self.value))
-        packed.append(struct.pack("!Q", self.value_mask))
+        packed.append(_struct_LQQ.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = metadata_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LQQ)
         assert(_type_len == 2147484944)
-        obj.value = reader.read("!Q")[0]
-        obj.value_mask = reader.read("!Q")[0]
         return obj
 
     def __eq__(self, other):
@@ -4380,6 +4282,7 @@ class metadata_masked(oxm):
 oxm.subtypes[2147484944] = metadata_masked
 
 class mpls_label(oxm):
+    __slots__ = ['value']
     type_len = 2147501060
 
     def __init__(self, value=None):
@@ -4391,16 +4294,14 @@ class mpls_label(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_struct_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = mpls_label()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 2147501060)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -4421,6 +4322,7 @@ class mpls_label(oxm):
 oxm.subtypes[2147501060] = mpls_label
 
 class mpls_label_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147501320
 
     def __init__(self, value=None, value_mask=None):
@@ -4436,18 +4338,14 @@ class mpls_label_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_struct_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = mpls_label_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 2147501320)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -4472,6 +4370,7 @@ class mpls_label_masked(oxm):
 oxm.subtypes[2147501320] = mpls_label_masked
 
 class mpls_tc(oxm):
+    __slots__ = ['value']
     type_len = 2147501569
 
     def __init__(self, value=None):
@@ -4483,16 +4382,14 @@ class mpls_tc(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
+        packed.append(_struct_LB.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = mpls_tc()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LB)
         assert(_type_len == 2147501569)
-        obj.value = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -4513,6 +4410,7 @@ class mpls_tc(oxm):
 oxm.subtypes[2147501569] = mpls_tc
 
 class mpls_tc_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147501826
 
     def __init__(self, value=None, value_mask=None):
@@ -4528,18 +4426,14 @@ class mpls_tc_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        packed.append(struct.pack("!B", self.value_mask))
+        packed.append(_struct_LBB.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = mpls_tc_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LBB)
         assert(_type_len == 2147501826)
-        obj.value = reader.read("!B")[0]
-        obj.value_mask = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -4564,6 +4458,7 @@ class mpls_tc_masked(oxm):
 oxm.subtypes[2147501826] = mpls_tc_masked
 
 class sctp_dst(oxm):
+    __slots__ = ['value']
     type_len = 2147492866
 
     def __init__(self, value=None):
@@ -4575,16 +4470,14 @@ class sctp_dst(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_struct_LH.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = sctp_dst()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LH)
         assert(_type_len == 2147492866)
-        obj.value = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -4605,6 +4498,7 @@ class sctp_dst(oxm):
 oxm.subtypes[2147492866] = sctp_dst
 
 class sctp_dst_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147493124
 
     def __init__(self, value=None, value_mask=None):
@@ -4620,18 +4514,14 @@ class sctp_dst_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        packed.append(struct.pack("!H", self.value_mask))
+        packed.append(_struct_LHH.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = sctp_dst_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LHH)
         assert(_type_len == 2147493124)
-        obj.value = reader.read("!H")[0]
-        obj.value_mask = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -4656,6 +4546,7 @@ class sctp_dst_masked(oxm):
 oxm.subtypes[2147493124] = sctp_dst_masked
 
 class sctp_src(oxm):
+    __slots__ = ['value']
     type_len = 2147492354
 
     def __init__(self, value=None):
@@ -4667,16 +4558,14 @@ class sctp_src(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_struct_LH.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = sctp_src()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LH)
         assert(_type_len == 2147492354)
-        obj.value = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -4697,6 +4586,7 @@ class sctp_src(oxm):
 oxm.subtypes[2147492354] = sctp_src
 
 class sctp_src_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147492612
 
     def __init__(self, value=None, value_mask=None):
@@ -4712,18 +4602,14 @@ class sctp_src_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        packed.append(struct.pack("!H", self.value_mask))
+        packed.append(_struct_LHH.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = sctp_src_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LHH)
         assert(_type_len == 2147492612)
-        obj.value = reader.read("!H")[0]
-        obj.value_mask = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -4748,6 +4634,7 @@ class sctp_src_masked(oxm):
 oxm.subtypes[2147492612] = sctp_src_masked
 
 class tcp_dst(oxm):
+    __slots__ = ['value']
     type_len = 2147490818
 
     def __init__(self, value=None):
@@ -4759,16 +4646,14 @@ class tcp_dst(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_struct_LH.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = tcp_dst()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LH)
         assert(_type_len == 2147490818)
-        obj.value = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -4789,6 +4674,7 @@ class tcp_dst(oxm):
 oxm.subtypes[2147490818] = tcp_dst
 
 class tcp_dst_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147491076
 
     def __init__(self, value=None, value_mask=None):
@@ -4804,18 +4690,14 @@ class tcp_dst_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        packed.append(struct.pack("!H", self.value_mask))
+        packed.append(_struct_LHH.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = tcp_dst_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LHH)
         assert(_type_len == 2147491076)
-        obj.value = reader.read("!H")[0]
-        obj.value_mask = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -4840,6 +4722,7 @@ class tcp_dst_masked(oxm):
 oxm.subtypes[2147491076] = tcp_dst_masked
 
 class tcp_src(oxm):
+    __slots__ = ['value']
     type_len = 2147490306
 
     def __init__(self, value=None):
@@ -4851,16 +4734,14 @@ class tcp_src(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_struct_LH.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = tcp_src()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LH)
         assert(_type_len == 2147490306)
-        obj.value = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -4881,6 +4762,7 @@ class tcp_src(oxm):
 oxm.subtypes[2147490306] = tcp_src
 
 class tcp_src_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147490564
 
     def __init__(self, value=None, value_mask=None):
@@ -4896,18 +4778,14 @@ class tcp_src_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        packed.append(struct.pack("!H", self.value_mask))
+        packed.append(_struct_LHH.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = tcp_src_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LHH)
         assert(_type_len == 2147490564)
-        obj.value = reader.read("!H")[0]
-        obj.value_mask = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -4932,6 +4810,7 @@ class tcp_src_masked(oxm):
 oxm.subtypes[2147490564] = tcp_src_masked
 
 class tunnel_ipv4_dst(oxm):
+    __slots__ = ['value']
     type_len = 81924
 
     def __init__(self, value=None):
@@ -4943,16 +4822,14 @@ class tunnel_ipv4_dst(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_struct_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = tunnel_ipv4_dst()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 81924)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -4973,6 +4850,7 @@ class tunnel_ipv4_dst(oxm):
 oxm.subtypes[81924] = tunnel_ipv4_dst
 
 class tunnel_ipv4_dst_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 82184
 
     def __init__(self, value=None, value_mask=None):
@@ -4988,18 +4866,14 @@ class tunnel_ipv4_dst_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_struct_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = tunnel_ipv4_dst_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 82184)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -5024,6 +4898,7 @@ class tunnel_ipv4_dst_masked(oxm):
 oxm.subtypes[82184] = tunnel_ipv4_dst_masked
 
 class tunnel_ipv4_src(oxm):
+    __slots__ = ['value']
     type_len = 81412
 
     def __init__(self, value=None):
@@ -5035,16 +4910,14 @@ class tunnel_ipv4_src(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_struct_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = tunnel_ipv4_src()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 81412)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -5065,6 +4938,7 @@ class tunnel_ipv4_src(oxm):
 oxm.subtypes[81412] = tunnel_ipv4_src
 
 class tunnel_ipv4_src_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 81672
 
     def __init__(self, value=None, value_mask=None):
@@ -5080,18 +4954,14 @@ class tunnel_ipv4_src_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_struct_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = tunnel_ipv4_src_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 81672)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -5116,6 +4986,7 @@ class tunnel_ipv4_src_masked(oxm):
 oxm.subtypes[81672] = tunnel_ipv4_src_masked
 
 class udp_dst(oxm):
+    __slots__ = ['value']
     type_len = 2147491842
 
     def __init__(self, value=None):
@@ -5127,16 +4998,14 @@ class udp_dst(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_struct_LH.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = udp_dst()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LH)
         assert(_type_len == 2147491842)
-        obj.value = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -5157,6 +5026,7 @@ class udp_dst(oxm):
 oxm.subtypes[2147491842] = udp_dst
 
 class udp_dst_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147492100
 
     def __init__(self, value=None, value_mask=None):
@@ -5172,18 +5042,14 @@ class udp_dst_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        packed.append(struct.pack("!H", self.value_mask))
+        packed.append(_struct_LHH.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = udp_dst_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LHH)
         assert(_type_len == 2147492100)
-        obj.value = reader.read("!H")[0]
-        obj.value_mask = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -5208,6 +5074,7 @@ class udp_dst_masked(oxm):
 oxm.subtypes[2147492100] = udp_dst_masked
 
 class udp_src(oxm):
+    __slots__ = ['value']
     type_len = 2147491330
 
     def __init__(self, value=None):
@@ -5219,16 +5086,14 @@ class udp_src(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_struct_LH.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = udp_src()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LH)
         assert(_type_len == 2147491330)
-        obj.value = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -5249,6 +5114,7 @@ class udp_src(oxm):
 oxm.subtypes[2147491330] = udp_src
 
 class udp_src_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147491588
 
     def __init__(self, value=None, value_mask=None):
@@ -5264,18 +5130,14 @@ class udp_src_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        packed.append(struct.pack("!H", self.value_mask))
+        packed.append(_struct_LHH.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = udp_src_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LHH)
         assert(_type_len == 2147491588)
-        obj.value = reader.read("!H")[0]
-        obj.value_mask = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -5300,6 +5162,7 @@ class udp_src_masked(oxm):
 oxm.subtypes[2147491588] = udp_src_masked
 
 class vlan_pcp(oxm):
+    __slots__ = ['value']
     type_len = 2147487233
 
     def __init__(self, value=None):
@@ -5311,16 +5174,14 @@ class vlan_pcp(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
+        packed.append(_struct_LB.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = vlan_pcp()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LB)
         assert(_type_len == 2147487233)
-        obj.value = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -5341,6 +5202,7 @@ class vlan_pcp(oxm):
 oxm.subtypes[2147487233] = vlan_pcp
 
 class vlan_pcp_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147487490
 
     def __init__(self, value=None, value_mask=None):
@@ -5356,18 +5218,14 @@ class vlan_pcp_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        packed.append(struct.pack("!B", self.value_mask))
+        packed.append(_struct_LBB.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = vlan_pcp_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LBB)
         assert(_type_len == 2147487490)
-        obj.value = reader.read("!B")[0]
-        obj.value_mask = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -5392,6 +5250,7 @@ class vlan_pcp_masked(oxm):
 oxm.subtypes[2147487490] = vlan_pcp_masked
 
 class vlan_vid(oxm):
+    __slots__ = ['value']
     type_len = 2147486722
 
     def __init__(self, value=None):
@@ -5403,16 +5262,14 @@ class vlan_vid(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_struct_LH.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = vlan_vid()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LH)
         assert(_type_len == 2147486722)
-        obj.value = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -5433,6 +5290,7 @@ class vlan_vid(oxm):
 oxm.subtypes[2147486722] = vlan_vid
 
 class vlan_vid_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147486980
 
     def __init__(self, value=None, value_mask=None):
@@ -5448,18 +5306,14 @@ class vlan_vid_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        packed.append(struct.pack("!H", self.value_mask))
+        packed.append(_struct_LHH.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = vlan_vid_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LHH)
         assert(_type_len == 2147486980)
-        obj.value = reader.read("!H")[0]
-        obj.value_mask = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -6,16 +6,19 @@
 # Automatically generated by LOXI from template init.py
 # Do not modify
 
+import loxi
 import const
-import bsn_tlv
-import meter_band
-import instruction
-import oxm
-import common
-import instruction_id
-import action
-import message
-import action_id
 from const import *
-from common import *
 from loxi import ProtocolError
+
+loxi.lazy_protocol(__name__, [
+    'bsn_tlv',
+    'meter_band',
+    'instruction',
+    'oxm',
+    'common',
+    'instruction_id',
+    'action',
+    'message',
+    'action_id',
+], 'common')
@@ -14,8 +14,29 @@ import loxi.generic_util
 import sys
 ofp = sys.modules['loxi.of13']
 
+# Precompiled layouts of fixed-size field runs
+_struct_B3x = struct.Struct("!B3x")
+_struct_H2x = struct.Struct("!H2x")
+_struct_H6x = struct.Struct("!H6x")
+_struct_HH = struct.Struct("!HH")
+_struct_LH = struct.Struct("!LH")
+_struct_LH2x4x = struct.Struct("!LH2x4x")
+_struct_LH6x = struct.Struct("!LH6x")
+_struct_LHB = struct.Struct("!LHB")
+_struct_LHB5x = struct.Struct("!LHB5x")
+_struct_LHBB = struct.Struct("!LHBB")
+_struct_LHBB4x = struct.Struct("!LHBB4x")
+_struct_LHLB = struct.Struct("!LHLB")
+_struct_LHLB1x = struct.Struct("!LHLB1x")
+_struct_LL = struct.Struct("!LL")
+_struct_LL4x = struct.Struct("!LL4x")
+_struct_LLL = struct.Struct("!LLL")
+_struct_LLLLB3x = struct.Struct("!LLLLB3x")
+
 class action(loxi.OFObject):
+    __slots__ = ['type']
     subtypes = {}
+    subtype_field = ('!H', 0)
 
 
     def __init__(self, type=None):
@@ -42,8 +63,7 @@ class action(loxi.OFObject):
             return subclass.unpack(reader)
 
         obj = action()
-        obj.type = reader.read("!H")[0]
-        _len = reader.read("!H")[0]
+        obj.type, _len = reader.read_struct(_struct_HH)
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         reader.skip(4)
@@ -64,7 +84,9 @@ class action(loxi.OFObject):
 
 
 class experimenter(action):
+    __slots__ = ['experimenter', 'data']
     subtypes = {}
+    subtype_field = ('!L', 4)
 
     type = 65535
 
@@ -99,9 +121,8 @@ class experimenter(action):
             return subclass.unpack(reader)
 
         obj = experimenter()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.experimenter = reader.read("!L")[0]
@@ -128,6 +149,7 @@ action.subtypes[65535] = experimenter
 """
 class bsn(experimenter):
     subtypes = {}
+    subtype_field = ('!L', 8)
 
     type = 65535
     experimenter = 6035143
@@ -143,9 +165,7 @@ class bsn(experimenter):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append('\x00' * 4)
+        packed.append(_struct_LL4x.pack(self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -158,15 +178,12 @@ class bsn(experimenter):
             return subclass.unpack(reader)
 
         obj = bsn()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, obj.subtype = reader.read_struct(_struct_LL4x)
         assert(_experimenter == 6035143)
-        obj.subtype = reader.read("!L")[0]
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -200,8 +217,7 @@ class bsn_checksum(bsn):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_struct_LL.pack(self.experimenter, self.subtype))
         packed.append(util.pack_checksum_128(self.checksum))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
@@ -210,14 +226,12 @@ class bsn_checksum(bsn):
     @staticmethod
     def unpack(reader):
         obj = bsn_checksum()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _subtype = reader.read_struct(_struct_LL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 4)
         obj.checksum = util.unpack_checksum_128(reader)
         return obj
@@ -259,9 +273,7 @@ class bsn_gentable(bsn):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.table_id))
+        packed.append(_struct_LLL.pack(self.experimenter, self.subtype, self.table_id))
         packed.append(loxi.generic_util.pack_list(self.key))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
@@ -270,16 +282,13 @@ class bsn_gentable(bsn):
     @staticmethod
     def unpack(reader):
         obj = bsn_gentable()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _subtype, obj.table_id = reader.read_struct(_struct_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 5)
-        obj.table_id = reader.read("!L")[0]
         obj.key = loxi.generic_util.unpack_list(reader, ofp.bsn_tlv.bsn_tlv.unpack)
         return obj
 
@@ -328,12 +337,7 @@ class bsn_mirror(bsn):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.dest_port))
-        packed.append(struct.pack("!L", self.vlan_tag))
-        packed.append(struct.pack("!B", self.copy_stage))
-        packed.append('\x00' * 3)
+        packed.append(_struct_LLLLB3x.pack(self.experimenter, self.subtype, self.dest_port, self.vlan_tag, self.copy_stage))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -341,19 +345,13 @@ class bsn_mirror(bsn):
     @staticmethod
     def unpack(reader):
         obj = bsn_mirror()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _subtype, obj.dest_port, obj.vlan_tag, obj.copy_stage = reader.read_struct(_struct_LLLLB3x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 1)
-        obj.dest_port = reader.read("!L")[0]
-        obj.vlan_tag = reader.read("!L")[0]
-        obj.copy_stage = reader.read("!B")[0]
-        reader.skip(3)
         return obj
 
     def __eq__(self, other):
@@ -397,9 +395,7 @@ class bsn_set_tunnel_dst(bsn):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.dst))
+        packed.append(_struct_LLL.pack(self.experimenter, self.subtype, self.dst))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -407,16 +403,13 @@ class bsn_set_tunnel_dst(bsn):
     @staticmethod
     def unpack(reader):
         obj = bsn_set_tunnel_dst()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _subtype, obj.dst = reader.read_struct(_struct_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 2)
-        obj.dst = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -438,6 +431,7 @@ bsn.subtypes[2] = bsn_set_tunnel_dst
 """
 
 class copy_ttl_in(action):
+    __slots__ = []
     type = 12
 
     def __init__(self):
@@ -455,9 +449,8 @@ class copy_ttl_in(action):
     @staticmethod
     def unpack(reader):
         obj = copy_ttl_in()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 12)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         reader.skip(4)
@@ -478,6 +471,7 @@ class copy_ttl_in(action):
 action.subtypes[12] = copy_ttl_in
 
 class copy_ttl_out(action):
+    __slots__ = []
     type = 11
 
     def __init__(self):
@@ -495,9 +489,8 @@ class copy_ttl_out(action):
     @staticmethod
     def unpack(reader):
         obj = copy_ttl_out()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 11)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         reader.skip(4)
@@ -518,6 +511,7 @@ class copy_ttl_out(action):
 action.subtypes[11] = copy_ttl_out
 
 class dec_mpls_ttl(action):
+    __slots__ = []
     type = 16
 
     def __init__(self):
@@ -535,9 +529,8 @@ class dec_mpls_ttl(action):
     @staticmethod
     def unpack(reader):
         obj = dec_mpls_ttl()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 16)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         reader.skip(4)
@@ -558,6 +551,7 @@ class dec_mpls_ttl(action):
 action.subtypes[16] = dec_mpls_ttl
 
 class dec_nw_ttl(action):
+    __slots__ = []
     type = 24
 
     def __init__(self):
@@ -575,9 +569,8 @@ class dec_nw_ttl(action):
     @staticmethod
     def unpack(reader):
         obj = dec_nw_ttl()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 24)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         reader.skip(4)
@@ -598,6 +591,7 @@ class dec_nw_ttl(action):
 action.subtypes[24] = dec_nw_ttl
 
 class group(action):
+    __slots__ = ['group_id']
     type = 22
 
     def __init__(self, group_id=None):
@@ -619,9 +613,8 @@ class group(action):
     @staticmethod
     def unpack(reader):
         obj = group()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 22)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.group_id = reader.read("!L")[0]
@@ -646,6 +639,7 @@ action.subtypes[22] = group
 """
 class nicira(experimenter):
     subtypes = {}
+    subtype_field = ('!H', 8)
 
     type = 65535
     experimenter = 8992
@@ -661,10 +655,7 @@ class nicira(experimenter):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!H", self.subtype))
-        packed.append('\x00' * 2)
-        packed.append('\x00' * 4)
+        packed.append(_struct_LH2x4x.pack(self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -677,16 +668,12 @@ class nicira(experimenter):
             return subclass.unpack(reader)
 
         obj = nicira()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, obj.subtype = reader.read_struct(_struct_LH2x4x)
         assert(_experimenter == 8992)
-        obj.subtype = reader.read("!H")[0]
-        reader.skip(2)
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -716,10 +703,7 @@ class nicira_dec_ttl(nicira):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!H", self.subtype))
-        packed.append('\x00' * 2)
-        packed.append('\x00' * 4)
+        packed.append(_struct_LH2x4x.pack(self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -727,17 +711,13 @@ class nicira_dec_ttl(nicira):
     @staticmethod
     def unpack(reader):
         obj = nicira_dec_ttl()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _subtype = reader.read_struct(_struct_LH2x4x)
         assert(_experimenter == 8992)
-        _subtype = reader.read("!H")[0]
         assert(_subtype == 18)
-        reader.skip(2)
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -755,6 +735,7 @@ class nicira_dec_ttl(nicira):
 nicira.subtypes[18] = nicira_dec_ttl
 """
 class output(action):
+    __slots__ = ['port', 'max_len']
     type = 0
 
     def __init__(self, port=None, max_len=None):
@@ -773,8 +754,7 @@ class output(action):
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
         packed.append(util.pack_port_no(self.port))
-        packed.append(struct.pack("!H", self.max_len))
-        packed.append('\x00' * 6)
+        packed.append(_struct_H6x.pack(self.max_len))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -782,9 +762,8 @@ class output(action):
     @staticmethod
     def unpack(reader):
         obj = output()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 0)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.port = util.unpack_port_no(reader)
@@ -814,6 +793,7 @@ class output(action):
 action.subtypes[0] = output
 
 class pop_mpls(action):
+    __slots__ = ['ethertype']
     type = 20
 
     def __init__(self, ethertype=None):
@@ -827,8 +807,7 @@ class pop_mpls(action):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!H", self.ethertype))
-        packed.append('\x00' * 2)
+        packed.append(_struct_H2x.pack(self.ethertype))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -836,9 +815,8 @@ class pop_mpls(action):
     @staticmethod
     def unpack(reader):
         obj = pop_mpls()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 20)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.ethertype = reader.read("!H")[0]
@@ -863,6 +841,7 @@ class pop_mpls(action):
 action.subtypes[20] = pop_mpls
 
 class pop_pbb(action):
+    __slots__ = []
     type = 27
 
     def __init__(self):
@@ -880,9 +859,8 @@ class pop_pbb(action):
     @staticmethod
     def unpack(reader):
         obj = pop_pbb()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 27)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         reader.skip(4)
@@ -903,6 +881,7 @@ class pop_pbb(action):
 action.subtypes[27] = pop_pbb
 
 class pop_vlan(action):
+    __slots__ = []
     type = 18
 
     def __init__(self):
@@ -920,9 +899,8 @@ class pop_vlan(action):
     @staticmethod
     def unpack(reader):
         obj = pop_vlan()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 18)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         reader.skip(4)
@@ -943,6 +921,7 @@ class pop_vlan(action):
 action.subtypes[18] = pop_vlan
 
 class push_mpls(action):
+    __slots__ = ['ethertype']
     type = 19
 
     def __init__(self, ethertype=None):
@@ -956,8 +935,7 @@ class push_mpls(action):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!H", self.ethertype))
-        packed.append('\x00' * 2)
+        packed.append(_struct_H2x.pack(self.ethertype))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -965,9 +943,8 @@ class push_mpls(action):
     @staticmethod
     def unpack(reader):
         obj = push_mpls()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 19)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.ethertype = reader.read("!H")[0]
@@ -992,6 +969,7 @@ class push_mpls(action):
 action.subtypes[19] = push_mpls
 
 class push_pbb(action):
+    __slots__ = ['ethertype']
     type = 26
 
     def __init__(self, ethertype=None):
@@ -1005,8 +983,7 @@ class push_pbb(action):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!H", self.ethertype))
-        packed.append('\x00' * 2)
+        packed.append(_struct_H2x.pack(self.ethertype))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1014,9 +991,8 @@ class push_pbb(action):
     @staticmethod
     def unpack(reader):
         obj = push_pbb()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 26)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.ethertype = reader.read("!H")[0]
@@ -1041,6 +1017,7 @@ class push_pbb(action):
 action.subtypes[26] = push_pbb
 
 class push_vlan(action):
+    __slots__ = ['ethertype']
     type = 17
 
     def __init__(self, ethertype=None):
@@ -1054,8 +1031,7 @@ class push_vlan(action):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!H", self.ethertype))
-        packed.append('\x00' * 2)
+        packed.append(_struct_H2x.pack(self.ethertype))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1063,9 +1039,8 @@ class push_vlan(action):
     @staticmethod
     def unpack(reader):
         obj = push_vlan()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 17)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.ethertype = reader.read("!H")[0]
@@ -1090,6 +1065,7 @@ class push_vlan(action):
 action.subtypes[17] = push_vlan
 
 class set_field(action):
+    __slots__ = ['field']
     type = 25
 
     def __init__(self, field=None):
@@ -1113,9 +1089,8 @@ class set_field(action):
     @staticmethod
     def unpack(reader):
         obj = set_field()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 25)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.field = ofp.oxm.oxm.unpack(reader)
@@ -1139,6 +1114,7 @@ class set_field(action):
 action.subtypes[25] = set_field
 
 class set_mpls_ttl(action):
+    __slots__ = ['mpls_ttl']
     type = 15
 
     def __init__(self, mpls_ttl=None):
@@ -1152,8 +1128,7 @@ class set_mpls_ttl(action):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!B", self.mpls_ttl))
-        packed.append('\x00' * 3)
+        packed.append(_struct_B3x.pack(self.mpls_ttl))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1161,9 +1136,8 @@ class set_mpls_ttl(action):
     @staticmethod
     def unpack(reader):
         obj = set_mpls_ttl()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 15)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.mpls_ttl = reader.read("!B")[0]
@@ -1188,6 +1162,7 @@ class set_mpls_ttl(action):
 action.subtypes[15] = set_mpls_ttl
 
 class set_nw_ttl(action):
+    __slots__ = ['nw_ttl']
     type = 23
 
     def __init__(self, nw_ttl=None):
@@ -1201,8 +1176,7 @@ class set_nw_ttl(action):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!B", self.nw_ttl))
-        packed.append('\x00' * 3)
+        packed.append(_struct_B3x.pack(self.nw_ttl))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1210,9 +1184,8 @@ class set_nw_ttl(action):
     @staticmethod
     def unpack(reader):
         obj = set_nw_ttl()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 23)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.nw_ttl = reader.read("!B")[0]
@@ -1237,6 +1210,7 @@ class set_nw_ttl(action):
 action.subtypes[23] = set_nw_ttl
 
 class set_queue(action):
+    __slots__ = ['queue_id']
     type = 21
 
     def __init__(self, queue_id=None):
@@ -1258,9 +1232,8 @@ class set_queue(action):
     @staticmethod
     def unpack(reader):
         obj = set_queue()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 21)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.queue_id = reader.read("!L")[0]
@@ -1286,7 +1259,9 @@ action.subtypes[21] = set_queue
 OFDPA_EXPERIMETER =0x00001018
 
 class ofdpa(experimenter):
+    __slots__ = ['subtype']
     subtypes = {}
+    subtype_field = ('!H', 8)
 
     type = 65535
     experimenter = OFDPA_EXPERIMETER
@@ -1302,9 +1277,7 @@ class ofdpa(experimenter):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!H", self.subtype))
-        packed.append('\x00' * 6)
+        packed.append(_struct_LH6x.pack(self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1318,15 +1291,12 @@ class ofdpa(experimenter):
             return subclass.unpack(reader)
 
         obj = ofdpa()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, obj.subtype = reader.read_struct(_struct_LH6x)
         assert(_experimenter == OFDPA_EXPERIMETER)
-        obj.subtype = reader.read("!H")[0]
-        reader.skip(6)
         return obj
 
     def __eq__(self, other):
@@ -1361,6 +1331,7 @@ OFDPA_ACT_SET_QOS_FROM_TABLE=15
 
 
 class ofdpa_push_l2_header(ofdpa):
+    __slots__ = []
     type = 65535
     experimenter = OFDPA_EXPERIMETER
     subtype = OFDPA_ACT_PUSH_L2_HEADER
@@ -1372,9 +1343,7 @@ class ofdpa_push_l2_header(ofdpa):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!H", self.subtype))
-        packed.append('\x00' * 6)
+        packed.append(_struct_LH6x.pack(self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1382,16 +1351,13 @@ class ofdpa_push_l2_header(ofdpa):
     @staticmethod
     def unpack(reader):
         obj = ofdpa_push_l2_header()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _subtype = reader.read_struct(_struct_LH6x)
         assert(_experimenter == OFDPA_EXPERIMETER)
-        _subtype = reader.read("!H")[0]
         assert(_subtype == OFDPA_ACT_PUSH_L2_HEADER)   
-        reader.skip(6)
         return obj
 
     def __eq__(self, other):
@@ -1410,6 +1376,7 @@ class ofdpa_push_l2_header(ofdpa):
 ofdpa.subtypes[OFDPA_ACT_PUSH_L2_HEADER] = ofdpa_push_l2_header
 
 class ofdpa_pop_l2_header(ofdpa):
+    __slots__ = []
     type = 65535
     experimenter = OFDPA_EXPERIMETER
     subtype = OFDPA_ACT_POP_L2_HEADER
@@ -1421,9 +1388,7 @@ class ofdpa_pop_l2_header(ofdpa):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!H", self.subtype))
-        packed.append('\x00' * 6)        
+        packed.append(_struct_LH6x.pack(self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1431,14 +1396,12 @@ class ofdpa_pop_l2_header(ofdpa):
     @staticmethod
     def unpack(reader):
         obj = ofdpa_pop_l2_header()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _subtype = reader.read_struct(_struct_LH)
         assert(_experimenter == OFDPA_EXPERIMETER)
-        _subtype = reader.read("!H")[0]
         assert(_subtype == OFDPA_ACT_POP_L2_HEADER)          
         return obj
 
@@ -1458,6 +1421,7 @@ class ofdpa_pop_l2_header(ofdpa):
 ofdpa.subtypes[OFDPA_ACT_POP_L2_HEADER] = ofdpa_pop_l2_header
 
 class ofdpa_push_cw(ofdpa):
+    __slots__ = []
     type = 65535
     experimenter = OFDPA_EXPERIMETER
     subtype = OFDPA_ACT_PUSH_CW
@@ -1469,9 +1433,7 @@ class ofdpa_push_cw(ofdpa):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!H", self.subtype))
-        packed.append('\x00' * 6)        
+        packed.append(_struct_LH6x.pack(self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1479,14 +1441,12 @@ class ofdpa_push_cw(ofdpa):
     @staticmethod
     def unpack(reader):
         obj = ofdpa_push_cw()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _subtype = reader.read_struct(_struct_LH)
         assert(_experimenter == OFDPA_EXPERIMETER)
-        _subtype = reader.read("!H")[0]
         assert(_subtype == OFDPA_ACT_PUSH_CW)          
         return obj
 
@@ -1506,6 +1466,7 @@ class ofdpa_push_cw(ofdpa):
 ofdpa.subtypes[OFDPA_ACT_PUSH_CW] = ofdpa_push_cw
 
 class ofdpa_pop_cw(ofdpa):
+    __slots__ = []
     type = 65535
     experimenter = OFDPA_EXPERIMETER
     subtype = OFDPA_ACT_POP_CW
@@ -1517,9 +1478,7 @@ class ofdpa_pop_cw(ofdpa):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!H", self.subtype))
-        packed.append('\x00' * 6)        
+        packed.append(_struct_LH6x.pack(self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1527,14 +1486,12 @@ class ofdpa_pop_cw(ofdpa):
     @staticmethod
     def unpack(reader):
         obj = ofdpa_pop_cw()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _subtype = reader.read_struct(_struct_LH)
         assert(_experimenter == OFDPA_EXPERIMETER)
-        _subtype = reader.read("!H")[0]
         assert(_subtype == OFDPA_ACT_POP_CW)          
         return obj
 
@@ -1554,6 +1511,7 @@ class ofdpa_pop_cw(ofdpa):
 ofdpa.subtypes[OFDPA_ACT_POP_CW] = ofdpa_pop_cw
 
 class ofdpa_copy_tc_in(ofdpa):
+    __slots__ = []
     type = 65535
     experimenter = OFDPA_EXPERIMETER
     subtype = OFDPA_ACT_COPY_TC_IN
@@ -1565,9 +1523,7 @@ class ofdpa_copy_tc_in(ofdpa):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!H", self.subtype))
-        packed.append('\x00' * 6)        
+        packed.append(_struct_LH6x.pack(self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1575,14 +1531,12 @@ class ofdpa_copy_tc_in(ofdpa):
     @staticmethod
     def unpack(reader):
         obj = ofdpa_copy_tc_in()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _subtype = reader.read_struct(_struct_LH)
         assert(_experimenter == OFDPA_EXPERIMETER)
-        _subtype = reader.read("!H")[0]
         assert(_subtype == OFDPA_ACT_COPY_TC_IN)  
         return obj
 
@@ -1602,6 +1556,7 @@ class ofdpa_copy_tc_in(ofdpa):
 ofdpa.subtypes[OFDPA_ACT_COPY_TC_IN] = ofdpa_copy_tc_in
 
 class ofdpa_copy_tc_out(ofdpa):
+    __slots__ = []
     type = 65535
     experimenter = OFDPA_EXPERIMETER
     subtype = OFDPA_ACT_COPY_TC_OUT
@@ -1613,9 +1568,7 @@ class ofdpa_copy_tc_out(ofdpa):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!H", self.subtype))
-        packed.append('\x00' * 6)        
+        packed.append(_struct_LH6x.pack(self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1623,14 +1576,12 @@ class ofdpa_copy_tc_out(ofdpa):
     @staticmethod
     def unpack(reader):
         obj = ofdpa_copy_tc_out()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _subtype = reader.read_struct(_struct_LH)
         assert(_experimenter == OFDPA_EXPERIMETER)
-        _subtype = reader.read("!H")[0]
         assert(_subtype == OFDPA_ACT_COPY_TC_OUT)        
         return obj
 
@@ -1650,6 +1601,7 @@ class ofdpa_copy_tc_out(ofdpa):
 ofdpa.subtypes[OFDPA_ACT_COPY_TC_OUT] = ofdpa_copy_tc_out
 
 class ofdpa_dec_ttl_mtu(ofdpa):
+    __slots__ = []
     type = 65535
     experimenter = OFDPA_EXPERIMETER
     subtype = OFDPA_ACT_DEC_TTL_MTU
@@ -1661,9 +1613,7 @@ class ofdpa_dec_ttl_mtu(ofdpa):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!H", self.subtype))
-        packed.append('\x00' * 6)        
+        packed.append(_struct_LH6x.pack(self.experimenter, self.subtype))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1671,14 +1621,12 @@ class ofdpa_dec_ttl_mtu(ofdpa):
     @staticmethod
     def unpack(reader):
         obj = ofdpa_dec_ttl_mtu()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _subtype = reader.read_struct(_struct_LH)
         assert(_experimenter == OFDPA_EXPERIMETER)
-        _subtype = reader.read("!H")[0]
         assert(_subtype == OFDPA_ACT_DEC_TTL_MTU)        
         return obj
 
@@ -1698,6 +1646,7 @@ class ofdpa_dec_ttl_mtu(ofdpa):
 ofdpa.subtypes[OFDPA_ACT_DEC_TTL_MTU] = ofdpa_dec_ttl_mtu
 
 class ofdpa_set_tc_from_table(ofdpa):
+    __slots__ = ['qos_index']
     type = 65535
     experimenter = OFDPA_EXPERIMETER
     subtype = OFDPA_ACT_SET_TC_FROM_TABLE
@@ -1713,10 +1662,7 @@ class ofdpa_set_tc_from_table(ofdpa):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!H", self.subtype))
-        packed.append(struct.pack("!B", self.qos_index))
-        packed.append('\x00' * 5)        
+        packed.append(_struct_LHB5x.pack(self.experimenter, self.subtype, self.qos_index))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1724,16 +1670,13 @@ class ofdpa_set_tc_from_table(ofdpa):
     @staticmethod
     def unpack(reader):
         obj = ofdpa_set_tc_from_table()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _subtype, obj.qos_index = reader.read_struct(_struct_LHB)
         assert(_experimenter == OFDPA_EXPERIMETER)
-        _subtype = reader.read("!H")[0]
         assert(_subtype == OFDPA_ACT_SET_TC_FROM_TABLE)
-        obj.qos_index = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -1755,6 +1698,7 @@ ofdpa.subtypes[OFDPA_ACT_SET_TC_FROM_TABLE] = ofdpa_set_tc_from_table
 
 
 class ofdpa_set_pcp_dfi_from_table(ofdpa):
+    __slots__ = ['qos_index']
     type = 65535
     experimenter = OFDPA_EXPERIMETER
     subtype = OFDPA_ACT_SET_PCP_DFI_FROM_TABLE
@@ -1770,10 +1714,7 @@ class ofdpa_set_pcp_dfi_from_table(ofdpa):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!H", self.subtype))
-        packed.append(struct.pack("!B", self.qos_index))
-        packed.append('\x00' * 5)         
+        packed.append(_struct_LHB5x.pack(self.experimenter, self.subtype, self.qos_index))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1781,16 +1722,13 @@ class ofdpa_set_pcp_dfi_from_table(ofdpa):
     @staticmethod
     def unpack(reader):
         obj = ofdpa_set_pcp_dfi_from_table()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _subtype, obj.qos_index = reader.read_struct(_struct_LHB)
         assert(_experimenter == OFDPA_EXPERIMETER)
-        _subtype = reader.read("!H")[0]
         assert(_subtype == OFDPA_ACT_SET_PCP_DFI_FROM_TABLE)
-        obj.qos_index = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -1812,6 +1750,7 @@ ofdpa.subtypes[OFDPA_ACT_SET_PCP_DFI_FROM_TABLE] = ofdpa_set_pcp_dfi_from_table
 
 
 class ofdpa_check_drop_status(ofdpa):
+    __slots__ = ['index', 'status_type']
     type = 65535
     experimenter = OFDPA_EXPERIMETER
     subtype = OFDPA_ACT_CHECK_DROP_STATUS
@@ -1825,11 +1764,7 @@ class ofdpa_check_drop_status(ofdpa):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!H", self.subtype))
-        packed.append(struct.pack("!L", self.index))
-        packed.append(struct.pack("!B", self.status_type))  
-        packed.append('\x00' * 1)    
+        packed.append(_struct_LHLB1x.pack(self.experimenter, self.subtype, self.index, self.status_type))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1837,17 +1772,13 @@ class ofdpa_check_drop_status(ofdpa):
     @staticmethod
     def unpack(reader):
         obj = ofdpa_check_drop_status()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _subtype, obj.status_type, obj.index = reader.read_struct(_struct_LHLB)
         assert(_experimenter == OFDPA_EXPERIMETER)
-        _subtype = reader.read("!H")[0]
         assert(_subtype == OFDPA_ACT_CHECK_DROP_STATUS)
-        obj.status_type  = reader.read("!L")[0]
-        obj.index = reader.read("!B")[0]        
         return obj
 
     def __eq__(self, other):
@@ -1871,6 +1802,7 @@ ofdpa.subtypes[OFDPA_ACT_CHECK_DROP_STATUS] = ofdpa_check_drop_status
 
 
 class ofdpa_set_qos_from_table(ofdpa):
+    __slots__ = ['qos_index', 'mpls_tc']
     type = 65535
     experimenter = OFDPA_EXPERIMETER
     subtype = OFDPA_ACT_SET_QOS_FROM_TABLE
@@ -1884,11 +1816,7 @@ class ofdpa_set_qos_from_table(ofdpa):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!H", self.subtype))
-        packed.append(struct.pack("!B", self.qos_index))
-        packed.append(struct.pack("!B", self.mpls_tc))   
-        packed.append('\x00' * 4)           
+        packed.append(_struct_LHBB4x.pack(self.experimenter, self.subtype, self.qos_index, self.mpls_tc))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1896,17 +1824,13 @@ class ofdpa_set_qos_from_table(ofdpa):
     @staticmethod
     def unpack(reader):
         obj = ofdpa_check_drop_status()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _subtype, obj.qos_index, obj.mpls_tc = reader.read_struct(_struct_LHBB)
         assert(_experimenter == OFDPA_EXPERIMETER)
-        _subtype = reader.read("!H")[0]
         assert(_subtype == OFDPA_ACT_SET_QOS_FROM_TABLE)
-        obj.qos_index = reader.read("!B")[0]
-        obj.mpls_tc  = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -1930,6 +1854,7 @@ ofdpa.subtypes[OFDPA_ACT_SET_QOS_FROM_TABLE] = ofdpa_set_qos_from_table
 
 
 class ofdpa_oam_lm_tx_count(ofdpa):
+    __slots__ = ['lmep_id', 'traffic_class']
     type = 65535
     experimenter = OFDPA_EXPERIMETER
     subtype = OFDPA_ACT_OAM_LM_TX_COUNT
@@ -1943,11 +1868,7 @@ class ofdpa_oam_lm_tx_count(ofdpa):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!H", self.subtype))
-        packed.append(struct.pack("!L", self.lmep_id))
-        packed.append(struct.pack("!B", self.traffic_class))   
-        packed.append('\x00' * 1)   
+        packed.append(_struct_LHLB1x.pack(self.experimenter, self.subtype, self.lmep_id, self.traffic_class))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -1955,17 +1876,13 @@ class ofdpa_oam_lm_tx_count(ofdpa):
     @staticmethod
     def unpack(reader):
         obj = ofdpa_check_drop_status()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _subtype, obj.lmep_id, obj.traffic_class = reader.read_struct(_struct_LHLB)
         assert(_experimenter == OFDPA_EXPERIMETER)
-        _subtype = reader.read("!H")[0]
         assert(_subtype == OFDPA_ACT_OAM_LM_TX_COUNT)
-        obj.lmep_id = reader.read("!L")[0]
-        obj.traffic_class  = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -1988,6 +1905,7 @@ class ofdpa_oam_lm_tx_count(ofdpa):
 ofdpa.subtypes[OFDPA_ACT_OAM_LM_TX_COUNT] = ofdpa_oam_lm_tx_count
 
 class ofdpa_oam_lm_rx_count(ofdpa):
+    __slots__ = ['lmep_id', 'traffic_class']
     type = 65535
     experimenter = OFDPA_EXPERIMETER
     subtype = OFDPA_ACT_OAM_LM_RX_COUNT
@@ -2001,11 +1919,7 @@ class ofdpa_oam_lm_rx_count(ofdpa):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!H", self.subtype))
-        packed.append(struct.pack("!L", self.lmep_id))
-        packed.append(struct.pack("!B", self.traffic_class))  
-        packed.append('\x00' * 1)   
+        packed.append(_struct_LHLB1x.pack(self.experimenter, self.subtype, self.lmep_id, self.traffic_class))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -2013,17 +1927,13 @@ class ofdpa_oam_lm_rx_count(ofdpa):
     @staticmethod
     def unpack(reader):
         obj = ofdpa_check_drop_status()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _subtype, obj.lmep_id, obj.traffic_class = reader.read_struct(_struct_LHLB)
         assert(_experimenter == OFDPA_EXPERIMETER)
-        _subtype = reader.read("!H")[0]
         assert(_subtype == OFDPA_ACT_OAM_LM_RX_COUNT)
-        obj.lmep_id = reader.read("!L")[0]
-        obj.traffic_class  = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -2047,6 +1957,7 @@ ofdpa.subtypes[OFDPA_ACT_OAM_LM_RX_COUNT] = ofdpa_oam_lm_rx_count
 
 
 class ofdpa_oam_set_counter_field(ofdpa):
+    __slots__ = ['lmep_id', 'traffic_class']
     type = 65535
     experimenter = OFDPA_EXPERIMETER
     subtype = OFDPA_ACT_OAM_SET_COUNTER_FIELDS
@@ -2060,11 +1971,7 @@ class ofdpa_oam_set_counter_field(ofdpa):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!H", self.subtype))
-        packed.append(struct.pack("!L", self.lmep_id))
-        packed.append(struct.pack("!B", self.traffic_class))  
-        packed.append('\x00' * 1)   
+        packed.append(_struct_LHLB1x.pack(self.experimenter, self.subtype, self.lmep_id, self.traffic_class))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -2072,17 +1979,13 @@ class ofdpa_oam_set_counter_field(ofdpa):
     @staticmethod
     def unpack(reader):
         obj = ofdpa_check_drop_status()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _subtype, obj.lmep_id, obj.traffic_class = reader.read_struct(_struct_LHLB)
         assert(_experimenter == OFDPA_EXPERIMETER)
-        _subtype = reader.read("!H")[0]
         assert(_subtype == OFDPA_ACT_OAM_SET_COUNTER_FIELDS)
-        obj.lmep_id = reader.read("!L")[0]
-        obj.traffic_class  = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -14,8 +14,13 @@ import loxi.generic_util
 import sys
 ofp = sys.modules['loxi.of13']
 
+# Precompiled layouts of fixed-size field runs
+_struct_HH = struct.Struct("!HH")
+
 class bsn_tlv(loxi.OFObject):
+    __slots__ = ['type']
     subtypes = {}
+    subtype_field = ('!H', 0)
 
 
     def __init__(self, type=None):
@@ -41,8 +46,7 @@ class bsn_tlv(loxi.OFObject):
             return subclass.unpack(reader)
 
         obj = bsn_tlv()
-        obj.type = reader.read("!H")[0]
-        _length = reader.read("!H")[0]
+        obj.type, _length = reader.read_struct(_struct_HH)
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         return obj
@@ -62,6 +66,7 @@ class bsn_tlv(loxi.OFObject):
 
 
 class actor_key(bsn_tlv):
+    __slots__ = ['value']
     type = 44
 
     def __init__(self, value=None):
@@ -83,9 +88,8 @@ class actor_key(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = actor_key()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 44)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!H")[0]
@@ -109,6 +113,7 @@ class actor_key(bsn_tlv):
 bsn_tlv.subtypes[44] = actor_key
 
 class actor_port_num(bsn_tlv):
+    __slots__ = ['value']
     type = 43
 
     def __init__(self, value=None):
@@ -130,9 +135,8 @@ class actor_port_num(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = actor_port_num()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 43)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!H")[0]
@@ -156,6 +160,7 @@ class actor_port_num(bsn_tlv):
 bsn_tlv.subtypes[43] = actor_port_num
 
 class actor_port_priority(bsn_tlv):
+    __slots__ = ['value']
     type = 42
 
     def __init__(self, value=None):
@@ -177,9 +182,8 @@ class actor_port_priority(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = actor_port_priority()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 42)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!H")[0]
@@ -203,6 +207,7 @@ class actor_port_priority(bsn_tlv):
 bsn_tlv.subtypes[42] = actor_port_priority
 
 class actor_state(bsn_tlv):
+    __slots__ = ['value']
     type = 53
 
     def __init__(self, value=None):
@@ -224,9 +229,8 @@ class actor_state(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = actor_state()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 53)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!B")[0]
@@ -250,6 +254,7 @@ class actor_state(bsn_tlv):
 bsn_tlv.subtypes[53] = actor_state
 
 class actor_system_mac(bsn_tlv):
+    __slots__ = ['value']
     type = 41
 
     def __init__(self, value=None):
@@ -271,9 +276,8 @@ class actor_system_mac(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = actor_system_mac()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 41)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = list(reader.read('!6B'))
@@ -297,6 +301,7 @@ class actor_system_mac(bsn_tlv):
 bsn_tlv.subtypes[41] = actor_system_mac
 
 class actor_system_priority(bsn_tlv):
+    __slots__ = ['value']
     type = 40
 
     def __init__(self, value=None):
@@ -318,9 +323,8 @@ class actor_system_priority(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = actor_system_priority()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 40)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!H")[0]
@@ -344,6 +348,7 @@ class actor_system_priority(bsn_tlv):
 bsn_tlv.subtypes[40] = actor_system_priority
 
 class anchor(bsn_tlv):
+    __slots__ = ['value']
     type = 81
 
     def __init__(self, value=None):
@@ -365,9 +370,8 @@ class anchor(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = anchor()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 81)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!H")[0]
@@ -391,6 +395,7 @@ class anchor(bsn_tlv):
 bsn_tlv.subtypes[81] = anchor
 
 class broadcast_query_timeout(bsn_tlv):
+    __slots__ = ['value']
     type = 10
 
     def __init__(self, value=None):
@@ -412,9 +417,8 @@ class broadcast_query_timeout(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = broadcast_query_timeout()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 10)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!L")[0]
@@ -438,6 +442,7 @@ class broadcast_query_timeout(bsn_tlv):
 bsn_tlv.subtypes[10] = broadcast_query_timeout
 
 class bucket(bsn_tlv):
+    __slots__ = ['value']
     type = 64
 
     def __init__(self, value=None):
@@ -459,9 +464,8 @@ class bucket(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = bucket()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 64)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = loxi.generic_util.unpack_list(reader, ofp.bsn_tlv.bsn_tlv.unpack)
@@ -485,6 +489,7 @@ class bucket(bsn_tlv):
 bsn_tlv.subtypes[64] = bucket
 
 class circuit_id(bsn_tlv):
+    __slots__ = ['value']
     type = 14
 
     def __init__(self, value=None):
@@ -506,9 +511,8 @@ class circuit_id(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = circuit_id()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 14)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = str(reader.read_all())
@@ -532,6 +536,7 @@ class circuit_id(bsn_tlv):
 bsn_tlv.subtypes[14] = circuit_id
 
 class convergence_status(bsn_tlv):
+    __slots__ = ['value']
     type = 45
 
     def __init__(self, value=None):
@@ -553,9 +558,8 @@ class convergence_status(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = convergence_status()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 45)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!B")[0]
@@ -579,6 +583,7 @@ class convergence_status(bsn_tlv):
 bsn_tlv.subtypes[45] = convergence_status
 
 class crc_enabled(bsn_tlv):
+    __slots__ = ['value']
     type = 22
 
     def __init__(self, value=None):
@@ -600,9 +605,8 @@ class crc_enabled(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = crc_enabled()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 22)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!B")[0]
@@ -626,6 +630,7 @@ class crc_enabled(bsn_tlv):
 bsn_tlv.subtypes[22] = crc_enabled
 
 class data(bsn_tlv):
+    __slots__ = ['value']
     type = 55
 
     def __init__(self, value=None):
@@ -647,9 +652,8 @@ class data(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = data()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 55)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = str(reader.read_all())
@@ -673,6 +677,7 @@ class data(bsn_tlv):
 bsn_tlv.subtypes[55] = data
 
 class eth_dst(bsn_tlv):
+    __slots__ = ['value']
     type = 33
 
     def __init__(self, value=None):
@@ -694,9 +699,8 @@ class eth_dst(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = eth_dst()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 33)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = list(reader.read('!6B'))
@@ -720,6 +724,7 @@ class eth_dst(bsn_tlv):
 bsn_tlv.subtypes[33] = eth_dst
 
 class eth_src(bsn_tlv):
+    __slots__ = ['value']
     type = 32
 
     def __init__(self, value=None):
@@ -741,9 +746,8 @@ class eth_src(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = eth_src()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 32)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = list(reader.read('!6B'))
@@ -767,6 +771,7 @@ class eth_src(bsn_tlv):
 bsn_tlv.subtypes[32] = eth_src
 
 class external_gateway_ip(bsn_tlv):
+    __slots__ = ['value']
     type = 26
 
     def __init__(self, value=None):
@@ -788,9 +793,8 @@ class external_gateway_ip(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = external_gateway_ip()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 26)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!L")[0]
@@ -814,6 +818,7 @@ class external_gateway_ip(bsn_tlv):
 bsn_tlv.subtypes[26] = external_gateway_ip
 
 class external_gateway_mac(bsn_tlv):
+    __slots__ = ['value']
     type = 29
 
     def __init__(self, value=None):
@@ -835,9 +840,8 @@ class external_gateway_mac(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = external_gateway_mac()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 29)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = list(reader.read('!6B'))
@@ -861,6 +865,7 @@ class external_gateway_mac(bsn_tlv):
 bsn_tlv.subtypes[29] = external_gateway_mac
 
 class external_ip(bsn_tlv):
+    __slots__ = ['value']
     type = 23
 
     def __init__(self, value=None):
@@ -882,9 +887,8 @@ class external_ip(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = external_ip()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 23)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!L")[0]
@@ -908,6 +912,7 @@ class external_ip(bsn_tlv):
 bsn_tlv.subtypes[23] = external_ip
 
 class external_mac(bsn_tlv):
+    __slots__ = ['value']
     type = 24
 
     def __init__(self, value=None):
@@ -929,9 +934,8 @@ class external_mac(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = external_mac()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 24)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = list(reader.read('!6B'))
@@ -955,6 +959,7 @@ class external_mac(bsn_tlv):
 bsn_tlv.subtypes[24] = external_mac
 
 class external_netmask(bsn_tlv):
+    __slots__ = ['value']
     type = 25
 
     def __init__(self, value=None):
@@ -976,9 +981,8 @@ class external_netmask(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = external_netmask()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 25)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!L")[0]
@@ -1002,6 +1006,7 @@ class external_netmask(bsn_tlv):
 bsn_tlv.subtypes[25] = external_netmask
 
 class generation_id(bsn_tlv):
+    __slots__ = ['value']
     type = 80
 
     def __init__(self, value=None):
@@ -1023,9 +1028,8 @@ class generation_id(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = generation_id()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 80)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!Q")[0]
@@ -1049,6 +1053,7 @@ class generation_id(bsn_tlv):
 bsn_tlv.subtypes[80] = generation_id
 
 class header_size(bsn_tlv):
+    __slots__ = ['value']
     type = 31
 
     def __init__(self, value=None):
@@ -1070,9 +1075,8 @@ class header_size(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = header_size()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 31)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!L")[0]
@@ -1096,6 +1100,7 @@ class header_size(bsn_tlv):
 bsn_tlv.subtypes[31] = header_size
 
 class icmp_code(bsn_tlv):
+    __slots__ = ['value']
     type = 69
 
     def __init__(self, value=None):
@@ -1117,9 +1122,8 @@ class icmp_code(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = icmp_code()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 69)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!B")[0]
@@ -1143,6 +1147,7 @@ class icmp_code(bsn_tlv):
 bsn_tlv.subtypes[69] = icmp_code
 
 class icmp_id(bsn_tlv):
+    __slots__ = ['value']
     type = 70
 
     def __init__(self, value=None):
@@ -1164,9 +1169,8 @@ class icmp_id(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = icmp_id()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 70)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!H")[0]
@@ -1190,6 +1194,7 @@ class icmp_id(bsn_tlv):
 bsn_tlv.subtypes[70] = icmp_id
 
 class icmp_type(bsn_tlv):
+    __slots__ = ['value']
     type = 68
 
     def __init__(self, value=None):
@@ -1211,9 +1216,8 @@ class icmp_type(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = icmp_type()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 68)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!B")[0]
@@ -1237,6 +1241,7 @@ class icmp_type(bsn_tlv):
 bsn_tlv.subtypes[68] = icmp_type
 
 class idle_notification(bsn_tlv):
+    __slots__ = []
     type = 7
 
     def __init__(self):
@@ -1253,9 +1258,8 @@ class idle_notification(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = idle_notification()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 7)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         return obj
@@ -1275,6 +1279,7 @@ class idle_notification(bsn_tlv):
 bsn_tlv.subtypes[7] = idle_notification
 
 class idle_time(bsn_tlv):
+    __slots__ = ['value']
     type = 5
 
     def __init__(self, value=None):
@@ -1296,9 +1301,8 @@ class idle_time(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = idle_time()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 5)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!Q")[0]
@@ -1322,6 +1326,7 @@ class idle_time(bsn_tlv):
 bsn_tlv.subtypes[5] = idle_time
 
 class idle_timeout(bsn_tlv):
+    __slots__ = ['value']
     type = 8
 
     def __init__(self, value=None):
@@ -1343,9 +1348,8 @@ class idle_timeout(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = idle_timeout()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 8)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!L")[0]
@@ -1369,6 +1373,7 @@ class idle_timeout(bsn_tlv):
 bsn_tlv.subtypes[8] = idle_timeout
 
 class igmp_snooping(bsn_tlv):
+    __slots__ = []
     type = 78
 
     def __init__(self):
@@ -1385,9 +1390,8 @@ class igmp_snooping(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = igmp_snooping()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 78)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         return obj
@@ -1407,6 +1411,7 @@ class igmp_snooping(bsn_tlv):
 bsn_tlv.subtypes[78] = igmp_snooping
 
 class internal_gateway_mac(bsn_tlv):
+    __slots__ = ['value']
     type = 28
 
     def __init__(self, value=None):
@@ -1428,9 +1433,8 @@ class internal_gateway_mac(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = internal_gateway_mac()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 28)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = list(reader.read('!6B'))
@@ -1454,6 +1458,7 @@ class internal_gateway_mac(bsn_tlv):
 bsn_tlv.subtypes[28] = internal_gateway_mac
 
 class internal_mac(bsn_tlv):
+    __slots__ = ['value']
     type = 27
 
     def __init__(self, value=None):
@@ -1475,9 +1480,8 @@ class internal_mac(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = internal_mac()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 27)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = list(reader.read('!6B'))
@@ -1501,6 +1505,7 @@ class internal_mac(bsn_tlv):
 bsn_tlv.subtypes[27] = internal_mac
 
 class interval(bsn_tlv):
+    __slots__ = ['value']
     type = 58
 
     def __init__(self, value=None):
@@ -1522,9 +1527,8 @@ class interval(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = interval()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 58)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!L")[0]
@@ -1548,6 +1552,7 @@ class interval(bsn_tlv):
 bsn_tlv.subtypes[58] = interval
 
 class ip_proto(bsn_tlv):
+    __slots__ = ['value']
     type = 67
 
     def __init__(self, value=None):
@@ -1569,9 +1574,8 @@ class ip_proto(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = ip_proto()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 67)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!B")[0]
@@ -1595,6 +1599,7 @@ class ip_proto(bsn_tlv):
 bsn_tlv.subtypes[67] = ip_proto
 
 class ipv4(bsn_tlv):
+    __slots__ = ['value']
     type = 4
 
     def __init__(self, value=None):
@@ -1616,9 +1621,8 @@ class ipv4(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = ipv4()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!L")[0]
@@ -1642,6 +1646,7 @@ class ipv4(bsn_tlv):
 bsn_tlv.subtypes[4] = ipv4
 
 class ipv4_dst(bsn_tlv):
+    __slots__ = ['value']
     type = 35
 
     def __init__(self, value=None):
@@ -1663,9 +1668,8 @@ class ipv4_dst(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = ipv4_dst()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 35)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!L")[0]
@@ -1689,6 +1693,7 @@ class ipv4_dst(bsn_tlv):
 bsn_tlv.subtypes[35] = ipv4_dst
 
 class ipv4_netmask(bsn_tlv):
+    __slots__ = ['value']
     type = 60
 
     def __init__(self, value=None):
@@ -1710,9 +1715,8 @@ class ipv4_netmask(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = ipv4_netmask()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 60)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!L")[0]
@@ -1736,6 +1740,7 @@ class ipv4_netmask(bsn_tlv):
 bsn_tlv.subtypes[60] = ipv4_netmask
 
 class ipv4_src(bsn_tlv):
+    __slots__ = ['value']
     type = 34
 
     def __init__(self, value=None):
@@ -1757,9 +1762,8 @@ class ipv4_src(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = ipv4_src()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 34)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!L")[0]
@@ -1783,6 +1787,7 @@ class ipv4_src(bsn_tlv):
 bsn_tlv.subtypes[34] = ipv4_src
 
 class l2_multicast_lookup(bsn_tlv):
+    __slots__ = []
     type = 79
 
     def __init__(self):
@@ -1799,9 +1804,8 @@ class l2_multicast_lookup(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = l2_multicast_lookup()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 79)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         return obj
@@ -1821,6 +1825,7 @@ class l2_multicast_lookup(bsn_tlv):
 bsn_tlv.subtypes[79] = l2_multicast_lookup
 
 class mac(bsn_tlv):
+    __slots__ = ['value']
     type = 1
 
     def __init__(self, value=None):
@@ -1842,9 +1847,8 @@ class mac(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = mac()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = list(reader.read('!6B'))
@@ -1868,6 +1872,7 @@ class mac(bsn_tlv):
 bsn_tlv.subtypes[1] = mac
 
 class mac_mask(bsn_tlv):
+    __slots__ = ['value']
     type = 56
 
     def __init__(self, value=None):
@@ -1889,9 +1894,8 @@ class mac_mask(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = mac_mask()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 56)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = list(reader.read('!6B'))
@@ -1915,6 +1919,7 @@ class mac_mask(bsn_tlv):
 bsn_tlv.subtypes[56] = mac_mask
 
 class miss_packets(bsn_tlv):
+    __slots__ = ['value']
     type = 13
 
     def __init__(self, value=None):
@@ -1936,9 +1941,8 @@ class miss_packets(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = miss_packets()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 13)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!Q")[0]
@@ -1962,6 +1966,7 @@ class miss_packets(bsn_tlv):
 bsn_tlv.subtypes[13] = miss_packets
 
 class mpls_control_word(bsn_tlv):
+    __slots__ = ['value']
     type = 62
 
     def __init__(self, value=None):
@@ -1983,9 +1988,8 @@ class mpls_control_word(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = mpls_control_word()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 62)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!B")[0]
@@ -2009,6 +2013,7 @@ class mpls_control_word(bsn_tlv):
 bsn_tlv.subtypes[62] = mpls_control_word
 
 class mpls_label(bsn_tlv):
+    __slots__ = ['value']
     type = 61
 
     def __init__(self, value=None):
@@ -2030,9 +2035,8 @@ class mpls_label(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = mpls_label()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 61)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!L")[0]
@@ -2056,6 +2060,7 @@ class mpls_label(bsn_tlv):
 bsn_tlv.subtypes[61] = mpls_label
 
 class mpls_sequenced(bsn_tlv):
+    __slots__ = ['value']
     type = 63
 
     def __init__(self, value=None):
@@ -2077,9 +2082,8 @@ class mpls_sequenced(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = mpls_sequenced()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 63)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!B")[0]
@@ -2103,6 +2107,7 @@ class mpls_sequenced(bsn_tlv):
 bsn_tlv.subtypes[63] = mpls_sequenced
 
 class name(bsn_tlv):
+    __slots__ = ['value']
     type = 52
 
     def __init__(self, value=None):
@@ -2124,9 +2129,8 @@ class name(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = name()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 52)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = str(reader.read_all())
@@ -2150,6 +2154,7 @@ class name(bsn_tlv):
 bsn_tlv.subtypes[52] = name
 
 class offset(bsn_tlv):
+    __slots__ = ['value']
     type = 82
 
     def __init__(self, value=None):
@@ -2171,9 +2176,8 @@ class offset(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = offset()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 82)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!H")[0]
@@ -2197,6 +2201,7 @@ class offset(bsn_tlv):
 bsn_tlv.subtypes[82] = offset
 
 class partner_key(bsn_tlv):
+    __slots__ = ['value']
     type = 51
 
     def __init__(self, value=None):
@@ -2218,9 +2223,8 @@ class partner_key(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = partner_key()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 51)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!H")[0]
@@ -2244,6 +2248,7 @@ class partner_key(bsn_tlv):
 bsn_tlv.subtypes[51] = partner_key
 
 class partner_port_num(bsn_tlv):
+    __slots__ = ['value']
     type = 50
 
     def __init__(self, value=None):
@@ -2265,9 +2270,8 @@ class partner_port_num(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = partner_port_num()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 50)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!H")[0]
@@ -2291,6 +2295,7 @@ class partner_port_num(bsn_tlv):
 bsn_tlv.subtypes[50] = partner_port_num
 
 class partner_port_priority(bsn_tlv):
+    __slots__ = ['value']
     type = 49
 
     def __init__(self, value=None):
@@ -2312,9 +2317,8 @@ class partner_port_priority(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = partner_port_priority()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 49)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!H")[0]
@@ -2338,6 +2342,7 @@ class partner_port_priority(bsn_tlv):
 bsn_tlv.subtypes[49] = partner_port_priority
 
 class partner_state(bsn_tlv):
+    __slots__ = ['value']
     type = 54
 
     def __init__(self, value=None):
@@ -2359,9 +2364,8 @@ class partner_state(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = partner_state()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 54)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!B")[0]
@@ -2385,6 +2389,7 @@ class partner_state(bsn_tlv):
 bsn_tlv.subtypes[54] = partner_state
 
 class partner_system_mac(bsn_tlv):
+    __slots__ = ['value']
     type = 48
 
     def __init__(self, value=None):
@@ -2406,9 +2411,8 @@ class partner_system_mac(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = partner_system_mac()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 48)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = list(reader.read('!6B'))
@@ -2432,6 +2436,7 @@ class partner_system_mac(bsn_tlv):
 bsn_tlv.subtypes[48] = partner_system_mac
 
 class partner_system_priority(bsn_tlv):
+    __slots__ = ['value']
     type = 47
 
     def __init__(self, value=None):
@@ -2453,9 +2458,8 @@ class partner_system_priority(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = partner_system_priority()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 47)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!H")[0]
@@ -2479,6 +2483,7 @@ class partner_system_priority(bsn_tlv):
 bsn_tlv.subtypes[47] = partner_system_priority
 
 class port(bsn_tlv):
+    __slots__ = ['value']
     type = 0
 
     def __init__(self, value=None):
@@ -2500,9 +2505,8 @@ class port(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = port()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 0)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = util.unpack_port_no(reader)
@@ -2526,6 +2530,7 @@ class port(bsn_tlv):
 bsn_tlv.subtypes[0] = port
 
 class priority(bsn_tlv):
+    __slots__ = ['value']
     type = 57
 
     def __init__(self, value=None):
@@ -2547,9 +2552,8 @@ class priority(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = priority()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 57)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!L")[0]
@@ -2573,6 +2577,7 @@ class priority(bsn_tlv):
 bsn_tlv.subtypes[57] = priority
 
 class queue_id(bsn_tlv):
+    __slots__ = ['value']
     type = 20
 
     def __init__(self, value=None):
@@ -2594,9 +2599,8 @@ class queue_id(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = queue_id()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 20)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!L")[0]
@@ -2620,6 +2624,7 @@ class queue_id(bsn_tlv):
 bsn_tlv.subtypes[20] = queue_id
 
 class queue_weight(bsn_tlv):
+    __slots__ = ['value']
     type = 21
 
     def __init__(self, value=None):
@@ -2641,9 +2646,8 @@ class queue_weight(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = queue_weight()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 21)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!L")[0]
@@ -2667,6 +2671,7 @@ class queue_weight(bsn_tlv):
 bsn_tlv.subtypes[21] = queue_weight
 
 class reference(bsn_tlv):
+    __slots__ = ['table_id', 'key']
     type = 59
 
     def __init__(self, table_id=None, key=None):
@@ -2693,9 +2698,8 @@ class reference(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = reference()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 59)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.table_id = reader.read("!H")[0]
@@ -2724,6 +2728,7 @@ class reference(bsn_tlv):
 bsn_tlv.subtypes[59] = reference
 
 class reply_packets(bsn_tlv):
+    __slots__ = ['value']
     type = 12
 
     def __init__(self, value=None):
@@ -2745,9 +2750,8 @@ class reply_packets(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = reply_packets()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 12)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!Q")[0]
@@ -2771,6 +2775,7 @@ class reply_packets(bsn_tlv):
 bsn_tlv.subtypes[12] = reply_packets
 
 class request_packets(bsn_tlv):
+    __slots__ = ['value']
     type = 11
 
     def __init__(self, value=None):
@@ -2792,9 +2797,8 @@ class request_packets(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = request_packets()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 11)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!Q")[0]
@@ -2818,6 +2822,7 @@ class request_packets(bsn_tlv):
 bsn_tlv.subtypes[11] = request_packets
 
 class rx_bytes(bsn_tlv):
+    __slots__ = ['value']
     type = 71
 
     def __init__(self, value=None):
@@ -2839,9 +2844,8 @@ class rx_bytes(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = rx_bytes()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 71)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!Q")[0]
@@ -2865,6 +2869,7 @@ class rx_bytes(bsn_tlv):
 bsn_tlv.subtypes[71] = rx_bytes
 
 class rx_packets(bsn_tlv):
+    __slots__ = ['value']
     type = 2
 
     def __init__(self, value=None):
@@ -2886,9 +2891,8 @@ class rx_packets(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = rx_packets()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 2)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!Q")[0]
@@ -2912,6 +2916,7 @@ class rx_packets(bsn_tlv):
 bsn_tlv.subtypes[2] = rx_packets
 
 class sampling_rate(bsn_tlv):
+    __slots__ = ['value']
     type = 30
 
     def __init__(self, value=None):
@@ -2933,9 +2938,8 @@ class sampling_rate(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = sampling_rate()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 30)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!L")[0]
@@ -2959,6 +2963,7 @@ class sampling_rate(bsn_tlv):
 bsn_tlv.subtypes[30] = sampling_rate
 
 class set_loopback_mode(bsn_tlv):
+    __slots__ = []
     type = 74
 
     def __init__(self):
@@ -2975,9 +2980,8 @@ class set_loopback_mode(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = set_loopback_mode()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 74)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         return obj
@@ -2997,6 +3001,7 @@ class set_loopback_mode(bsn_tlv):
 bsn_tlv.subtypes[74] = set_loopback_mode
 
 class strip_mpls_l2_on_ingress(bsn_tlv):
+    __slots__ = []
     type = 75
 
     def __init__(self):
@@ -3013,9 +3018,8 @@ class strip_mpls_l2_on_ingress(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = strip_mpls_l2_on_ingress()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 75)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         return obj
@@ -3035,6 +3039,7 @@ class strip_mpls_l2_on_ingress(bsn_tlv):
 bsn_tlv.subtypes[75] = strip_mpls_l2_on_ingress
 
 class strip_mpls_l3_on_ingress(bsn_tlv):
+    __slots__ = []
     type = 76
 
     def __init__(self):
@@ -3051,9 +3056,8 @@ class strip_mpls_l3_on_ingress(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = strip_mpls_l3_on_ingress()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 76)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         return obj
@@ -3073,6 +3077,7 @@ class strip_mpls_l3_on_ingress(bsn_tlv):
 bsn_tlv.subtypes[76] = strip_mpls_l3_on_ingress
 
 class strip_vlan_on_egress(bsn_tlv):
+    __slots__ = []
     type = 73
 
     def __init__(self):
@@ -3089,9 +3094,8 @@ class strip_vlan_on_egress(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = strip_vlan_on_egress()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 73)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         return obj
@@ -3111,6 +3115,7 @@ class strip_vlan_on_egress(bsn_tlv):
 bsn_tlv.subtypes[73] = strip_vlan_on_egress
 
 class sub_agent_id(bsn_tlv):
+    __slots__ = ['value']
     type = 38
 
     def __init__(self, value=None):
@@ -3132,9 +3137,8 @@ class sub_agent_id(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = sub_agent_id()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 38)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!L")[0]
@@ -3158,6 +3162,7 @@ class sub_agent_id(bsn_tlv):
 bsn_tlv.subtypes[38] = sub_agent_id
 
 class tcp_dst(bsn_tlv):
+    __slots__ = ['value']
     type = 66
 
     def __init__(self, value=None):
@@ -3179,9 +3184,8 @@ class tcp_dst(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = tcp_dst()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 66)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!H")[0]
@@ -3205,6 +3209,7 @@ class tcp_dst(bsn_tlv):
 bsn_tlv.subtypes[66] = tcp_dst
 
 class tcp_src(bsn_tlv):
+    __slots__ = ['value']
     type = 65
 
     def __init__(self, value=None):
@@ -3226,9 +3231,8 @@ class tcp_src(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = tcp_src()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 65)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!H")[0]
@@ -3252,6 +3256,7 @@ class tcp_src(bsn_tlv):
 bsn_tlv.subtypes[65] = tcp_src
 
 class tx_bytes(bsn_tlv):
+    __slots__ = ['value']
     type = 39
 
     def __init__(self, value=None):
@@ -3273,9 +3278,8 @@ class tx_bytes(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = tx_bytes()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 39)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!Q")[0]
@@ -3299,6 +3303,7 @@ class tx_bytes(bsn_tlv):
 bsn_tlv.subtypes[39] = tx_bytes
 
 class tx_packets(bsn_tlv):
+    __slots__ = ['value']
     type = 3
 
     def __init__(self, value=None):
@@ -3320,9 +3325,8 @@ class tx_packets(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = tx_packets()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 3)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!Q")[0]
@@ -3346,6 +3350,7 @@ class tx_packets(bsn_tlv):
 bsn_tlv.subtypes[3] = tx_packets
 
 class udf_anchor(bsn_tlv):
+    __slots__ = ['value']
     type = 16
 
     def __init__(self, value=None):
@@ -3367,9 +3372,8 @@ class udf_anchor(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = udf_anchor()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 16)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!H")[0]
@@ -3393,6 +3397,7 @@ class udf_anchor(bsn_tlv):
 bsn_tlv.subtypes[16] = udf_anchor
 
 class udf_id(bsn_tlv):
+    __slots__ = ['value']
     type = 15
 
     def __init__(self, value=None):
@@ -3414,9 +3419,8 @@ class udf_id(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = udf_id()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 15)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!H")[0]
@@ -3440,6 +3444,7 @@ class udf_id(bsn_tlv):
 bsn_tlv.subtypes[15] = udf_id
 
 class udf_length(bsn_tlv):
+    __slots__ = ['value']
     type = 18
 
     def __init__(self, value=None):
@@ -3461,9 +3466,8 @@ class udf_length(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = udf_length()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!H")[0]
@@ -3487,6 +3491,7 @@ class udf_length(bsn_tlv):
 bsn_tlv.subtypes[18] = udf_length
 
 class udf_offset(bsn_tlv):
+    __slots__ = ['value']
     type = 17
 
     def __init__(self, value=None):
@@ -3508,9 +3513,8 @@ class udf_offset(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = udf_offset()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 17)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!H")[0]
@@ -3534,6 +3538,7 @@ class udf_offset(bsn_tlv):
 bsn_tlv.subtypes[17] = udf_offset
 
 class udp_dst(bsn_tlv):
+    __slots__ = ['value']
     type = 37
 
     def __init__(self, value=None):
@@ -3555,9 +3560,8 @@ class udp_dst(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = udp_dst()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 37)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!H")[0]
@@ -3581,6 +3585,7 @@ class udp_dst(bsn_tlv):
 bsn_tlv.subtypes[37] = udp_dst
 
 class udp_src(bsn_tlv):
+    __slots__ = ['value']
     type = 36
 
     def __init__(self, value=None):
@@ -3602,9 +3607,8 @@ class udp_src(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = udp_src()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 36)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!H")[0]
@@ -3628,6 +3632,7 @@ class udp_src(bsn_tlv):
 bsn_tlv.subtypes[36] = udp_src
 
 class unicast_query_timeout(bsn_tlv):
+    __slots__ = ['value']
     type = 9
 
     def __init__(self, value=None):
@@ -3649,9 +3654,8 @@ class unicast_query_timeout(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = unicast_query_timeout()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 9)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!L")[0]
@@ -3675,6 +3679,7 @@ class unicast_query_timeout(bsn_tlv):
 bsn_tlv.subtypes[9] = unicast_query_timeout
 
 class vlan_pcp(bsn_tlv):
+    __slots__ = ['value']
     type = 72
 
     def __init__(self, value=None):
@@ -3696,9 +3701,8 @@ class vlan_pcp(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = vlan_pcp()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 72)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!B")[0]
@@ -3722,6 +3726,7 @@ class vlan_pcp(bsn_tlv):
 bsn_tlv.subtypes[72] = vlan_pcp
 
 class vlan_vid(bsn_tlv):
+    __slots__ = ['value']
     type = 6
 
     def __init__(self, value=None):
@@ -3743,9 +3748,8 @@ class vlan_vid(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = vlan_vid()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 6)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!H")[0]
@@ -3769,6 +3773,7 @@ class vlan_vid(bsn_tlv):
 bsn_tlv.subtypes[6] = vlan_vid
 
 class vlan_vid_mask(bsn_tlv):
+    __slots__ = ['value']
     type = 77
 
     def __init__(self, value=None):
@@ -3790,9 +3795,8 @@ class vlan_vid_mask(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = vlan_vid_mask()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 77)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!H")[0]
@@ -3816,6 +3820,7 @@ class vlan_vid_mask(bsn_tlv):
 bsn_tlv.subtypes[77] = vlan_vid_mask
 
 class vrf(bsn_tlv):
+    __slots__ = ['value']
     type = 19
 
     def __init__(self, value=None):
@@ -3837,9 +3842,8 @@ class vrf(bsn_tlv):
     @staticmethod
     def unpack(reader):
         obj = vrf()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!L")[0]
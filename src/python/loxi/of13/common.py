@@ -14,7 +14,39 @@ import loxi.generic_util
 import sys
 ofp = sys.modules['loxi.of13']
 
+# Precompiled layouts of fixed-size field runs
+_struct_2xL = struct.Struct("!2xL")
+_struct_2xLL4xQQLL = struct.Struct("!2xLL4xQQLL")
+_struct_4xH6x = struct.Struct("!4xH6x")
+_struct_4xL4x = struct.Struct("!4xL4x")
+_struct_4xQQQQQQQQQQQQLL = struct.Struct("!4xQQQQQQQQQQQQLL")
+_struct_6xLQQLL = struct.Struct("!6xLQQLL")
+_struct_B1xL = struct.Struct("!B1xL")
+_struct_B1xLLHHHH4xQQQ = struct.Struct("!B1xLLHHHH4xQQQ")
+_struct_B3xLQQ = struct.Struct("!B3xLQQ")
+_struct_B5x = struct.Struct("!B5x")
+_struct_BB2xL = struct.Struct("!BB2xL")
+_struct_BQ = struct.Struct("!BQ")
+_struct_H2xL = struct.Struct("!H2xL")
+_struct_H4x = struct.Struct("!H4x")
+_struct_HH = struct.Struct("!HH")
+_struct_HHH2x = struct.Struct("!HHH2x")
+_struct_HHHB1xH = struct.Struct("!HHHB1xH")
+_struct_HL = struct.Struct("!HL")
+_struct_L4x = struct.Struct("!L4x")
+_struct_LH = struct.Struct("!LH")
+_struct_LHHHH = struct.Struct("!LHHHH")
+_struct_LL = struct.Struct("!LL")
+_struct_LL4x = struct.Struct("!LL4x")
+_struct_LLBB2xLL = struct.Struct("!LLBB2xLL")
+_struct_LLLBB2x = struct.Struct("!LLLBB2x")
+_struct_LLLLLLLL = struct.Struct("!LLLLLLLL")
+_struct_LQQQLL = struct.Struct("!LQQQLL")
+_struct_QQ = struct.Struct("!QQ")
+_struct_QQLL = struct.Struct("!QQLL")
+
 class bsn_controller_connection(loxi.OFObject):
+    __slots__ = ['state', 'auxiliary_id', 'role', 'uri']
 
     def __init__(self, state=None, auxiliary_id=None, role=None, uri=None):
         if state != None:
@@ -37,20 +69,14 @@ class bsn_controller_connection(loxi.OFObject):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.state))
-        packed.append(struct.pack("!B", self.auxiliary_id))
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!L", self.role))
+        packed.append(_struct_BB2xL.pack(self.state, self.auxiliary_id, self.role))
         packed.append(struct.pack("!256s", self.uri))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_controller_connection()
-        obj.state = reader.read("!B")[0]
-        obj.auxiliary_id = reader.read("!B")[0]
-        reader.skip(2)
-        obj.role = reader.read("!L")[0]
+        obj.state, obj.auxiliary_id, obj.role = reader.read_struct(_struct_BB2xL)
         obj.uri = reader.read("!256s")[0].rstrip("\x00")
         return obj
 
@@ -83,6 +109,7 @@ class bsn_controller_connection(loxi.OFObject):
 
 
 class bsn_debug_counter_desc_stats_entry(loxi.OFObject):
+    __slots__ = ['counter_id', 'name', 'description']
 
     def __init__(self, counter_id=None, name=None, description=None):
         if counter_id != None:
@@ -139,6 +166,7 @@ class bsn_debug_counter_desc_stats_entry(loxi.OFObject):
 
 
 class bsn_debug_counter_stats_entry(loxi.OFObject):
+    __slots__ = ['counter_id', 'value']
 
     def __init__(self, counter_id=None, value=None):
         if counter_id != None:
@@ -153,15 +181,13 @@ class bsn_debug_counter_stats_entry(loxi.OFObject):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!Q", self.counter_id))
-        packed.append(struct.pack("!Q", self.value))
+        packed.append(_struct_QQ.pack(self.counter_id, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_debug_counter_stats_entry()
-        obj.counter_id = reader.read("!Q")[0]
-        obj.value = reader.read("!Q")[0]
+        obj.counter_id, obj.value = reader.read_struct(_struct_QQ)
         return obj
 
     def __eq__(self, other):
@@ -185,6 +211,7 @@ class bsn_debug_counter_stats_entry(loxi.OFObject):
 
 
 class bsn_flow_checksum_bucket_stats_entry(loxi.OFObject):
+    __slots__ = ['checksum']
 
     def __init__(self, checksum=None):
         if checksum != None:
@@ -221,6 +248,7 @@ class bsn_flow_checksum_bucket_stats_entry(loxi.OFObject):
 
 
 class bsn_generic_stats_entry(loxi.OFObject):
+    __slots__ = ['tlvs']
 
     def __init__(self, tlvs=None):
         if tlvs != None:
@@ -263,6 +291,7 @@ class bsn_generic_stats_entry(loxi.OFObject):
 
 
 class bsn_gentable_bucket_stats_entry(loxi.OFObject):
+    __slots__ = ['checksum']
 
     def __init__(self, checksum=None):
         if checksum != None:
@@ -299,6 +328,7 @@ class bsn_gentable_bucket_stats_entry(loxi.OFObject):
 
 
 class bsn_gentable_desc_stats_entry(loxi.OFObject):
+    __slots__ = ['table_id', 'name', 'buckets_size', 'max_entries']
 
     def __init__(self, table_id=None, name=None, buckets_size=None, max_entries=None):
         if table_id != None:
@@ -324,9 +354,7 @@ class bsn_gentable_desc_stats_entry(loxi.OFObject):
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 0
         packed.append(struct.pack("!H", self.table_id))
         packed.append(struct.pack("!32s", self.name))
-        packed.append(struct.pack("!L", self.buckets_size))
-        packed.append(struct.pack("!L", self.max_entries))
-        packed.append('\x00' * 4)
+        packed.append(_struct_LL4x.pack(self.buckets_size, self.max_entries))
         length = sum([len(x) for x in packed])
         packed[0] = struct.pack("!H", length)
         return ''.join(packed)
@@ -339,9 +367,7 @@ class bsn_gentable_desc_stats_entry(loxi.OFObject):
         reader = orig_reader.slice(_length, 2)
         obj.table_id = reader.read("!H")[0]
         obj.name = reader.read("!32s")[0].rstrip("\x00")
-        obj.buckets_size = reader.read("!L")[0]
-        obj.max_entries = reader.read("!L")[0]
-        reader.skip(4)
+        obj.buckets_size, obj.max_entries = reader.read_struct(_struct_LL4x)
         return obj
 
     def __eq__(self, other):
@@ -373,6 +399,7 @@ class bsn_gentable_desc_stats_entry(loxi.OFObject):
 
 
 class bsn_gentable_entry_desc_stats_entry(loxi.OFObject):
+    __slots__ = ['checksum', 'key', 'value']
 
     def __init__(self, checksum=None, key=None, value=None):
         if checksum != None:
@@ -438,6 +465,7 @@ class bsn_gentable_entry_desc_stats_entry(loxi.OFObject):
 
 
 class bsn_gentable_entry_stats_entry(loxi.OFObject):
+    __slots__ = ['key', 'stats']
 
     def __init__(self, key=None, stats=None):
         if key != None:
@@ -493,6 +521,7 @@ class bsn_gentable_entry_stats_entry(loxi.OFObject):
 
 
 class bsn_gentable_stats_entry(loxi.OFObject):
+    __slots__ = ['table_id', 'entry_count', 'checksum']
 
     def __init__(self, table_id=None, entry_count=None, checksum=None):
         if table_id != None:
@@ -511,18 +540,14 @@ class bsn_gentable_stats_entry(loxi.OFObject):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!H", self.table_id))
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!L", self.entry_count))
+        packed.append(_struct_H2xL.pack(self.table_id, self.entry_count))
         packed.append(util.pack_checksum_128(self.checksum))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_gentable_stats_entry()
-        obj.table_id = reader.read("!H")[0]
-        reader.skip(2)
-        obj.entry_count = reader.read("!L")[0]
+        obj.table_id, obj.entry_count = reader.read_struct(_struct_H2xL)
         obj.checksum = util.unpack_checksum_128(reader)
         return obj
 
@@ -551,6 +576,7 @@ class bsn_gentable_stats_entry(loxi.OFObject):
 
 
 class bsn_interface(loxi.OFObject):
+    __slots__ = ['hw_addr', 'name', 'ipv4_addr', 'ipv4_netmask']
 
     def __init__(self, hw_addr=None, name=None, ipv4_addr=None, ipv4_netmask=None):
         if hw_addr != None:
@@ -576,8 +602,7 @@ class bsn_interface(loxi.OFObject):
         packed.append(struct.pack("!6B", *self.hw_addr))
         packed.append('\x00' * 2)
         packed.append(struct.pack("!16s", self.name))
-        packed.append(struct.pack("!L", self.ipv4_addr))
-        packed.append(struct.pack("!L", self.ipv4_netmask))
+        packed.append(_struct_LL.pack(self.ipv4_addr, self.ipv4_netmask))
         return ''.join(packed)
 
     @staticmethod
@@ -586,8 +611,7 @@ class bsn_interface(loxi.OFObject):
         obj.hw_addr = list(reader.read('!6B'))
         reader.skip(2)
         obj.name = reader.read("!16s")[0].rstrip("\x00")
-        obj.ipv4_addr = reader.read("!L")[0]
-        obj.ipv4_netmask = reader.read("!L")[0]
+        obj.ipv4_addr, obj.ipv4_netmask = reader.read_struct(_struct_LL)
         return obj
 
     def __eq__(self, other):
@@ -619,6 +643,7 @@ class bsn_interface(loxi.OFObject):
 
 
 class bsn_lacp_stats_entry(loxi.OFObject):
+    __slots__ = ['port_no', 'actor_sys_priority', 'actor_sys_mac', 'actor_port_priority', 'actor_port_num', 'actor_key', 'convergence_status', 'partner_sys_priority', 'partner_sys_mac', 'partner_port_priority', 'partner_port_num', 'partner_key']
 
     def __init__(self, port_no=None, actor_sys_priority=None, actor_sys_mac=None, actor_port_priority=None, actor_port_num=None, actor_key=None, convergence_status=None, partner_sys_priority=None, partner_sys_mac=None, partner_port_priority=None, partner_port_num=None, partner_key=None):
         if port_no != None:
@@ -676,17 +701,9 @@ class bsn_lacp_stats_entry(loxi.OFObject):
         packed.append(util.pack_port_no(self.port_no))
         packed.append(struct.pack("!H", self.actor_sys_priority))
         packed.append(struct.pack("!6B", *self.actor_sys_mac))
-        packed.append(struct.pack("!H", self.actor_port_priority))
-        packed.append(struct.pack("!H", self.actor_port_num))
-        packed.append(struct.pack("!H", self.actor_key))
-        packed.append(struct.pack("!B", self.convergence_status))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!H", self.partner_sys_priority))
+        packed.append(_struct_HHHB1xH.pack(self.actor_port_priority, self.actor_port_num, self.actor_key, self.convergence_status, self.partner_sys_priority))
         packed.append(struct.pack("!6B", *self.partner_sys_mac))
-        packed.append(struct.pack("!H", self.partner_port_priority))
-        packed.append(struct.pack("!H", self.partner_port_num))
-        packed.append(struct.pack("!H", self.partner_key))
-        packed.append('\x00' * 2)
+        packed.append(_struct_HHH2x.pack(self.partner_port_priority, self.partner_port_num, self.partner_key))
         return ''.join(packed)
 
     @staticmethod
@@ -695,17 +712,9 @@ class bsn_lacp_stats_entry(loxi.OFObject):
         obj.port_no = util.unpack_port_no(reader)
         obj.actor_sys_priority = reader.read("!H")[0]
         obj.actor_sys_mac = list(reader.read('!6B'))
-        obj.actor_port_priority = reader.read("!H")[0]
-        obj.actor_port_num = reader.read("!H")[0]
-        obj.actor_key = reader.read("!H")[0]
-        obj.convergence_status = reader.read("!B")[0]
-        reader.skip(1)
-        obj.partner_sys_priority = reader.read("!H")[0]
+        obj.actor_port_priority, obj.actor_port_num, obj.actor_key, obj.convergence_status, obj.partner_sys_priority = reader.read_struct(_struct_HHHB1xH)
         obj.partner_sys_mac = list(reader.read('!6B'))
-        obj.partner_port_priority = reader.read("!H")[0]
-        obj.partner_port_num = reader.read("!H")[0]
-        obj.partner_key = reader.read("!H")[0]
-        reader.skip(2)
+        obj.partner_port_priority, obj.partner_port_num, obj.partner_key = reader.read_struct(_struct_HHH2x)
         return obj
 
     def __eq__(self, other):
@@ -769,6 +778,7 @@ class bsn_lacp_stats_entry(loxi.OFObject):
 
 
 class bsn_port_counter_stats_entry(loxi.OFObject):
+    __slots__ = ['port_no', 'values']
 
     def __init__(self, port_no=None, values=None):
         if port_no != None:
@@ -823,6 +833,7 @@ class bsn_port_counter_stats_entry(loxi.OFObject):
 
 
 class bsn_switch_pipeline_stats_entry(loxi.OFObject):
+    __slots__ = ['pipeline']
 
     def __init__(self, pipeline=None):
         if pipeline != None:
@@ -859,6 +870,7 @@ class bsn_switch_pipeline_stats_entry(loxi.OFObject):
 
 
 class bsn_table_checksum_stats_entry(loxi.OFObject):
+    __slots__ = ['table_id', 'checksum']
 
     def __init__(self, table_id=None, checksum=None):
         if table_id != None:
@@ -873,15 +885,13 @@ class bsn_table_checksum_stats_entry(loxi.OFObject):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append(struct.pack("!Q", self.checksum))
+        packed.append(_struct_BQ.pack(self.table_id, self.checksum))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_table_checksum_stats_entry()
-        obj.table_id = reader.read("!B")[0]
-        obj.checksum = reader.read("!Q")[0]
+        obj.table_id, obj.checksum = reader.read_struct(_struct_BQ)
         return obj
 
     def __eq__(self, other):
@@ -905,7 +915,9 @@ class bsn_table_checksum_stats_entry(loxi.OFObject):
 
 
 class bsn_vport(loxi.OFObject):
+    __slots__ = ['type']
     subtypes = {}
+    subtype_field = ('!H', 0)
 
 
     def __init__(self, type=None):
@@ -931,8 +943,7 @@ class bsn_vport(loxi.OFObject):
             return subclass.unpack(reader)
 
         obj = bsn_vport()
-        obj.type = reader.read("!H")[0]
-        _length = reader.read("!H")[0]
+        obj.type, _length = reader.read_struct(_struct_HH)
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         return obj
@@ -952,6 +963,7 @@ class bsn_vport(loxi.OFObject):
 
 
 class bsn_vlan_counter_stats_entry(loxi.OFObject):
+    __slots__ = ['vlan_vid', 'values']
 
     def __init__(self, vlan_vid=None, values=None):
         if vlan_vid != None:
@@ -967,8 +979,7 @@ class bsn_vlan_counter_stats_entry(loxi.OFObject):
     def pack(self):
         packed = []
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 0
-        packed.append(struct.pack("!H", self.vlan_vid))
-        packed.append('\x00' * 4)
+        packed.append(_struct_H4x.pack(self.vlan_vid))
         packed.append(loxi.generic_util.pack_list(self.values))
         length = sum([len(x) for x in packed])
         packed[0] = struct.pack("!H", length)
@@ -1006,6 +1017,7 @@ class bsn_vlan_counter_stats_entry(loxi.OFObject):
 
 
 class bsn_vport_l2gre(bsn_vport):
+    __slots__ = ['flags', 'port_no', 'loopback_port_no', 'local_mac', 'nh_mac', 'src_ip', 'dst_ip', 'dscp', 'ttl', 'vpn', 'rate_limit', 'if_name']
     type = 1
 
     def __init__(self, flags=None, port_no=None, loopback_port_no=None, local_mac=None, nh_mac=None, src_ip=None, dst_ip=None, dscp=None, ttl=None, vpn=None, rate_limit=None, if_name=None):
@@ -1068,13 +1080,7 @@ class bsn_vport_l2gre(bsn_vport):
         packed.append(util.pack_port_no(self.loopback_port_no))
         packed.append(struct.pack("!6B", *self.local_mac))
         packed.append(struct.pack("!6B", *self.nh_mac))
-        packed.append(struct.pack("!L", self.src_ip))
-        packed.append(struct.pack("!L", self.dst_ip))
-        packed.append(struct.pack("!B", self.dscp))
-        packed.append(struct.pack("!B", self.ttl))
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!L", self.vpn))
-        packed.append(struct.pack("!L", self.rate_limit))
+        packed.append(_struct_LLBB2xLL.pack(self.src_ip, self.dst_ip, self.dscp, self.ttl, self.vpn, self.rate_limit))
         packed.append(struct.pack("!16s", self.if_name))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
@@ -1083,9 +1089,8 @@ class bsn_vport_l2gre(bsn_vport):
     @staticmethod
     def unpack(reader):
         obj = bsn_vport_l2gre()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.flags = reader.read("!L")[0]
@@ -1093,13 +1098,7 @@ class bsn_vport_l2gre(bsn_vport):
         obj.loopback_port_no = util.unpack_port_no(reader)
         obj.local_mac = list(reader.read('!6B'))
         obj.nh_mac = list(reader.read('!6B'))
-        obj.src_ip = reader.read("!L")[0]
-        obj.dst_ip = reader.read("!L")[0]
-        obj.dscp = reader.read("!B")[0]
-        obj.ttl = reader.read("!B")[0]
-        reader.skip(2)
-        obj.vpn = reader.read("!L")[0]
-        obj.rate_limit = reader.read("!L")[0]
+        obj.src_ip, obj.dst_ip, obj.dscp, obj.ttl, obj.vpn, obj.rate_limit = reader.read_struct(_struct_LLBB2xLL)
         obj.if_name = reader.read("!16s")[0].rstrip("\x00")
         return obj
 
@@ -1165,6 +1164,7 @@ class bsn_vport_l2gre(bsn_vport):
 bsn_vport.subtypes[1] = bsn_vport_l2gre
 
 class bsn_vport_q_in_q(bsn_vport):
+    __slots__ = ['port_no', 'ingress_tpid', 'ingress_vlan_id', 'egress_tpid', 'egress_vlan_id', 'if_name']
     type = 0
 
     def __init__(self, port_no=None, ingress_tpid=None, ingress_vlan_id=None, egress_tpid=None, egress_vlan_id=None, if_name=None):
@@ -1198,11 +1198,7 @@ class bsn_vport_q_in_q(bsn_vport):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.port_no))
-        packed.append(struct.pack("!H", self.ingress_tpid))
-        packed.append(struct.pack("!H", self.ingress_vlan_id))
-        packed.append(struct.pack("!H", self.egress_tpid))
-        packed.append(struct.pack("!H", self.egress_vlan_id))
+        packed.append(_struct_LHHHH.pack(self.port_no, self.ingress_tpid, self.ingress_vlan_id, self.egress_tpid, self.egress_vlan_id))
         packed.append(struct.pack("!16s", self.if_name))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
@@ -1211,16 +1207,11 @@ class bsn_vport_q_in_q(bsn_vport):
     @staticmethod
     def unpack(reader):
         obj = bsn_vport_q_in_q()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 0)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.port_no = reader.read("!L")[0]
-        obj.ingress_tpid = reader.read("!H")[0]
-        obj.ingress_vlan_id = reader.read("!H")[0]
-        obj.egress_tpid = reader.read("!H")[0]
-        obj.egress_vlan_id = reader.read("!H")[0]
+        obj.port_no, obj.ingress_tpid, obj.ingress_vlan_id, obj.egress_tpid, obj.egress_vlan_id = reader.read_struct(_struct_LHHHH)
         obj.if_name = reader.read("!16s")[0].rstrip("\x00")
         return obj
 
@@ -1262,6 +1253,7 @@ class bsn_vport_q_in_q(bsn_vport):
 bsn_vport.subtypes[0] = bsn_vport_q_in_q
 
 class bsn_vrf_counter_stats_entry(loxi.OFObject):
+    __slots__ = ['vrf', 'values']
 
     def __init__(self, vrf=None, values=None):
         if vrf != None:
@@ -1277,8 +1269,7 @@ class bsn_vrf_counter_stats_entry(loxi.OFObject):
     def pack(self):
         packed = []
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 0
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!L", self.vrf))
+        packed.append(_struct_2xL.pack(self.vrf))
         packed.append(loxi.generic_util.pack_list(self.values))
         length = sum([len(x) for x in packed])
         packed[0] = struct.pack("!H", length)
@@ -1316,6 +1307,7 @@ class bsn_vrf_counter_stats_entry(loxi.OFObject):
 
 
 class bucket(loxi.OFObject):
+    __slots__ = ['weight', 'watch_port', 'watch_group', 'actions']
 
     def __init__(self, weight=None, watch_port=None, watch_group=None, actions=None):
         if weight != None:
@@ -1341,8 +1333,7 @@ class bucket(loxi.OFObject):
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 0
         packed.append(struct.pack("!H", self.weight))
         packed.append(util.pack_port_no(self.watch_port))
-        packed.append(struct.pack("!L", self.watch_group))
-        packed.append('\x00' * 4)
+        packed.append(_struct_L4x.pack(self.watch_group))
         packed.append(loxi.generic_util.pack_list(self.actions))
         length = sum([len(x) for x in packed])
         packed[0] = struct.pack("!H", length)
@@ -1390,6 +1381,7 @@ class bucket(loxi.OFObject):
 
 
 class bucket_counter(loxi.OFObject):
+    __slots__ = ['packet_count', 'byte_count']
 
     def __init__(self, packet_count=None, byte_count=None):
         if packet_count != None:
@@ -1404,15 +1396,13 @@ class bucket_counter(loxi.OFObject):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!Q", self.packet_count))
-        packed.append(struct.pack("!Q", self.byte_count))
+        packed.append(_struct_QQ.pack(self.packet_count, self.byte_count))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bucket_counter()
-        obj.packet_count = reader.read("!Q")[0]
-        obj.byte_count = reader.read("!Q")[0]
+        obj.packet_count, obj.byte_count = reader.read_struct(_struct_QQ)
         return obj
 
     def __eq__(self, other):
@@ -1436,6 +1426,7 @@ class bucket_counter(loxi.OFObject):
 
 
 class flow_stats_entry(loxi.OFObject):
+    __slots__ = ['table_id', 'duration_sec', 'duration_nsec', 'priority', 'idle_timeout', 'hard_timeout', 'flags', 'cookie', 'packet_count', 'byte_count', 'match', 'instructions']
 
     def __init__(self, table_id=None, duration_sec=None, duration_nsec=None, priority=None, idle_timeout=None, hard_timeout=None, flags=None, cookie=None, packet_count=None, byte_count=None, match=None, instructions=None):
         if table_id != None:
@@ -1491,18 +1482,7 @@ class flow_stats_entry(loxi.OFObject):
     def pack(self):
         packed = []
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 0
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!L", self.duration_sec))
-        packed.append(struct.pack("!L", self.duration_nsec))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append(struct.pack("!H", self.hard_timeout))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!Q", self.cookie))
-        packed.append(struct.pack("!Q", self.packet_count))
-        packed.append(struct.pack("!Q", self.byte_count))
+        packed.append(_struct_B1xLLHHHH4xQQQ.pack(self.table_id, self.duration_sec, self.duration_nsec, self.priority, self.idle_timeout, self.hard_timeout, self.flags, self.cookie, self.packet_count, self.byte_count))
         packed.append(self.match.pack())
         packed.append(loxi.generic_util.pack_list(self.instructions))
         length = sum([len(x) for x in packed])
@@ -1515,18 +1495,7 @@ class flow_stats_entry(loxi.OFObject):
         _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 2)
-        obj.table_id = reader.read("!B")[0]
-        reader.skip(1)
-        obj.duration_sec = reader.read("!L")[0]
-        obj.duration_nsec = reader.read("!L")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.idle_timeout = reader.read("!H")[0]
-        obj.hard_timeout = reader.read("!H")[0]
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        obj.cookie = reader.read("!Q")[0]
-        obj.packet_count = reader.read("!Q")[0]
-        obj.byte_count = reader.read("!Q")[0]
+        obj.table_id, obj.duration_sec, obj.duration_nsec, obj.priority, obj.idle_timeout, obj.hard_timeout, obj.flags, obj.cookie, obj.packet_count, obj.byte_count = reader.read_struct(_struct_B1xLLHHHH4xQQQ)
         obj.match = ofp.match.unpack(reader)
         obj.instructions = loxi.generic_util.unpack_list(reader, ofp.instruction.instruction.unpack)
         return obj
@@ -1592,6 +1561,7 @@ class flow_stats_entry(loxi.OFObject):
 
 
 class group_desc_stats_entry(loxi.OFObject):
+    __slots__ = ['group_type', 'group_id', 'buckets']
 
     def __init__(self, group_type=None, group_id=None, buckets=None):
         if group_type != None:
@@ -1611,9 +1581,7 @@ class group_desc_stats_entry(loxi.OFObject):
     def pack(self):
         packed = []
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 0
-        packed.append(struct.pack("!B", self.group_type))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!L", self.group_id))
+        packed.append(_struct_B1xL.pack(self.group_type, self.group_id))
         packed.append(loxi.generic_util.pack_list(self.buckets))
         length = sum([len(x) for x in packed])
         packed[0] = struct.pack("!H", length)
@@ -1625,9 +1593,7 @@ class group_desc_stats_entry(loxi.OFObject):
         _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 2)
-        obj.group_type = reader.read("!B")[0]
-        reader.skip(1)
-        obj.group_id = reader.read("!L")[0]
+        obj.group_type, obj.group_id = reader.read_struct(_struct_B1xL)
         obj.buckets = loxi.generic_util.unpack_list(reader, ofp.common.bucket.unpack)
         return obj
 
@@ -1656,6 +1622,7 @@ class group_desc_stats_entry(loxi.OFObject):
 
 
 class group_stats_entry(loxi.OFObject):
+    __slots__ = ['group_id', 'ref_count', 'packet_count', 'byte_count', 'duration_sec', 'duration_nsec', 'bucket_stats']
 
     def __init__(self, group_id=None, ref_count=None, packet_count=None, byte_count=None, duration_sec=None, duration_nsec=None, bucket_stats=None):
         if group_id != None:
@@ -1691,14 +1658,7 @@ class group_stats_entry(loxi.OFObject):
     def pack(self):
         packed = []
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 0
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!L", self.group_id))
-        packed.append(struct.pack("!L", self.ref_count))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!Q", self.packet_count))
-        packed.append(struct.pack("!Q", self.byte_count))
-        packed.append(struct.pack("!L", self.duration_sec))
-        packed.append(struct.pack("!L", self.duration_nsec))
+        packed.append(_struct_2xLL4xQQLL.pack(self.group_id, self.ref_count, self.packet_count, self.byte_count, self.duration_sec, self.duration_nsec))
         packed.append(loxi.generic_util.pack_list(self.bucket_stats))
         length = sum([len(x) for x in packed])
         packed[0] = struct.pack("!H", length)
@@ -1710,14 +1670,7 @@ class group_stats_entry(loxi.OFObject):
         _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 2)
-        reader.skip(2)
-        obj.group_id = reader.read("!L")[0]
-        obj.ref_count = reader.read("!L")[0]
-        reader.skip(4)
-        obj.packet_count = reader.read("!Q")[0]
-        obj.byte_count = reader.read("!Q")[0]
-        obj.duration_sec = reader.read("!L")[0]
-        obj.duration_nsec = reader.read("!L")[0]
+        obj.group_id, obj.ref_count, obj.packet_count, obj.byte_count, obj.duration_sec, obj.duration_nsec = reader.read_struct(_struct_2xLL4xQQLL)
         obj.bucket_stats = loxi.generic_util.unpack_list(reader, ofp.common.bucket_counter.unpack)
         return obj
 
@@ -1762,7 +1715,9 @@ class group_stats_entry(loxi.OFObject):
 
 
 class hello_elem(loxi.OFObject):
+    __slots__ = ['type']
     subtypes = {}
+    subtype_field = ('!H', 0)
 
 
     def __init__(self, type=None):
@@ -1788,8 +1743,7 @@ class hello_elem(loxi.OFObject):
             return subclass.unpack(reader)
 
         obj = hello_elem()
-        obj.type = reader.read("!H")[0]
-        _length = reader.read("!H")[0]
+        obj.type, _length = reader.read_struct(_struct_HH)
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         return obj
@@ -1809,6 +1763,7 @@ class hello_elem(loxi.OFObject):
 
 
 class hello_elem_versionbitmap(hello_elem):
+    __slots__ = ['bitmaps']
     type = 1
 
     def __init__(self, bitmaps=None):
@@ -1830,9 +1785,8 @@ class hello_elem_versionbitmap(hello_elem):
     @staticmethod
     def unpack(reader):
         obj = hello_elem_versionbitmap()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.bitmaps = loxi.generic_util.unpack_list(reader, ofp.common.uint32.unpack)
@@ -1856,6 +1810,7 @@ class hello_elem_versionbitmap(hello_elem):
 hello_elem.subtypes[1] = hello_elem_versionbitmap
 
 class match_v3(loxi.OFObject):
+    __slots__ = ['_oxm_list', '_oxm_raw', '_oxm_index', '_oxm_key']
     type = 1
 
     def __init__(self, oxm_list=None):
@@ -1865,11 +1820,78 @@ class match_v3(loxi.OFObject):
             self.oxm_list = []
         return
 
+    # A parsed match keeps its OXM TLVs as raw bytes; the list of oxm
+    # objects is only decoded when oxm_list is first accessed.
+    @property
+    def oxm_list(self):
+        if self._oxm_list is None:
+            reader = loxi.generic_util.OFReader(self._oxm_raw)
+            self._oxm_list = loxi.generic_util.unpack_list(reader, ofp.oxm.oxm.unpack)
+            self._oxm_raw = None
+            self._oxm_index = None
+            self._oxm_key = None
+        return self._oxm_list
+
+    @oxm_list.setter
+    def oxm_list(self, value):
+        self._oxm_list = value
+        self._oxm_raw = None
+        self._oxm_index = None
+        self._oxm_key = None
+
+    def get(self, oxm_class):
+        """
+        Return the first OXM of the given class, or None
+
+        An undecoded match only decodes the requested TLV.
+        """
+        if self._oxm_list is not None:
+            for oxm in self._oxm_list:
+                if type(oxm) == oxm_class:
+                    return oxm
+            return None
+        if self._oxm_index is None:
+            self._oxm_index = {}
+            for (type_len, start, end) in loxi.generic_util.oxm_spans(self._oxm_raw):
+                self._oxm_index.setdefault(type_len, (start, end))
+        span = self._oxm_index.get(oxm_class.type_len)
+        if span is None:
+            return None
+        (start, end) = span
+        oxm = ofp.oxm.oxm.unpack(loxi.generic_util.OFReader(self._oxm_raw, start, end - start))
+        if type(oxm) != oxm_class:
+            return None
+        return oxm
+
+    def canonical(self):
+        """
+        Return the OXM TLVs sorted and concatenated
+
+        Two matches with the same fields in any order have the same
+        canonical form. It is cached (along with its hash) while the match
+        is undecoded and so cannot change.
+        """
+        if self._oxm_list is None:
+            if self._oxm_key is None:
+                raw = self._oxm_raw
+                tlvs = [raw[start:end] for (_, start, end) in loxi.generic_util.oxm_spans(raw)]
+                tlvs.sort()
+                self._oxm_key = ''.join(tlvs)
+            return self._oxm_key
+        tlvs = [x.pack() for x in self._oxm_list]
+        tlvs.sort()
+        return ''.join(tlvs)
+
     def pack(self):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(loxi.generic_util.pack_list(self.oxm_list))
+        if loxi.packing_canonical():
+            packed.append(self.canonical())
+        elif self._oxm_list is None:
+            packed.append(self._oxm_raw)
+        else:
+            packed.append(loxi.generic_util.pack_list(self._oxm_list))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         packed.append(loxi.generic_util.pad_to(8, length))
@@ -1878,20 +1900,24 @@ class match_v3(loxi.OFObject):
     @staticmethod
     def unpack(reader):
         obj = match_v3()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.oxm_list = loxi.generic_util.unpack_list(reader, ofp.oxm.oxm.unpack)
+        obj._oxm_list = None
+        obj._oxm_raw = reader.read_all()
+        obj._oxm_key = None
         orig_reader.skip_align()
         return obj
 
     def __eq__(self, other):
         if type(self) != type(other): return False
-        if self.oxm_list != other.oxm_list: return False
+        if self.canonical() != other.canonical(): return False
         return True
 
+    def __hash__(self):
+        return hash(self.canonical())
+
     def pretty_print(self, q):
         q.text("match_v3 {")
         with q.group():
@@ -1904,6 +1930,7 @@ class match_v3(loxi.OFObject):
 
 
 class meter_band_stats(loxi.OFObject):
+    __slots__ = ['packet_band_count', 'byte_band_count']
 
     def __init__(self, packet_band_count=None, byte_band_count=None):
         if packet_band_count != None:
@@ -1918,15 +1945,13 @@ class meter_band_stats(loxi.OFObject):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!Q", self.packet_band_count))
-        packed.append(struct.pack("!Q", self.byte_band_count))
+        packed.append(_struct_QQ.pack(self.packet_band_count, self.byte_band_count))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = meter_band_stats()
-        obj.packet_band_count = reader.read("!Q")[0]
-        obj.byte_band_count = reader.read("!Q")[0]
+        obj.packet_band_count, obj.byte_band_count = reader.read_struct(_struct_QQ)
         return obj
 
     def __eq__(self, other):
@@ -1950,6 +1975,7 @@ class meter_band_stats(loxi.OFObject):
 
 
 class meter_config(loxi.OFObject):
+    __slots__ = ['flags', 'meter_id', 'entries']
 
     def __init__(self, flags=None, meter_id=None, entries=None):
         if flags != None:
@@ -1969,8 +1995,7 @@ class meter_config(loxi.OFObject):
     def pack(self):
         packed = []
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 0
-        packed.append(struct.pack("!H", self.flags))
-        packed.append(struct.pack("!L", self.meter_id))
+        packed.append(_struct_HL.pack(self.flags, self.meter_id))
         packed.append(loxi.generic_util.pack_list(self.entries))
         length = sum([len(x) for x in packed])
         packed[0] = struct.pack("!H", length)
@@ -1982,8 +2007,7 @@ class meter_config(loxi.OFObject):
         _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 2)
-        obj.flags = reader.read("!H")[0]
-        obj.meter_id = reader.read("!L")[0]
+        obj.flags, obj.meter_id = reader.read_struct(_struct_HL)
         obj.entries = loxi.generic_util.unpack_list(reader, ofp.meter_band.meter_band.unpack)
         return obj
 
@@ -2012,6 +2036,7 @@ class meter_config(loxi.OFObject):
 
 
 class meter_features(loxi.OFObject):
+    __slots__ = ['max_meter', 'band_types', 'capabilities', 'max_bands', 'max_color']
 
     def __init__(self, max_meter=None, band_types=None, capabilities=None, max_bands=None, max_color=None):
         if max_meter != None:
@@ -2038,23 +2063,13 @@ class meter_features(loxi.OFObject):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.max_meter))
-        packed.append(struct.pack("!L", self.band_types))
-        packed.append(struct.pack("!L", self.capabilities))
-        packed.append(struct.pack("!B", self.max_bands))
-        packed.append(struct.pack("!B", self.max_color))
-        packed.append('\x00' * 2)
+        packed.append(_struct_LLLBB2x.pack(self.max_meter, self.band_types, self.capabilities, self.max_bands, self.max_color))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = meter_features()
-        obj.max_meter = reader.read("!L")[0]
-        obj.band_types = reader.read("!L")[0]
-        obj.capabilities = reader.read("!L")[0]
-        obj.max_bands = reader.read("!B")[0]
-        obj.max_color = reader.read("!B")[0]
-        reader.skip(2)
+        obj.max_meter, obj.band_types, obj.capabilities, obj.max_bands, obj.max_color = reader.read_struct(_struct_LLLBB2x)
         return obj
 
     def __eq__(self, other):
@@ -2090,6 +2105,7 @@ class meter_features(loxi.OFObject):
 
 
 class meter_stats(loxi.OFObject):
+    __slots__ = ['meter_id', 'flow_count', 'packet_in_count', 'byte_in_count', 'duration_sec', 'duration_nsec', 'band_stats']
 
     def __init__(self, meter_id=None, flow_count=None, packet_in_count=None, byte_in_count=None, duration_sec=None, duration_nsec=None, band_stats=None):
         if meter_id != None:
@@ -2126,12 +2142,7 @@ class meter_stats(loxi.OFObject):
         packed = []
         packed.append(struct.pack("!L", self.meter_id))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append('\x00' * 6)
-        packed.append(struct.pack("!L", self.flow_count))
-        packed.append(struct.pack("!Q", self.packet_in_count))
-        packed.append(struct.pack("!Q", self.byte_in_count))
-        packed.append(struct.pack("!L", self.duration_sec))
-        packed.append(struct.pack("!L", self.duration_nsec))
+        packed.append(_struct_6xLQQLL.pack(self.flow_count, self.packet_in_count, self.byte_in_count, self.duration_sec, self.duration_nsec))
         packed.append(loxi.generic_util.pack_list(self.band_stats))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
@@ -2140,16 +2151,10 @@ class meter_stats(loxi.OFObject):
     @staticmethod
     def unpack(reader):
         obj = meter_stats()
-        obj.meter_id = reader.read("!L")[0]
-        _len = reader.read("!H")[0]
+        obj.meter_id, _len = reader.read_struct(_struct_LH)
         orig_reader = reader
         reader = orig_reader.slice(_len, 6)
-        reader.skip(6)
-        obj.flow_count = reader.read("!L")[0]
-        obj.packet_in_count = reader.read("!Q")[0]
-        obj.byte_in_count = reader.read("!Q")[0]
-        obj.duration_sec = reader.read("!L")[0]
-        obj.duration_nsec = reader.read("!L")[0]
+        obj.flow_count, obj.packet_in_count, obj.byte_in_count, obj.duration_sec, obj.duration_nsec = reader.read_struct(_struct_6xLQQLL)
         obj.band_stats = loxi.generic_util.unpack_list(reader, ofp.common.meter_band_stats.unpack)
         return obj
 
@@ -2194,6 +2199,7 @@ class meter_stats(loxi.OFObject):
 
 
 class packet_queue(loxi.OFObject):
+    __slots__ = ['queue_id', 'port', 'properties']
 
     def __init__(self, queue_id=None, port=None, properties=None):
         if queue_id != None:
@@ -2258,6 +2264,7 @@ class packet_queue(loxi.OFObject):
 
 
 class port_desc(loxi.OFObject):
+    __slots__ = ['port_no', 'hw_addr', 'name', 'config', 'state', 'curr', 'advertised', 'supported', 'peer', 'curr_speed', 'max_speed']
 
     def __init__(self, port_no=None, hw_addr=None, name=None, config=None, state=None, curr=None, advertised=None, supported=None, peer=None, curr_speed=None, max_speed=None):
         if port_no != None:
@@ -2313,14 +2320,7 @@ class port_desc(loxi.OFObject):
         packed.append(struct.pack("!6B", *self.hw_addr))
         packed.append('\x00' * 2)
         packed.append(struct.pack("!16s", self.name))
-        packed.append(struct.pack("!L", self.config))
-        packed.append(struct.pack("!L", self.state))
-        packed.append(struct.pack("!L", self.curr))
-        packed.append(struct.pack("!L", self.advertised))
-        packed.append(struct.pack("!L", self.supported))
-        packed.append(struct.pack("!L", self.peer))
-        packed.append(struct.pack("!L", self.curr_speed))
-        packed.append(struct.pack("!L", self.max_speed))
+        packed.append(_struct_LLLLLLLL.pack(self.config, self.state, self.curr, self.advertised, self.supported, self.peer, self.curr_speed, self.max_speed))
         return ''.join(packed)
 
     @staticmethod
@@ -2331,14 +2331,7 @@ class port_desc(loxi.OFObject):
         obj.hw_addr = list(reader.read('!6B'))
         reader.skip(2)
         obj.name = reader.read("!16s")[0].rstrip("\x00")
-        obj.config = reader.read("!L")[0]
-        obj.state = reader.read("!L")[0]
-        obj.curr = reader.read("!L")[0]
-        obj.advertised = reader.read("!L")[0]
-        obj.supported = reader.read("!L")[0]
-        obj.peer = reader.read("!L")[0]
-        obj.curr_speed = reader.read("!L")[0]
-        obj.max_speed = reader.read("!L")[0]
+        obj.config, obj.state, obj.curr, obj.advertised, obj.supported, obj.peer, obj.curr_speed, obj.max_speed = reader.read_struct(_struct_LLLLLLLL)
         return obj
 
     def __eq__(self, other):
@@ -2398,6 +2391,7 @@ class port_desc(loxi.OFObject):
 
 
 class port_stats_entry(loxi.OFObject):
+    __slots__ = ['port_no', 'rx_packets', 'tx_packets', 'rx_bytes', 'tx_bytes', 'rx_dropped', 'tx_dropped', 'rx_errors', 'tx_errors', 'rx_frame_err', 'rx_over_err', 'rx_crc_err', 'collisions', 'duration_sec', 'duration_nsec']
 
     def __init__(self, port_no=None, rx_packets=None, tx_packets=None, rx_bytes=None, tx_bytes=None, rx_dropped=None, tx_dropped=None, rx_errors=None, tx_errors=None, rx_frame_err=None, rx_over_err=None, rx_crc_err=None, collisions=None, duration_sec=None, duration_nsec=None):
         if port_no != None:
@@ -2465,42 +2459,14 @@ class port_stats_entry(loxi.OFObject):
     def pack(self):
         packed = []
         packed.append(util.pack_port_no(self.port_no))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!Q", self.rx_packets))
-        packed.append(struct.pack("!Q", self.tx_packets))
-        packed.append(struct.pack("!Q", self.rx_bytes))
-        packed.append(struct.pack("!Q", self.tx_bytes))
-        packed.append(struct.pack("!Q", self.rx_dropped))
-        packed.append(struct.pack("!Q", self.tx_dropped))
-        packed.append(struct.pack("!Q", self.rx_errors))
-        packed.append(struct.pack("!Q", self.tx_errors))
-        packed.append(struct.pack("!Q", self.rx_frame_err))
-        packed.append(struct.pack("!Q", self.rx_over_err))
-        packed.append(struct.pack("!Q", self.rx_crc_err))
-        packed.append(struct.pack("!Q", self.collisions))
-        packed.append(struct.pack("!L", self.duration_sec))
-        packed.append(struct.pack("!L", self.duration_nsec))
+        packed.append(_struct_4xQQQQQQQQQQQQLL.pack(self.rx_packets, self.tx_packets, self.rx_bytes, self.tx_bytes, self.rx_dropped, self.tx_dropped, self.rx_errors, self.tx_errors, self.rx_frame_err, self.rx_over_err, self.rx_crc_err, self.collisions, self.duration_sec, self.duration_nsec))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = port_stats_entry()
         obj.port_no = util.unpack_port_no(reader)
-        reader.skip(4)
-        obj.rx_packets = reader.read("!Q")[0]
-        obj.tx_packets = reader.read("!Q")[0]
-        obj.rx_bytes = reader.read("!Q")[0]
-        obj.tx_bytes = reader.read("!Q")[0]
-        obj.rx_dropped = reader.read("!Q")[0]
-        obj.tx_dropped = reader.read("!Q")[0]
-        obj.rx_errors = reader.read("!Q")[0]
-        obj.tx_errors = reader.read("!Q")[0]
-        obj.rx_frame_err = reader.read("!Q")[0]
-        obj.rx_over_err = reader.read("!Q")[0]
-        obj.rx_crc_err = reader.read("!Q")[0]
-        obj.collisions = reader.read("!Q")[0]
-        obj.duration_sec = reader.read("!L")[0]
-        obj.duration_nsec = reader.read("!L")[0]
+        obj.rx_packets, obj.tx_packets, obj.rx_bytes, obj.tx_bytes, obj.rx_dropped, obj.tx_dropped, obj.rx_errors, obj.tx_errors, obj.rx_frame_err, obj.rx_over_err, obj.rx_crc_err, obj.collisions, obj.duration_sec, obj.duration_nsec = reader.read_struct(_struct_4xQQQQQQQQQQQQLL)
         return obj
 
     def __eq__(self, other):
@@ -2576,7 +2542,9 @@ class port_stats_entry(loxi.OFObject):
 
 
 class queue_prop(loxi.OFObject):
+    __slots__ = ['type']
     subtypes = {}
+    subtype_field = ('!H', 0)
 
 
     def __init__(self, type=None):
@@ -2603,8 +2571,7 @@ class queue_prop(loxi.OFObject):
             return subclass.unpack(reader)
 
         obj = queue_prop()
-        obj.type = reader.read("!H")[0]
-        _len = reader.read("!H")[0]
+        obj.type, _len = reader.read_struct(_struct_HH)
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         reader.skip(4)
@@ -2625,7 +2592,9 @@ class queue_prop(loxi.OFObject):
 
 
 class queue_prop_experimenter(queue_prop):
+    __slots__ = ['experimenter', 'data']
     subtypes = {}
+    subtype_field = ('!L', 8)
 
     type = 65535
 
@@ -2644,9 +2613,7 @@ class queue_prop_experimenter(queue_prop):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append('\x00' * 4)
+        packed.append(_struct_4xL4x.pack(self.experimenter))
         packed.append(self.data)
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
@@ -2660,9 +2627,8 @@ class queue_prop_experimenter(queue_prop):
             return subclass.unpack(reader)
 
         obj = queue_prop_experimenter()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         reader.skip(4)
@@ -2690,6 +2656,7 @@ class queue_prop_experimenter(queue_prop):
 queue_prop.subtypes[65535] = queue_prop_experimenter
 
 class queue_prop_max_rate(queue_prop):
+    __slots__ = ['rate']
     type = 2
 
     def __init__(self, rate=None):
@@ -2703,9 +2670,7 @@ class queue_prop_max_rate(queue_prop):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!H", self.rate))
-        packed.append('\x00' * 6)
+        packed.append(_struct_4xH6x.pack(self.rate))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -2713,9 +2678,8 @@ class queue_prop_max_rate(queue_prop):
     @staticmethod
     def unpack(reader):
         obj = queue_prop_max_rate()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 2)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         reader.skip(4)
@@ -2741,6 +2705,7 @@ class queue_prop_max_rate(queue_prop):
 queue_prop.subtypes[2] = queue_prop_max_rate
 
 class queue_prop_min_rate(queue_prop):
+    __slots__ = ['rate']
     type = 1
 
     def __init__(self, rate=None):
@@ -2754,9 +2719,7 @@ class queue_prop_min_rate(queue_prop):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!H", self.rate))
-        packed.append('\x00' * 6)
+        packed.append(_struct_4xH6x.pack(self.rate))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -2764,9 +2727,8 @@ class queue_prop_min_rate(queue_prop):
     @staticmethod
     def unpack(reader):
         obj = queue_prop_min_rate()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 1)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         reader.skip(4)
@@ -2792,6 +2754,7 @@ class queue_prop_min_rate(queue_prop):
 queue_prop.subtypes[1] = queue_prop_min_rate
 
 class queue_stats_entry(loxi.OFObject):
+    __slots__ = ['port_no', 'queue_id', 'tx_bytes', 'tx_packets', 'tx_errors', 'duration_sec', 'duration_nsec']
 
     def __init__(self, port_no=None, queue_id=None, tx_bytes=None, tx_packets=None, tx_errors=None, duration_sec=None, duration_nsec=None):
         if port_no != None:
@@ -2827,24 +2790,14 @@ class queue_stats_entry(loxi.OFObject):
     def pack(self):
         packed = []
         packed.append(util.pack_port_no(self.port_no))
-        packed.append(struct.pack("!L", self.queue_id))
-        packed.append(struct.pack("!Q", self.tx_bytes))
-        packed.append(struct.pack("!Q", self.tx_packets))
-        packed.append(struct.pack("!Q", self.tx_errors))
-        packed.append(struct.pack("!L", self.duration_sec))
-        packed.append(struct.pack("!L", self.duration_nsec))
+        packed.append(_struct_LQQQLL.pack(self.queue_id, self.tx_bytes, self.tx_packets, self.tx_errors, self.duration_sec, self.duration_nsec))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = queue_stats_entry()
         obj.port_no = util.unpack_port_no(reader)
-        obj.queue_id = reader.read("!L")[0]
-        obj.tx_bytes = reader.read("!Q")[0]
-        obj.tx_packets = reader.read("!Q")[0]
-        obj.tx_errors = reader.read("!Q")[0]
-        obj.duration_sec = reader.read("!L")[0]
-        obj.duration_nsec = reader.read("!L")[0]
+        obj.queue_id, obj.tx_bytes, obj.tx_packets, obj.tx_errors, obj.duration_sec, obj.duration_nsec = reader.read_struct(_struct_LQQQLL)
         return obj
 
     def __eq__(self, other):
@@ -2888,7 +2841,9 @@ class queue_stats_entry(loxi.OFObject):
 
 
 class table_feature_prop(loxi.OFObject):
+    __slots__ = ['type']
     subtypes = {}
+    subtype_field = ('!H', 0)
 
 
     def __init__(self, type=None):
@@ -2914,8 +2869,7 @@ class table_feature_prop(loxi.OFObject):
             return subclass.unpack(reader)
 
         obj = table_feature_prop()
-        obj.type = reader.read("!H")[0]
-        _length = reader.read("!H")[0]
+        obj.type, _length = reader.read_struct(_struct_HH)
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         return obj
@@ -2935,6 +2889,7 @@ class table_feature_prop(loxi.OFObject):
 
 
 class table_feature_prop_apply_actions(table_feature_prop):
+    __slots__ = ['action_ids']
     type = 6
 
     def __init__(self, action_ids=None):
@@ -2957,9 +2912,8 @@ class table_feature_prop_apply_actions(table_feature_prop):
     @staticmethod
     def unpack(reader):
         obj = table_feature_prop_apply_actions()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 6)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.action_ids = loxi.generic_util.unpack_list(reader, ofp.action_id.action_id.unpack)
@@ -2984,6 +2938,7 @@ class table_feature_prop_apply_actions(table_feature_prop):
 table_feature_prop.subtypes[6] = table_feature_prop_apply_actions
 
 class table_feature_prop_apply_actions_miss(table_feature_prop):
+    __slots__ = ['action_ids']
     type = 7
 
     def __init__(self, action_ids=None):
@@ -3006,9 +2961,8 @@ class table_feature_prop_apply_actions_miss(table_feature_prop):
     @staticmethod
     def unpack(reader):
         obj = table_feature_prop_apply_actions_miss()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 7)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.action_ids = loxi.generic_util.unpack_list(reader, ofp.action_id.action_id.unpack)
@@ -3033,6 +2987,7 @@ class table_feature_prop_apply_actions_miss(table_feature_prop):
 table_feature_prop.subtypes[7] = table_feature_prop_apply_actions_miss
 
 class table_feature_prop_apply_setfield(table_feature_prop):
+    __slots__ = ['oxm_ids']
     type = 14
 
     def __init__(self, oxm_ids=None):
@@ -3055,9 +3010,8 @@ class table_feature_prop_apply_setfield(table_feature_prop):
     @staticmethod
     def unpack(reader):
         obj = table_feature_prop_apply_setfield()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 14)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.oxm_ids = loxi.generic_util.unpack_list(reader, ofp.common.uint32.unpack)
@@ -3082,6 +3036,7 @@ class table_feature_prop_apply_setfield(table_feature_prop):
 table_feature_prop.subtypes[14] = table_feature_prop_apply_setfield
 
 class table_feature_prop_apply_setfield_miss(table_feature_prop):
+    __slots__ = ['oxm_ids']
     type = 15
 
     def __init__(self, oxm_ids=None):
@@ -3104,9 +3059,8 @@ class table_feature_prop_apply_setfield_miss(table_feature_prop):
     @staticmethod
     def unpack(reader):
         obj = table_feature_prop_apply_setfield_miss()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 15)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.oxm_ids = loxi.generic_util.unpack_list(reader, ofp.common.uint32.unpack)
@@ -3131,7 +3085,9 @@ class table_feature_prop_apply_setfield_miss(table_feature_prop):
 table_feature_prop.subtypes[15] = table_feature_prop_apply_setfield_miss
 
 class table_feature_prop_experimenter(table_feature_prop):
+    __slots__ = ['experimenter', 'subtype', 'experimenter_data']
     subtypes = {}
+    subtype_field = ('!L', 4)
 
     type = 65534
 
@@ -3154,8 +3110,7 @@ class table_feature_prop_experimenter(table_feature_prop):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_struct_LL.pack(self.experimenter, self.subtype))
         packed.append(self.experimenter_data)
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
@@ -3170,13 +3125,11 @@ class table_feature_prop_experimenter(table_feature_prop):
             return subclass.unpack(reader)
 
         obj = table_feature_prop_experimenter()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 65534)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.experimenter = reader.read("!L")[0]
-        obj.subtype = reader.read("!L")[0]
+        obj.experimenter, obj.subtype = reader.read_struct(_struct_LL)
         obj.experimenter_data = str(reader.read_all())
         orig_reader.skip_align()
         return obj
@@ -3204,7 +3157,9 @@ class table_feature_prop_experimenter(table_feature_prop):
 table_feature_prop.subtypes[65534] = table_feature_prop_experimenter
 
 class table_feature_prop_experimenter_miss(table_feature_prop):
+    __slots__ = ['experimenter', 'subtype', 'experimenter_data']
     subtypes = {}
+    subtype_field = ('!L', 4)
 
     type = 65535
 
@@ -3227,8 +3182,7 @@ class table_feature_prop_experimenter_miss(table_feature_prop):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
+        packed.append(_struct_LL.pack(self.experimenter, self.subtype))
         packed.append(self.experimenter_data)
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
@@ -3243,13 +3197,11 @@ class table_feature_prop_experimenter_miss(table_feature_prop):
             return subclass.unpack(reader)
 
         obj = table_feature_prop_experimenter_miss()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.experimenter = reader.read("!L")[0]
-        obj.subtype = reader.read("!L")[0]
+        obj.experimenter, obj.subtype = reader.read_struct(_struct_LL)
         obj.experimenter_data = str(reader.read_all())
         orig_reader.skip_align()
         return obj
@@ -3277,6 +3229,7 @@ class table_feature_prop_experimenter_miss(table_feature_prop):
 table_feature_prop.subtypes[65535] = table_feature_prop_experimenter_miss
 
 class table_feature_prop_instructions(table_feature_prop):
+    __slots__ = ['instruction_ids']
     type = 0
 
     def __init__(self, instruction_ids=None):
@@ -3299,9 +3252,8 @@ class table_feature_prop_instructions(table_feature_prop):
     @staticmethod
     def unpack(reader):
         obj = table_feature_prop_instructions()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 0)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.instruction_ids = loxi.generic_util.unpack_list(reader, ofp.instruction_id.instruction_id.unpack)
@@ -3326,6 +3278,7 @@ class table_feature_prop_instructions(table_feature_prop):
 table_feature_prop.subtypes[0] = table_feature_prop_instructions
 
 class table_feature_prop_instructions_miss(table_feature_prop):
+    __slots__ = ['instruction_ids']
     type = 1
 
     def __init__(self, instruction_ids=None):
@@ -3348,9 +3301,8 @@ class table_feature_prop_instructions_miss(table_feature_prop):
     @staticmethod
     def unpack(reader):
         obj = table_feature_prop_instructions_miss()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.instruction_ids = loxi.generic_util.unpack_list(reader, ofp.instruction_id.instruction_id.unpack)
@@ -3375,6 +3327,7 @@ class table_feature_prop_instructions_miss(table_feature_prop):
 table_feature_prop.subtypes[1] = table_feature_prop_instructions_miss
 
 class table_feature_prop_match(table_feature_prop):
+    __slots__ = ['oxm_ids']
     type = 8
 
     def __init__(self, oxm_ids=None):
@@ -3397,9 +3350,8 @@ class table_feature_prop_match(table_feature_prop):
     @staticmethod
     def unpack(reader):
         obj = table_feature_prop_match()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 8)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.oxm_ids = loxi.generic_util.unpack_list(reader, ofp.common.uint32.unpack)
@@ -3424,6 +3376,7 @@ class table_feature_prop_match(table_feature_prop):
 table_feature_prop.subtypes[8] = table_feature_prop_match
 
 class table_feature_prop_next_tables(table_feature_prop):
+    __slots__ = ['next_table_ids']
     type = 2
 
     def __init__(self, next_table_ids=None):
@@ -3446,9 +3399,8 @@ class table_feature_prop_next_tables(table_feature_prop):
     @staticmethod
     def unpack(reader):
         obj = table_feature_prop_next_tables()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 2)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.next_table_ids = loxi.generic_util.unpack_list(reader, ofp.common.uint8.unpack)
@@ -3473,6 +3425,7 @@ class table_feature_prop_next_tables(table_feature_prop):
 table_feature_prop.subtypes[2] = table_feature_prop_next_tables
 
 class table_feature_prop_next_tables_miss(table_feature_prop):
+    __slots__ = ['next_table_ids']
     type = 3
 
     def __init__(self, next_table_ids=None):
@@ -3495,9 +3448,8 @@ class table_feature_prop_next_tables_miss(table_feature_prop):
     @staticmethod
     def unpack(reader):
         obj = table_feature_prop_next_tables_miss()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 3)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.next_table_ids = loxi.generic_util.unpack_list(reader, ofp.common.uint8.unpack)
@@ -3522,6 +3474,7 @@ class table_feature_prop_next_tables_miss(table_feature_prop):
 table_feature_prop.subtypes[3] = table_feature_prop_next_tables_miss
 
 class table_feature_prop_wildcards(table_feature_prop):
+    __slots__ = ['oxm_ids']
     type = 10
 
     def __init__(self, oxm_ids=None):
@@ -3544,9 +3497,8 @@ class table_feature_prop_wildcards(table_feature_prop):
     @staticmethod
     def unpack(reader):
         obj = table_feature_prop_wildcards()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 10)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.oxm_ids = loxi.generic_util.unpack_list(reader, ofp.common.uint32.unpack)
@@ -3571,6 +3523,7 @@ class table_feature_prop_wildcards(table_feature_prop):
 table_feature_prop.subtypes[10] = table_feature_prop_wildcards
 
 class table_feature_prop_write_actions(table_feature_prop):
+    __slots__ = ['action_ids']
     type = 4
 
     def __init__(self, action_ids=None):
@@ -3593,9 +3546,8 @@ class table_feature_prop_write_actions(table_feature_prop):
     @staticmethod
     def unpack(reader):
         obj = table_feature_prop_write_actions()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.action_ids = loxi.generic_util.unpack_list(reader, ofp.action_id.action_id.unpack)
@@ -3620,6 +3572,7 @@ class table_feature_prop_write_actions(table_feature_prop):
 table_feature_prop.subtypes[4] = table_feature_prop_write_actions
 
 class table_feature_prop_write_actions_miss(table_feature_prop):
+    __slots__ = ['action_ids']
     type = 5
 
     def __init__(self, action_ids=None):
@@ -3642,9 +3595,8 @@ class table_feature_prop_write_actions_miss(table_feature_prop):
     @staticmethod
     def unpack(reader):
         obj = table_feature_prop_write_actions_miss()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 5)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.action_ids = loxi.generic_util.unpack_list(reader, ofp.action_id.action_id.unpack)
@@ -3669,6 +3621,7 @@ class table_feature_prop_write_actions_miss(table_feature_prop):
 table_feature_prop.subtypes[5] = table_feature_prop_write_actions_miss
 
 class table_feature_prop_write_setfield(table_feature_prop):
+    __slots__ = ['oxm_ids']
     type = 12
 
     def __init__(self, oxm_ids=None):
@@ -3691,9 +3644,8 @@ class table_feature_prop_write_setfield(table_feature_prop):
     @staticmethod
     def unpack(reader):
         obj = table_feature_prop_write_setfield()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 12)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.oxm_ids = loxi.generic_util.unpack_list(reader, ofp.common.uint32.unpack)
@@ -3718,6 +3670,7 @@ class table_feature_prop_write_setfield(table_feature_prop):
 table_feature_prop.subtypes[12] = table_feature_prop_write_setfield
 
 class table_feature_prop_write_setfield_miss(table_feature_prop):
+    __slots__ = ['oxm_ids']
     type = 13
 
     def __init__(self, oxm_ids=None):
@@ -3740,9 +3693,8 @@ class table_feature_prop_write_setfield_miss(table_feature_prop):
     @staticmethod
     def unpack(reader):
         obj = table_feature_prop_write_setfield_miss()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 13)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.oxm_ids = loxi.generic_util.unpack_list(reader, ofp.common.uint32.unpack)
@@ -3767,6 +3719,7 @@ class table_feature_prop_write_setfield_miss(table_feature_prop):
 table_feature_prop.subtypes[13] = table_feature_prop_write_setfield_miss
 
 class table_features(loxi.OFObject):
+    __slots__ = ['table_id', 'name', 'metadata_match', 'metadata_write', 'config', 'max_entries', 'properties']
 
     def __init__(self, table_id=None, name=None, metadata_match=None, metadata_write=None, config=None, max_entries=None, properties=None):
         if table_id != None:
@@ -3802,13 +3755,9 @@ class table_features(loxi.OFObject):
     def pack(self):
         packed = []
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 0
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append('\x00' * 5)
+        packed.append(_struct_B5x.pack(self.table_id))
         packed.append(struct.pack("!32s", self.name))
-        packed.append(struct.pack("!Q", self.metadata_match))
-        packed.append(struct.pack("!Q", self.metadata_write))
-        packed.append(struct.pack("!L", self.config))
-        packed.append(struct.pack("!L", self.max_entries))
+        packed.append(_struct_QQLL.pack(self.metadata_match, self.metadata_write, self.config, self.max_entries))
         packed.append(loxi.generic_util.pack_list(self.properties))
         length = sum([len(x) for x in packed])
         packed[0] = struct.pack("!H", length)
@@ -3823,10 +3772,7 @@ class table_features(loxi.OFObject):
         obj.table_id = reader.read("!B")[0]
         reader.skip(5)
         obj.name = reader.read("!32s")[0].rstrip("\x00")
-        obj.metadata_match = reader.read("!Q")[0]
-        obj.metadata_write = reader.read("!Q")[0]
-        obj.config = reader.read("!L")[0]
-        obj.max_entries = reader.read("!L")[0]
+        obj.metadata_match, obj.metadata_write, obj.config, obj.max_entries = reader.read_struct(_struct_QQLL)
         obj.properties = loxi.generic_util.unpack_list(reader, ofp.common.table_feature_prop.unpack)
         return obj
 
@@ -3871,6 +3817,7 @@ class table_features(loxi.OFObject):
 
 
 class table_stats_entry(loxi.OFObject):
+    __slots__ = ['table_id', 'active_count', 'lookup_count', 'matched_count']
 
     def __init__(self, table_id=None, active_count=None, lookup_count=None, matched_count=None):
         if table_id != None:
@@ -3893,21 +3840,13 @@ class table_stats_entry(loxi.OFObject):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append('\x00' * 3)
-        packed.append(struct.pack("!L", self.active_count))
-        packed.append(struct.pack("!Q", self.lookup_count))
-        packed.append(struct.pack("!Q", self.matched_count))
+        packed.append(_struct_B3xLQQ.pack(self.table_id, self.active_count, self.lookup_count, self.matched_count))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = table_stats_entry()
-        obj.table_id = reader.read("!B")[0]
-        reader.skip(3)
-        obj.active_count = reader.read("!L")[0]
-        obj.lookup_count = reader.read("!Q")[0]
-        obj.matched_count = reader.read("!Q")[0]
+        obj.table_id, obj.active_count, obj.lookup_count, obj.matched_count = reader.read_struct(_struct_B3xLQQ)
         return obj
 
     def __eq__(self, other):
@@ -3939,6 +3878,7 @@ class table_stats_entry(loxi.OFObject):
 
 
 class uint32(loxi.OFObject):
+    __slots__ = ['value']
 
     def __init__(self, value=None):
         if value != None:
@@ -3975,6 +3915,7 @@ class uint32(loxi.OFObject):
 
 
 class uint64(loxi.OFObject):
+    __slots__ = ['value']
 
     def __init__(self, value=None):
         if value != None:
@@ -4011,6 +3952,7 @@ class uint64(loxi.OFObject):
 
 
 class uint8(loxi.OFObject):
+    __slots__ = ['value']
 
     def __init__(self, value=None):
         if value != None:
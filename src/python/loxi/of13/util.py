@@ -8,13 +8,6 @@
 import struct
 import loxi
 import const
-import common
-import action
-import instruction
-import oxm
-import action_id
-import instruction_id
-import meter_band
 
 def pretty_mac(mac):
     return ':'.join(["%02x" % x for x in mac])
@@ -6,25 +6,28 @@
 # Automatically generated by LOXI from template init.py
 # Do not modify
 
+import loxi
 import const
-import port_desc_prop
-import bsn_tlv
-import meter_band
-import table_mod_prop
-import instruction
-import queue_desc_prop
-import oxm
-import bundle_prop
-import common
-import instruction_id
-import action
-import role_prop
-import message
-import queue_stats_prop
-import port_stats_prop
-import port_mod_prop
-import async_config_prop
-import action_id
 from const import *
-from common import *
 from loxi import ProtocolError
+
+loxi.lazy_protocol(__name__, [
+    'port_desc_prop',
+    'bsn_tlv',
+    'meter_band',
+    'table_mod_prop',
+    'instruction',
+    'queue_desc_prop',
+    'oxm',
+    'bundle_prop',
+    'common',
+    'instruction_id',
+    'action',
+    'role_prop',
+    'message',
+    'queue_stats_prop',
+    'port_stats_prop',
+    'port_mod_prop',
+    'async_config_prop',
+    'action_id',
+], 'common')
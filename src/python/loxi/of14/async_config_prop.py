@@ -14,8 +14,13 @@ import loxi.generic_util
 import sys
 ofp = sys.modules['loxi.of14']
 
+# Precompiled layouts of fixed-size field runs
+_struct_HH = struct.Struct("!HH")
+
 class async_config_prop(loxi.OFObject):
+    __slots__ = ['type']
     subtypes = {}
+    subtype_field = ('!H', 0)
 
 
     def __init__(self, type=None):
@@ -41,8 +46,7 @@ class async_config_prop(loxi.OFObject):
             return subclass.unpack(reader)
 
         obj = async_config_prop()
-        obj.type = reader.read("!H")[0]
-        _length = reader.read("!H")[0]
+        obj.type, _length = reader.read_struct(_struct_HH)
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         return obj
@@ -62,6 +66,7 @@ class async_config_prop(loxi.OFObject):
 
 
 class experimenter_master(async_config_prop):
+    __slots__ = []
     type = 65535
 
     def __init__(self):
@@ -78,9 +83,8 @@ class experimenter_master(async_config_prop):
     @staticmethod
     def unpack(reader):
         obj = experimenter_master()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         return obj
@@ -100,6 +104,7 @@ class experimenter_master(async_config_prop):
 async_config_prop.subtypes[65535] = experimenter_master
 
 class experimenter_slave(async_config_prop):
+    __slots__ = []
     type = 65534
 
     def __init__(self):
@@ -116,9 +121,8 @@ class experimenter_slave(async_config_prop):
     @staticmethod
     def unpack(reader):
         obj = experimenter_slave()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 65534)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         return obj
@@ -138,6 +142,7 @@ class experimenter_slave(async_config_prop):
 async_config_prop.subtypes[65534] = experimenter_slave
 
 class flow_removed_master(async_config_prop):
+    __slots__ = ['mask']
     type = 5
 
     def __init__(self, mask=None):
@@ -159,9 +164,8 @@ class flow_removed_master(async_config_prop):
     @staticmethod
     def unpack(reader):
         obj = flow_removed_master()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 5)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.mask = reader.read("!L")[0]
@@ -185,6 +189,7 @@ class flow_removed_master(async_config_prop):
 async_config_prop.subtypes[5] = flow_removed_master
 
 class flow_removed_slave(async_config_prop):
+    __slots__ = ['mask']
     type = 4
 
     def __init__(self, mask=None):
@@ -206,9 +211,8 @@ class flow_removed_slave(async_config_prop):
     @staticmethod
     def unpack(reader):
         obj = flow_removed_slave()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.mask = reader.read("!L")[0]
@@ -232,6 +236,7 @@ class flow_removed_slave(async_config_prop):
 async_config_prop.subtypes[4] = flow_removed_slave
 
 class packet_in_master(async_config_prop):
+    __slots__ = ['mask']
     type = 1
 
     def __init__(self, mask=None):
@@ -253,9 +258,8 @@ class packet_in_master(async_config_prop):
     @staticmethod
     def unpack(reader):
         obj = packet_in_master()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.mask = reader.read("!L")[0]
@@ -279,6 +283,7 @@ class packet_in_master(async_config_prop):
 async_config_prop.subtypes[1] = packet_in_master
 
 class packet_in_slave(async_config_prop):
+    __slots__ = ['mask']
     type = 0
 
     def __init__(self, mask=None):
@@ -300,9 +305,8 @@ class packet_in_slave(async_config_prop):
     @staticmethod
     def unpack(reader):
         obj = packet_in_slave()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 0)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.mask = reader.read("!L")[0]
@@ -326,6 +330,7 @@ class packet_in_slave(async_config_prop):
 async_config_prop.subtypes[0] = packet_in_slave
 
 class port_status_master(async_config_prop):
+    __slots__ = ['mask']
     type = 3
 
     def __init__(self, mask=None):
@@ -347,9 +352,8 @@ class port_status_master(async_config_prop):
     @staticmethod
     def unpack(reader):
         obj = port_status_master()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 3)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.mask = reader.read("!L")[0]
@@ -373,6 +377,7 @@ class port_status_master(async_config_prop):
 async_config_prop.subtypes[3] = port_status_master
 
 class port_status_slave(async_config_prop):
+    __slots__ = ['mask']
     type = 2
 
     def __init__(self, mask=None):
@@ -394,9 +399,8 @@ class port_status_slave(async_config_prop):
     @staticmethod
     def unpack(reader):
         obj = port_status_slave()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 2)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.mask = reader.read("!L")[0]
@@ -420,6 +424,7 @@ class port_status_slave(async_config_prop):
 async_config_prop.subtypes[2] = port_status_slave
 
 class requestforward_master(async_config_prop):
+    __slots__ = ['mask']
     type = 11
 
     def __init__(self, mask=None):
@@ -441,9 +446,8 @@ class requestforward_master(async_config_prop):
     @staticmethod
     def unpack(reader):
         obj = requestforward_master()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 11)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.mask = reader.read("!L")[0]
@@ -467,6 +471,7 @@ class requestforward_master(async_config_prop):
 async_config_prop.subtypes[11] = requestforward_master
 
 class requestforward_slave(async_config_prop):
+    __slots__ = ['mask']
     type = 10
 
     def __init__(self, mask=None):
@@ -488,9 +493,8 @@ class requestforward_slave(async_config_prop):
     @staticmethod
     def unpack(reader):
         obj = requestforward_slave()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 10)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.mask = reader.read("!L")[0]
@@ -514,6 +518,7 @@ class requestforward_slave(async_config_prop):
 async_config_prop.subtypes[10] = requestforward_slave
 
 class role_status_master(async_config_prop):
+    __slots__ = ['mask']
     type = 7
 
     def __init__(self, mask=None):
@@ -535,9 +540,8 @@ class role_status_master(async_config_prop):
     @staticmethod
     def unpack(reader):
         obj = role_status_master()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 7)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.mask = reader.read("!L")[0]
@@ -561,6 +565,7 @@ class role_status_master(async_config_prop):
 async_config_prop.subtypes[7] = role_status_master
 
 class role_status_slave(async_config_prop):
+    __slots__ = ['mask']
     type = 6
 
     def __init__(self, mask=None):
@@ -582,9 +587,8 @@ class role_status_slave(async_config_prop):
     @staticmethod
     def unpack(reader):
         obj = role_status_slave()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 6)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.mask = reader.read("!L")[0]
@@ -608,6 +612,7 @@ class role_status_slave(async_config_prop):
 async_config_prop.subtypes[6] = role_status_slave
 
 class table_status_master(async_config_prop):
+    __slots__ = ['mask']
     type = 9
 
     def __init__(self, mask=None):
@@ -629,9 +634,8 @@ class table_status_master(async_config_prop):
     @staticmethod
     def unpack(reader):
         obj = table_status_master()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 9)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.mask = reader.read("!L")[0]
@@ -655,6 +659,7 @@ class table_status_master(async_config_prop):
 async_config_prop.subtypes[9] = table_status_master
 
 class table_status_slave(async_config_prop):
+    __slots__ = ['mask']
     type = 8
 
     def __init__(self, mask=None):
@@ -676,9 +681,8 @@ class table_status_slave(async_config_prop):
     @staticmethod
     def unpack(reader):
         obj = table_status_slave()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 8)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.mask = reader.read("!L")[0]
@@ -14,8 +14,16 @@ import loxi.generic_util
 import sys
 ofp = sys.modules['loxi.of14']
 
+# Precompiled layouts of fixed-size field runs
+_struct_HH = struct.Struct("!HH")
+_struct_LL4x = struct.Struct("!LL4x")
+_struct_LLB3x = struct.Struct("!LLB3x")
+_struct_LLL = struct.Struct("!LLL")
+
 class meter_band(loxi.OFObject):
+    __slots__ = ['type']
     subtypes = {}
+    subtype_field = ('!H', 0)
 
 
     def __init__(self, type=None):
@@ -41,8 +49,7 @@ class meter_band(loxi.OFObject):
             return subclass.unpack(reader)
 
         obj = meter_band()
-        obj.type = reader.read("!H")[0]
-        _len = reader.read("!H")[0]
+        obj.type, _len = reader.read_struct(_struct_HH)
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         return obj
@@ -62,6 +69,7 @@ class meter_band(loxi.OFObject):
 
 
 class drop(meter_band):
+    __slots__ = ['rate', 'burst_size']
     type = 1
 
     def __init__(self, rate=None, burst_size=None):
@@ -79,9 +87,7 @@ class drop(meter_band):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.rate))
-        packed.append(struct.pack("!L", self.burst_size))
-        packed.append('\x00' * 4)
+        packed.append(_struct_LL4x.pack(self.rate, self.burst_size))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -89,14 +95,11 @@ class drop(meter_band):
     @staticmethod
     def unpack(reader):
         obj = drop()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 1)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        obj.rate = reader.read("!L")[0]
-        obj.burst_size = reader.read("!L")[0]
-        reader.skip(4)
+        obj.rate, obj.burst_size = reader.read_struct(_struct_LL4x)
         return obj
 
     def __eq__(self, other):
@@ -121,6 +124,7 @@ class drop(meter_band):
 meter_band.subtypes[1] = drop
 
 class dscp_remark(meter_band):
+    __slots__ = ['rate', 'burst_size', 'prec_level']
     type = 2
 
     def __init__(self, rate=None, burst_size=None, prec_level=None):
@@ -142,10 +146,7 @@ class dscp_remark(meter_band):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.rate))
-        packed.append(struct.pack("!L", self.burst_size))
-        packed.append(struct.pack("!B", self.prec_level))
-        packed.append('\x00' * 3)
+        packed.append(_struct_LLB3x.pack(self.rate, self.burst_size, self.prec_level))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -153,15 +154,11 @@ class dscp_remark(meter_band):
     @staticmethod
     def unpack(reader):
         obj = dscp_remark()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 2)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        obj.rate = reader.read("!L")[0]
-        obj.burst_size = reader.read("!L")[0]
-        obj.prec_level = reader.read("!B")[0]
-        reader.skip(3)
+        obj.rate, obj.burst_size, obj.prec_level = reader.read_struct(_struct_LLB3x)
         return obj
 
     def __eq__(self, other):
@@ -190,6 +187,7 @@ class dscp_remark(meter_band):
 meter_band.subtypes[2] = dscp_remark
 
 class experimenter(meter_band):
+    __slots__ = ['rate', 'burst_size', 'experimenter']
     type = 65535
 
     def __init__(self, rate=None, burst_size=None, experimenter=None):
@@ -211,9 +209,7 @@ class experimenter(meter_band):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.rate))
-        packed.append(struct.pack("!L", self.burst_size))
-        packed.append(struct.pack("!L", self.experimenter))
+        packed.append(_struct_LLL.pack(self.rate, self.burst_size, self.experimenter))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -221,14 +217,11 @@ class experimenter(meter_band):
     @staticmethod
     def unpack(reader):
         obj = experimenter()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        obj.rate = reader.read("!L")[0]
-        obj.burst_size = reader.read("!L")[0]
-        obj.experimenter = reader.read("!L")[0]
+        obj.rate, obj.burst_size, obj.experimenter = reader.read_struct(_struct_LLL)
         return obj
 
     def __eq__(self, other):
@@ -14,8 +14,20 @@ import loxi.generic_util
 import sys
 ofp = sys.modules['loxi.of14']
 
+# Precompiled layouts of fixed-size field runs
+_struct_LB = struct.Struct("!LB")
+_struct_LBB = struct.Struct("!LBB")
+_struct_LH = struct.Struct("!LH")
+_struct_LHH = struct.Struct("!LHH")
+_struct_LL = struct.Struct("!LL")
+_struct_LLL = struct.Struct("!LLL")
+_struct_LQ = struct.Struct("!LQ")
+_struct_LQQ = struct.Struct("!LQQ")
+
 class oxm(loxi.OFObject):
+    __slots__ = ['type_len']
     subtypes = {}
+    subtype_field = ('!L', 0)
 
 
     def __init__(self, type_len=None):
@@ -56,6 +68,7 @@ class oxm(loxi.OFObject):
 
 
 class arp_op(oxm):
+    __slots__ = ['value']
     type_len = 2147494402
 
     def __init__(self, value=None):
@@ -67,16 +80,14 @@ class arp_op(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_struct_LH.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = arp_op()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LH)
         assert(_type_len == 2147494402)
-        obj.value = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -97,6 +108,7 @@ class arp_op(oxm):
 oxm.subtypes[2147494402] = arp_op
 
 class arp_op_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147494660
 
     def __init__(self, value=None, value_mask=None):
@@ -112,18 +124,14 @@ class arp_op_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        packed.append(struct.pack("!H", self.value_mask))
+        packed.append(_struct_LHH.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = arp_op_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LHH)
         assert(_type_len == 2147494660)
-        obj.value = reader.read("!H")[0]
-        obj.value_mask = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -148,6 +156,7 @@ class arp_op_masked(oxm):
 oxm.subtypes[2147494660] = arp_op_masked
 
 class arp_sha(oxm):
+    __slots__ = ['value']
     type_len = 2147495942
 
     def __init__(self, value=None):
@@ -189,6 +198,7 @@ class arp_sha(oxm):
 oxm.subtypes[2147495942] = arp_sha
 
 class arp_sha_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147496204
 
     def __init__(self, value=None, value_mask=None):
@@ -240,6 +250,7 @@ class arp_sha_masked(oxm):
 oxm.subtypes[2147496204] = arp_sha_masked
 
 class arp_spa(oxm):
+    __slots__ = ['value']
     type_len = 2147494916
 
     def __init__(self, value=None):
@@ -251,16 +262,14 @@ class arp_spa(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_struct_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = arp_spa()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 2147494916)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -281,6 +290,7 @@ class arp_spa(oxm):
 oxm.subtypes[2147494916] = arp_spa
 
 class arp_spa_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147495176
 
     def __init__(self, value=None, value_mask=None):
@@ -296,18 +306,14 @@ class arp_spa_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_struct_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = arp_spa_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 2147495176)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -332,6 +338,7 @@ class arp_spa_masked(oxm):
 oxm.subtypes[2147495176] = arp_spa_masked
 
 class arp_tha(oxm):
+    __slots__ = ['value']
     type_len = 2147496454
 
     def __init__(self, value=None):
@@ -373,6 +380,7 @@ class arp_tha(oxm):
 oxm.subtypes[2147496454] = arp_tha
 
 class arp_tha_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147496716
 
     def __init__(self, value=None, value_mask=None):
@@ -424,6 +432,7 @@ class arp_tha_masked(oxm):
 oxm.subtypes[2147496716] = arp_tha_masked
 
 class arp_tpa(oxm):
+    __slots__ = ['value']
     type_len = 2147495428
 
     def __init__(self, value=None):
@@ -435,16 +444,14 @@ class arp_tpa(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_struct_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = arp_tpa()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 2147495428)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -465,6 +472,7 @@ class arp_tpa(oxm):
 oxm.subtypes[2147495428] = arp_tpa
 
 class arp_tpa_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147495688
 
     def __init__(self, value=None, value_mask=None):
@@ -480,18 +488,14 @@ class arp_tpa_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_struct_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = arp_tpa_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 2147495688)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -516,6 +520,7 @@ class arp_tpa_masked(oxm):
 oxm.subtypes[2147495688] = arp_tpa_masked
 
 class bsn_egr_port_group_id(oxm):
+    __slots__ = ['value']
     type_len = 200196
 
     def __init__(self, value=None):
@@ -527,16 +532,14 @@ class bsn_egr_port_group_id(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_struct_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_egr_port_group_id()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 200196)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -557,6 +560,7 @@ class bsn_egr_port_group_id(oxm):
 oxm.subtypes[200196] = bsn_egr_port_group_id
 
 class bsn_egr_port_group_id_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 200456
 
     def __init__(self, value=None, value_mask=None):
@@ -572,18 +576,14 @@ class bsn_egr_port_group_id_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_struct_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_egr_port_group_id_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 200456)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -608,6 +608,7 @@ class bsn_egr_port_group_id_masked(oxm):
 oxm.subtypes[200456] = bsn_egr_port_group_id_masked
 
 class bsn_in_ports_128(oxm):
+    __slots__ = ['value']
     type_len = 196624
 
     def __init__(self, value=None):
@@ -649,6 +650,7 @@ class bsn_in_ports_128(oxm):
 oxm.subtypes[196624] = bsn_in_ports_128
 
 class bsn_in_ports_128_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 196896
 
     def __init__(self, value=None, value_mask=None):
@@ -700,6 +702,7 @@ class bsn_in_ports_128_masked(oxm):
 oxm.subtypes[196896] = bsn_in_ports_128_masked
 
 class bsn_in_ports_512(oxm):
+    __slots__ = ['value']
     type_len = 206400
 
     def __init__(self, value=None):
@@ -741,6 +744,7 @@ class bsn_in_ports_512(oxm):
 oxm.subtypes[206400] = bsn_in_ports_512
 
 class bsn_in_ports_512_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 206720
 
     def __init__(self, value=None, value_mask=None):
@@ -792,6 +796,7 @@ class bsn_in_ports_512_masked(oxm):
 oxm.subtypes[206720] = bsn_in_ports_512_masked
 
 class bsn_ingress_port_group_id(oxm):
+    __slots__ = ['value']
     type_len = 206852
 
     def __init__(self, value=None):
@@ -803,16 +808,14 @@ class bsn_ingress_port_group_id(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_struct_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_ingress_port_group_id()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 206852)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -833,6 +836,7 @@ class bsn_ingress_port_group_id(oxm):
 oxm.subtypes[206852] = bsn_ingress_port_group_id
 
 class bsn_ingress_port_group_id_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 207112
 
     def __init__(self, value=None, value_mask=None):
@@ -848,18 +852,14 @@ class bsn_ingress_port_group_id_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_struct_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_ingress_port_group_id_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 207112)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -884,6 +884,7 @@ class bsn_ingress_port_group_id_masked(oxm):
 oxm.subtypes[207112] = bsn_ingress_port_group_id_masked
 
 class bsn_inner_eth_dst(oxm):
+    __slots__ = ['value']
     type_len = 207878
 
     def __init__(self, value=None):
@@ -925,6 +926,7 @@ class bsn_inner_eth_dst(oxm):
 oxm.subtypes[207878] = bsn_inner_eth_dst
 
 class bsn_inner_eth_dst_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 208140
 
     def __init__(self, value=None, value_mask=None):
@@ -976,6 +978,7 @@ class bsn_inner_eth_dst_masked(oxm):
 oxm.subtypes[208140] = bsn_inner_eth_dst_masked
 
 class bsn_inner_eth_src(oxm):
+    __slots__ = ['value']
     type_len = 208390
 
     def __init__(self, value=None):
@@ -1017,6 +1020,7 @@ class bsn_inner_eth_src(oxm):
 oxm.subtypes[208390] = bsn_inner_eth_src
 
 class bsn_inner_eth_src_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 208652
 
     def __init__(self, value=None, value_mask=None):
@@ -1068,6 +1072,7 @@ class bsn_inner_eth_src_masked(oxm):
 oxm.subtypes[208652] = bsn_inner_eth_src_masked
 
 class bsn_inner_vlan_vid(oxm):
+    __slots__ = ['value']
     type_len = 208898
 
     def __init__(self, value=None):
@@ -1079,16 +1084,14 @@ class bsn_inner_vlan_vid(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_struct_LH.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_inner_vlan_vid()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LH)
         assert(_type_len == 208898)
-        obj.value = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -1109,6 +1112,7 @@ class bsn_inner_vlan_vid(oxm):
 oxm.subtypes[208898] = bsn_inner_vlan_vid
 
 class bsn_inner_vlan_vid_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 209156
 
     def __init__(self, value=None, value_mask=None):
@@ -1124,18 +1128,14 @@ class bsn_inner_vlan_vid_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        packed.append(struct.pack("!H", self.value_mask))
+        packed.append(_struct_LHH.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_inner_vlan_vid_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LHH)
         assert(_type_len == 209156)
-        obj.value = reader.read("!H")[0]
-        obj.value_mask = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -1160,6 +1160,7 @@ class bsn_inner_vlan_vid_masked(oxm):
 oxm.subtypes[209156] = bsn_inner_vlan_vid_masked
 
 class bsn_l3_interface_class_id(oxm):
+    __slots__ = ['value']
     type_len = 198660
 
     def __init__(self, value=None):
@@ -1171,16 +1172,14 @@ class bsn_l3_interface_class_id(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_struct_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_l3_interface_class_id()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 198660)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1201,6 +1200,7 @@ class bsn_l3_interface_class_id(oxm):
 oxm.subtypes[198660] = bsn_l3_interface_class_id
 
 class bsn_l3_interface_class_id_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 198920
 
     def __init__(self, value=None, value_mask=None):
@@ -1216,18 +1216,14 @@ class bsn_l3_interface_class_id_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_struct_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_l3_interface_class_id_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 198920)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1252,6 +1248,7 @@ class bsn_l3_interface_class_id_masked(oxm):
 oxm.subtypes[198920] = bsn_l3_interface_class_id_masked
 
 class bsn_l3_src_class_id(oxm):
+    __slots__ = ['value']
     type_len = 199172
 
     def __init__(self, value=None):
@@ -1263,16 +1260,14 @@ class bsn_l3_src_class_id(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_struct_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_l3_src_class_id()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 199172)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1293,6 +1288,7 @@ class bsn_l3_src_class_id(oxm):
 oxm.subtypes[199172] = bsn_l3_src_class_id
 
 class bsn_l3_src_class_id_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 199432
 
     def __init__(self, value=None, value_mask=None):
@@ -1308,18 +1304,14 @@ class bsn_l3_src_class_id_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_struct_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_l3_src_class_id_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 199432)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1344,6 +1336,7 @@ class bsn_l3_src_class_id_masked(oxm):
 oxm.subtypes[199432] = bsn_l3_src_class_id_masked
 
 class bsn_lag_id(oxm):
+    __slots__ = ['value']
     type_len = 197124
 
     def __init__(self, value=None):
@@ -1355,16 +1348,14 @@ class bsn_lag_id(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_struct_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_lag_id()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 197124)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1385,6 +1376,7 @@ class bsn_lag_id(oxm):
 oxm.subtypes[197124] = bsn_lag_id
 
 class bsn_lag_id_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 197384
 
     def __init__(self, value=None, value_mask=None):
@@ -1400,18 +1392,14 @@ class bsn_lag_id_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_struct_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_lag_id_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 197384)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1436,6 +1424,7 @@ class bsn_lag_id_masked(oxm):
 oxm.subtypes[197384] = bsn_lag_id_masked
 
 class bsn_tcp_flags(oxm):
+    __slots__ = ['value']
     type_len = 204802
 
     def __init__(self, value=None):
@@ -1447,16 +1436,14 @@ class bsn_tcp_flags(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_struct_LH.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_tcp_flags()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LH)
         assert(_type_len == 204802)
-        obj.value = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -1477,6 +1464,7 @@ class bsn_tcp_flags(oxm):
 oxm.subtypes[204802] = bsn_tcp_flags
 
 class bsn_tcp_flags_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 205060
 
     def __init__(self, value=None, value_mask=None):
@@ -1492,18 +1480,14 @@ class bsn_tcp_flags_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        packed.append(struct.pack("!H", self.value_mask))
+        packed.append(_struct_LHH.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_tcp_flags_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LHH)
         assert(_type_len == 205060)
-        obj.value = reader.read("!H")[0]
-        obj.value_mask = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -1528,6 +1512,7 @@ class bsn_tcp_flags_masked(oxm):
 oxm.subtypes[205060] = bsn_tcp_flags_masked
 
 class bsn_udf0(oxm):
+    __slots__ = ['value']
     type_len = 200708
 
     def __init__(self, value=None):
@@ -1539,16 +1524,14 @@ class bsn_udf0(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_struct_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf0()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 200708)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1569,6 +1552,7 @@ class bsn_udf0(oxm):
 oxm.subtypes[200708] = bsn_udf0
 
 class bsn_udf0_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 200968
 
     def __init__(self, value=None, value_mask=None):
@@ -1584,18 +1568,14 @@ class bsn_udf0_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_struct_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf0_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 200968)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1620,6 +1600,7 @@ class bsn_udf0_masked(oxm):
 oxm.subtypes[200968] = bsn_udf0_masked
 
 class bsn_udf1(oxm):
+    __slots__ = ['value']
     type_len = 201220
 
     def __init__(self, value=None):
@@ -1631,16 +1612,14 @@ class bsn_udf1(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_struct_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf1()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 201220)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1661,6 +1640,7 @@ class bsn_udf1(oxm):
 oxm.subtypes[201220] = bsn_udf1
 
 class bsn_udf1_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 201480
 
     def __init__(self, value=None, value_mask=None):
@@ -1676,18 +1656,14 @@ class bsn_udf1_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_struct_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf1_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 201480)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1712,6 +1688,7 @@ class bsn_udf1_masked(oxm):
 oxm.subtypes[201480] = bsn_udf1_masked
 
 class bsn_udf2(oxm):
+    __slots__ = ['value']
     type_len = 201732
 
     def __init__(self, value=None):
@@ -1723,16 +1700,14 @@ class bsn_udf2(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_struct_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf2()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 201732)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1753,6 +1728,7 @@ class bsn_udf2(oxm):
 oxm.subtypes[201732] = bsn_udf2
 
 class bsn_udf2_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 201992
 
     def __init__(self, value=None, value_mask=None):
@@ -1768,18 +1744,14 @@ class bsn_udf2_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_struct_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf2_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 201992)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1804,6 +1776,7 @@ class bsn_udf2_masked(oxm):
 oxm.subtypes[201992] = bsn_udf2_masked
 
 class bsn_udf3(oxm):
+    __slots__ = ['value']
     type_len = 202244
 
     def __init__(self, value=None):
@@ -1815,16 +1788,14 @@ class bsn_udf3(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_struct_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf3()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 202244)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1845,6 +1816,7 @@ class bsn_udf3(oxm):
 oxm.subtypes[202244] = bsn_udf3
 
 class bsn_udf3_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 202504
 
     def __init__(self, value=None, value_mask=None):
@@ -1860,18 +1832,14 @@ class bsn_udf3_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_struct_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf3_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 202504)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1896,6 +1864,7 @@ class bsn_udf3_masked(oxm):
 oxm.subtypes[202504] = bsn_udf3_masked
 
 class bsn_udf4(oxm):
+    __slots__ = ['value']
     type_len = 202756
 
     def __init__(self, value=None):
@@ -1907,16 +1876,14 @@ class bsn_udf4(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_struct_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf4()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 202756)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1937,6 +1904,7 @@ class bsn_udf4(oxm):
 oxm.subtypes[202756] = bsn_udf4
 
 class bsn_udf4_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 203016
 
     def __init__(self, value=None, value_mask=None):
@@ -1952,18 +1920,14 @@ class bsn_udf4_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_struct_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf4_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 203016)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1988,6 +1952,7 @@ class bsn_udf4_masked(oxm):
 oxm.subtypes[203016] = bsn_udf4_masked
 
 class bsn_udf5(oxm):
+    __slots__ = ['value']
     type_len = 203268
 
     def __init__(self, value=None):
@@ -1999,16 +1964,14 @@ class bsn_udf5(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_struct_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf5()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 203268)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -2029,6 +1992,7 @@ class bsn_udf5(oxm):
 oxm.subtypes[203268] = bsn_udf5
 
 class bsn_udf5_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 203528
 
     def __init__(self, value=None, value_mask=None):
@@ -2044,18 +2008,14 @@ class bsn_udf5_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_struct_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf5_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 203528)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -2080,6 +2040,7 @@ class bsn_udf5_masked(oxm):
 oxm.subtypes[203528] = bsn_udf5_masked
 
 class bsn_udf6(oxm):
+    __slots__ = ['value']
     type_len = 203780
 
     def __init__(self, value=None):
@@ -2091,16 +2052,14 @@ class bsn_udf6(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_struct_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf6()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 203780)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -2121,6 +2080,7 @@ class bsn_udf6(oxm):
 oxm.subtypes[203780] = bsn_udf6
 
 class bsn_udf6_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 204040
 
     def __init__(self, value=None, value_mask=None):
@@ -2136,18 +2096,14 @@ class bsn_udf6_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_struct_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf6_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 204040)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -2172,6 +2128,7 @@ class bsn_udf6_masked(oxm):
 oxm.subtypes[204040] = bsn_udf6_masked
 
 class bsn_udf7(oxm):
+    __slots__ = ['value']
     type_len = 204292
 
     def __init__(self, value=None):
@@ -2183,16 +2140,14 @@ class bsn_udf7(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_struct_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf7()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 204292)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -2213,6 +2168,7 @@ class bsn_udf7(oxm):
 oxm.subtypes[204292] = bsn_udf7
 
 class bsn_udf7_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 204552
 
     def __init__(self, value=None, value_mask=None):
@@ -2228,18 +2184,14 @@ class bsn_udf7_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_struct_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf7_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 204552)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -2264,6 +2216,7 @@ class bsn_udf7_masked(oxm):
 oxm.subtypes[204552] = bsn_udf7_masked
 
 class bsn_vlan_xlate_port_group_id(oxm):
+    __slots__ = ['value']
     type_len = 205316
 
     def __init__(self, value=None):
@@ -2275,16 +2228,14 @@ class bsn_vlan_xlate_port_group_id(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_struct_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_vlan_xlate_port_group_id()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 205316)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -2305,6 +2256,7 @@ class bsn_vlan_xlate_port_group_id(oxm):
 oxm.subtypes[205316] = bsn_vlan_xlate_port_group_id
 
 class bsn_vlan_xlate_port_group_id_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 205576
 
     def __init__(self, value=None, value_mask=None):
@@ -2320,18 +2272,14 @@ class bsn_vlan_xlate_port_group_id_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_struct_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_vlan_xlate_port_group_id_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 205576)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -2356,6 +2304,7 @@ class bsn_vlan_xlate_port_group_id_masked(oxm):
 oxm.subtypes[205576] = bsn_vlan_xlate_port_group_id_masked
 
 class bsn_vrf(oxm):
+    __slots__ = ['value']
     type_len = 197636
 
     def __init__(self, value=None):
@@ -2367,16 +2316,14 @@ class bsn_vrf(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_struct_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_vrf()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 197636)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -2397,6 +2344,7 @@ class bsn_vrf(oxm):
 oxm.subtypes[197636] = bsn_vrf
 
 class bsn_vrf_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 197896
 
     def __init__(self, value=None, value_mask=None):
@@ -2412,18 +2360,14 @@ class bsn_vrf_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_struct_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_vrf_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 197896)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -2448,6 +2392,7 @@ class bsn_vrf_masked(oxm):
 oxm.subtypes[197896] = bsn_vrf_masked
 
 class bsn_vxlan_network_id(oxm):
+    __slots__ = ['value']
     type_len = 207364
 
     def __init__(self, value=None):
@@ -2459,16 +2404,14 @@ class bsn_vxlan_network_id(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_struct_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_vxlan_network_id()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 207364)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -2489,6 +2432,7 @@ class bsn_vxlan_network_id(oxm):
 oxm.subtypes[207364] = bsn_vxlan_network_id
 
 class bsn_vxlan_network_id_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 207624
 
     def __init__(self, value=None, value_mask=None):
@@ -2504,18 +2448,14 @@ class bsn_vxlan_network_id_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_struct_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_vxlan_network_id_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 207624)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -2540,6 +2480,7 @@ class bsn_vxlan_network_id_masked(oxm):
 oxm.subtypes[207624] = bsn_vxlan_network_id_masked
 
 class eth_dst(oxm):
+    __slots__ = ['value']
     type_len = 2147485190
 
     def __init__(self, value=None):
@@ -2581,6 +2522,7 @@ class eth_dst(oxm):
 oxm.subtypes[2147485190] = eth_dst
 
 class eth_dst_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147485452
 
     def __init__(self, value=None, value_mask=None):
@@ -2632,6 +2574,7 @@ class eth_dst_masked(oxm):
 oxm.subtypes[2147485452] = eth_dst_masked
 
 class eth_src(oxm):
+    __slots__ = ['value']
     type_len = 2147485702
 
     def __init__(self, value=None):
@@ -2673,6 +2616,7 @@ class eth_src(oxm):
 oxm.subtypes[2147485702] = eth_src
 
 class eth_src_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147485964
 
     def __init__(self, value=None, value_mask=None):
@@ -2724,6 +2668,7 @@ class eth_src_masked(oxm):
 oxm.subtypes[2147485964] = eth_src_masked
 
 class eth_type(oxm):
+    __slots__ = ['value']
     type_len = 2147486210
 
     def __init__(self, value=None):
@@ -2735,16 +2680,14 @@ class eth_type(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_struct_LH.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = eth_type()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LH)
         assert(_type_len == 2147486210)
-        obj.value = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -2765,6 +2708,7 @@ class eth_type(oxm):
 oxm.subtypes[2147486210] = eth_type
 
 class eth_type_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147486468
 
     def __init__(self, value=None, value_mask=None):
@@ -2780,18 +2724,14 @@ class eth_type_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        packed.append(struct.pack("!H", self.value_mask))
+        packed.append(_struct_LHH.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = eth_type_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LHH)
         assert(_type_len == 2147486468)
-        obj.value = reader.read("!H")[0]
-        obj.value_mask = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -2816,6 +2756,7 @@ class eth_type_masked(oxm):
 oxm.subtypes[2147486468] = eth_type_masked
 
 class icmpv4_code(oxm):
+    __slots__ = ['value']
     type_len = 2147493889
 
     def __init__(self, value=None):
@@ -2827,16 +2768,14 @@ class icmpv4_code(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
+        packed.append(_struct_LB.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = icmpv4_code()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LB)
         assert(_type_len == 2147493889)
-        obj.value = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -2857,6 +2796,7 @@ class icmpv4_code(oxm):
 oxm.subtypes[2147493889] = icmpv4_code
 
 class icmpv4_code_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147494146
 
     def __init__(self, value=None, value_mask=None):
@@ -2872,18 +2812,14 @@ class icmpv4_code_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        packed.append(struct.pack("!B", self.value_mask))
+        packed.append(_struct_LBB.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = icmpv4_code_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LBB)
         assert(_type_len == 2147494146)
-        obj.value = reader.read("!B")[0]
-        obj.value_mask = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -2908,6 +2844,7 @@ class icmpv4_code_masked(oxm):
 oxm.subtypes[2147494146] = icmpv4_code_masked
 
 class icmpv4_type(oxm):
+    __slots__ = ['value']
     type_len = 2147493377
 
     def __init__(self, value=None):
@@ -2919,16 +2856,14 @@ class icmpv4_type(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
+        packed.append(_struct_LB.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = icmpv4_type()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LB)
         assert(_type_len == 2147493377)
-        obj.value = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -2949,6 +2884,7 @@ class icmpv4_type(oxm):
 oxm.subtypes[2147493377] = icmpv4_type
 
 class icmpv4_type_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147493634
 
     def __init__(self, value=None, value_mask=None):
@@ -2964,18 +2900,14 @@ class icmpv4_type_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        packed.append(struct.pack("!B", self.value_mask))
+        packed.append(_struct_LBB.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = icmpv4_type_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LBB)
         assert(_type_len == 2147493634)
-        obj.value = reader.read("!B")[0]
-        obj.value_mask = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -3000,6 +2932,7 @@ class icmpv4_type_masked(oxm):
 oxm.subtypes[2147493634] = icmpv4_type_masked
 
 class icmpv6_code(oxm):
+    __slots__ = ['value']
     type_len = 2147499009
 
     def __init__(self, value=None):
@@ -3011,16 +2944,14 @@ class icmpv6_code(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
+        packed.append(_struct_LB.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = icmpv6_code()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LB)
         assert(_type_len == 2147499009)
-        obj.value = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -3041,6 +2972,7 @@ class icmpv6_code(oxm):
 oxm.subtypes[2147499009] = icmpv6_code
 
 class icmpv6_code_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147499266
 
     def __init__(self, value=None, value_mask=None):
@@ -3056,18 +2988,14 @@ class icmpv6_code_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        packed.append(struct.pack("!B", self.value_mask))
+        packed.append(_struct_LBB.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = icmpv6_code_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LBB)
         assert(_type_len == 2147499266)
-        obj.value = reader.read("!B")[0]
-        obj.value_mask = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -3092,6 +3020,7 @@ class icmpv6_code_masked(oxm):
 oxm.subtypes[2147499266] = icmpv6_code_masked
 
 class icmpv6_type(oxm):
+    __slots__ = ['value']
     type_len = 2147498497
 
     def __init__(self, value=None):
@@ -3103,16 +3032,14 @@ class icmpv6_type(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
+        packed.append(_struct_LB.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = icmpv6_type()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LB)
         assert(_type_len == 2147498497)
-        obj.value = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -3133,6 +3060,7 @@ class icmpv6_type(oxm):
 oxm.subtypes[2147498497] = icmpv6_type
 
 class icmpv6_type_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147498754
 
     def __init__(self, value=None, value_mask=None):
@@ -3148,18 +3076,14 @@ class icmpv6_type_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        packed.append(struct.pack("!B", self.value_mask))
+        packed.append(_struct_LBB.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = icmpv6_type_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LBB)
         assert(_type_len == 2147498754)
-        obj.value = reader.read("!B")[0]
-        obj.value_mask = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -3184,6 +3108,7 @@ class icmpv6_type_masked(oxm):
 oxm.subtypes[2147498754] = icmpv6_type_masked
 
 class in_phy_port(oxm):
+    __slots__ = ['value']
     type_len = 2147484164
 
     def __init__(self, value=None):
@@ -3225,6 +3150,7 @@ class in_phy_port(oxm):
 oxm.subtypes[2147484164] = in_phy_port
 
 class in_phy_port_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147484424
 
     def __init__(self, value=None, value_mask=None):
@@ -3276,6 +3202,7 @@ class in_phy_port_masked(oxm):
 oxm.subtypes[2147484424] = in_phy_port_masked
 
 class in_port(oxm):
+    __slots__ = ['value']
     type_len = 2147483652
 
     def __init__(self, value=None):
@@ -3317,6 +3244,7 @@ class in_port(oxm):
 oxm.subtypes[2147483652] = in_port
 
 class in_port_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147483912
 
     def __init__(self, value=None, value_mask=None):
@@ -3368,6 +3296,7 @@ class in_port_masked(oxm):
 oxm.subtypes[2147483912] = in_port_masked
 
 class ip_dscp(oxm):
+    __slots__ = ['value']
     type_len = 2147487745
 
     def __init__(self, value=None):
@@ -3379,16 +3308,14 @@ class ip_dscp(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
+        packed.append(_struct_LB.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ip_dscp()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LB)
         assert(_type_len == 2147487745)
-        obj.value = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -3409,6 +3336,7 @@ class ip_dscp(oxm):
 oxm.subtypes[2147487745] = ip_dscp
 
 class ip_dscp_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147488002
 
     def __init__(self, value=None, value_mask=None):
@@ -3424,18 +3352,14 @@ class ip_dscp_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        packed.append(struct.pack("!B", self.value_mask))
+        packed.append(_struct_LBB.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ip_dscp_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LBB)
         assert(_type_len == 2147488002)
-        obj.value = reader.read("!B")[0]
-        obj.value_mask = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -3460,6 +3384,7 @@ class ip_dscp_masked(oxm):
 oxm.subtypes[2147488002] = ip_dscp_masked
 
 class ip_ecn(oxm):
+    __slots__ = ['value']
     type_len = 2147488257
 
     def __init__(self, value=None):
@@ -3471,16 +3396,14 @@ class ip_ecn(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
+        packed.append(_struct_LB.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ip_ecn()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LB)
         assert(_type_len == 2147488257)
-        obj.value = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -3501,6 +3424,7 @@ class ip_ecn(oxm):
 oxm.subtypes[2147488257] = ip_ecn
 
 class ip_ecn_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147488514
 
     def __init__(self, value=None, value_mask=None):
@@ -3516,18 +3440,14 @@ class ip_ecn_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        packed.append(struct.pack("!B", self.value_mask))
+        packed.append(_struct_LBB.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ip_ecn_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LBB)
         assert(_type_len == 2147488514)
-        obj.value = reader.read("!B")[0]
-        obj.value_mask = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -3552,6 +3472,7 @@ class ip_ecn_masked(oxm):
 oxm.subtypes[2147488514] = ip_ecn_masked
 
 class ip_proto(oxm):
+    __slots__ = ['value']
     type_len = 2147488769
 
     def __init__(self, value=None):
@@ -3563,16 +3484,14 @@ class ip_proto(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
+        packed.append(_struct_LB.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ip_proto()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LB)
         assert(_type_len == 2147488769)
-        obj.value = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -3593,6 +3512,7 @@ class ip_proto(oxm):
 oxm.subtypes[2147488769] = ip_proto
 
 class ip_proto_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147489026
 
     def __init__(self, value=None, value_mask=None):
@@ -3608,18 +3528,14 @@ class ip_proto_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        packed.append(struct.pack("!B", self.value_mask))
+        packed.append(_struct_LBB.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ip_proto_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LBB)
         assert(_type_len == 2147489026)
-        obj.value = reader.read("!B")[0]
-        obj.value_mask = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -3644,6 +3560,7 @@ class ip_proto_masked(oxm):
 oxm.subtypes[2147489026] = ip_proto_masked
 
 class ipv4_dst(oxm):
+    __slots__ = ['value']
     type_len = 2147489796
 
     def __init__(self, value=None):
@@ -3655,16 +3572,14 @@ class ipv4_dst(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_struct_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ipv4_dst()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 2147489796)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -3685,6 +3600,7 @@ class ipv4_dst(oxm):
 oxm.subtypes[2147489796] = ipv4_dst
 
 class ipv4_dst_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147490056
 
     def __init__(self, value=None, value_mask=None):
@@ -3700,18 +3616,14 @@ class ipv4_dst_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_struct_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ipv4_dst_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 2147490056)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -3736,6 +3648,7 @@ class ipv4_dst_masked(oxm):
 oxm.subtypes[2147490056] = ipv4_dst_masked
 
 class ipv4_src(oxm):
+    __slots__ = ['value']
     type_len = 2147489284
 
     def __init__(self, value=None):
@@ -3747,16 +3660,14 @@ class ipv4_src(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_struct_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ipv4_src()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 2147489284)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -3777,6 +3688,7 @@ class ipv4_src(oxm):
 oxm.subtypes[2147489284] = ipv4_src
 
 class ipv4_src_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147489544
 
     def __init__(self, value=None, value_mask=None):
@@ -3792,18 +3704,14 @@ class ipv4_src_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_struct_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ipv4_src_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 2147489544)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -3828,6 +3736,7 @@ class ipv4_src_masked(oxm):
 oxm.subtypes[2147489544] = ipv4_src_masked
 
 class ipv6_dst(oxm):
+    __slots__ = ['value']
     type_len = 2147497488
 
     def __init__(self, value=None):
@@ -3869,6 +3778,7 @@ class ipv6_dst(oxm):
 oxm.subtypes[2147497488] = ipv6_dst
 
 class ipv6_dst_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147497760
 
     def __init__(self, value=None, value_mask=None):
@@ -3920,6 +3830,7 @@ class ipv6_dst_masked(oxm):
 oxm.subtypes[2147497760] = ipv6_dst_masked
 
 class ipv6_exthdr(oxm):
+    __slots__ = ['value']
     type_len = 2147503618
 
     def __init__(self, value=None):
@@ -3931,16 +3842,14 @@ class ipv6_exthdr(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_struct_LH.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ipv6_exthdr()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LH)
         assert(_type_len == 2147503618)
-        obj.value = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -3961,6 +3870,7 @@ class ipv6_exthdr(oxm):
 oxm.subtypes[2147503618] = ipv6_exthdr
 
 class ipv6_exthdr_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147503876
 
     def __init__(self, value=None, value_mask=None):
@@ -3976,18 +3886,14 @@ class ipv6_exthdr_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        packed.append(struct.pack("!H", self.value_mask))
+        packed.append(_struct_LHH.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ipv6_exthdr_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LHH)
         assert(_type_len == 2147503876)
-        obj.value = reader.read("!H")[0]
-        obj.value_mask = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -4012,6 +3918,7 @@ class ipv6_exthdr_masked(oxm):
 oxm.subtypes[2147503876] = ipv6_exthdr_masked
 
 class ipv6_flabel(oxm):
+    __slots__ = ['value']
     type_len = 2147497988
 
     def __init__(self, value=None):
@@ -4023,16 +3930,14 @@ class ipv6_flabel(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_struct_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ipv6_flabel()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 2147497988)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -4053,6 +3958,7 @@ class ipv6_flabel(oxm):
 oxm.subtypes[2147497988] = ipv6_flabel
 
 class ipv6_flabel_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147498248
 
     def __init__(self, value=None, value_mask=None):
@@ -4068,18 +3974,14 @@ class ipv6_flabel_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_struct_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = ipv6_flabel_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 2147498248)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -4104,6 +4006,7 @@ class ipv6_flabel_masked(oxm):
 oxm.subtypes[2147498248] = ipv6_flabel_masked
 
 class ipv6_nd_sll(oxm):
+    __slots__ = ['value']
     type_len = 2147500038
 
     def __init__(self, value=None):
@@ -4145,6 +4048,7 @@ class ipv6_nd_sll(oxm):
 oxm.subtypes[2147500038] = ipv6_nd_sll
 
 class ipv6_nd_sll_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147500300
 
     def __init__(self, value=None, value_mask=None):
@@ -4196,6 +4100,7 @@ class ipv6_nd_sll_masked(oxm):
 oxm.subtypes[2147500300] = ipv6_nd_sll_masked
 
 class ipv6_nd_target(oxm):
+    __slots__ = ['value']
     type_len = 2147499536
 
     def __init__(self, value=None):
@@ -4237,6 +4142,7 @@ class ipv6_nd_target(oxm):
 oxm.subtypes[2147499536] = ipv6_nd_target
 
 class ipv6_nd_target_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147499808
 
     def __init__(self, value=None, value_mask=None):
@@ -4288,6 +4194,7 @@ class ipv6_nd_target_masked(oxm):
 oxm.subtypes[2147499808] = ipv6_nd_target_masked
 
 class ipv6_nd_tll(oxm):
+    __slots__ = ['value']
     type_len = 2147500550
 
     def __init__(self, value=None):
@@ -4329,6 +4236,7 @@ class ipv6_nd_tll(oxm):
 oxm.subtypes[2147500550] = ipv6_nd_tll
 
 class ipv6_nd_tll_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147500812
 
     def __init__(self, value=None, value_mask=None):
@@ -4380,6 +4288,7 @@ class ipv6_nd_tll_masked(oxm):
 oxm.subtypes[2147500812] = ipv6_nd_tll_masked
 
 class ipv6_src(oxm):
+    __slots__ = ['value']
     type_len = 2147496976
 
     def __init__(self, value=None):
@@ -4421,6 +4330,7 @@ class ipv6_src(oxm):
 oxm.subtypes[2147496976] = ipv6_src
 
 class ipv6_src_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147497248
 
     def __init__(self, value=None, value_mask=None):
@@ -4472,6 +4382,7 @@ class ipv6_src_masked(oxm):
 oxm.subtypes[2147497248] = ipv6_src_masked
 
 class metadata(oxm):
+    __slots__ = ['value']
     type_len = 2147484680
 
     def __init__(self, value=None):
@@ -4483,16 +4394,14 @@ class metadata(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!Q", self.value))
+        packed.append(_struct_LQ.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = metadata()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LQ)
         assert(_type_len == 2147484680)
-        obj.value = reader.read("!Q")[0]
         return obj
 
     def __eq__(self, other):
@@ -4513,6 +4422,7 @@ class metadata(oxm):
 oxm.subtypes[2147484680] = metadata
 
 class metadata_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147484944
 
     def __init__(self, value=None, value_mask=None):
@@ -4528,18 +4438,14 @@ class metadata_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!Q", self.value))
-        packed.append(struct.pack("!Q", self.value_mask))
+        packed.append(_struct_LQQ.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = metadata_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LQQ)
         assert(_type_len == 2147484944)
-        obj.value = reader.read("!Q")[0]
-        obj.value_mask = reader.read("!Q")[0]
         return obj
 
     def __eq__(self, other):
@@ -4564,6 +4470,7 @@ class metadata_masked(oxm):
 oxm.subtypes[2147484944] = metadata_masked
 
 class mpls_bos(oxm):
+    __slots__ = ['value']
     type_len = 2147502081
 
     def __init__(self, value=None):
@@ -4575,16 +4482,14 @@ class mpls_bos(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
+        packed.append(_struct_LB.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = mpls_bos()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LB)
         assert(_type_len == 2147502081)
-        obj.value = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -4605,6 +4510,7 @@ class mpls_bos(oxm):
 oxm.subtypes[2147502081] = mpls_bos
 
 class mpls_bos_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147502338
 
     def __init__(self, value=None, value_mask=None):
@@ -4620,18 +4526,14 @@ class mpls_bos_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        packed.append(struct.pack("!B", self.value_mask))
+        packed.append(_struct_LBB.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = mpls_bos_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LBB)
         assert(_type_len == 2147502338)
-        obj.value = reader.read("!B")[0]
-        obj.value_mask = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -4656,6 +4558,7 @@ class mpls_bos_masked(oxm):
 oxm.subtypes[2147502338] = mpls_bos_masked
 
 class mpls_label(oxm):
+    __slots__ = ['value']
     type_len = 2147501060
 
     def __init__(self, value=None):
@@ -4667,16 +4570,14 @@ class mpls_label(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_struct_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = mpls_label()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 2147501060)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -4697,6 +4598,7 @@ class mpls_label(oxm):
 oxm.subtypes[2147501060] = mpls_label
 
 class mpls_label_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147501320
 
     def __init__(self, value=None, value_mask=None):
@@ -4712,18 +4614,14 @@ class mpls_label_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_struct_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = mpls_label_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 2147501320)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -4748,6 +4646,7 @@ class mpls_label_masked(oxm):
 oxm.subtypes[2147501320] = mpls_label_masked
 
 class mpls_tc(oxm):
+    __slots__ = ['value']
     type_len = 2147501569
 
     def __init__(self, value=None):
@@ -4759,16 +4658,14 @@ class mpls_tc(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
+        packed.append(_struct_LB.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = mpls_tc()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LB)
         assert(_type_len == 2147501569)
-        obj.value = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -4789,6 +4686,7 @@ class mpls_tc(oxm):
 oxm.subtypes[2147501569] = mpls_tc
 
 class mpls_tc_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147501826
 
     def __init__(self, value=None, value_mask=None):
@@ -4804,18 +4702,14 @@ class mpls_tc_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        packed.append(struct.pack("!B", self.value_mask))
+        packed.append(_struct_LBB.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = mpls_tc_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LBB)
         assert(_type_len == 2147501826)
-        obj.value = reader.read("!B")[0]
-        obj.value_mask = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -4840,6 +4734,7 @@ class mpls_tc_masked(oxm):
 oxm.subtypes[2147501826] = mpls_tc_masked
 
 class pbb_uca(oxm):
+    __slots__ = ['value']
     type_len = 2147504641
 
     def __init__(self, value=None):
@@ -4851,16 +4746,14 @@ class pbb_uca(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
+        packed.append(_struct_LB.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = pbb_uca()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LB)
         assert(_type_len == 2147504641)
-        obj.value = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -4881,6 +4774,7 @@ class pbb_uca(oxm):
 oxm.subtypes[2147504641] = pbb_uca
 
 class pbb_uca_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147504898
 
     def __init__(self, value=None, value_mask=None):
@@ -4896,18 +4790,14 @@ class pbb_uca_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        packed.append(struct.pack("!B", self.value_mask))
+        packed.append(_struct_LBB.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = pbb_uca_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LBB)
         assert(_type_len == 2147504898)
-        obj.value = reader.read("!B")[0]
-        obj.value_mask = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -4932,6 +4822,7 @@ class pbb_uca_masked(oxm):
 oxm.subtypes[2147504898] = pbb_uca_masked
 
 class sctp_dst(oxm):
+    __slots__ = ['value']
     type_len = 2147492866
 
     def __init__(self, value=None):
@@ -4943,16 +4834,14 @@ class sctp_dst(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_struct_LH.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = sctp_dst()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LH)
         assert(_type_len == 2147492866)
-        obj.value = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -4973,6 +4862,7 @@ class sctp_dst(oxm):
 oxm.subtypes[2147492866] = sctp_dst
 
 class sctp_dst_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147493124
 
     def __init__(self, value=None, value_mask=None):
@@ -4988,18 +4878,14 @@ class sctp_dst_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        packed.append(struct.pack("!H", self.value_mask))
+        packed.append(_struct_LHH.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = sctp_dst_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LHH)
         assert(_type_len == 2147493124)
-        obj.value = reader.read("!H")[0]
-        obj.value_mask = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -5024,6 +4910,7 @@ class sctp_dst_masked(oxm):
 oxm.subtypes[2147493124] = sctp_dst_masked
 
 class sctp_src(oxm):
+    __slots__ = ['value']
     type_len = 2147492354
 
     def __init__(self, value=None):
@@ -5035,16 +4922,14 @@ class sctp_src(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_struct_LH.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = sctp_src()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LH)
         assert(_type_len == 2147492354)
-        obj.value = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -5065,6 +4950,7 @@ class sctp_src(oxm):
 oxm.subtypes[2147492354] = sctp_src
 
 class sctp_src_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147492612
 
     def __init__(self, value=None, value_mask=None):
@@ -5080,18 +4966,14 @@ class sctp_src_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        packed.append(struct.pack("!H", self.value_mask))
+        packed.append(_struct_LHH.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = sctp_src_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LHH)
         assert(_type_len == 2147492612)
-        obj.value = reader.read("!H")[0]
-        obj.value_mask = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -5116,6 +4998,7 @@ class sctp_src_masked(oxm):
 oxm.subtypes[2147492612] = sctp_src_masked
 
 class tcp_dst(oxm):
+    __slots__ = ['value']
     type_len = 2147490818
 
     def __init__(self, value=None):
@@ -5127,16 +5010,14 @@ class tcp_dst(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_struct_LH.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = tcp_dst()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LH)
         assert(_type_len == 2147490818)
-        obj.value = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -5157,6 +5038,7 @@ class tcp_dst(oxm):
 oxm.subtypes[2147490818] = tcp_dst
 
 class tcp_dst_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147491076
 
     def __init__(self, value=None, value_mask=None):
@@ -5172,18 +5054,14 @@ class tcp_dst_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        packed.append(struct.pack("!H", self.value_mask))
+        packed.append(_struct_LHH.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = tcp_dst_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LHH)
         assert(_type_len == 2147491076)
-        obj.value = reader.read("!H")[0]
-        obj.value_mask = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -5208,6 +5086,7 @@ class tcp_dst_masked(oxm):
 oxm.subtypes[2147491076] = tcp_dst_masked
 
 class tcp_src(oxm):
+    __slots__ = ['value']
     type_len = 2147490306
 
     def __init__(self, value=None):
@@ -5219,16 +5098,14 @@ class tcp_src(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_struct_LH.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = tcp_src()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LH)
         assert(_type_len == 2147490306)
-        obj.value = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -5249,6 +5126,7 @@ class tcp_src(oxm):
 oxm.subtypes[2147490306] = tcp_src
 
 class tcp_src_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147490564
 
     def __init__(self, value=None, value_mask=None):
@@ -5264,18 +5142,14 @@ class tcp_src_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        packed.append(struct.pack("!H", self.value_mask))
+        packed.append(_struct_LHH.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = tcp_src_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LHH)
         assert(_type_len == 2147490564)
-        obj.value = reader.read("!H")[0]
-        obj.value_mask = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -5300,6 +5174,7 @@ class tcp_src_masked(oxm):
 oxm.subtypes[2147490564] = tcp_src_masked
 
 class tunnel_id(oxm):
+    __slots__ = ['value']
     type_len = 2147503112
 
     def __init__(self, value=None):
@@ -5311,16 +5186,14 @@ class tunnel_id(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!Q", self.value))
+        packed.append(_struct_LQ.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = tunnel_id()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LQ)
         assert(_type_len == 2147503112)
-        obj.value = reader.read("!Q")[0]
         return obj
 
     def __eq__(self, other):
@@ -5341,6 +5214,7 @@ class tunnel_id(oxm):
 oxm.subtypes[2147503112] = tunnel_id
 
 class tunnel_id_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147503376
 
     def __init__(self, value=None, value_mask=None):
@@ -5356,18 +5230,14 @@ class tunnel_id_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!Q", self.value))
-        packed.append(struct.pack("!Q", self.value_mask))
+        packed.append(_struct_LQQ.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = tunnel_id_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LQQ)
         assert(_type_len == 2147503376)
-        obj.value = reader.read("!Q")[0]
-        obj.value_mask = reader.read("!Q")[0]
         return obj
 
     def __eq__(self, other):
@@ -5392,6 +5262,7 @@ class tunnel_id_masked(oxm):
 oxm.subtypes[2147503376] = tunnel_id_masked
 
 class tunnel_ipv4_dst(oxm):
+    __slots__ = ['value']
     type_len = 81924
 
     def __init__(self, value=None):
@@ -5403,16 +5274,14 @@ class tunnel_ipv4_dst(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_struct_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = tunnel_ipv4_dst()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 81924)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -5433,6 +5302,7 @@ class tunnel_ipv4_dst(oxm):
 oxm.subtypes[81924] = tunnel_ipv4_dst
 
 class tunnel_ipv4_dst_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 82184
 
     def __init__(self, value=None, value_mask=None):
@@ -5448,18 +5318,14 @@ class tunnel_ipv4_dst_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_struct_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = tunnel_ipv4_dst_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 82184)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -5484,6 +5350,7 @@ class tunnel_ipv4_dst_masked(oxm):
 oxm.subtypes[82184] = tunnel_ipv4_dst_masked
 
 class tunnel_ipv4_src(oxm):
+    __slots__ = ['value']
     type_len = 81412
 
     def __init__(self, value=None):
@@ -5495,16 +5362,14 @@ class tunnel_ipv4_src(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
+        packed.append(_struct_LL.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = tunnel_ipv4_src()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 81412)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -5525,6 +5390,7 @@ class tunnel_ipv4_src(oxm):
 oxm.subtypes[81412] = tunnel_ipv4_src
 
 class tunnel_ipv4_src_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 81672
 
     def __init__(self, value=None, value_mask=None):
@@ -5540,18 +5406,14 @@ class tunnel_ipv4_src_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
+        packed.append(_struct_LLL.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = tunnel_ipv4_src_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 81672)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -5576,6 +5438,7 @@ class tunnel_ipv4_src_masked(oxm):
 oxm.subtypes[81672] = tunnel_ipv4_src_masked
 
 class udp_dst(oxm):
+    __slots__ = ['value']
     type_len = 2147491842
 
     def __init__(self, value=None):
@@ -5587,16 +5450,14 @@ class udp_dst(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_struct_LH.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = udp_dst()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LH)
         assert(_type_len == 2147491842)
-        obj.value = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -5617,6 +5478,7 @@ class udp_dst(oxm):
 oxm.subtypes[2147491842] = udp_dst
 
 class udp_dst_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147492100
 
     def __init__(self, value=None, value_mask=None):
@@ -5632,18 +5494,14 @@ class udp_dst_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        packed.append(struct.pack("!H", self.value_mask))
+        packed.append(_struct_LHH.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = udp_dst_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LHH)
         assert(_type_len == 2147492100)
-        obj.value = reader.read("!H")[0]
-        obj.value_mask = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -5668,6 +5526,7 @@ class udp_dst_masked(oxm):
 oxm.subtypes[2147492100] = udp_dst_masked
 
 class udp_src(oxm):
+    __slots__ = ['value']
     type_len = 2147491330
 
     def __init__(self, value=None):
@@ -5679,16 +5538,14 @@ class udp_src(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_struct_LH.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = udp_src()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LH)
         assert(_type_len == 2147491330)
-        obj.value = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -5709,6 +5566,7 @@ class udp_src(oxm):
 oxm.subtypes[2147491330] = udp_src
 
 class udp_src_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147491588
 
     def __init__(self, value=None, value_mask=None):
@@ -5724,18 +5582,14 @@ class udp_src_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        packed.append(struct.pack("!H", self.value_mask))
+        packed.append(_struct_LHH.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = udp_src_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LHH)
         assert(_type_len == 2147491588)
-        obj.value = reader.read("!H")[0]
-        obj.value_mask = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -5760,6 +5614,7 @@ class udp_src_masked(oxm):
 oxm.subtypes[2147491588] = udp_src_masked
 
 class vlan_pcp(oxm):
+    __slots__ = ['value']
     type_len = 2147487233
 
     def __init__(self, value=None):
@@ -5771,16 +5626,14 @@ class vlan_pcp(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
+        packed.append(_struct_LB.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = vlan_pcp()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LB)
         assert(_type_len == 2147487233)
-        obj.value = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -5801,6 +5654,7 @@ class vlan_pcp(oxm):
 oxm.subtypes[2147487233] = vlan_pcp
 
 class vlan_pcp_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147487490
 
     def __init__(self, value=None, value_mask=None):
@@ -5816,18 +5670,14 @@ class vlan_pcp_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        packed.append(struct.pack("!B", self.value_mask))
+        packed.append(_struct_LBB.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = vlan_pcp_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LBB)
         assert(_type_len == 2147487490)
-        obj.value = reader.read("!B")[0]
-        obj.value_mask = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -5852,6 +5702,7 @@ class vlan_pcp_masked(oxm):
 oxm.subtypes[2147487490] = vlan_pcp_masked
 
 class vlan_vid(oxm):
+    __slots__ = ['value']
     type_len = 2147486722
 
     def __init__(self, value=None):
@@ -5863,16 +5714,14 @@ class vlan_vid(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
+        packed.append(_struct_LH.pack(self.type_len, self.value))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = vlan_vid()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LH)
         assert(_type_len == 2147486722)
-        obj.value = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -5893,6 +5742,7 @@ class vlan_vid(oxm):
 oxm.subtypes[2147486722] = vlan_vid
 
 class vlan_vid_masked(oxm):
+    __slots__ = ['value', 'value_mask']
     type_len = 2147486980
 
     def __init__(self, value=None, value_mask=None):
@@ -5908,18 +5758,14 @@ class vlan_vid_masked(oxm):
 
     def pack(self):
         packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        packed.append(struct.pack("!H", self.value_mask))
+        packed.append(_struct_LHH.pack(self.type_len, self.value, self.value_mask))
         return ''.join(packed)
 
     @staticmethod
     def unpack(reader):
         obj = vlan_vid_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LHH)
         assert(_type_len == 2147486980)
-        obj.value = reader.read("!H")[0]
-        obj.value_mask = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -14,8 +14,17 @@ import loxi.generic_util
 import sys
 ofp = sys.modules['loxi.of14']
 
+# Precompiled layouts of fixed-size field runs
+_struct_4xLLLLLL = struct.Struct("!4xLLLLLL")
+_struct_4xLLLLLLLLL = struct.Struct("!4xLLLLLLLLL")
+_struct_HH = struct.Struct("!HH")
+_struct_LL = struct.Struct("!LL")
+_struct_LLQ = struct.Struct("!LLQ")
+
 class port_desc_prop(loxi.OFObject):
+    __slots__ = ['type']
     subtypes = {}
+    subtype_field = ('!H', 0)
 
 
     def __init__(self, type=None):
@@ -41,8 +50,7 @@ class port_desc_prop(loxi.OFObject):
             return subclass.unpack(reader)
 
         obj = port_desc_prop()
-        obj.type = reader.read("!H")[0]
-        _length = reader.read("!H")[0]
+        obj.type, _length = reader.read_struct(_struct_HH)
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         return obj
@@ -62,7 +70,9 @@ class port_desc_prop(loxi.OFObject):
 
 
 class experimenter(port_desc_prop):
+    __slots__ = ['experimenter']
     subtypes = {}
+    subtype_field = ('!L', 4)
 
     type = 65535
 
@@ -90,9 +100,8 @@ class experimenter(port_desc_prop):
             return subclass.unpack(reader)
 
         obj = experimenter()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.experimenter = reader.read("!L")[0]
@@ -114,7 +123,9 @@ class experimenter(port_desc_prop):
 port_desc_prop.subtypes[65535] = experimenter
 
 class bsn(experimenter):
+    __slots__ = ['exp_type']
     subtypes = {}
+    subtype_field = ('!L', 8)
 
     type = 65535
     experimenter = 6035143
@@ -130,8 +141,7 @@ class bsn(experimenter):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.exp_type))
+        packed.append(_struct_LL.pack(self.experimenter, self.exp_type))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -144,14 +154,12 @@ class bsn(experimenter):
             return subclass.unpack(reader)
 
         obj = bsn()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, obj.exp_type = reader.read_struct(_struct_LL)
         assert(_experimenter == 6035143)
-        obj.exp_type = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -170,6 +178,7 @@ class bsn(experimenter):
 experimenter.subtypes[6035143] = bsn
 
 class bsn_generation_id(bsn):
+    __slots__ = ['generation_id']
     type = 65535
     experimenter = 6035143
     exp_type = 1
@@ -185,9 +194,7 @@ class bsn_generation_id(bsn):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.exp_type))
-        packed.append(struct.pack("!Q", self.generation_id))
+        packed.append(_struct_LLQ.pack(self.experimenter, self.exp_type, self.generation_id))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -195,16 +202,13 @@ class bsn_generation_id(bsn):
     @staticmethod
     def unpack(reader):
         obj = bsn_generation_id()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _exp_type, obj.generation_id = reader.read_struct(_struct_LLQ)
         assert(_experimenter == 6035143)
-        _exp_type = reader.read("!L")[0]
         assert(_exp_type == 1)
-        obj.generation_id = reader.read("!Q")[0]
         return obj
 
     def __eq__(self, other):
@@ -225,6 +229,7 @@ class bsn_generation_id(bsn):
 bsn.subtypes[1] = bsn_generation_id
 
 class bsn_uplink(bsn):
+    __slots__ = []
     type = 65535
     experimenter = 6035143
     exp_type = 0
@@ -236,8 +241,7 @@ class bsn_uplink(bsn):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.exp_type))
+        packed.append(_struct_LL.pack(self.experimenter, self.exp_type))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -245,14 +249,12 @@ class bsn_uplink(bsn):
     @staticmethod
     def unpack(reader):
         obj = bsn_uplink()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _exp_type = reader.read_struct(_struct_LL)
         assert(_experimenter == 6035143)
-        _exp_type = reader.read("!L")[0]
         assert(_exp_type == 0)
         return obj
 
@@ -271,6 +273,7 @@ class bsn_uplink(bsn):
 bsn.subtypes[0] = bsn_uplink
 
 class ethernet(port_desc_prop):
+    __slots__ = ['curr', 'advertised', 'supported', 'peer', 'curr_speed', 'max_speed']
     type = 0
 
     def __init__(self, curr=None, advertised=None, supported=None, peer=None, curr_speed=None, max_speed=None):
@@ -304,13 +307,7 @@ class ethernet(port_desc_prop):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.curr))
-        packed.append(struct.pack("!L", self.advertised))
-        packed.append(struct.pack("!L", self.supported))
-        packed.append(struct.pack("!L", self.peer))
-        packed.append(struct.pack("!L", self.curr_speed))
-        packed.append(struct.pack("!L", self.max_speed))
+        packed.append(_struct_4xLLLLLL.pack(self.curr, self.advertised, self.supported, self.peer, self.curr_speed, self.max_speed))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -318,18 +315,11 @@ class ethernet(port_desc_prop):
     @staticmethod
     def unpack(reader):
         obj = ethernet()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 0)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        reader.skip(4)
-        obj.curr = reader.read("!L")[0]
-        obj.advertised = reader.read("!L")[0]
-        obj.supported = reader.read("!L")[0]
-        obj.peer = reader.read("!L")[0]
-        obj.curr_speed = reader.read("!L")[0]
-        obj.max_speed = reader.read("!L")[0]
+        obj.curr, obj.advertised, obj.supported, obj.peer, obj.curr_speed, obj.max_speed = reader.read_struct(_struct_4xLLLLLL)
         return obj
 
     def __eq__(self, other):
@@ -370,6 +360,7 @@ class ethernet(port_desc_prop):
 port_desc_prop.subtypes[0] = ethernet
 
 class optical(port_desc_prop):
+    __slots__ = ['supported', 'tx_min_freq_lmda', 'tx_max_freq_lmda', 'tx_grid_freq_lmda', 'rx_min_freq_lmda', 'rx_max_freq_lmda', 'rx_grid_freq_lmda', 'tx_pwr_min', 'tx_pwr_max']
     type = 1
 
     def __init__(self, supported=None, tx_min_freq_lmda=None, tx_max_freq_lmda=None, tx_grid_freq_lmda=None, rx_min_freq_lmda=None, rx_max_freq_lmda=None, rx_grid_freq_lmda=None, tx_pwr_min=None, tx_pwr_max=None):
@@ -415,16 +406,7 @@ class optical(port_desc_prop):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.supported))
-        packed.append(struct.pack("!L", self.tx_min_freq_lmda))
-        packed.append(struct.pack("!L", self.tx_max_freq_lmda))
-        packed.append(struct.pack("!L", self.tx_grid_freq_lmda))
-        packed.append(struct.pack("!L", self.rx_min_freq_lmda))
-        packed.append(struct.pack("!L", self.rx_max_freq_lmda))
-        packed.append(struct.pack("!L", self.rx_grid_freq_lmda))
-        packed.append(struct.pack("!L", self.tx_pwr_min))
-        packed.append(struct.pack("!L", self.tx_pwr_max))
+        packed.append(_struct_4xLLLLLLLLL.pack(self.supported, self.tx_min_freq_lmda, self.tx_max_freq_lmda, self.tx_grid_freq_lmda, self.rx_min_freq_lmda, self.rx_max_freq_lmda, self.rx_grid_freq_lmda, self.tx_pwr_min, self.tx_pwr_max))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -432,21 +414,11 @@ class optical(port_desc_prop):
     @staticmethod
     def unpack(reader):
         obj = optical()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        reader.skip(4)
-        obj.supported = reader.read("!L")[0]
-        obj.tx_min_freq_lmda = reader.read("!L")[0]
-        obj.tx_max_freq_lmda = reader.read("!L")[0]
-        obj.tx_grid_freq_lmda = reader.read("!L")[0]
-        obj.rx_min_freq_lmda = reader.read("!L")[0]
-        obj.rx_max_freq_lmda = reader.read("!L")[0]
-        obj.rx_grid_freq_lmda = reader.read("!L")[0]
-        obj.tx_pwr_min = reader.read("!L")[0]
-        obj.tx_pwr_max = reader.read("!L")[0]
+        obj.supported, obj.tx_min_freq_lmda, obj.tx_max_freq_lmda, obj.tx_grid_freq_lmda, obj.rx_min_freq_lmda, obj.rx_max_freq_lmda, obj.rx_grid_freq_lmda, obj.tx_pwr_min, obj.tx_pwr_max = reader.read_struct(_struct_4xLLLLLLLLL)
         return obj
 
     def __eq__(self, other):
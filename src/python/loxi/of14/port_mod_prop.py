@@ -14,8 +14,15 @@ import loxi.generic_util
 import sys
 ofp = sys.modules['loxi.of14']
 
+# Precompiled layouts of fixed-size field runs
+_struct_HH = struct.Struct("!HH")
+_struct_LL = struct.Struct("!LL")
+_struct_LLLLL = struct.Struct("!LLLLL")
+
 class port_mod_prop(loxi.OFObject):
+    __slots__ = ['type']
     subtypes = {}
+    subtype_field = ('!H', 0)
 
 
     def __init__(self, type=None):
@@ -41,8 +48,7 @@ class port_mod_prop(loxi.OFObject):
             return subclass.unpack(reader)
 
         obj = port_mod_prop()
-        obj.type = reader.read("!H")[0]
-        _length = reader.read("!H")[0]
+        obj.type, _length = reader.read_struct(_struct_HH)
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         return obj
@@ -62,6 +68,7 @@ class port_mod_prop(loxi.OFObject):
 
 
 class ethernet(port_mod_prop):
+    __slots__ = ['advertise']
     type = 0
 
     def __init__(self, advertise=None):
@@ -83,9 +90,8 @@ class ethernet(port_mod_prop):
     @staticmethod
     def unpack(reader):
         obj = ethernet()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 0)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.advertise = reader.read("!L")[0]
@@ -109,7 +115,9 @@ class ethernet(port_mod_prop):
 port_mod_prop.subtypes[0] = ethernet
 
 class experimenter(port_mod_prop):
+    __slots__ = ['experimenter', 'exp_type']
     subtypes = {}
+    subtype_field = ('!L', 4)
 
     type = 65535
 
@@ -128,8 +136,7 @@ class experimenter(port_mod_prop):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.exp_type))
+        packed.append(_struct_LL.pack(self.experimenter, self.exp_type))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -142,13 +149,11 @@ class experimenter(port_mod_prop):
             return subclass.unpack(reader)
 
         obj = experimenter()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.experimenter = reader.read("!L")[0]
-        obj.exp_type = reader.read("!L")[0]
+        obj.experimenter, obj.exp_type = reader.read_struct(_struct_LL)
         return obj
 
     def __eq__(self, other):
@@ -170,6 +175,7 @@ class experimenter(port_mod_prop):
 port_mod_prop.subtypes[65535] = experimenter
 
 class optical(port_mod_prop):
+    __slots__ = ['configure', 'freq_ldma', 'fl_offset', 'grid_span', 'tx_pwr']
     type = 1
 
     def __init__(self, configure=None, freq_ldma=None, fl_offset=None, grid_span=None, tx_pwr=None):
@@ -199,11 +205,7 @@ class optical(port_mod_prop):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.configure))
-        packed.append(struct.pack("!L", self.freq_ldma))
-        packed.append(struct.pack("!L", self.fl_offset))
-        packed.append(struct.pack("!L", self.grid_span))
-        packed.append(struct.pack("!L", self.tx_pwr))
+        packed.append(_struct_LLLLL.pack(self.configure, self.freq_ldma, self.fl_offset, self.grid_span, self.tx_pwr))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -211,16 +213,11 @@ class optical(port_mod_prop):
     @staticmethod
     def unpack(reader):
         obj = optical()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.configure = reader.read("!L")[0]
-        obj.freq_ldma = reader.read("!L")[0]
-        obj.fl_offset = reader.read("!L")[0]
-        obj.grid_span = reader.read("!L")[0]
-        obj.tx_pwr = reader.read("!L")[0]
+        obj.configure, obj.freq_ldma, obj.fl_offset, obj.grid_span, obj.tx_pwr = reader.read_struct(_struct_LLLLL)
         return obj
 
     def __eq__(self, other):
@@ -14,8 +14,16 @@ import loxi.generic_util
 import sys
 ofp = sys.modules['loxi.of14']
 
+# Precompiled layouts of fixed-size field runs
+_struct_4xLLLLLLLHHHH = struct.Struct("!4xLLLLLLLHHHH")
+_struct_4xQQQQ = struct.Struct("!4xQQQQ")
+_struct_HH = struct.Struct("!HH")
+_struct_LL = struct.Struct("!LL")
+
 class port_stats_prop(loxi.OFObject):
+    __slots__ = ['type']
     subtypes = {}
+    subtype_field = ('!H', 0)
 
 
     def __init__(self, type=None):
@@ -41,8 +49,7 @@ class port_stats_prop(loxi.OFObject):
             return subclass.unpack(reader)
 
         obj = port_stats_prop()
-        obj.type = reader.read("!H")[0]
-        _length = reader.read("!H")[0]
+        obj.type, _length = reader.read_struct(_struct_HH)
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         return obj
@@ -62,6 +69,7 @@ class port_stats_prop(loxi.OFObject):
 
 
 class ethernet(port_stats_prop):
+    __slots__ = ['rx_frame_err', 'rx_over_err', 'rx_crc_err', 'collisions']
     type = 0
 
     def __init__(self, rx_frame_err=None, rx_over_err=None, rx_crc_err=None, collisions=None):
@@ -87,11 +95,7 @@ class ethernet(port_stats_prop):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!Q", self.rx_frame_err))
-        packed.append(struct.pack("!Q", self.rx_over_err))
-        packed.append(struct.pack("!Q", self.rx_crc_err))
-        packed.append(struct.pack("!Q", self.collisions))
+        packed.append(_struct_4xQQQQ.pack(self.rx_frame_err, self.rx_over_err, self.rx_crc_err, self.collisions))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -99,16 +103,11 @@ class ethernet(port_stats_prop):
     @staticmethod
     def unpack(reader):
         obj = ethernet()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 0)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        reader.skip(4)
-        obj.rx_frame_err = reader.read("!Q")[0]
-        obj.rx_over_err = reader.read("!Q")[0]
-        obj.rx_crc_err = reader.read("!Q")[0]
-        obj.collisions = reader.read("!Q")[0]
+        obj.rx_frame_err, obj.rx_over_err, obj.rx_crc_err, obj.collisions = reader.read_struct(_struct_4xQQQQ)
         return obj
 
     def __eq__(self, other):
@@ -141,7 +140,9 @@ class ethernet(port_stats_prop):
 port_stats_prop.subtypes[0] = ethernet
 
 class experimenter(port_stats_prop):
+    __slots__ = ['experimenter', 'exp_type', 'experimenter_data']
     subtypes = {}
+    subtype_field = ('!L', 4)
 
     type = 65535
 
@@ -164,8 +165,7 @@ class experimenter(port_stats_prop):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.exp_type))
+        packed.append(_struct_LL.pack(self.experimenter, self.exp_type))
         packed.append(self.experimenter_data)
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
@@ -179,13 +179,11 @@ class experimenter(port_stats_prop):
             return subclass.unpack(reader)
 
         obj = experimenter()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.experimenter = reader.read("!L")[0]
-        obj.exp_type = reader.read("!L")[0]
+        obj.experimenter, obj.exp_type = reader.read_struct(_struct_LL)
         obj.experimenter_data = str(reader.read_all())
         return obj
 
@@ -212,6 +210,7 @@ class experimenter(port_stats_prop):
 port_stats_prop.subtypes[65535] = experimenter
 
 class optical(port_stats_prop):
+    __slots__ = ['flags', 'tx_freq_lmda', 'tx_offset', 'tx_grid_span', 'rx_freq_lmda', 'rx_offset', 'rx_grid_span', 'tx_pwr', 'rx_pwr', 'bias_current', 'temperature']
     type = 1
 
     def __init__(self, flags=None, tx_freq_lmda=None, tx_offset=None, tx_grid_span=None, rx_freq_lmda=None, rx_offset=None, rx_grid_span=None, tx_pwr=None, rx_pwr=None, bias_current=None, temperature=None):
@@ -265,18 +264,7 @@ class optical(port_stats_prop):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.flags))
-        packed.append(struct.pack("!L", self.tx_freq_lmda))
-        packed.append(struct.pack("!L", self.tx_offset))
-        packed.append(struct.pack("!L", self.tx_grid_span))
-        packed.append(struct.pack("!L", self.rx_freq_lmda))
-        packed.append(struct.pack("!L", self.rx_offset))
-        packed.append(struct.pack("!L", self.rx_grid_span))
-        packed.append(struct.pack("!H", self.tx_pwr))
-        packed.append(struct.pack("!H", self.rx_pwr))
-        packed.append(struct.pack("!H", self.bias_current))
-        packed.append(struct.pack("!H", self.temperature))
+        packed.append(_struct_4xLLLLLLLHHHH.pack(self.flags, self.tx_freq_lmda, self.tx_offset, self.tx_grid_span, self.rx_freq_lmda, self.rx_offset, self.rx_grid_span, self.tx_pwr, self.rx_pwr, self.bias_current, self.temperature))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -284,23 +272,11 @@ class optical(port_stats_prop):
     @staticmethod
     def unpack(reader):
         obj = optical()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        reader.skip(4)
-        obj.flags = reader.read("!L")[0]
-        obj.tx_freq_lmda = reader.read("!L")[0]
-        obj.tx_offset = reader.read("!L")[0]
-        obj.tx_grid_span = reader.read("!L")[0]
-        obj.rx_freq_lmda = reader.read("!L")[0]
-        obj.rx_offset = reader.read("!L")[0]
-        obj.rx_grid_span = reader.read("!L")[0]
-        obj.tx_pwr = reader.read("!H")[0]
-        obj.rx_pwr = reader.read("!H")[0]
-        obj.bias_current = reader.read("!H")[0]
-        obj.temperature = reader.read("!H")[0]
+        obj.flags, obj.tx_freq_lmda, obj.tx_offset, obj.tx_grid_span, obj.rx_freq_lmda, obj.rx_offset, obj.rx_grid_span, obj.tx_pwr, obj.rx_pwr, obj.bias_current, obj.temperature = reader.read_struct(_struct_4xLLLLLLLHHHH)
         return obj
 
     def __eq__(self, other):
@@ -14,8 +14,15 @@ import loxi.generic_util
 import sys
 ofp = sys.modules['loxi.of14']
 
+# Precompiled layouts of fixed-size field runs
+_struct_H2x = struct.Struct("!H2x")
+_struct_HH = struct.Struct("!HH")
+_struct_LL = struct.Struct("!LL")
+
 class queue_desc_prop(loxi.OFObject):
+    __slots__ = ['type']
     subtypes = {}
+    subtype_field = ('!H', 0)
 
 
     def __init__(self, type=None):
@@ -41,8 +48,7 @@ class queue_desc_prop(loxi.OFObject):
             return subclass.unpack(reader)
 
         obj = queue_desc_prop()
-        obj.type = reader.read("!H")[0]
-        _length = reader.read("!H")[0]
+        obj.type, _length = reader.read_struct(_struct_HH)
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         return obj
@@ -62,7 +68,9 @@ class queue_desc_prop(loxi.OFObject):
 
 
 class experimenter(queue_desc_prop):
+    __slots__ = ['experimenter', 'exp_type']
     subtypes = {}
+    subtype_field = ('!L', 4)
 
     type = 65535
 
@@ -81,8 +89,7 @@ class experimenter(queue_desc_prop):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.exp_type))
+        packed.append(_struct_LL.pack(self.experimenter, self.exp_type))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -95,13 +102,11 @@ class experimenter(queue_desc_prop):
             return subclass.unpack(reader)
 
         obj = experimenter()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.experimenter = reader.read("!L")[0]
-        obj.exp_type = reader.read("!L")[0]
+        obj.experimenter, obj.exp_type = reader.read_struct(_struct_LL)
         return obj
 
     def __eq__(self, other):
@@ -123,6 +128,7 @@ class experimenter(queue_desc_prop):
 queue_desc_prop.subtypes[65535] = experimenter
 
 class max_rate(queue_desc_prop):
+    __slots__ = ['rate']
     type = 2
 
     def __init__(self, rate=None):
@@ -136,8 +142,7 @@ class max_rate(queue_desc_prop):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!H", self.rate))
-        packed.append('\x00' * 2)
+        packed.append(_struct_H2x.pack(self.rate))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -145,9 +150,8 @@ class max_rate(queue_desc_prop):
     @staticmethod
     def unpack(reader):
         obj = max_rate()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 2)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.rate = reader.read("!H")[0]
@@ -172,6 +176,7 @@ class max_rate(queue_desc_prop):
 queue_desc_prop.subtypes[2] = max_rate
 
 class min_rate(queue_desc_prop):
+    __slots__ = ['rate']
     type = 1
 
     def __init__(self, rate=None):
@@ -185,8 +190,7 @@ class min_rate(queue_desc_prop):
         packed = []
         packed.append(struct.pack("!H", self.type))
         packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!H", self.rate))
-        packed.append('\x00' * 2)
+        packed.append(_struct_H2x.pack(self.rate))
         length = sum([len(x) for x in packed])
         packed[1] = struct.pack("!H", length)
         return ''.join(packed)
@@ -194,9 +198,8 @@ class min_rate(queue_desc_prop):
     @staticmethod
     def unpack(reader):
         obj = min_rate()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.rate = reader.read("!H")[0]
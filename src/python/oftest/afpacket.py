@@ -5,16 +5,30 @@ When VLAN offload is enabled on the NIC Linux will not deliver the VLAN tag
 in the data returned by recv. Instead, it delivers the VLAN TCI in a control
 message. Python 2.x doesn't have built-in support for recvmsg, so we have to
 use ctypes to call it. The recv function exported by this module reconstructs
-the VLAN tag if it was offloaded.
+the VLAN tag if it was offloaded. Receiver and RecvBatch do the same with
+buffers allocated once per socket; frames are received past room reserved
+for the tag, so it is reinserted in place and the frame is copied out once.
+
+RxRing receives through a TPACKET_V3 ring instead: the kernel writes packets
+into blocks of memory shared with the process, so reading a packet needs no
+syscall or buffer allocation. The VLAN TCI is taken from the per-packet
+header and the tag is reconstructed the same way.
 """
 
+import errno
+import mmap
 import socket
 import struct
 from ctypes import *
 
 ETH_P_8021Q = 0x8100
 SOL_PACKET = 263
+PACKET_RX_RING = 5
 PACKET_AUXDATA = 8
+PACKET_VERSION = 10
+TPACKET_V3 = 2
+TP_STATUS_KERNEL = 0
+TP_STATUS_USER = 1 << 0
 TP_STATUS_VLAN_VALID = 1 << 4
 
 class struct_iovec(Structure):
@@ -52,11 +66,71 @@ class struct_tpacket_auxdata(Structure):
         ("tp_padding", c_ushort),
     ]
 
-libc = CDLL("libc.so.6")
+class struct_mmsghdr(Structure):
+    _fields_ = [
+        ("msg_hdr", struct_msghdr),
+        ("msg_len", c_uint),
+    ]
+
+libc = CDLL("libc.so.6", use_errno=True)
 recvmsg = libc.recvmsg
 recvmsg.argtypes = [c_int, POINTER(struct_msghdr), c_int]
 recvmsg.retype = c_int
 
+recvmmsg = libc.recvmmsg
+recvmmsg.argtypes = [c_int, POINTER(struct_mmsghdr), c_uint, c_int, c_void_p]
+recvmmsg.restype = c_int
+
+MSG_DONTWAIT = 0x40
+
+CTRL_BUFSIZE = sizeof(struct_cmsghdr) + sizeof(struct_tpacket_auxdata) + sizeof(c_size_t)
+
+# tp_status and tp_vlan_tci of struct tpacket_auxdata
+auxdata_vlan = struct.Struct("=I12xH")
+
+VLAN_HEADER_LEN = 4
+vlan_header = struct.Struct("!HH")
+
+class struct_sock_filter(Structure):
+    _fields_ = [
+        ("code", c_ushort),
+        ("jt", c_ubyte),
+        ("jf", c_ubyte),
+        ("k", c_uint32),
+    ]
+
+class struct_sock_fprog(Structure):
+    _fields_ = [
+        ("len", c_ushort),
+        ("filter", POINTER(struct_sock_filter)),
+    ]
+
+SO_ATTACH_FILTER = 26
+SO_DETACH_FILTER = 27
+
+def attach_filter(sk, insns):
+    """
+    Attach a classic BPF program to the socket, replacing any other
+
+    Frames the program rejects are dropped by the kernel.
+    @sk Socket
+    @insns List of (code, jt, jf, k) instructions, see oftest.bpf
+    """
+    insns = (struct_sock_filter * len(insns))(*insns)
+    fprog = struct_sock_fprog(len(insns), insns)
+    sk.setsockopt(socket.SOL_SOCKET, SO_ATTACH_FILTER,
+                  string_at(addressof(fprog), sizeof(fprog)))
+
+def detach_filter(sk):
+    """
+    Remove the BPF program attached to the socket, if any
+    """
+    try:
+        sk.setsockopt(socket.SOL_SOCKET, SO_DETACH_FILTER, 0)
+    except socket.error:
+        # No filter attached
+        pass
+
 def enable_auxdata(sk):
     """
     Ask the kernel to return the VLAN tag in a control message
@@ -65,48 +139,227 @@ def enable_auxdata(sk):
     """
     sk.setsockopt(SOL_PACKET, PACKET_AUXDATA, 1)
 
+def frame(buf, offset, length, ctrl_buf, ctrl_offset, ctrl_len):
+    """
+    Return a received frame as a string, with its VLAN tag reinserted
+
+    The frame must have been received VLAN_HEADER_LEN bytes past offset
+    in buf, so the tag can be put back in place and the frame copied out
+    once.
+    @buf Packet buffer
+    @offset Offset of the space reserved in front of the frame
+    @length Frame length
+    @ctrl_buf Control buffer
+    @ctrl_offset Offset of the control message
+    @ctrl_len Length of the control message
+    """
+    base = addressof(buf) + offset
+    # The kernel only delivers control messages we ask for. We
+    # only enabled PACKET_AUXDATA, so we can assume it's the
+    # only control message.
+    if ctrl_len >= sizeof(struct_cmsghdr):
+        (tp_status, tp_vlan_tci) = auxdata_vlan.unpack_from(
+            ctrl_buf, ctrl_offset + sizeof(struct_cmsghdr))
+        if tp_vlan_tci != 0 or tp_status & TP_STATUS_VLAN_VALID:
+            # Insert VLAN tag
+            memmove(base, base + VLAN_HEADER_LEN, 12)
+            vlan_header.pack_into(buf, offset + 12, ETH_P_8021Q, tp_vlan_tci)
+            return string_at(base, length + VLAN_HEADER_LEN)
+    return string_at(base + VLAN_HEADER_LEN, length)
+
+class Receiver(object):
+    """
+    Buffers for receiving packets from a socket one recvmsg call at a time
+
+    The message header, packet buffer and control buffer are allocated
+    once and reused by every call to recv.
+    """
+
+    def __init__(self, bufsize):
+        self.buf = create_string_buffer(VLAN_HEADER_LEN + bufsize)
+        self.ctrl_buf = create_string_buffer(CTRL_BUFSIZE)
+
+        self.iov = struct_iovec()
+        self.iov.iov_base = addressof(self.buf) + VLAN_HEADER_LEN
+        self.iov.iov_len = bufsize
+
+        self.msghdr = struct_msghdr()
+        self.msghdr.msg_name = None
+        self.msghdr.msg_namelen = 0
+        self.msghdr.msg_iov = pointer(self.iov)
+        self.msghdr.msg_iovlen = 1
+        self.msghdr.msg_control = addressof(self.ctrl_buf)
+
+    def recv(self, sk):
+        """
+        Receive a packet from an AF_PACKET socket
+        @sk Socket
+        """
+        msghdr = self.msghdr
+        msghdr.msg_controllen = CTRL_BUFSIZE
+        msghdr.msg_flags = 0
+
+        rv = recvmsg(sk.fileno(), byref(msghdr), 0)
+        if rv < 0:
+            raise RuntimeError("recvmsg failed: rv=%d" % rv)
+
+        return frame(self.buf, 0, rv, self.ctrl_buf, 0, msghdr.msg_controllen)
+
 def recv(sk, bufsize):
     """
     Receive a packet from an AF_PACKET socket
     @sk Socket
     @bufsize Maximum packet size
+
+    Allocates new buffers on every call; use a Receiver to receive
+    repeatedly from the same socket.
     """
-    buf = create_string_buffer(bufsize)
+    return Receiver(bufsize).recv(sk)
 
-    ctrl_bufsize = sizeof(struct_cmsghdr) + sizeof(struct_tpacket_auxdata) + sizeof(c_size_t)
-    ctrl_buf = create_string_buffer(ctrl_bufsize)
+class RecvBatch(object):
+    """
+    Buffers for receiving up to count packets with one recvmmsg call
 
-    iov = struct_iovec()
-    iov.iov_base = cast(buf, c_void_p)
-    iov.iov_len = bufsize
+    The message headers, packet buffers and control buffers are allocated
+    once and reused by every call to recv.
+    """
 
-    msghdr = struct_msghdr()
-    msghdr.msg_name = None
-    msghdr.msg_namelen = 0
-    msghdr.msg_iov = pointer(iov)
-    msghdr.msg_iovlen = 1
-    msghdr.msg_control = cast(ctrl_buf, c_void_p)
-    msghdr.msg_controllen = ctrl_bufsize
-    msghdr.msg_flags = 0
+    def __init__(self, count, bufsize):
+        self.count = count
+        self.stride = VLAN_HEADER_LEN + bufsize
+        self.bufs = create_string_buffer(count * self.stride)
+        self.ctrl_bufs = create_string_buffer(count * CTRL_BUFSIZE)
+        self.iovs = (struct_iovec * count)()
+        self.msgs = (struct_mmsghdr * count)()
 
-    rv = recvmsg(sk.fileno(), byref(msghdr), 0)
-    if rv < 0:
-        raise RuntimeError("recvmsg failed: rv=%d", rv)
+        buf_base = addressof(self.bufs)
+        ctrl_base = addressof(self.ctrl_bufs)
+        iov_base = addressof(self.iovs)
+        for i in range(count):
+            self.iovs[i].iov_base = buf_base + i * self.stride + VLAN_HEADER_LEN
+            self.iovs[i].iov_len = bufsize
+            msghdr = self.msgs[i].msg_hdr
+            msghdr.msg_iov = cast(iov_base + i * sizeof(struct_iovec), POINTER(struct_iovec))
+            msghdr.msg_iovlen = 1
+            msghdr.msg_control = ctrl_base + i * CTRL_BUFSIZE
+            msghdr.msg_controllen = CTRL_BUFSIZE
 
-    # The kernel only delivers control messages we ask for. We
-    # only enabled PACKET_AUXDATA, so we can assume it's the
-    # only control message.
-    assert msghdr.msg_controllen >= sizeof(struct_cmsghdr)
+        # recvmmsg overwrites the control lengths and flags, so the headers
+        # are restored from this copy before each call
+        self.msgs_init = create_string_buffer(string_at(self.msgs, sizeof(self.msgs)))
+
+    def recv(self, sk):
+        """
+        Receive the packets waiting on an AF_PACKET socket, without blocking
+        @sk Socket with auxdata enabled
+        @retval List of packets, empty if none were waiting
+        """
+        memmove(self.msgs, self.msgs_init, sizeof(self.msgs))
+        rv = recvmmsg(sk.fileno(), self.msgs, self.count, MSG_DONTWAIT, None)
+        if rv < 0:
+            err = get_errno()
+            if err in (errno.EAGAIN, errno.EWOULDBLOCK, errno.EINTR):
+                return []
+            raise OSError(err, "recvmmsg failed")
+
+        pkts = []
+        for i in range(rv):
+            msg = self.msgs[i]
+            pkts.append(frame(self.bufs, i * self.stride, msg.msg_len,
+                              self.ctrl_bufs, i * CTRL_BUFSIZE,
+                              msg.msg_hdr.msg_controllen))
+        return pkts
+
+# struct tpacket_req3
+tpacket_req3 = struct.Struct("=IIIIIII")
+
+# struct tpacket_block_desc: block_status, num_pkts, offset_to_first_pkt
+# following version and offset_to_priv
+block_desc = struct.Struct("=8xIII")
+BLOCK_STATUS_OFFSET = 8
+
+# struct tpacket3_hdr: tp_next_offset, tp_sec, tp_nsec, tp_snaplen, tp_len,
+# tp_status, tp_mac, tp_net, tp_rxhash, tp_vlan_tci
+tpacket3_hdr = struct.Struct("=IIIIIIHHII")
+
+class RxRing(object):
+    """
+    TPACKET_V3 receive ring of an AF_PACKET socket
+
+    The kernel fills one block at a time and hands it to us when it is full
+    or when retire_tov milliseconds have passed, at which point the socket
+    polls readable. Packets are read in order and each block is given back
+    to the kernel once all of its packets have been read.
+    """
+
+    def __init__(self, sk, block_size=1 << 20, block_nr=8, frame_size=4096,
+                 retire_tov=10):
+        """
+        @param sk AF_PACKET socket
+        @param block_size Size of a block; a multiple of the page size
+        @param block_nr Number of blocks in the ring
+        @param frame_size Maximum packet size including its header
+        @param retire_tov Milliseconds before a partly filled block is
+        handed over
+        """
+        sk.setsockopt(SOL_PACKET, PACKET_VERSION, TPACKET_V3)
+        frame_nr = block_size * block_nr / frame_size
+        sk.setsockopt(SOL_PACKET, PACKET_RX_RING,
+                      tpacket_req3.pack(block_size, block_nr, frame_size,
+                                        frame_nr, retire_tov, 0, 0))
+        self.map = mmap.mmap(sk.fileno(), block_size * block_nr,
+                             mmap.MAP_SHARED, mmap.PROT_READ | mmap.PROT_WRITE)
+        self.block_size = block_size
+        self.block_nr = block_nr
+        self.block = 0       # Index of the block being read
+        self.remaining = 0   # Packets left to read in that block
+        self.offset = 0      # Offset of the next packet in the ring
+
+    def close(self):
+        self.map.close()
+
+    def _next_block(self):
+        """
+        Start reading the current block if the kernel has handed it over
+        """
+        base = self.block * self.block_size
+        (status, num_pkts, first) = block_desc.unpack_from(self.map, base)
+        if not status & TP_STATUS_USER:
+            return False
+        self.remaining = num_pkts
+        self.offset = base + first
+        return True
+
+    def _release_block(self):
+        struct.pack_into("=I", self.map,
+                         self.block * self.block_size + BLOCK_STATUS_OFFSET,
+                         TP_STATUS_KERNEL)
+        self.block = (self.block + 1) % self.block_nr
 
-    cmsghdr = struct_cmsghdr.from_buffer(ctrl_buf) # pylint: disable=E1101
-    assert cmsghdr.cmsg_level == SOL_PACKET
-    assert cmsghdr.cmsg_type == PACKET_AUXDATA
+    def recv(self):
+        """
+        Return the next packet, or None if none is ready
+        @retval (packet data, timestamp)
+        """
+        while self.remaining == 0:
+            if not self._next_block():
+                return None
+            if self.remaining == 0:
+                self._release_block()
 
-    auxdata = struct_tpacket_auxdata.from_buffer(ctrl_buf, sizeof(struct_cmsghdr)) # pylint: disable=E1101
+        (next_offset, sec, nsec, snaplen, _, status, mac, _, _,
+         vlan_tci) = tpacket3_hdr.unpack_from(self.map, self.offset)
+        start = self.offset + mac
+        if vlan_tci != 0 or status & TP_STATUS_VLAN_VALID:
+            # Insert VLAN tag
+            tag = struct.pack("!HH", ETH_P_8021Q, vlan_tci)
+            pkt = self.map[start:start+12] + tag + self.map[start+12:start+snaplen]
+        else:
+            pkt = self.map[start:start+snaplen]
 
-    if auxdata.tp_vlan_tci != 0 or auxdata.tp_status & TP_STATUS_VLAN_VALID:
-        # Insert VLAN tag
-        tag = struct.pack("!HH", ETH_P_8021Q, auxdata.tp_vlan_tci)
-        return buf.raw[:12] + tag + buf.raw[12:rv]
-    else:
-        return buf.raw[:rv]
+        self.remaining -= 1
+        if self.remaining == 0:
+            self._release_block()
+        else:
+            self.offset += next_offset
+        return (pkt, sec + nsec * 1e-9)
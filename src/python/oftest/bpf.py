@@ -0,0 +1,267 @@
+"""
+Classic BPF programs for dataplane port filters
+
+A filter attached to a dataplane port is run by the kernel on every frame
+the interface receives, so frames a test does not care about (LLDP, IPv6
+neighbor discovery, host chatter) are dropped before they are copied into
+Python and queued.
+
+Programs are built in one of two ways:
+
+    bpf.compile_expr("eth.type == 0x0800 and udp.dst == 4789")
+    bpf.from_packet(simple_tcp_packet(...))
+
+An expression is a list of comparisons joined by 'and'. Each compares a
+header field, optionally masked ('ip.tos & 0xfc == 0x20'), with an
+integer, MAC, IPv4 or IPv6 address. As with OpenFlow matches, a field
+implies its prerequisites: 'udp.dst == 53' only accepts IPv4 UDP frames.
+
+The kernel removes the outer VLAN tag before AF_PACKET sockets see a frame
+(afpacket puts it back), so 'vlan.vid' and 'vlan.pcp' are read from the
+frame's metadata and the fields after the Ethernet header are at their
+untagged offsets.
+
+A program is a list of (code, jt, jf, k) instructions, as taken by
+afpacket.attach_filter.
+"""
+
+import re
+import socket
+import struct
+
+# Instruction classes, sizes, modes and operations
+BPF_LD = 0x00
+BPF_LDX = 0x01
+BPF_ALU = 0x04
+BPF_JMP = 0x05
+BPF_RET = 0x06
+BPF_W = 0x00
+BPF_H = 0x08
+BPF_B = 0x10
+BPF_ABS = 0x20
+BPF_IND = 0x40
+BPF_MSH = 0xa0
+BPF_AND = 0x50
+BPF_JEQ = 0x10
+BPF_K = 0x00
+
+BPF_MAXINSNS = 4096
+
+# Ancillary data loads
+SKF_AD_OFF = -0x1000
+SKF_AD_VLAN_TAG = 44
+SKF_AD_VLAN_TAG_PRESENT = 48
+
+# Kernels before 4.0 used the CFI bit of the TCI as the tag present flag
+VLAN_TCI_MASK = 0xefff
+
+ETH_P_8021Q = 0x8100
+ETH_HLEN = 14
+
+ACCEPT = (BPF_RET | BPF_K, 0, 0, 0x40000)
+REJECT = (BPF_RET | BPF_K, 0, 0, 0)
+
+_sizes = { 4: BPF_W, 2: BPF_H, 1: BPF_B }
+
+class Field(object):
+    """
+    A header field that can appear in an expression
+
+    @var offset Byte offset, from the start of the frame for absolute
+    fields, from the start of the L4 header for 'l4' fields, or the
+    ancillary data offset for 'vlan' fields
+    @var size Size in bytes
+    @var mode 'abs', 'l4' or 'vlan'
+    @var mask Bits of the loaded value that belong to the field
+    @var shift Right shift of the field within the loaded value
+    @var prereqs Comparisons (name, value) the field implies
+    """
+
+    def __init__(self, offset, size, mode='abs', mask=None, shift=0, prereqs=()):
+        self.offset = offset
+        self.size = size
+        self.mode = mode
+        self.mask = mask
+        self.shift = shift
+        self.prereqs = prereqs
+
+_ipv4 = (('eth.type', 0x0800),)
+_ipv6 = (('eth.type', 0x86dd),)
+_tcp = _ipv4 + (('ip.proto', 6),)
+_udp = _ipv4 + (('ip.proto', 17),)
+
+fields = {
+    'eth.dst': Field(0, 6),
+    'eth.src': Field(6, 6),
+    'eth.type': Field(12, 2),
+    'vlan.vid': Field(SKF_AD_VLAN_TAG, 4, 'vlan', mask=0xfff),
+    'vlan.pcp': Field(SKF_AD_VLAN_TAG, 4, 'vlan', mask=0xe000, shift=13),
+    'arp.op': Field(ETH_HLEN + 6, 2, prereqs=(('eth.type', 0x0806),)),
+    'ip.tos': Field(ETH_HLEN + 1, 1, prereqs=_ipv4),
+    'ip.proto': Field(ETH_HLEN + 9, 1, prereqs=_ipv4),
+    'ip.src': Field(ETH_HLEN + 12, 4, prereqs=_ipv4),
+    'ip.dst': Field(ETH_HLEN + 16, 4, prereqs=_ipv4),
+    'ipv6.next': Field(ETH_HLEN + 6, 1, prereqs=_ipv6),
+    'ipv6.src': Field(ETH_HLEN + 8, 16, prereqs=_ipv6),
+    'ipv6.dst': Field(ETH_HLEN + 24, 16, prereqs=_ipv6),
+    'tcp.src': Field(0, 2, 'l4', prereqs=_tcp),
+    'tcp.dst': Field(2, 2, 'l4', prereqs=_tcp),
+    'udp.src': Field(0, 2, 'l4', prereqs=_udp),
+    'udp.dst': Field(2, 2, 'l4', prereqs=_udp),
+    'icmp.type': Field(0, 1, 'l4', prereqs=_ipv4 + (('ip.proto', 1),)),
+}
+
+def _value_bytes(text, size):
+    """
+    Parse a value of the given size into a string of bytes
+    """
+    if ':' in text and size == 6:
+        data = ''.join(chr(int(x, 16)) for x in text.split(':'))
+    elif '.' in text and size == 4:
+        data = socket.inet_aton(text)
+    elif ':' in text and size == 16:
+        data = socket.inet_pton(socket.AF_INET6, text)
+    else:
+        value = int(text, 0)
+        if value >> (8 * size):
+            raise ValueError("value %s does not fit in %d bytes" % (text, size))
+        data = ''.join(chr((value >> (8 * i)) & 0xff) for i in reversed(range(size)))
+    if len(data) != size:
+        raise ValueError("invalid value %s" % text)
+    return data
+
+def _compare(mode, offset, size, value, mask=None):
+    """
+    Instructions that reject the frame unless the loaded value matches
+    """
+    if mode == 'l4':
+        code = BPF_LD | _sizes[size] | BPF_IND
+    else:
+        code = BPF_LD | _sizes[size] | BPF_ABS
+    insns = [(code, 0, 0, offset & 0xffffffff)]
+    if mask is not None:
+        insns.append((BPF_ALU | BPF_AND | BPF_K, 0, 0, mask))
+    insns.append((BPF_JMP | BPF_JEQ | BPF_K, 1, 0, value))
+    insns.append(REJECT)
+    return insns
+
+def _compare_bytes(offset, data, mask=None):
+    """
+    Instructions that reject the frame unless data is found at offset
+    """
+    insns = []
+    pos = 0
+    while pos < len(data):
+        size = 4 if len(data) - pos >= 4 else (2 if len(data) - pos >= 2 else 1)
+        value = 0
+        for c in data[pos:pos+size]:
+            value = (value << 8) | ord(c)
+        if mask is not None:
+            # Only fields that fit in a single load are masked
+            insns.extend(_compare('abs', offset + pos, size, value & mask, mask))
+        else:
+            insns.extend(_compare('abs', offset + pos, size, value))
+        pos += size
+    return insns
+
+def _vlan_present():
+    return _compare('abs', SKF_AD_OFF + SKF_AD_VLAN_TAG_PRESENT, 4, 1)
+
+def _field_insns(name, value, mask=None):
+    field = fields[name]
+    if field.mode == 'vlan':
+        field_mask = field.mask
+        if mask is not None:
+            field_mask &= mask << field.shift
+        return _vlan_present() + \
+            _compare('abs', SKF_AD_OFF + field.offset, 4,
+                     (value << field.shift) & field_mask, field_mask)
+    data = _value_bytes(str(value), field.size) if isinstance(value, (int, long)) else value
+    if field.mode == 'l4':
+        # X = IPv4 header length, then load relative to the L4 header
+        insns = [(BPF_LDX | BPF_B | BPF_MSH, 0, 0, ETH_HLEN)]
+        value = 0
+        for c in data:
+            value = (value << 8) | ord(c)
+        if mask is not None:
+            value &= mask
+        return insns + _compare('l4', ETH_HLEN + field.offset, field.size, value, mask)
+    return _compare_bytes(field.offset, data, mask)
+
+_term = re.compile(r"^\s*([a-z0-9]+\.[a-z]+)\s*(?:&\s*(\S+)\s*)?==\s*(\S+)\s*$")
+
+def compile_expr(expr):
+    """
+    Compile an expression into a program
+
+    @param expr Comparisons joined by 'and', e.g.
+    "eth.dst == 00:01:02:03:04:05 and vlan.vid == 10"
+    """
+    terms = []
+    for text in re.split(r"\s+and\s+", expr.strip()):
+        m = _term.match(text)
+        if not m or m.group(1) not in fields:
+            raise ValueError("invalid filter term %r" % text)
+        (name, mask, value) = m.groups()
+        field = fields[name]
+        if mask and field.size > 4:
+            raise ValueError("cannot mask field %s" % name)
+        if field.mode == 'vlan':
+            value = int(value, 0)
+        else:
+            value = _value_bytes(value, field.size)
+        terms.append((name, value, mask and int(mask, 0)))
+
+    # Check prerequisites first, each once
+    insns = []
+    done = set()
+    for (name, _, _) in terms:
+        for prereq in fields[name].prereqs:
+            if prereq not in done:
+                done.add(prereq)
+                insns.extend(_field_insns(*prereq))
+    for (name, value, mask) in terms:
+        insns.extend(_field_insns(name, value, mask))
+    insns.append(ACCEPT)
+    if len(insns) > BPF_MAXINSNS:
+        raise ValueError("filter too long")
+    return insns
+
+def _header_length(pkt):
+    """
+    Length of the headers of a scapy packet, excluding its payload
+    """
+    layer = pkt
+    while layer and type(layer).__name__ not in ('Raw', 'Padding'):
+        layer = layer.payload
+    if not layer:
+        return len(str(pkt))
+    return len(str(pkt)) - len(str(layer))
+
+def from_packet(pkt, length=None):
+    """
+    Compile a program accepting frames that start like pkt
+
+    @param pkt Expected packet, a scapy packet or a string
+    @param length Number of bytes to compare; by default the headers of a
+    scapy packet, or all of a string
+    """
+    data = str(pkt)
+    if length is None:
+        length = len(data) if isinstance(pkt, str) else _header_length(pkt)
+    data = data[:length]
+
+    insns = []
+    if len(data) >= ETH_HLEN + 4 and \
+            struct.unpack("!H", data[12:14])[0] == ETH_P_8021Q:
+        # The outer tag is only in the frame metadata
+        (tci,) = struct.unpack("!H", data[14:16])
+        insns.extend(_vlan_present())
+        insns.extend(_compare('abs', SKF_AD_OFF + SKF_AD_VLAN_TAG, 4,
+                              tci & VLAN_TCI_MASK, VLAN_TCI_MASK))
+        data = data[:12] + data[16:]
+    insns.extend(_compare_bytes(0, data))
+    insns.append(ACCEPT)
+    if len(insns) > BPF_MAXINSNS:
+        raise ValueError("filter too long; compare fewer bytes")
+    return insns
@@ -0,0 +1,192 @@
+"""
+Columnar decoding of flow stats replies
+
+Verifying a large flow table usually needs only a few counters from each
+flow stats entry, but parsing the replies builds a full loxi object per
+entry, including its match and instruction lists. FlowStatsColumns decodes
+the fixed-size fields of every entry straight from the raw replies into
+one array per field. The match and the complete entry of a row are only
+parsed when asked for.
+
+Without NumPy the columns are stdlib arrays; sum(), max(), zip() and
+array comparisons over them run in C rather than touching an object per
+flow.
+"""
+
+import struct
+from array import array
+
+import loxi
+import loxi.generic_util
+
+# Typecode for 64-bit columns; fall back to a list where array has none
+_U64 = 'L' if array('L').itemsize == 8 else None
+
+_TYPECODES = {'B': 'B', 'H': 'H', 'L': 'I', 'Q': _U64}
+
+_header_struct = struct.Struct("!BBHLH")
+_length_struct = struct.Struct("!H")
+
+class _Layout(object):
+    """
+    Offsets of the fixed fields of a flow_stats_entry in one OF version
+
+    @var body_offset Offset of the first entry in a stats reply
+    @var fields_offset Offset of the fixed fields in an entry
+    @var fields_struct Struct unpacking the fixed fields
+    @var names Field names, in struct order
+    @var typecodes Array typecodes, in struct order
+    @var match_offset Offset of the match in an entry
+    """
+
+    def __init__(self, body_offset, fields_offset, fmt, names, match_offset):
+        self.body_offset = body_offset
+        self.fields_offset = fields_offset
+        self.fields_struct = struct.Struct("!" + fmt)
+        self.names = names
+        self.typecodes = [_TYPECODES[c] for c in fmt if c in _TYPECODES]
+        self.match_offset = match_offset
+        assert len(self.typecodes) == len(names)
+
+_common_names = ('duration_sec', 'duration_nsec', 'priority',
+                 'idle_timeout', 'hard_timeout')
+_counter_names = ('cookie', 'packet_count', 'byte_count')
+
+_layouts = {
+    1: _Layout(12, 44, "LLHHH6xQQQ",
+               _common_names + _counter_names, 4),
+    2: _Layout(16, 2, "B1xLLHHH6xQQQ",
+               ('table_id',) + _common_names + _counter_names, 48),
+    3: _Layout(16, 2, "B1xLLHHH6xQQQ",
+               ('table_id',) + _common_names + _counter_names, 48),
+    4: _Layout(16, 2, "B1xLLHHHH4xQQQ",
+               ('table_id',) + _common_names + ('flags',) + _counter_names, 48),
+    5: _Layout(16, 2, "B1xLLHHHHH2xQQQ",
+               ('table_id',) + _common_names + ('flags', 'importance') + _counter_names, 48),
+}
+
+def _raw(msg):
+    """
+    Return the raw bytes of a raw, lazy or parsed message
+    """
+    if isinstance(msg, str):
+        return msg
+    raw = getattr(msg, 'raw', None)
+    if raw is not None:
+        return raw
+    return msg.pack()
+
+class FlowStatsColumns(object):
+    """
+    Flow stats entries stored as one array per fixed-size field
+
+    Columns are reached as attributes named after the flow_stats_entry
+    fields (table.cookie, table.packet_count, ...). Row i of every column
+    describes the same flow.
+
+    @var version OpenFlow wire version of the replies
+    @var columns Map from field name to its array
+    """
+
+    def __init__(self, version):
+        self.version = version
+        self.ofp = loxi.protocol(version)
+        self.layout = _layouts[version]
+        self.columns = {}
+        for (name, typecode) in zip(self.layout.names, self.layout.typecodes):
+            self.columns[name] = array(typecode) if typecode else []
+        if 'table_id' not in self.columns:
+            # OF 1.0 keeps table_id in front of the match
+            self.columns['table_id'] = array('B')
+        self.buffers = []
+        self.row_buffer = array('I')
+        self.row_offset = array('I')
+        self.row_length = array('H')
+
+    def __getattr__(self, name):
+        # Only called for names that are not instance attributes
+        try:
+            return self.__dict__['columns'][name]
+        except KeyError:
+            raise AttributeError(name)
+
+    def __len__(self):
+        return len(self.row_offset)
+
+    def add_reply(self, msg):
+        """
+        Append the entries of one flow stats reply
+
+        @param msg Raw bytes, or a lazy or parsed flow_stats_reply
+        """
+        buf = _raw(msg)
+        (version, msg_type, _, _, stats_type) = _header_struct.unpack_from(buf)
+        if version != self.version or msg_type != self.ofp.OFPT_STATS_REPLY or \
+                stats_type != self.ofp.OFPST_FLOW:
+            raise ValueError("not an OpenFlow %s flow stats reply" %
+                             loxi.version_names[self.version])
+        layout = self.layout
+        fields_unpack = layout.fields_struct.unpack_from
+        length_unpack = _length_struct.unpack_from
+        fields_offset = layout.fields_offset
+        of10 = self.version == 1
+
+        values = []
+        offsets = array('I')
+        lengths = array('H')
+        table_ids = array('B')
+        offset = layout.body_offset
+        end = len(buf)
+        while offset < end:
+            (length,) = length_unpack(buf, offset)
+            if length < layout.match_offset or offset + length > end:
+                raise loxi.ProtocolError("invalid flow stats entry length %d" % length)
+            values.extend(fields_unpack(buf, offset + fields_offset))
+            offsets.append(offset)
+            lengths.append(length)
+            if of10:
+                table_ids.append(ord(buf[offset + 2]))
+            offset += length
+
+        # Distribute the flat list of values into the columns
+        count = len(layout.names)
+        for (i, name) in enumerate(layout.names):
+            self.columns[name].extend(values[i::count])
+        if of10:
+            self.columns['table_id'].extend(table_ids)
+
+        self.row_buffer.extend([len(self.buffers)] * len(offsets))
+        self.row_offset.extend(offsets)
+        self.row_length.extend(lengths)
+        self.buffers.append(buf)
+
+    def _reader(self, i, skip=0):
+        buf = self.buffers[self.row_buffer[i]]
+        offset = self.row_offset[i]
+        return loxi.generic_util.OFReader(buf, offset + skip,
+                                          self.row_length[i] - skip)
+
+    def match(self, i):
+        """
+        Parse the match of row i
+        """
+        return self.ofp.match.unpack(self._reader(i, self.layout.match_offset))
+
+    def entry(self, i):
+        """
+        Parse row i into a complete flow_stats_entry
+        """
+        return self.ofp.flow_stats_entry.unpack(self._reader(i))
+
+    def rows(self, name, value):
+        """
+        Return the row numbers whose column name equals value
+        """
+        column = self.columns[name]
+        return [i for (i, x) in enumerate(column) if x == value]
+
+    def total(self, name):
+        """
+        Return the sum of a column
+        """
+        return sum(self.columns[name])
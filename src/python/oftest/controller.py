@@ -15,12 +15,13 @@ poll calls.
 
 Callbacks and polling support specifying the message type
 
-@todo Support transaction semantics via xid
+Transactions are tracked per XID, so several may be outstanding at once.
+
 @todo Support select and listen on an administrative socket (or
 use a timeout to support clean shutdown).
 
-Currently only one connection is accepted during the life of
-the controller.   There seems
+Controller accepts only one connection during its life; use
+MultiController to serve several switches from one thread.   There seems
 to be no clean way to interrupt an accept call.  Using select that also listens
 on an administrative socket and can shut down the socket might work.
 
@@ -33,12 +34,15 @@ import time
 import struct
 import select
 import logging
+import Queue
+from collections import deque
 from threading import Thread
 from threading import Lock
 from threading import Condition
 
 import ofutils
 import loxi
+import loxi.generic_util
 
 # Configured openflow version
 import ofp as cfg_ofp
@@ -65,6 +69,410 @@ def hex_dump_buffer(src, length=16):
 ##@todo Find a better home for these identifiers (controller)
 RCV_SIZE_DEFAULT = 32768
 LISTEN_QUEUE_SIZE = 1
+MULTI_LISTEN_QUEUE_SIZE = 64
+HANDLER_POOL_SIZE = 4
+BULK_WRITE_SIZE = 65536
+BULK_BARRIER_INTERVAL = 1000
+BULK_BARRIER_WINDOW = 4
+
+def listen_socket(host, port, backlog):
+    """
+    Create a TCP socket listening for switch connections
+    """
+    ai = socket.getaddrinfo(host, port, socket.AF_UNSPEC,
+                            socket.SOCK_STREAM, 0, socket.AI_PASSIVE)
+    # Use first returned addrinfo
+    (family, socktype, proto, name, sockaddr) = ai[0]
+    soc = socket.socket(family, socktype)
+    soc.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    soc.bind(sockaddr)
+    soc.listen(backlog)
+    return soc
+
+class LazyMessage(object):
+    """
+    Received message decoded only as far as its OpenFlow header
+
+    The loxi object is parsed from the raw bytes the first time it is
+    needed, either through the msg attribute or by reading one of its
+    fields through this wrapper.  Messages that nobody looks at (echo
+    requests, expired queue entries) are never parsed.
+
+    @var version The header version
+    @var type The header message type
+    @var length The header length
+    @var xid The header transaction ID
+    @var raw The raw message bytes
+    """
+
+    def __init__(self, raw, version, type, length, xid, controller=None):
+        """
+        @param controller If set, the Controller whose parse_errors count
+        a failure to parse the message
+        """
+        self.raw = raw
+        self.version = version
+        self.type = type
+        self.length = length
+        self.xid = xid
+        self._msg = None
+        self._controller = controller
+
+    @property
+    def msg(self):
+        """
+        The parsed loxi message object
+        """
+        if self._msg is None:
+            ofp = loxi.protocol(self.version)
+            try:
+                self._msg = ofp.message.parse_message(self.raw)
+            except loxi.ProtocolError:
+                # Count the message once, however often it is asked for
+                if self._controller:
+                    self._controller.parse_errors += 1
+                    self._controller.logger.warn("Could not parse message")
+                    self._controller = None
+                raise
+        return self._msg
+
+    @property
+    def klass(self):
+        """
+        The loxi class of the message, without parsing the body
+
+        Resolved from the type and subtype fields through the flat
+        dispatch table of the protocol version, so it is the exact class
+        parsing would produce.
+        """
+        if self._msg is not None:
+            return type(self._msg)
+        message = loxi.protocol(self.version).message
+        try:
+            return message.message_class(self.raw)
+        except loxi.ProtocolError:
+            # Truncated subtype field; parsing will report the error
+            return message.message.subtypes.get(self.type, message.message)
+
+    def __getattr__(self, name):
+        # Only called for attributes that are not header fields
+        return getattr(self.msg, name)
+
+def materialize(msg):
+    """
+    Return the parsed message object for a possibly lazy message
+    """
+    if isinstance(msg, LazyMessage):
+        return msg.msg
+    return msg
+
+def message_class(msg):
+    """
+    Return the class a possibly lazy message is known to be an instance of
+    """
+    if isinstance(msg, LazyMessage):
+        return msg.klass
+    return type(msg)
+
+class Transaction(object):
+    """
+    A request waiting for the reply with the same XID
+
+    Created by Controller.transact_start and kept in the controller's
+    transaction table until the reply arrives, the waiter gives up or
+    the controller shuts down.
+
+    @var xid The transaction ID of the request
+    @var response The (msg, pkt) reply pair, or None if not (yet) received
+    @var done True once the transaction has completed or been cancelled
+    @var callback If not None, called from the controller thread with the
+    response (or None on cancel) when the transaction completes
+    """
+
+    multipart = False
+
+    def __init__(self, xid, callback=None):
+        self.xid = xid
+        self.cv = Condition()
+        self.response = None
+        self.done = False
+        self.callback = callback
+
+    def complete(self, response):
+        """
+        Record the reply (or None on cancel) and wake up the waiter
+        """
+        with self.cv:
+            self.response = response
+            self.done = True
+            self.cv.notify_all()
+        if self.callback:
+            self.callback(response)
+
+    def wait(self, timeout=-1):
+        """
+        Wait for the reply
+
+        @param timeout The timeout in seconds; if -1 use default.
+        @retval The (msg, pkt) reply pair, or (None, None) on timeout
+        """
+        with self.cv:
+            ofutils.timed_wait(self.cv, lambda: True if self.done else None,
+                               timeout=timeout)
+            if self.response:
+                (msg, pkt) = self.response
+                return (materialize(msg), pkt)
+        return (None, None)
+
+def multipart_more(msg):
+    """
+    Return True if msg is a multipart (stats) reply with more parts to come
+
+    Only the raw bytes are inspected, so a lazy message is not parsed.
+    """
+    ofp = loxi.protocol(msg.version)
+    if msg.type != ofp.OFPT_STATS_REPLY:
+        return False
+    (flags,) = struct.unpack_from("!H", msg.raw, 10)
+    return flags & ofp.OFPSF_REPLY_MORE != 0
+
+class MultipartTransaction(object):
+    """
+    A multipart request collecting reply parts by XID
+
+    Stays in the controller's transaction table until the last part (one
+    without the more flag, or an error) arrives.  Parts are kept unparsed
+    until the consumer takes them.  Once the consumer stops, remaining
+    parts are dropped as they arrive.
+
+    @var xid The transaction ID of the request
+    @var parts Deque of (msg, pkt) parts not yet taken
+    @var done True once the last part has arrived or the transaction has
+    been cancelled
+    @var discard True once the consumer has stopped
+    """
+
+    multipart = True
+
+    def __init__(self, xid):
+        self.xid = xid
+        self.cv = Condition()
+        self.parts = deque()
+        self.done = False
+        self.discard = False
+
+    def complete(self, response):
+        with self.cv:
+            if response is None:
+                self.done = True
+            else:
+                if not self.discard:
+                    self.parts.append(response)
+                if not multipart_more(response[0]):
+                    self.done = True
+            self.cv.notify_all()
+
+    def next_part(self, timeout=-1):
+        """
+        Wait for the next reply part
+
+        @param timeout The timeout in seconds; if -1 use default.
+        @retval A (msg, pkt) pair with msg still unparsed, or (None, None)
+        on timeout or cancel
+        """
+        def grab():
+            if self.parts:
+                return self.parts.popleft()
+            if self.done:
+                return (None, None)
+            return None
+
+        with self.cv:
+            ret = ofutils.timed_wait(self.cv, grab, timeout=timeout)
+        return ret or (None, None)
+
+    def stop(self):
+        """
+        Drop queued parts and any that arrive later
+        """
+        with self.cv:
+            self.discard = True
+            self.parts.clear()
+
+class ErrorCollector(object):
+    """
+    Transaction table entry shared by all messages of a bulk send
+
+    Anything the switch sends back with one of these XIDs (normally an
+    error message) is recorded instead of being queued.
+
+    @var responses List of (msg, pkt) pairs received
+    """
+
+    multipart = False
+
+    def __init__(self):
+        self.responses = []
+
+    def complete(self, response):
+        if response:
+            self.responses.append(response)
+
+class MessageQueue(object):
+    """
+    Queue of received messages indexed by message class
+
+    Each message class has its own deque, so polling for a class does not
+    scan unrelated messages.  Lazy messages are filed under their exact
+    class, resolved from the type and subtype fields without parsing, so
+    polling for any class only looks at the head of the deques of its
+    subclasses.  A second deque records the arrival
+    order across all classes for eviction and class-agnostic polls; entries
+    taken through a class deque are only marked dead there and skipped
+    later.
+
+    @var max_len Maximum number of queued messages
+    @var expired Map from message class to number of messages evicted
+    """
+
+    def __init__(self, max_len):
+        self.max_len = max_len
+        self.expired = {}
+        self.clear()
+
+    def clear(self):
+        # Entries are [seq, msg, pkt, live, klass]
+        self.by_class = {}
+        self.order = deque()
+        self.count = 0
+        self.seq = 0
+        self.subclass_cache = {}
+
+    def __len__(self):
+        return self.count
+
+    def append(self, msg, pkt):
+        """
+        Enqueue a message, evicting the oldest one if the queue is full
+
+        @retval The evicted (msg, pkt) pair, or None
+        """
+        evicted = None
+        if self.count >= self.max_len:
+            evicted = self.popleft()
+            klass = message_class(evicted[0])
+            self.expired[klass] = self.expired.get(klass, 0) + 1
+
+        klass = message_class(msg)
+        entry = [self.seq, msg, pkt, True, klass]
+        self.seq += 1
+        if klass not in self.by_class:
+            self.by_class[klass] = deque()
+        self.by_class[klass].append(entry)
+        self.order.append(entry)
+        self.count += 1
+        return evicted
+
+    def popleft(self):
+        """
+        Dequeue the oldest message of any class
+
+        @retval A (msg, pkt) pair, or None if the queue is empty
+        """
+        while self.order:
+            entry = self.order.popleft()
+            if entry[3]:
+                self._take(entry[4])
+                return (entry[1], entry[2])
+        return None
+
+    def pop_class(self, klass):
+        """
+        Dequeue the oldest message that is an instance of klass
+
+        @retval A (msg, pkt) pair, or None if no such message is queued
+        """
+        if klass is None:
+            return self.popleft()
+
+        entry = None
+        for (qklass, queue) in self.by_class.items():
+            key = (klass, qklass)
+            match = self.subclass_cache.get(key)
+            if match is None:
+                match = self.subclass_cache[key] = issubclass(qklass, klass)
+            if match and (entry is None or queue[0][0] < entry[0]):
+                entry = queue[0]
+
+        if entry is None:
+            return None
+        self._take(entry[4])
+        entry[3] = False
+        if self.count == 0:
+            self.order.clear()
+        elif len(self.order) > 2 * self.max_len:
+            self.order = deque(e for e in self.order if e[3])
+        return (entry[1], entry[2])
+
+    def _take(self, klass):
+        queue = self.by_class[klass]
+        queue.popleft()
+        if not queue:
+            del self.by_class[klass]
+        self.count -= 1
+
+class Subscription(object):
+    """
+    A message handler registered with a controller
+
+    @var msg_type The message type, or "all"
+    @var handler The function to call (see sample_handler)
+    @var predicate If not None, the handler only sees messages for which
+    predicate(msg) is True
+    @var threaded If True, the handler runs on the controller's handler pool
+    """
+
+    def __init__(self, msg_type, handler, predicate=None, threaded=False):
+        self.msg_type = msg_type
+        self.handler = handler
+        self.predicate = predicate
+        self.threaded = threaded
+
+class HandlerPool(object):
+    """
+    Worker threads running message handlers off the controller thread
+    """
+
+    def __init__(self, size, logger):
+        self.logger = logger
+        self.queue = Queue.Queue()
+        self.workers = []
+        for i in range(size):
+            worker = Thread(target=self._work, name="handler-%d" % i)
+            worker.daemon = True
+            worker.start()
+            self.workers.append(worker)
+
+    def submit(self, handler, *args):
+        self.queue.put((handler, args))
+
+    def _work(self):
+        while True:
+            item = self.queue.get()
+            if item is None:
+                return
+            (handler, args) = item
+            try:
+                handler(*args)
+            except:
+                self.logger.exception("Error in message handler")
+
+    def stop(self):
+        """
+        Let queued handlers finish, then end the worker threads
+        """
+        for worker in self.workers:
+            self.queue.put(None)
 
 class Controller(Thread):
     """
@@ -107,9 +515,7 @@ class Controller(Thread):
         self.connect_cv = Condition()
         self.message_cv = Condition()
         self.tx_lock = Lock()
-
-        # Used to wake up the event loop from another thread
-        self.waker = ofutils.EventDescriptor()
+        self._event_loop_init()
 
         # Counters
         self.socket_errors = 0
@@ -121,14 +527,18 @@ class Controller(Thread):
 
         # State
         self.sync = Lock()
+        # Map from message type to a tuple of Subscriptions; replaced, not
+        # modified, under handlers_lock so the receive path needs no lock
         self.handlers = {}
+        self.handlers_lock = Lock()
+        self.handler_pool = None
         self.keep_alive = False
         self.active = True
         self.initial_hello = True
 
         # OpenFlow message/packet queue
         # Protected by the packets_cv lock / condition variable
-        self.packets = []
+        self.packets = MessageQueue(max_pkts)
         self.packets_cv = Condition()
         self.packet_in_count = 0
 
@@ -146,29 +556,29 @@ class Controller(Thread):
         self.pkt_in_dropped = 0 # Total dropped packet ins
         self.transact_to = 15 # Transact timeout default value; add to config
 
-        # Transaction and message type waiting variables 
-        #   xid_cv: Condition variable (semaphore) for packet waiters
-        #   xid: Transaction ID being waited on
-        #   xid_response: Transaction response message
-        self.xid_cv = Condition()
-        self.xid = None
-        self.xid_response = None
+        # Outstanding transactions
+        #   transactions: Map from XID to Transaction object
+        #   xid_lock: Protects the transactions map
+        self.transactions = {}
+        self.xid_lock = Lock()
 
-        self.buffered_input = ""
+        self.rx_buffer = loxi.generic_util.MessageBuffer(2 * self.rcv_size)
 
         # Create listen socket
         if self.passive:
             self.logger.info("Create/listen at " + self.host + ":" +
                              str(self.port))
-            ai = socket.getaddrinfo(self.host, self.port, socket.AF_UNSPEC,
-                                    socket.SOCK_STREAM, 0, socket.AI_PASSIVE)
-            # Use first returned addrinfo
-            (family, socktype, proto, name, sockaddr) = ai[0]
-            self.listen_socket = socket.socket(family, socktype)
-            self.listen_socket.setsockopt(socket.SOL_SOCKET,
-                                          socket.SO_REUSEADDR, 1)
-            self.listen_socket.bind(sockaddr)
-            self.listen_socket.listen(LISTEN_QUEUE_SIZE)
+            self.listen_socket = listen_socket(self.host, self.port,
+                                               LISTEN_QUEUE_SIZE)
+            self.poller.register(self.listen_socket)
+
+    def _event_loop_init(self):
+        # Used to wake up the event loop from another thread
+        self.waker = ofutils.EventDescriptor()
+
+        # Sockets watched by the event loop
+        self.poller = ofutils.EventPoller()
+        self.poller.register(self.waker)
 
     def filter_packet(self, rawmsg, hdr):
         """
@@ -192,11 +602,11 @@ class Controller(Thread):
 
         return False
 
-    def _pkt_handle(self, pkt):
+    def _pkt_handle(self, pkt=None):
         """
         Check for all packet handling conditions
 
-        Parse and verify message 
+        Decode the message header; the body is only parsed on demand
         Check if XID matches something waiting
         Check if message is being expected for a poll operation
         Check if keep alive is on and message is an echo request
@@ -205,52 +615,44 @@ class Controller(Thread):
 
         an echo request in case keep_alive is true, followed by
         registered message handlers.
-        @param pkt The raw packet (string) which may contain multiple OF msgs
+        @param pkt Raw data (string) to append to the receive buffer, which
+        may contain multiple OF msgs.  None if the data was received
+        directly into the buffer.
         """
 
-        # snag any left over data from last read()
-        pkt = self.buffered_input + pkt
-        self.buffered_input = ""
-
-        # Process each of the OF msgs inside the pkt
-        offset = 0
-        while offset < len(pkt):
-            if offset + 8 > len(pkt):
-                break
+        if pkt:
+            self.rx_buffer.feed(pkt)
 
-            # Parse the header to get type
-            hdr_version, hdr_type, hdr_length, hdr_xid = cfg_ofp.message.parse_header(pkt[offset:])
+        # Process each complete OF msg in the receive buffer; any partial
+        # message stays buffered until the rest arrives
+        for (hdr_version, hdr_type, hdr_length, hdr_xid, rawmsg) in \
+                self.rx_buffer.messages():
 
             # Use loxi to resolve to ofp of matching version
             ofp = loxi.protocol(hdr_version)
 
-            # Extract the raw message bytes
-            if (offset + hdr_length) > len(pkt):
-                break
-            rawmsg = pkt[offset : offset + hdr_length]
-            offset += hdr_length
-
             #if self.filter_packet(rawmsg, hdr):
             #    continue
 
-            msg = ofp.message.parse_message(rawmsg)
-            if not msg:
-                self.parse_errors += 1
-                self.logger.warn("Could not parse message")
+            # The body is only parsed once someone looks at it
+            msg = LazyMessage(rawmsg, hdr_version, hdr_type, hdr_length, hdr_xid,
+                              self)
+
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Msg in: version %d class %s len %d xid %d",
+                                  hdr_version, msg.klass.__name__, hdr_length, hdr_xid)
+
+            # Check if transaction is waiting
+            with self.xid_lock:
+                txn = self.transactions.get(hdr_xid)
+                if txn and not (txn.multipart and multipart_more(msg)):
+                    del self.transactions[hdr_xid]
+            if txn:
+                self.logger.debug("Matched expected XID " + str(hdr_xid))
+                txn.complete((msg, rawmsg))
                 continue
 
-            self.logger.debug("Msg in: version %d class %s len %d xid %d",
-                              hdr_version, type(msg).__name__, hdr_length, hdr_xid)
-
             with self.sync:
-                # Check if transaction is waiting
-                with self.xid_cv:
-                    if self.xid and hdr_xid == self.xid:
-                        self.logger.debug("Matched expected XID " + str(hdr_xid))
-                        self.xid_response = (msg, rawmsg)
-                        self.xid = None
-                        self.xid_cv.notify()
-                        continue
 
                 # Check if keep alive is set; if so, respond to echo requests
                 if self.keep_alive:
@@ -263,11 +665,11 @@ class Controller(Thread):
                         continue
 
                 # Generalize to counters for all packet types?
-                if msg.type == ofp.OFPT_PACKET_IN:
+                if hdr_type == ofp.OFPT_PACKET_IN:
                     self.packet_in_count += 1
 
                 # Log error messages
-                if isinstance(msg, ofp.message.error_msg):
+                if hdr_type == ofp.OFPT_ERROR:
                     #pylint: disable=E1103
                     if msg.err_type in ofp.ofp_error_type_map:
                         type_str = ofp.ofp_error_type_map[msg.err_type]
@@ -296,30 +698,45 @@ class Controller(Thread):
                     self.logger.warn("Received error message: xid=%d type=%s (%d) code=%s (%d)",
                                      hdr_xid, type_str, msg.err_type, code_str, msg.code)
 
-                # Now check for message handlers; preference is given to
-                # handlers for a specific packet
-                handled = False
-                if hdr_type in self.handlers.keys():
-                    handled = self.handlers[hdr_type](self, msg, rawmsg)
-                if not handled and ("all" in self.handlers.keys()):
-                    handled = self.handlers["all"](self, msg, rawmsg)
-
-                if not handled: # Not handled, enqueue
-                    with self.packets_cv:
-                        if len(self.packets) >= self.max_pkts:
-                            self.packets.pop(0)
-                            self.packets_expired += 1
-                        self.packets.append((msg, rawmsg))
-                        self.packets_cv.notify_all()
-                    self.packets_total += 1
-                else:
-                    self.packets_handled += 1
-                    self.logger.debug("Message handled by callback")
+            # Now check for message handlers; preference is given to
+            # handlers for a specific packet.  They run without any
+            # controller lock held.
+            handled = self._dispatch(hdr_type, msg, rawmsg)
+
+            if not handled: # Not handled, enqueue
+                with self.packets_cv:
+                    if self.packets.append(msg, rawmsg):
+                        self.packets_expired += 1
+                    self.packets_cv.notify_all()
+                self.packets_total += 1
+            else:
+                self.packets_handled += 1
+                self.logger.debug("Message handled by callback")
+
+    def _dispatch(self, hdr_type, msg, rawmsg):
+        """
+        Run the handlers subscribed to a message
 
-        # end of 'while offset < len(pkt)'
-        #   note that if offset = len(pkt), this is
-        #   appends a harmless empty string
-        self.buffered_input += pkt[offset:]
+        Every matching subscriber for the message type is called; the
+        "all" subscribers are only tried if none of those handled it.
+        Threaded subscribers are queued to the handler pool and count as
+        having handled the message.
+
+        @retval True if the message was handled
+        """
+        handled = False
+        for key in (hdr_type, "all"):
+            for sub in self.handlers.get(key, ()):
+                if sub.predicate and not sub.predicate(msg.msg):
+                    continue
+                if sub.threaded:
+                    self.handler_pool.submit(sub.handler, self, msg.msg, rawmsg)
+                    handled = True
+                elif sub.handler(self, msg.msg, rawmsg):
+                    handled = True
+            if handled:
+                break
+        return handled
 
     def _socket_ready_handle(self, s):
         """
@@ -347,17 +764,20 @@ class Controller(Thread):
                 (self.switch_socket, self.switch_addr) = (sock, addr)
                 self.switch_socket.setsockopt(socket.IPPROTO_TCP,
                                               socket.TCP_NODELAY, True)
+                self.poller.register(self.switch_socket)
                 if self.initial_hello:
                     self.message_send(cfg_ofp.message.hello())
                 self.connect_cv.notify() # Notify anyone waiting
 
             # Prevent further connections
+            self.poller.unregister(self.listen_socket)
             self.listen_socket.close()
             self.listen_socket = None
         elif s and s == self.switch_socket:
             for idx in range(3): # debug: try a couple of times
                 try:
-                    pkt = self.switch_socket.recv(self.rcv_size)
+                    count = self.rx_buffer.recv_from(self.switch_socket,
+                                                     self.rcv_size)
                 except:
                     self.logger.warning("Error on switch read")
                     return -1
@@ -365,17 +785,17 @@ class Controller(Thread):
                 if not self.active:
                     return 0
       
-                if len(pkt) == 0:
+                if count == 0:
                     self.logger.warning("Zero-length switch read, %d" % idx)
                 else:
                     break
 
-            if len(pkt) == 0: # Still no packet
+            if count == 0: # Still no packet
                 self.logger.warning("Zero-length switch read; closing cxn")
                 self.logger.info(str(self))
                 return -1
 
-            self._pkt_handle(pkt)
+            self._pkt_handle()
         elif s and s == self.waker:
             self.waker.wait()
         else:
@@ -410,7 +830,7 @@ class Controller(Thread):
 
     def sockets(self):
         """
-        Return list of sockets to select on.
+        Return list of sockets the event loop watches.
         """
         socs = [self.listen_socket, self.switch_socket, self.waker]
         return [x for x in socs if x]
@@ -434,12 +854,12 @@ class Controller(Thread):
 
         while self.active:
             try:
-                sel_in, sel_out, sel_err = \
-                    select.select(self.sockets(), [], self.sockets(), 1)
+                sel_in, sel_err = self.poller.poll(1)
             except:
                 print sys.exc_info()
                 self.logger.error("Select error, disconnecting")
                 self.disconnect()
+                sel_in, sel_err = [], []
 
             for s in sel_err:
                 self.logger.error("Got socket error on: " + str(s) + ", disconnecting")
@@ -470,6 +890,7 @@ class Controller(Thread):
                 self.logger.info("Connected to %s", self.switch)
                 self.dbg_state = "running"
                 self.switch_socket = soc
+                self.poller.register(soc)
                 self.wakeup()
                 with self.connect_cv:
                     if self.initial_hello:
@@ -491,11 +912,12 @@ class Controller(Thread):
         If connected to a switch, disconnect.
         """
         if self.switch_socket:
+            self.poller.unregister(self.switch_socket)
             self.switch_socket.close()
             self.switch_socket = None
             self.switch_addr = None
             with self.packets_cv:
-                self.packets = []
+                self.packets.clear()
             with self.connect_cv:
                 self.connect_cv.notifyAll()
 
@@ -527,6 +949,10 @@ class Controller(Thread):
         """
 
         self.active = False
+        if self.switch_socket:
+            self.poller.unregister(self.switch_socket)
+        if self.listen_socket:
+            self.poller.unregister(self.listen_socket)
         try:
             self.switch_socket.shutdown(socket.SHUT_RDWR)
         except:
@@ -540,12 +966,19 @@ class Controller(Thread):
         self.listen_socket = None
 
         # Wakeup condition variables on which controller may be wait
-        with self.xid_cv:
-            self.xid_cv.notifyAll()
+        with self.xid_lock:
+            pending = self.transactions.values()
+            self.transactions = {}
+        for txn in pending:
+            txn.complete(None)
 
         with self.connect_cv:
             self.connect_cv.notifyAll()
 
+        if self.handler_pool:
+            self.handler_pool.stop()
+            self.handler_pool = None
+
         self.wakeup()
         self.dbg_state = "down"
 
@@ -553,22 +986,61 @@ class Controller(Thread):
         """
         Register a callback to receive a specific message type.
 
-        Only one handler may be registered for a given message type.
+        Replaces any handlers already subscribed to the message type; use
+        subscribe to add one alongside them.
 
-        WARNING:  A lock is held during the handler call back, so 
-        the handler should not make any blocking calls
+        The handler runs in the controller thread, so it should not make
+        any blocking calls
 
         @param msg_type The type of message to receive.  May be DEFAULT 
         for all non-handled packets.  The special type, the string "all"
         will send all packets to the handler.
         @param handler The function to call when a message of the given 
-        type is received.
+        type is received.  None removes the handlers for the type.
         """
         # Should check type is valid
-        if not handler and msg_type in self.handlers.keys():
-            del self.handlers[msg_type]
-            return
-        self.handlers[msg_type] = handler
+        with self.handlers_lock:
+            if not handler:
+                self.handlers.pop(msg_type, None)
+            else:
+                self.handlers[msg_type] = (Subscription(msg_type, handler),)
+
+    def subscribe(self, msg_type, handler, predicate=None, threaded=False):
+        """
+        Add a callback for a message type
+
+        Any number of handlers may be subscribed to the same type; each one
+        sees every matching message, in subscription order.
+
+        @param msg_type The message type, or "all" (see register)
+        @param handler The function to call, with the same signature as
+        sample_handler
+        @param predicate If not None, a function of the parsed message; the
+        handler is only called when it returns True (e.g. packet-ins on
+        one port)
+        @param threaded If True, run the handler on the handler pool instead
+        of the controller thread.  Such handlers may block, run in no
+        particular order, and always count as handling the message.
+        @retval The Subscription, for unsubscribe
+        """
+        sub = Subscription(msg_type, handler, predicate, threaded)
+        with self.handlers_lock:
+            if threaded and not self.handler_pool:
+                self.handler_pool = HandlerPool(HANDLER_POOL_SIZE, self.logger)
+            self.handlers[msg_type] = self.handlers.get(msg_type, ()) + (sub,)
+        return sub
+
+    def unsubscribe(self, sub):
+        """
+        Remove a callback added with subscribe
+        """
+        with self.handlers_lock:
+            subs = tuple(x for x in self.handlers.get(sub.msg_type, ())
+                         if x is not sub)
+            if subs:
+                self.handlers[sub.msg_type] = subs
+            else:
+                self.handlers.pop(sub.msg_type, None)
 
     def poll(self, exp_msg=None, timeout=-1):
         """
@@ -602,10 +1074,10 @@ class Controller(Thread):
 
         # Take the packet from the queue
         def grab():
-            for i, (msg, pkt) in enumerate(self.packets):
-                if klass is None or isinstance(msg, klass):
-                    self.logger.debug("Got %s message", msg.__class__.__name__)
-                    return self.packets.pop(i)
+            ret = self.packets.pop_class(klass)
+            if ret:
+                self.logger.debug("Got %s message", message_class(ret[0]).__name__)
+                return ret
             # Not found
             self.logger.debug("%s message not in queue", klass.__name__)
             return None
@@ -615,10 +1087,67 @@ class Controller(Thread):
 
         if ret != None:
             (msg, pkt) = ret
-            return (msg, pkt)
+            return (materialize(msg), pkt)
         else:
             return (None, None)
 
+    def transact_start(self, msg, callback=None):
+        """
+        Send a request and register it in the transaction table
+
+        Several transactions may be outstanding at the same time, from one
+        or more threads.  Use transact_wait to collect the reply.
+
+        @param msg The message object to send; must not be a string
+        @param callback If not None, called from the controller thread with
+        the (msg, pkt) response, or None if the transaction is cancelled.
+        It must not block.
+        @retval A Transaction object, or None if a transaction with the
+        same XID is already outstanding
+        """
+
+        if msg.xid == None:
+            msg.xid = ofutils.gen_xid()
+
+        self.logger.debug("Running transaction %d" % msg.xid)
+
+        txn = Transaction(msg.xid, callback)
+        with self.xid_lock:
+            if msg.xid in self.transactions:
+                self.logger.error("Transaction %d already outstanding" % msg.xid)
+                return None
+            self.transactions[msg.xid] = txn
+
+        try:
+            self.message_send(msg)
+        except:
+            with self.xid_lock:
+                self.transactions.pop(msg.xid, None)
+            raise
+
+        return txn
+
+    def transact_wait(self, txn, timeout=-1):
+        """
+        Wait for the reply to a transaction started with transact_start
+
+        The transaction is removed from the table if the wait times out.
+
+        @param txn The Transaction object returned by transact_start
+        @param timeout The timeout in seconds; if -1 use default.
+        @retval A pair (msg, pkt), or (None, None) if no reply was received
+        """
+
+        self.logger.debug("Waiting for transaction %d" % txn.xid)
+        (resp, pkt) = txn.wait(timeout=timeout)
+
+        if resp is None:
+            with self.xid_lock:
+                if self.transactions.get(txn.xid) is txn:
+                    del self.transactions[txn.xid]
+            self.logger.warning("No response for xid " + str(txn.xid))
+        return (resp, pkt)
+
     def transact(self, msg, timeout=-1):
         """
         Run a message transaction with the switch
@@ -631,32 +1160,157 @@ class Controller(Thread):
         @param timeout The timeout in seconds; if -1 use default.
         """
 
+        txn = self.transact_start(msg)
+        if txn is None:
+            return (None, None)
+        return self.transact_wait(txn, timeout=timeout)
+
+    def transact_multi(self, msgs, timeout=-1):
+        """
+        Run many transactions concurrently from the calling thread
+
+        All requests are registered and sent (in large writes) before
+        waiting for any reply, so thousands of transactions can be
+        outstanding without a thread per request.
+
+        @param msgs A list of message objects to send
+        @param timeout The overall timeout in seconds; if -1 use default.
+        @retval A list of (msg, pkt) reply pairs in the order of msgs, with
+        (None, None) for each request that got no reply
+        """
+
+        if timeout == -1:
+            timeout = ofutils.default_timeout
+
+        txns = []
+        chunk = []
+        chunk_len = 0
+        for msg in msgs:
+            if msg.xid == None:
+                msg.xid = ofutils.gen_xid()
+            txn = Transaction(msg.xid)
+            with self.xid_lock:
+                if msg.xid in self.transactions:
+                    self.logger.error("Transaction %d already outstanding" % msg.xid)
+                    txns.append(None)
+                    continue
+                self.transactions[msg.xid] = txn
+            txns.append(txn)
+            outpkt = msg.pack()
+            chunk.append(outpkt)
+            chunk_len += len(outpkt)
+            if chunk_len >= BULK_WRITE_SIZE:
+                self._send_raw("".join(chunk))
+                chunk = []
+                chunk_len = 0
+        if chunk:
+            self._send_raw("".join(chunk))
+
+        end_time = time.time() + timeout
+        results = []
+        for txn in txns:
+            if txn is None:
+                results.append((None, None))
+            else:
+                remaining = max(end_time - time.time(), 0)
+                results.append(self.transact_wait(txn, timeout=remaining))
+        return results
+
+    def transact_multipart(self, msg, timeout=-1):
+        """
+        Generator yielding the entries of the replies to a multipart request
+
+        Reply parts are matched by XID and each one is parsed only when
+        the caller reaches it, so entries never accumulate beyond the
+        parts received but not yet consumed.  If the caller stops early
+        (or closes the generator), the remaining parts are dropped
+        unparsed as they arrive.
+
+        @param msg The stats/multipart request message object to send
+        @param timeout Maximum seconds to wait for each reply part; if -1
+        use default.
+        @raise AssertionError if a reply part is missing or is not a
+        stats reply
+        """
+        replies = self.transact_multipart_replies(msg, timeout)
+        try:
+            for reply in replies:
+                for entry in materialize(reply).entries:
+                    yield entry
+        finally:
+            replies.close()
+
+    def transact_multipart_replies(self, msg, timeout=-1):
+        """
+        Generator yielding the reply parts to a multipart request
+
+        Like transact_multipart, but each reply part is yielded as
+        received, possibly as a LazyMessage that has not been parsed.
+        Decoders that work on the raw bytes (see oftest.columnar) use
+        this to avoid building loxi objects.
+
+        @param msg The stats/multipart request message object to send
+        @param timeout Maximum seconds to wait for each reply part; if -1
+        use default.
+        @raise AssertionError if a reply part is missing or is not a
+        stats reply
+        """
+
         if msg.xid == None:
             msg.xid = ofutils.gen_xid()
 
-        self.logger.debug("Running transaction %d" % msg.xid)
-
-        with self.xid_cv:
-            if self.xid:
-                self.logger.error("Can only run one transaction at a time")
-                return (None, None)
+        txn = MultipartTransaction(msg.xid)
+        with self.xid_lock:
+            if msg.xid in self.transactions:
+                raise AssertionError("Transaction %d already outstanding" % msg.xid)
+            self.transactions[msg.xid] = txn
 
-            self.xid = msg.xid
-            self.xid_response = None
+        try:
             self.message_send(msg)
+        except:
+            with self.xid_lock:
+                self.transactions.pop(msg.xid, None)
+            raise
 
-            self.logger.debug("Waiting for transaction %d" % msg.xid)
-            ofutils.timed_wait(self.xid_cv, lambda: self.xid_response, timeout=timeout)
+        try:
+            while True:
+                (reply, pkt) = txn.next_part(timeout=timeout)
+                if reply is None:
+                    with self.xid_lock:
+                        if self.transactions.get(msg.xid) is txn:
+                            del self.transactions[msg.xid]
+                    raise AssertionError("No response to %s" % type(msg).__name__)
+                ofp = loxi.protocol(reply.version)
+                if reply.type != ofp.OFPT_STATS_REPLY:
+                    raise AssertionError("Received %s in response to %s" %
+                                         (message_class(reply).__name__, type(msg).__name__))
+                yield reply
+                if not multipart_more(reply):
+                    return
+        finally:
+            # The controller removes the transaction when the last part
+            # arrives; parts before that are dropped unparsed
+            txn.stop()
+
+    def stream(self, exp_msg, timeout=-1):
+        """
+        Generator yielding received messages of the given class or type
 
-            if self.xid_response:
-                (resp, pkt) = self.xid_response
-                self.xid_response = None
-            else:
-                (resp, pkt) = (None, None)
+        Yields queued messages first, then new ones as they arrive.  Stops
+        when no matching message arrives within timeout seconds.  Other
+        messages stay queued, so one thread can interleave several streams
+        and transactions.
 
-        if resp is None:
-            self.logger.warning("No response for xid " + str(self.xid))
-        return (resp, pkt)
+        @param exp_msg The message class or type to receive (see poll)
+        @param timeout Maximum seconds to wait for each message; if -1 use
+        default.
+        """
+
+        while True:
+            (msg, pkt) = self.poll(exp_msg, timeout=timeout)
+            if msg is None:
+                return
+            yield msg
 
     def message_send(self, msg):
         """
@@ -667,16 +1321,20 @@ class Controller(Thread):
         """
 
         if not self.switch_socket:
-            # Sending a string indicates the message is ready to go
             raise Exception("no socket")
 
-        if msg.xid == None:
-            msg.xid = ofutils.gen_xid()
+        if isinstance(msg, str):
+            # Sending a string indicates the message is ready to go
+            outpkt = msg
+            self.logger.debug("Msg out: raw len %d", len(outpkt))
+        else:
+            if msg.xid == None:
+                msg.xid = ofutils.gen_xid()
 
-        outpkt = msg.pack()
+            outpkt = msg.pack()
 
-        self.logger.debug("Msg out: version %d class %s len %d xid %d",
-                          msg.version, type(msg).__name__, len(outpkt), msg.xid)
+            self.logger.debug("Msg out: version %d class %s len %d xid %d",
+                              msg.version, type(msg).__name__, len(outpkt), msg.xid)
 
         with self.tx_lock:
             if self.switch_socket.sendall(outpkt) is not None:
@@ -684,14 +1342,122 @@ class Controller(Thread):
 
         return 0 # for backwards compatibility
 
+    def message_send_bulk(self, msgs, barrier_interval=BULK_BARRIER_INTERVAL,
+                          window=BULK_BARRIER_WINDOW, timeout=-1):
+        """
+        Send many messages (typically flow-mods) without a round trip each
+
+        Messages are packed into large writes.  A barrier request follows
+        every barrier_interval messages, and at most window barriers are
+        left unanswered before waiting on the oldest one.  A final barrier
+        ensures every message has been processed on return.
+
+        @param msgs An iterable of OpenFlow message objects or packed
+        message strings (see oftest.template)
+        @param barrier_interval Number of messages between barriers
+        @param window Maximum number of outstanding barriers
+        @param timeout Timeout for each barrier reply; if -1 use default.
+        @retval A list of the messages received in reply to msgs (error
+        messages), in arrival order
+        @raise AssertionError if a barrier reply is not received
+        """
+
+        if not self.switch_socket:
+            raise Exception("no socket")
+
+        errors = ErrorCollector()
+        barriers = deque()
+        xids = []
+        chunk = []
+        chunk_len = 0
+        count = 0
+        version = None
+
+        try:
+            for msg in msgs:
+                if isinstance(msg, str):
+                    outpkt = msg
+                    (version, _, _, xid) = struct.unpack_from("!BBHL", outpkt)
+                else:
+                    if msg.xid == None:
+                        msg.xid = ofutils.gen_xid()
+                    version = msg.version
+                    xid = msg.xid
+                    outpkt = msg.pack()
+                with self.xid_lock:
+                    if self.transactions.setdefault(xid, errors) is errors:
+                        xids.append(xid)
+                chunk.append(outpkt)
+                chunk_len += len(outpkt)
+                count += 1
+
+                if count % barrier_interval == 0:
+                    barriers.append(self._bulk_barrier(version, chunk))
+                    self._send_raw("".join(chunk))
+                    chunk = []
+                    chunk_len = 0
+                    while len(barriers) > window:
+                        self._bulk_barrier_wait(barriers.popleft(), timeout)
+                elif chunk_len >= BULK_WRITE_SIZE:
+                    self._send_raw("".join(chunk))
+                    chunk = []
+                    chunk_len = 0
+
+            if version is not None:
+                barriers.append(self._bulk_barrier(version, chunk))
+                self._send_raw("".join(chunk))
+            while barriers:
+                self._bulk_barrier_wait(barriers.popleft(), timeout)
+        finally:
+            with self.xid_lock:
+                for xid in xids:
+                    if self.transactions.get(xid) is errors:
+                        del self.transactions[xid]
+                for txn in barriers:
+                    self.transactions.pop(txn.xid, None)
+
+        self.logger.debug("Bulk send of %d messages, %d errors",
+                          count, len(errors.responses))
+        return [materialize(msg) for (msg, pkt) in errors.responses]
+
+    def _bulk_barrier(self, version, chunk):
+        """
+        Append a barrier request to chunk and register its transaction
+        """
+        barrier = loxi.protocol(version).message.barrier_request()
+        barrier.xid = ofutils.gen_xid()
+        txn = Transaction(barrier.xid)
+        with self.xid_lock:
+            self.transactions[barrier.xid] = txn
+        chunk.append(barrier.pack())
+        return txn
+
+    def _bulk_barrier_wait(self, txn, timeout):
+        (resp, pkt) = self.transact_wait(txn, timeout=timeout)
+        if resp is None:
+            raise AssertionError("barrier failed")
+
+    def _send_raw(self, outpkt):
+        """
+        Send already packed message bytes to the switch
+        """
+        if not self.switch_socket:
+            raise Exception("no socket")
+
+        self.logger.debug("Raw out: len %d", len(outpkt))
+
+        with self.tx_lock:
+            if self.switch_socket.sendall(outpkt) is not None:
+                raise AssertionError("failed to send message to switch")
+
     def clear_queue(self):
         """
         Clear the input queue and report the number of messages
         that were in it
         """
-        enqueued_pkt_count = len(self.packets)
         with self.packets_cv:
-            self.packets = []
+            enqueued_pkt_count = len(self.packets)
+            self.packets.clear()
         return enqueued_pkt_count
 
     def __str__(self):
@@ -699,6 +1465,7 @@ class Controller(Thread):
         string += "  state           " + self.dbg_state + "\n"
         string += "  switch_addr     " + str(self.switch_addr) + "\n"
         string += "  pending pkts    " + str(len(self.packets)) + "\n"
+        string += "  pending xacts   " + str(len(self.transactions)) + "\n"
         string += "  total pkts      " + str(self.packets_total) + "\n"
         string += "  expired pkts    " + str(self.packets_expired) + "\n"
         string += "  handled pkts    " + str(self.packets_handled) + "\n"
@@ -717,6 +1484,256 @@ class Controller(Thread):
     def show(self):
         print str(self)
 
+class SwitchSession(Controller):
+    """
+    One switch connection of a MultiController
+
+    Offers the same interface as Controller (message_send, transact, poll,
+    register, counters, ...) for a single switch, but has no thread of its
+    own: the owning MultiController reads from its socket.
+
+    @var dpid The datapath ID from the switch's features reply, or None
+    until it has been received
+    @var features The features reply message
+    """
+
+    def __init__(self, parent, sock, addr):
+        self.parent = parent
+        Controller.__init__(self, switch=addr[0], host=parent.host,
+                            port=addr[1], max_pkts=parent.max_pkts)
+        self.dpid = None
+        self.features = None
+        self.logger = logging.getLogger("controller.session")
+
+        self.keep_alive = True
+        self.dbg_state = "running"
+        self.switch_socket = sock
+        self.switch_addr = addr
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, True)
+        self.poller.register(sock)
+
+    def _event_loop_init(self):
+        # Share the parent's event loop
+        self.poller = self.parent.poller
+        self.waker = self.parent.waker
+
+    def handshake(self):
+        """
+        Send hello and a features request; the reply sets the DPID
+        """
+        if self.initial_hello:
+            self.message_send(cfg_ofp.message.hello())
+        self.transact_start(cfg_ofp.message.features_request(),
+                            callback=self._features_reply)
+
+    def _features_reply(self, response):
+        if response is None:
+            return
+        self.features = materialize(response[0])
+        self.dpid = self.features.datapath_id
+        self.logger = logging.getLogger("controller.%016x" % self.dpid)
+        self.parent._session_ready(self)
+
+    def start(self):
+        pass
+
+    def run(self):
+        pass
+
+    def join(self, timeout=None):
+        pass
+
+    def connect(self, timeout=-1):
+        return self.switch_socket is not None
+
+    def disconnect(self, timeout=-1):
+        Controller.disconnect(self)
+        self.parent._session_closed(self)
+
+    def kill(self):
+        self.shutdown()
+
+    def shutdown(self):
+        sock = self.switch_socket
+        Controller.shutdown(self)
+        if sock:
+            sock.close()
+        self.parent._session_closed(self)
+
+    def __str__(self):
+        string = Controller.__str__(self)
+        if self.dpid is not None:
+            string += "  dpid            %016x\n" % self.dpid
+        return string
+
+class MultiController(Thread):
+    """
+    Controller accepting any number of switch connections
+
+    A single thread listens for connections and reads from every switch
+    socket.  Each connection gets a SwitchSession with its own message
+    queue, handlers, transaction table and counters.  Once the switch has
+    answered the features request the session can be looked up by DPID.
+
+    @var sessions Map from DPID to SwitchSession
+    """
+
+    def __init__(self, host='0.0.0.0', port=6653, max_pkts=1024):
+        Thread.__init__(self)
+        self.host = host
+        self.port = port
+        self.max_pkts = max_pkts
+        self.active = True
+        self.logger = logging.getLogger("controller")
+
+        self.waker = ofutils.EventDescriptor()
+        self.poller = ofutils.EventPoller()
+        self.poller.register(self.waker)
+
+        # Protected by sessions_cv
+        self.sessions = {}
+        self.connections = {}
+        self.sessions_cv = Condition()
+
+        self.logger.info("Create/listen at " + self.host + ":" +
+                         str(self.port))
+        self.listen_socket = listen_socket(self.host, self.port,
+                                           MULTI_LISTEN_QUEUE_SIZE)
+        self.poller.register(self.listen_socket)
+
+    def run(self):
+        """
+        Activity function for class
+
+        Accepts switch connections and dispatches input on every switch
+        socket to its session until killed.
+        """
+        while self.active:
+            try:
+                sel_in, sel_err = self.poller.poll(1)
+            except:
+                self.logger.error("Select error: %s", sys.exc_info()[1])
+                continue
+
+            for s in sel_err:
+                session = self.connections.get(s)
+                if session:
+                    self.logger.error("Got socket error on %s, disconnecting",
+                                      session.switch_addr)
+                    session.disconnect()
+
+            for s in sel_in:
+                if s == self.waker:
+                    self.waker.wait()
+                elif s == self.listen_socket:
+                    self._accept()
+                else:
+                    session = self.connections.get(s)
+                    if session and session._socket_ready_handle(s) == -1:
+                        session.disconnect()
+
+        self.logger.info("Exiting controller thread")
+        self.shutdown()
+
+    def _accept(self):
+        try:
+            (sock, addr) = self.listen_socket.accept()
+        except:
+            self.logger.warning("Error on listen socket accept")
+            return
+        self.logger.info(self.host+":"+str(self.port)+": Incoming connection from "+str(addr))
+        session = SwitchSession(self, sock, addr)
+        with self.sessions_cv:
+            self.connections[sock] = session
+        session.handshake()
+
+    def _session_ready(self, session):
+        with self.sessions_cv:
+            old = self.sessions.get(session.dpid)
+            self.sessions[session.dpid] = session
+            self.sessions_cv.notify_all()
+        self.logger.info("Switch %016x connected from %s", session.dpid,
+                         str(session.switch_addr))
+        if old and old is not session:
+            self.logger.warning("Switch %016x reconnected, dropping old session",
+                                session.dpid)
+            old.disconnect()
+
+    def _session_closed(self, session):
+        with self.sessions_cv:
+            for (sock, other) in self.connections.items():
+                if other is session:
+                    del self.connections[sock]
+            if self.sessions.get(session.dpid) is session:
+                del self.sessions[session.dpid]
+            self.sessions_cv.notify_all()
+
+    def session(self, dpid, timeout=-1):
+        """
+        Return the session for a switch, waiting for it to connect
+
+        @param dpid The datapath ID of the switch
+        @param timeout Block for up to timeout seconds. Pass -1 for the default.
+        @retval A SwitchSession, or None on timeout
+        """
+        with self.sessions_cv:
+            return ofutils.timed_wait(self.sessions_cv,
+                                      lambda: self.sessions.get(dpid),
+                                      timeout=timeout)
+
+    def wait_for_switches(self, count, timeout=-1):
+        """
+        Wait until at least count switches have completed the handshake
+
+        @param timeout Block for up to timeout seconds. Pass -1 for the default.
+        @retval The sorted list of connected DPIDs
+        """
+        with self.sessions_cv:
+            ofutils.timed_wait(self.sessions_cv,
+                               lambda: True if len(self.sessions) >= count else None,
+                               timeout=timeout)
+            return sorted(self.sessions.keys())
+
+    def wakeup(self):
+        """
+        Wake up the event loop, presumably from another thread.
+        """
+        self.waker.notify()
+
+    def kill(self):
+        """
+        Force the controller thread to quit
+        """
+        self.active = False
+        self.wakeup()
+        self.join()
+
+    def shutdown(self):
+        """
+        Close the listen socket and every switch connection
+        """
+        self.active = False
+        with self.sessions_cv:
+            sessions = self.connections.values()
+        for session in sessions:
+            session.shutdown()
+        if self.listen_socket:
+            self.poller.unregister(self.listen_socket)
+            self.listen_socket.close()
+            self.listen_socket = None
+        self.wakeup()
+
+    def __str__(self):
+        with self.sessions_cv:
+            sessions = self.sessions.items()
+        string = "MultiController:\n"
+        string += "  host            " + str(self.host) + "\n"
+        string += "  port            " + str(self.port) + "\n"
+        string += "  connections     " + str(len(self.connections)) + "\n"
+        for (dpid, session) in sorted(sessions):
+            string += "  %016x %s\n" % (dpid, str(session.switch_addr))
+        return string
+
 def sample_handler(controller, msg, pkt):
     """
     Sample message handler
@@ -20,11 +20,13 @@ import socket
 import time
 import select
 import logging
+from collections import deque
 from threading import Thread
 from threading import Lock
 from threading import Condition
 import ofutils
 import netutils
+import bpf
 from pcap_writer import PcapWriter
 
 if "linux" in sys.platform:
@@ -32,28 +34,31 @@ if "linux" in sys.platform:
 else:
     import pcap
 
-def match_exp_pkt(self, exp_pkt, pkt):
+# Ways an expected packet can match a received one
+MATCH_EXACT = "exact"       # identical, ignoring padding of short packets
+MATCH_PREFIX = "prefix"     # received packet starts with the expected one
+MATCH_CONTAINS = "contains" # expected packet appears anywhere in it
+MATCH_MODES = (MATCH_EXACT, MATCH_PREFIX, MATCH_CONTAINS)
+
+def match_exp_pkt(exp_pkt, pkt, mode=MATCH_CONTAINS):
     """
-    Compare the string value of pkt with the string value of exp_pkt,
-    and return True iff they are identical.  If the length of exp_pkt is
-    less than the minimum Ethernet frame size (60 bytes), then padding
-    bytes in pkt are ignored.
+    Compare the string value of pkt with the string value of exp_pkt.
+
+    In exact mode, return True iff they are identical.  If the length of
+    exp_pkt is less than the minimum Ethernet frame size (60 bytes), then
+    padding bytes in pkt are ignored.  Prefix mode also ignores any bytes
+    after exp_pkt, and contains mode any bytes before or after it, for NICs
+    that capture more than the frame.
     """
     e = str(exp_pkt)
     p = str(pkt)
-    if len(e) < 60:
+    if mode == MATCH_PREFIX:
+        return p.startswith(e)
+    elif mode == MATCH_CONTAINS:
+        return p.find(e) >= 0
+    if len(e) < 60 and len(p) <= 60:
         p = p[:len(e)]
-
-    #return e == p
-    #some nic card have capature problem, will have more bytes capatured.
-    if pkt.find(exp_pkt) >=0:
-        return True
-    else:      
-        if self.config["dump_packet"]:
-            self.logger.debug("rx pkt    ->"+(":".join("{:02x}".format(ord(c)) for c in pkt)))
-            self.logger.debug("expect pkt->"+(":".join("{:02x}".format(ord(c)) for c in exp_pkt)))
-
-        return False
+    return e == p
 
 
 class DataPlanePortLinux:
@@ -62,6 +67,7 @@ class DataPlanePortLinux:
     """
 
     RCV_SIZE_DEFAULT = 4096
+    RCV_BATCH_DEFAULT = 64
     ETH_P_ALL = 0x03
     RCV_TIMEOUT = 10000
 
@@ -75,6 +81,8 @@ class DataPlanePortLinux:
         self.socket.bind((interface_name, self.ETH_P_ALL))
         netutils.set_promisc(self.socket, interface_name)
         self.socket.settimeout(self.RCV_TIMEOUT)
+        self.receiver = afpacket.Receiver(self.RCV_SIZE_DEFAULT)
+        self.batch = None
 
     def __del__(self):
         if self.socket:
@@ -91,9 +99,21 @@ class DataPlanePortLinux:
         Receive a packet from this port.
         @retval (packet data, timestamp)
         """
-        pkt = afpacket.recv(self.socket, self.RCV_SIZE_DEFAULT)
+        pkt = self.receiver.recv(self.socket)
         return (pkt, time.time())
 
+    def recv_batch(self):
+        """
+        Receive the packets waiting on this port without blocking, up to
+        RCV_BATCH_DEFAULT of them.
+        @retval List of (packet data, timestamp)
+        """
+        if not self.batch:
+            self.batch = afpacket.RecvBatch(self.RCV_BATCH_DEFAULT,
+                                            self.RCV_SIZE_DEFAULT)
+        timestamp = time.time()
+        return [(pkt, timestamp) for pkt in self.batch.recv(self.socket)]
+
     def send(self, packet):
         """
         Send a packet out this port.
@@ -102,6 +122,16 @@ class DataPlanePortLinux:
         """
         return self.socket.send(packet)
 
+    def set_filter(self, insns):
+        """
+        Have the kernel drop received frames the BPF program rejects.
+        @param insns Program from oftest.bpf, or None to remove the filter
+        """
+        if insns is None:
+            afpacket.detach_filter(self.socket)
+        else:
+            afpacket.attach_filter(self.socket, insns)
+
     def down(self):
         """
         Bring the physical link down.
@@ -115,6 +145,48 @@ class DataPlanePortLinux:
         os.system("ifconfig up %s" % self.interface_name)
 
 
+class DataPlanePortLinuxRing(DataPlanePortLinux):
+    """
+    Receives through a memory-mapped TPACKET_V3 ring instead of a recvmsg
+    per packet. Select it with config["dataplane"]["portclass"].
+    """
+
+    def __init__(self, interface_name, port_number):
+        DataPlanePortLinux.__init__(self, interface_name, port_number)
+        self.ring = afpacket.RxRing(self.socket)
+
+    def __del__(self):
+        self.ring.close()
+        DataPlanePortLinux.__del__(self)
+
+    def recv(self):
+        """
+        Receive a packet from this port.
+        @retval (packet data, timestamp)
+        """
+        while True:
+            result = self.ring.recv()
+            if result:
+                return result
+            (sel_in, _, _) = select.select([self.socket], [], [], self.RCV_TIMEOUT)
+            if not sel_in:
+                raise socket.timeout("timed out")
+
+    def recv_batch(self):
+        """
+        Receive the packets ready in the ring, up to RCV_BATCH_DEFAULT of
+        them.
+        @retval List of (packet data, timestamp)
+        """
+        result = []
+        for i in range(self.RCV_BATCH_DEFAULT):
+            item = self.ring.recv()
+            if not item:
+                break
+            result.append(item)
+        return result
+
+
 class DataPlanePortPcap:
     """
     Alternate port implementation using libpcap. This is used by non-Linux
@@ -155,15 +227,28 @@ class DataPlane(Thread):
 
     MAX_QUEUE_LEN = 100
 
+    # Queued packets are indexed by this many leading bytes
+    INDEX_LEN = 42
+
     def __init__(self, config=None):
         Thread.__init__(self)
 
         # dict from port number to port object
         self.ports = {}
 
-        # dict from port number to list of (timestamp, packet)
+        # dict from port number to list of (packet, timestamp)
         self.packet_queues = {}
 
+        # dict from port number to a dict from the first INDEX_LEN bytes
+        # of queued packets to the deque of their sequence numbers.
+        # Only kept up to date once an exact or prefix poll has built it.
+        self.packet_index = {}
+        self.index_built = False
+
+        # dict from port number to the sequence number of the first
+        # packet in its queue, while the index is kept
+        self.packet_base = {}
+
         # cvar serves double duty as a regular top level lock and
         # as a condition variable
         self.cvar = Condition()
@@ -172,6 +257,10 @@ class DataPlane(Thread):
         self.waker = ofutils.EventDescriptor()
         self.killed = False
 
+        # Ports and waker watched by the event loop
+        self.poller = ofutils.EventPoller()
+        self.poller.register(self.waker)
+
         self.logger = logging.getLogger("dataplane")
         self.pcap_writer = None
 
@@ -180,6 +269,10 @@ class DataPlane(Thread):
         else:
             self.config = config; 
 
+        self.match_mode = self.config.get("packet_match", MATCH_CONTAINS)
+        if self.match_mode not in MATCH_MODES:
+            raise ValueError("invalid packet match mode %s" % self.match_mode)
+
         ############################################################
         #
         # The platform/config can provide a custom DataPlanePort class
@@ -190,6 +283,9 @@ class DataPlane(Thread):
         # where MyDataPlanePortClass has the same interface as the class
         # DataPlanePort defined here. 
         #
+        # On Linux, DataPlanePortLinuxRing receives through a TPACKET_V3
+        # ring and keeps up with higher packet rates.
+        #
         if "dataplane" in self.config and "portclass" in self.config["dataplane"]:
             self.dppclass = self.config["dataplane"]["portclass"]
         elif "linux" in sys.platform:
@@ -204,9 +300,8 @@ class DataPlane(Thread):
         Activity function for class
         """
         while not self.killed:
-            sockets = [self.waker] + self.ports.values()
             try:
-                sel_in, sel_out, sel_err = select.select(sockets, [], [], 1)
+                sel_in, sel_err = self.poller.poll(1)
             except:
                 print sys.exc_info()
                 self.logger.error("Select error, exiting")
@@ -218,19 +313,25 @@ class DataPlane(Thread):
                         self.waker.wait()
                         continue
                     else:
-                        # Enqueue packet
-                        pkt, timestamp = port.recv()
+                        # Enqueue packets, draining a burst at once from
+                        # ports that support it
+                        if hasattr(port, "recv_batch"):
+                            pkts = port.recv_batch()
+                        else:
+                            pkts = [port.recv()]
                         port_number = port._port_number
-                        self.logger.debug("Pkt len %d in on port %d",
-                                          len(pkt), port_number)
-                        if self.pcap_writer:
-                            self.pcap_writer.write(pkt, timestamp, port_number)
+                        for (pkt, timestamp) in pkts:
+                            self.logger.debug("Pkt len %d in on port %d",
+                                              len(pkt), port_number)
+                            if self.pcap_writer:
+                                self.pcap_writer.write(pkt, timestamp, port_number)
+                            self._enqueue(port_number, pkt, timestamp)
                         queue = self.packet_queues[port_number]
-                        if len(queue) >= self.MAX_QUEUE_LEN:
+                        if len(queue) > self.MAX_QUEUE_LEN:
                             # Queue full, throw away oldest
-                            queue.pop(0)
-                            self.logger.debug("Discarding oldest packet to make room")
-                        queue.append((pkt, timestamp))
+                            while len(queue) > self.MAX_QUEUE_LEN:
+                                self._dequeue(port_number)
+                            self.logger.debug("Discarding oldest packets to make room")
                 self.cvar.notify_all()
 
         self.logger.info("Thread exit")
@@ -244,7 +345,8 @@ class DataPlane(Thread):
         """
         self.ports[port_number] = self.dppclass(interface_name, port_number)
         self.ports[port_number]._port_number = port_number
-        self.packet_queues[port_number] = []
+        self._clear(port_number)
+        self.poller.register(self.ports[port_number])
         # Need to wake up event loop to change the sockets being selected on.
         self.waker.notify()
 
@@ -264,6 +366,89 @@ class DataPlane(Thread):
                      (bytes, len(packet)))
         return bytes
 
+    def _enqueue(self, port_number, pkt, timestamp):
+        queue = self.packet_queues[port_number]
+        if self.index_built and len(pkt) >= self.INDEX_LEN:
+            seq = self.packet_base[port_number] + len(queue)
+            index = self.packet_index[port_number]
+            index.setdefault(pkt[:self.INDEX_LEN], deque()).append(seq)
+        queue.append((pkt, timestamp))
+
+    def _dequeue(self, port_number):
+        (pkt, timestamp) = self.packet_queues[port_number].pop(0)
+        if self.index_built:
+            self.packet_base[port_number] += 1
+            if len(pkt) >= self.INDEX_LEN:
+                # The oldest packet is first among those sharing its key
+                index = self.packet_index[port_number]
+                key = pkt[:self.INDEX_LEN]
+                index[key].popleft()
+                if not index[key]:
+                    del index[key]
+        return (pkt, timestamp)
+
+    def _clear(self, port_number):
+        self.packet_queues[port_number] = []
+        if self.index_built:
+            self.packet_index[port_number] = {}
+            self.packet_base[port_number] = 0
+
+    def _build_index(self):
+        """
+        Index the packets already queued; from then on the index is kept
+        up to date as packets are queued and dequeued
+        """
+        for (port_number, queue) in self.packet_queues.items():
+            index = {}
+            for (seq, (pkt, _)) in enumerate(queue):
+                if len(pkt) >= self.INDEX_LEN:
+                    index.setdefault(pkt[:self.INDEX_LEN], deque()).append(seq)
+            self.packet_index[port_number] = index
+            self.packet_base[port_number] = 0
+        self.index_built = True
+
+    def _grab_indexed(self, port_number, exp):
+        """
+        Dequeue the oldest packet matching exp, looked up by its first
+        INDEX_LEN bytes, discarding the packets received before it as a
+        scan with packets() would.
+        """
+        if not self.index_built:
+            self._build_index()
+
+        if port_number:
+            port_numbers = [port_number]
+        else:
+            port_numbers = self.packet_queues.keys()
+
+        key = exp[:self.INDEX_LEN]
+        found = None
+        for rcv_port_number in port_numbers:
+            queue = self.packet_queues[rcv_port_number]
+            base = self.packet_base[rcv_port_number]
+            for seq in self.packet_index[rcv_port_number].get(key, ()):
+                (pkt, time) = queue[seq - base]
+                if match_exp_pkt(exp, pkt, self.match_mode):
+                    if not found or time < found[2]:
+                        found = (rcv_port_number, seq, time)
+                    break
+
+        if not found:
+            for rcv_port_number in port_numbers:
+                self._clear(rcv_port_number)
+            return None
+
+        (rcv_port_number, seq, time) = found
+        for other_port_number in port_numbers:
+            queue = self.packet_queues[other_port_number]
+            if other_port_number != rcv_port_number:
+                while queue and queue[0][1] < time:
+                    self._dequeue(other_port_number)
+        while self.packet_base[rcv_port_number] < seq:
+            self._dequeue(rcv_port_number)
+        (pkt, time) = self._dequeue(rcv_port_number)
+        return (rcv_port_number, pkt, time)
+
     def oldest_port_number(self):
         """
         Returns the port number with the oldest packet, or
@@ -294,7 +479,7 @@ class DataPlane(Thread):
                 self.logger.debug("Out of packets on port %d", rcv_port_number)
                 break
 
-            pkt, time = queue.pop(0)
+            pkt, time = self._dequeue(rcv_port_number)
             yield (rcv_port_number, pkt, time)
 
     def poll(self, port_number=None, timeout=-1, exp_pkt=None):
@@ -305,7 +490,12 @@ class DataPlane(Thread):
         Otherwise, find the port with the oldest packet and return
         that packet.
 
-        If exp_pkt is true, discard all packets until that one is found
+        If exp_pkt is true, discard all packets until that one is found.
+        Packets match as set by config["packet_match"] (see
+        match_exp_pkt); except in contains mode, a packet of at least
+        INDEX_LEN bytes is looked up by hash instead of by a scan.  The
+        index is built by the first such poll, so the receive path only
+        maintains it once it is used.
 
         @param port_number If set, get packet from this port
         @param timeout If positive and no packet is available, block
@@ -321,13 +511,25 @@ class DataPlane(Thread):
         if exp_pkt and not port_number:
             self.logger.warn("Dataplane poll with exp_pkt but no port number")
 
+        exp = exp_pkt and str(exp_pkt)
+        indexed = exp and self.match_mode != MATCH_CONTAINS and \
+            len(exp) >= self.INDEX_LEN
+
         # Retrieve the packet. Returns (port number, packet, time).
         def grab():
             self.logger.debug("Grabbing packet")
+            if indexed:
+                ret = self._grab_indexed(port_number, exp)
+                if not ret:
+                    self.logger.debug("Did not find packet")
+                return ret
             for (rcv_port_number, pkt, time) in self.packets(port_number):
                 self.logger.debug("Checking packet from port %d", rcv_port_number)
-                if not exp_pkt or match_exp_pkt(self, exp_pkt, pkt):
+                if not exp or match_exp_pkt(exp, pkt, self.match_mode):
                     return (rcv_port_number, pkt, time)
+                if self.config.get("dump_packet"):
+                    self.logger.debug("rx pkt    ->"+(":".join("{:02x}".format(ord(c)) for c in pkt)))
+                    self.logger.debug("expect pkt->"+(":".join("{:02x}".format(ord(c)) for c in exp)))
             self.logger.debug("Did not find packet")
             return None
 
@@ -347,6 +549,9 @@ class DataPlane(Thread):
         self.killed = True
         self.waker.notify()
         self.join()
+        for port in self.ports.values():
+            self.poller.unregister(port)
+        self.poller.close()
         # Explicitly release ports to ensure we don't run out of sockets
         # even if someone keeps holding a reference to the dataplane.
         del self.ports
@@ -359,12 +564,35 @@ class DataPlane(Thread):
         """Brings the specified port up"""
         self.ports[port_number].up()
 
+    def port_filter(self, port_number, filt):
+        """
+        Filter the packets received on a port in the kernel
+
+        Only frames accepted by the filter are queued; others never reach
+        the dataplane thread, so they cannot push expected packets out of
+        the queue.
+
+        @param port_number The port to filter
+        @param filt A bpf.compile_expr expression string, a program from
+        bpf.compile_expr or bpf.from_packet, or None to receive everything
+        @retval True if the filter was set, False if the port class does
+        not support filters
+        """
+        port = self.ports[port_number]
+        if not hasattr(port, "set_filter"):
+            self.logger.debug("Port %d does not support filters", port_number)
+            return False
+        if isinstance(filt, str):
+            filt = bpf.compile_expr(filt)
+        port.set_filter(filt)
+        return True
+
     def flush(self):
         """
         Drop any queued packets.
         """
         for port_number in self.packet_queues.keys():
-            self.packet_queues[port_number] = []
+            self._clear(port_number)
 
     def start_pcap(self, filename):
         assert(self.pcap_writer == None)
@@ -637,7 +637,6 @@ def flow_msg_create(parent, pkt, ing_port=0, match_fields=None, instruction_list
     if egr_queue is not None:
         parent.assertTrue(egr_port is not None, "Egress port not set")
         act = ofp.action.set_queue()
-        act.port = egr_port
         act.queue_id = egr_queue
         action_list.append(act)
     elif egr_port is not None:
@@ -1494,7 +1493,7 @@ def flow_stats_get(parent, match_fields = None):
     request.out_group = ofp.OFPG_ANY
     request.table_id = 0xff
     if match_fields != None:
-        request.match_fields = match_fields
+        request.match = match_fields
     response, _ = parent.controller.transact(request, timeout=2)
     parent.assertTrue(response is not None, "Did not get response")
     parent.assertTrue(isinstance(response,ofp.message.flow_stats_reply),
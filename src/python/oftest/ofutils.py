@@ -7,7 +7,9 @@ import random
 import time
 import os
 import fcntl
+import select
 import logging
+from threading import Lock
 
 default_timeout = None # set by oft
 default_negative_timeout = None # set by oft
@@ -62,3 +64,76 @@ class EventDescriptor():
 
     def fileno(self):
         return self.pipe_rd
+
+class EventPoller():
+    """
+    Waits for any of a set of registered objects to become readable.
+
+    Objects (sockets, ports, EventDescriptors) only need a fileno() method.
+    They are registered once instead of being passed on every wait, and
+    epoll is used when available so the cost of a wakeup does not grow
+    with the number of objects.  Falls back to select() elsewhere.
+    """
+
+    def __init__(self):
+        self.lock = Lock()
+        self.objs = {} # fd -> obj
+        self.fds = {} # obj -> fd
+        if hasattr(select, "epoll"):
+            self.epoll = select.epoll()
+        else:
+            self.epoll = None
+
+    def register(self, obj):
+        """
+        Start watching obj.  Must be unregistered before it is closed.
+        """
+        fd = obj.fileno()
+        with self.lock:
+            self.objs[fd] = obj
+            self.fds[obj] = fd
+        if self.epoll:
+            self.epoll.register(fd, select.EPOLLIN | select.EPOLLPRI)
+
+    def unregister(self, obj):
+        """
+        Stop watching obj.  Does nothing if obj is not registered.
+        """
+        with self.lock:
+            fd = self.fds.pop(obj, None)
+            if fd is None:
+                return
+            del self.objs[fd]
+        if self.epoll:
+            try:
+                self.epoll.unregister(fd)
+            except (IOError, ValueError):
+                pass
+
+    def poll(self, timeout):
+        """
+        Wait up to timeout seconds for registered objects to be ready.
+
+        @retval A pair (readable, errored) of lists of registered objects
+        """
+        if not self.epoll:
+            with self.lock:
+                objs = self.objs.values()
+            readable, _, errored = select.select(objs, [], objs, timeout)
+            return (readable, errored)
+
+        readable = []
+        errored = []
+        for fd, events in self.epoll.poll(timeout):
+            obj = self.objs.get(fd)
+            if obj is None:
+                continue
+            if events & select.EPOLLERR:
+                errored.append(obj)
+            else:
+                readable.append(obj)
+        return (readable, errored)
+
+    def close(self):
+        if self.epoll:
+            self.epoll.close()
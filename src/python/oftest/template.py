@@ -0,0 +1,224 @@
+"""
+Message templates for high-rate sends
+
+A MessageTemplate packs a message once and records where its patchable
+fields are in the packed bytes. New messages are produced by writing the
+new field values over those bytes, without building or packing a loxi
+object per message:
+
+    tmpl = MessageTemplate(ofp.message.flow_add(...),
+                           {'prio': 'priority', 'dst': 'match.eth_dst'})
+    for i in range(n):
+        controller.message_send(tmpl.pack(xid=i, prio=i, dst=macs[i]))
+
+Fields are named by attribute paths from the message, optionally with
+list indices (e.g. 'match.oxm_list[0].value' or 'actions[0].port'). The
+xid is always patchable. Offsets are found by packing the message with
+the field set to all zero and all one bits and comparing the results, so
+any fixed-size integer, MAC address or IPv6 address field whose value does
+not change the message length can be patched.
+
+pack_batch() encodes many messages at once from columns of field values:
+
+    buf = tmpl.pack_batch(prio=range(n), dst=macs)
+    controller.message_send(buf)
+
+The template is copied n times into one buffer and each column is packed
+in a single struct call, then scattered into the copies with one strided
+slice assignment per byte of the field, so the per-message work happens in
+C rather than in Python.
+"""
+
+import re
+import struct
+
+_path_part = re.compile(r"^(\w+)(?:\[(\d+)\])?$")
+
+_int_structs = {
+    1: struct.Struct("!B"),
+    2: struct.Struct("!H"),
+    4: struct.Struct("!L"),
+    8: struct.Struct("!Q"),
+}
+
+class _Accessor(object):
+    """
+    Get and set the value at an attribute path below a message
+    """
+
+    def __init__(self, msg, path):
+        parts = []
+        for part in path.split('.'):
+            m = _path_part.match(part)
+            if not m:
+                raise ValueError("invalid field path %r" % path)
+            parts.append((m.group(1), m.group(2) and int(m.group(2))))
+        obj = msg
+        for (name, index) in parts[:-1]:
+            obj = getattr(obj, name)
+            if index is not None:
+                obj = obj[index]
+        (self.name, self.index) = parts[-1]
+        self.obj = obj
+
+    def get(self):
+        value = getattr(self.obj, self.name)
+        if self.index is not None:
+            value = value[self.index]
+        return value
+
+    def set(self, value):
+        if self.index is not None:
+            getattr(self.obj, self.name)[self.index] = value
+        else:
+            setattr(self.obj, self.name, value)
+
+def _pack_with(msg, accessor, value):
+    accessor.set(value)
+    return msg.pack()
+
+def _sample_bytes(width):
+    """
+    A fixed value distinct from all zero and all one bits in every byte
+    """
+    return [(0x5a, 0xa5)[i % 2] for i in range(width)]
+
+def _locate(msg, path):
+    """
+    Find the offset and width of a field in the packed message
+
+    @retval (offset, width, struct), struct being None for MAC-style
+    lists of byte values and fixed-size byte strings
+    """
+    accessor = _Accessor(msg, path)
+    orig = accessor.get()
+    try:
+        if isinstance(orig, (list, str)):
+            width = len(orig)
+            st = None
+            if isinstance(orig, str):
+                convert = lambda x: str(bytearray(x))
+            else:
+                convert = list
+            low = _pack_with(msg, accessor, convert([0] * width))
+            high = _pack_with(msg, accessor, convert([0xff] * width))
+            sample = convert(_sample_bytes(width))
+        elif isinstance(orig, (int, long)):
+            for width in (8, 4, 2, 1):
+                try:
+                    high = _pack_with(msg, accessor, (1 << (8 * width)) - 1)
+                    break
+                except Exception:
+                    continue
+            else:
+                raise ValueError("field %s cannot be packed" % path)
+            st = _int_structs[width]
+            low = _pack_with(msg, accessor, 0)
+            sample = st.unpack(str(bytearray(_sample_bytes(width))))[0]
+        else:
+            raise ValueError("field %s is not an integer or byte string" % path)
+        check = _pack_with(msg, accessor, sample)
+    finally:
+        accessor.set(orig)
+
+    if len(low) != len(high):
+        raise ValueError("field %s changes the message length" % path)
+    diff = [i for i in range(len(low)) if low[i] != high[i]]
+    if not diff or diff[-1] - diff[0] + 1 != width:
+        raise ValueError("field %s is not a contiguous %d byte field" % (path, width))
+    offset = diff[0]
+
+    # The sample value must pack exactly as patching it in would
+    buf = bytearray(low)
+    _patch(buf, offset, width, st, sample)
+    if str(buf) != check:
+        raise ValueError("field %s cannot be patched in place" % path)
+    return (offset, width, st)
+
+def _patch(buf, offset, width, st, value):
+    if st is not None:
+        st.pack_into(buf, offset, value)
+    else:
+        if len(value) != width:
+            raise ValueError("expected %d bytes, got %d" % (width, len(value)))
+        buf[offset:offset+width] = bytearray(value)
+
+def _pack_column(width, st, values):
+    """
+    Pack a column of field values into consecutive big-endian bytes
+    """
+    if st is not None:
+        return struct.pack("!%d%s" % (len(values), st.format[-1]), *values)
+    packed = bytearray().join(bytearray(value) for value in values)
+    if len(packed) != width * len(values):
+        raise ValueError("expected %d bytes per value" % width)
+    return packed
+
+class MessageTemplate(object):
+    """
+    A packed message with patchable fields
+
+    @var buf The current message bytes
+    @var fields Map from field name to (offset, width, struct)
+    """
+
+    def __init__(self, msg, fields=()):
+        """
+        @param msg The message to pack; its xid must be set or is
+        treated as 0
+        @param fields A list of attribute paths, or a dict mapping names
+        to attribute paths
+        """
+        if msg.xid == None:
+            msg.xid = 0
+        self.version = msg.version
+        self.buf = bytearray(msg.pack())
+        self.fields = { 'xid': (4, 4, _int_structs[4]) }
+        if not isinstance(fields, dict):
+            fields = dict((path, path) for path in fields)
+        for (name, path) in fields.items():
+            self.fields[name] = _locate(msg, path)
+
+    def set(self, name, value):
+        """
+        Patch one field of the template
+        """
+        (offset, width, st) = self.fields[name]
+        _patch(self.buf, offset, width, st, value)
+
+    def pack(self, **values):
+        """
+        Patch the given fields and return the message bytes
+        """
+        for (name, value) in values.items():
+            self.set(name, value)
+        return str(self.buf)
+
+    def pack_batch(self, count=None, **columns):
+        """
+        Return the bytes of many messages built from columns of values
+
+        Message i is the template with every named field set to item i of
+        its column. Fields without a column keep their template value.
+        The template itself is not modified.
+
+        @param count Number of messages; defaults to the column length
+        @param columns Map from field name to a sequence of values
+        """
+        lengths = set(len(values) for values in columns.values())
+        if count is None:
+            if len(lengths) != 1:
+                raise ValueError("columns must have the same length")
+            count = lengths.pop()
+        elif lengths - set([count]):
+            raise ValueError("columns must have %d values" % count)
+
+        size = len(self.buf)
+        buf = self.buf * count
+        end = size * count
+        for (name, values) in columns.items():
+            (offset, width, st) = self.fields[name]
+            packed = _pack_column(width, st, values)
+            for i in range(width):
+                buf[offset+i:end:size] = packed[i::width]
+        return str(buf)
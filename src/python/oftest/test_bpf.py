@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+import unittest
+import bpf
+
+ACCEPT = (0x06, 0, 0, 0x40000)
+REJECT = (0x06, 0, 0, 0)
+
+# Instructions checking the prerequisites of IPv4 fields
+IPV4 = [(0x28, 0, 0, 12), (0x15, 1, 0, 0x0800), REJECT]
+UDP = IPV4 + [(0x30, 0, 0, 23), (0x15, 1, 0, 17), REJECT]
+TCP = IPV4 + [(0x30, 0, 0, 23), (0x15, 1, 0, 6), REJECT]
+
+# VLAN tag present, from the ancillary data
+VLAN_PRESENT = [(0x20, 0, 0, 0xfffff030), (0x15, 1, 0, 1), REJECT]
+
+class TestCompileExpr(unittest.TestCase):
+    def test_bytes(self):
+        expected = [
+            (0x20, 0, 0, 0), (0x15, 1, 0, 0x00010203), REJECT,
+            (0x28, 0, 0, 4), (0x15, 1, 0, 0x0405), REJECT,
+            ACCEPT,
+        ]
+        self.assertEquals(bpf.compile_expr("eth.dst == 00:01:02:03:04:05"),
+                          expected)
+
+    def test_masked(self):
+        expected = IPV4 + [
+            (0x30, 0, 0, 15), (0x54, 0, 0, 0xfc), (0x15, 1, 0, 0x20), REJECT,
+            ACCEPT,
+        ]
+        self.assertEquals(bpf.compile_expr("ip.tos & 0xfc == 0x20"), expected)
+        # Bits outside the mask are ignored
+        self.assertEquals(bpf.compile_expr("ip.tos & 0xfc == 0x23"), expected)
+
+    def test_masked_address(self):
+        expected = IPV4 + [
+            (0x20, 0, 0, 30), (0x54, 0, 0, 0xffffff00),
+            (0x15, 1, 0, 0x0a000100), REJECT,
+            ACCEPT,
+        ]
+        self.assertEquals(bpf.compile_expr("ip.dst & 0xffffff00 == 10.0.1.7"),
+                          expected)
+
+    def test_l4(self):
+        # X = IPv4 header length, then an indirect load from the L4 header
+        expected = UDP + [
+            (0xb1, 0, 0, 14), (0x48, 0, 0, 16), (0x15, 1, 0, 4789), REJECT,
+            ACCEPT,
+        ]
+        self.assertEquals(bpf.compile_expr("udp.dst == 4789"), expected)
+
+    def test_prereqs_once(self):
+        expected = UDP + [
+            (0xb1, 0, 0, 14), (0x48, 0, 0, 14), (0x15, 1, 0, 1234), REJECT,
+            (0xb1, 0, 0, 14), (0x48, 0, 0, 16), (0x15, 1, 0, 53), REJECT,
+            ACCEPT,
+        ]
+        self.assertEquals(bpf.compile_expr("udp.src == 1234 and udp.dst == 53"),
+                          expected)
+
+    def test_conflicting_prereqs(self):
+        # Both protocols are checked, so no frame is accepted
+        expected = TCP + [(0x30, 0, 0, 23), (0x15, 1, 0, 1), REJECT] + [
+            (0xb1, 0, 0, 14), (0x48, 0, 0, 16), (0x15, 1, 0, 80), REJECT,
+            (0xb1, 0, 0, 14), (0x50, 0, 0, 14), (0x15, 1, 0, 8), REJECT,
+            ACCEPT,
+        ]
+        self.assertEquals(bpf.compile_expr("tcp.dst == 80 and icmp.type == 8"),
+                          expected)
+
+    def test_vlan(self):
+        expected = VLAN_PRESENT + [
+            (0x20, 0, 0, 0xfffff02c), (0x54, 0, 0, 0xfff), (0x15, 1, 0, 10), REJECT,
+            ACCEPT,
+        ]
+        self.assertEquals(bpf.compile_expr("vlan.vid == 10"), expected)
+
+    def test_vlan_pcp(self):
+        expected = VLAN_PRESENT + [
+            (0x20, 0, 0, 0xfffff02c), (0x54, 0, 0, 0xe000), (0x15, 1, 0, 0xa000), REJECT,
+            ACCEPT,
+        ]
+        self.assertEquals(bpf.compile_expr("vlan.pcp == 5"), expected)
+
+    def test_vlan_masked(self):
+        expected = VLAN_PRESENT + [
+            (0x20, 0, 0, 0xfffff02c), (0x54, 0, 0, 0xff0), (0x15, 1, 0, 0x120), REJECT,
+            ACCEPT,
+        ]
+        self.assertEquals(bpf.compile_expr("vlan.vid & 0xff0 == 0x123"), expected)
+
+    def test_bad_term(self):
+        for expr in ["foo.bar == 1", "eth.type = 0x0800", "eth.type == 0x0800 or ip.proto == 6", ""]:
+            self.assertRaises(ValueError, bpf.compile_expr, expr)
+
+    def test_bad_value(self):
+        self.assertRaises(ValueError, bpf.compile_expr, "ip.proto == 256")
+        self.assertRaises(ValueError, bpf.compile_expr, "eth.dst == 00:01:02:03:04")
+
+    def test_mask_too_wide(self):
+        self.assertRaises(ValueError, bpf.compile_expr, "eth.dst & 0xff == 1")
+        self.assertRaises(ValueError, bpf.compile_expr,
+                          "ipv6.dst & 0xffff == ::1")
+
+    def test_too_long(self):
+        expr = " and ".join(["eth.dst == 00:01:02:03:04:05"] * 700)
+        self.assertRaises(ValueError, bpf.compile_expr, expr)
+
+class TestFromPacket(unittest.TestCase):
+    def test_untagged(self):
+        pkt = '\x00\x01\x02\x03\x04\x05\x00\x06\x07\x08\x09\x0a\x08\x00\x45'
+        expected = [
+            (0x20, 0, 0, 0), (0x15, 1, 0, 0x00010203), REJECT,
+            (0x20, 0, 0, 4), (0x15, 1, 0, 0x04050006), REJECT,
+            (0x20, 0, 0, 8), (0x15, 1, 0, 0x0708090a), REJECT,
+            (0x28, 0, 0, 12), (0x15, 1, 0, 0x0800), REJECT,
+            (0x30, 0, 0, 14), (0x15, 1, 0, 0x45), REJECT,
+            ACCEPT,
+        ]
+        self.assertEquals(bpf.from_packet(pkt), expected)
+        self.assertEquals(bpf.from_packet(pkt + 'payload', len(pkt)), expected)
+
+    def test_tagged(self):
+        # The tag is compared in the ancillary data, without the CFI bit,
+        # and the rest of the frame at its untagged offsets
+        pkt = '\x00\x01\x02\x03\x04\x05\x00\x06\x07\x08\x09\x0a' \
+              '\x81\x00\xb0\x0a\x08\x00'
+        expected = VLAN_PRESENT + [
+            (0x20, 0, 0, 0xfffff02c), (0x54, 0, 0, 0xefff), (0x15, 1, 0, 0xa00a), REJECT,
+            (0x20, 0, 0, 0), (0x15, 1, 0, 0x00010203), REJECT,
+            (0x20, 0, 0, 4), (0x15, 1, 0, 0x04050006), REJECT,
+            (0x20, 0, 0, 8), (0x15, 1, 0, 0x0708090a), REJECT,
+            (0x28, 0, 0, 12), (0x15, 1, 0, 0x0800), REJECT,
+            ACCEPT,
+        ]
+        self.assertEquals(bpf.from_packet(pkt), expected)
+
+    def test_too_long(self):
+        self.assertRaises(ValueError, bpf.from_packet, '\x00' * 6000)
+
+if __name__ == '__main__':
+    unittest.main()
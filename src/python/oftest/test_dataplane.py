@@ -0,0 +1,162 @@
+#!/usr/bin/env python
+import unittest
+import dataplane
+
+def frame(n, tail=''):
+    """
+    A 60 byte frame whose first INDEX_LEN bytes depend only on n
+    """
+    head = chr(n) * 6 + '\x00\x06\x07\x08\x09\x0a' + '\x08\x00'
+    head += chr(n) * (dataplane.DataPlane.INDEX_LEN - len(head))
+    return head + tail + '\x00' * (60 - len(head) - len(tail))
+
+class DataPlaneQueueTest(unittest.TestCase):
+    def setUp(self):
+        self.dps = []
+
+    def tearDown(self):
+        for dp in self.dps:
+            dp.kill()
+
+    def make(self, mode, ports=(1, 2)):
+        dp = dataplane.DataPlane({ "packet_match": mode })
+        self.dps.append(dp)
+        for port_number in ports:
+            dp._clear(port_number)
+        return dp
+
+    def check_index(self, dp):
+        """
+        Once the index is built, every queued frame of at least INDEX_LEN
+        bytes is indexed once, under its own key, in queue order
+        """
+        if not dp.index_built:
+            self.assertEquals(dp.packet_index, {})
+            return
+        for (port_number, queue) in dp.packet_queues.items():
+            base = dp.packet_base[port_number]
+            indexed = []
+            for (key, seqs) in dp.packet_index[port_number].items():
+                self.assertTrue(seqs)
+                self.assertEquals(sorted(seqs), list(seqs))
+                for seq in seqs:
+                    self.assertEquals(queue[seq - base][0][:dp.INDEX_LEN], key)
+                indexed.extend(seqs)
+            expected = [base + i for (i, (pkt, _)) in enumerate(queue)
+                        if len(pkt) >= dp.INDEX_LEN]
+            self.assertEquals(sorted(indexed), expected)
+
+    def remaining(self, dp):
+        return dict((port_number, [pkt for (pkt, _) in queue])
+                    for (port_number, queue) in dp.packet_queues.items())
+
+    def test_modes(self):
+        exp = frame(2)
+        longer = exp + 'fcs!'
+        shifted = '\x00\x00' + exp
+        expected = {
+            dataplane.MATCH_EXACT: (exp, []),
+            dataplane.MATCH_PREFIX: (longer, [shifted, exp]),
+            dataplane.MATCH_CONTAINS: (longer, [shifted, exp]),
+        }
+        for mode in dataplane.MATCH_MODES:
+            dp = self.make(mode)
+            for (i, pkt) in enumerate([frame(1), longer, shifted, exp]):
+                dp._enqueue(1, pkt, i)
+            (port_number, pkt, _) = dp.poll(1, timeout=0, exp_pkt=exp)
+            self.assertEquals(port_number, 1)
+            self.assertEquals(pkt, expected[mode][0])
+            self.assertEquals(self.remaining(dp)[1], expected[mode][1])
+            self.check_index(dp)
+
+    def test_contains_shifted(self):
+        exp = frame(2)
+        dp = self.make(dataplane.MATCH_CONTAINS)
+        dp._enqueue(1, frame(1), 0)
+        dp._enqueue(1, '\x00\x00' + exp, 1)
+        (port_number, pkt, _) = dp.poll(1, timeout=0, exp_pkt=exp)
+        self.assertEquals(pkt, '\x00\x00' + exp)
+        # Contains mode never reads the index, so never builds it
+        self.assertFalse(dp.index_built)
+        self.assertEquals(dp.packet_index, {})
+
+    def test_any_port(self):
+        exp = frame(2)
+        for mode in dataplane.MATCH_MODES:
+            dp = self.make(mode)
+            dp._enqueue(1, frame(1), 1)
+            dp._enqueue(1, exp, 3)
+            dp._enqueue(2, exp, 2)
+            dp._enqueue(2, frame(4), 4)
+            (port_number, pkt, time) = dp.poll(None, timeout=0, exp_pkt=exp)
+            self.assertEquals((port_number, pkt, time), (2, exp, 2))
+            # Only the packets received before the match are discarded
+            self.assertEquals(self.remaining(dp), { 1: [exp], 2: [frame(4)] })
+            self.check_index(dp)
+
+    def test_not_found(self):
+        for mode in dataplane.MATCH_MODES:
+            dp = self.make(mode)
+            dp._enqueue(1, frame(1), 1)
+            dp._enqueue(2, frame(3), 2)
+            self.assertEquals(dp.poll(None, timeout=0, exp_pkt=frame(2)),
+                              (None, None, None))
+            self.assertEquals(self.remaining(dp), { 1: [], 2: [] })
+            self.check_index(dp)
+
+    def test_eviction(self):
+        dp = self.make(dataplane.MATCH_PREFIX, ports=(1,))
+        dp._build_index()
+        count = dp.MAX_QUEUE_LEN + 10
+
+        def fill():
+            queue = dp.packet_queues[1]
+            for i in range(count):
+                dp._enqueue(1, frame(i % 5, str(i)), i)
+                # As the dataplane thread does when the queue is full
+                while len(queue) > dp.MAX_QUEUE_LEN:
+                    dp._dequeue(1)
+
+        fill()
+        self.assertEquals(len(dp.packet_queues[1]), dp.MAX_QUEUE_LEN)
+        self.assertEquals(dp.packet_base[1], count - dp.MAX_QUEUE_LEN)
+        self.check_index(dp)
+
+        # Frame 3 was evicted, although frames 13 and 18 share its key
+        self.assertEquals(dp.poll(1, timeout=0, exp_pkt=frame(3, '3')),
+                          (None, None, None))
+
+        fill()
+        (_, pkt, time) = dp.poll(1, timeout=0, exp_pkt=frame(3, '18'))
+        self.assertEquals(time, 18)
+        self.assertEquals(len(dp.packet_queues[1]), count - 19)
+        self.check_index(dp)
+
+    def test_short_frames(self):
+        short = frame(2)[:dataplane.DataPlane.INDEX_LEN - 2]
+        exp = frame(2)
+        dp = self.make(dataplane.MATCH_PREFIX, ports=(1,))
+        dp._enqueue(1, short, 0)
+        dp._enqueue(1, frame(1), 1)
+        dp._enqueue(1, exp, 2)
+        self.assertFalse(dp.index_built)
+
+        # A long expected packet builds the index and skips short frames
+        dp._build_index()
+        self.assertEquals(len(dp.packet_index[1]), 2)
+        self.check_index(dp)
+        (_, pkt, _) = dp.poll(1, timeout=0, exp_pkt=exp)
+        self.assertEquals(pkt, exp)
+        self.assertEquals(self.remaining(dp)[1], [])
+        self.assertEquals(dp.packet_index[1], {})
+
+        # A short expected packet is found by a scan
+        dp._enqueue(1, frame(1), 3)
+        dp._enqueue(1, short + 'ab', 4)
+        (_, pkt, _) = dp.poll(1, timeout=0, exp_pkt=short)
+        self.assertEquals(pkt, short + 'ab')
+        self.assertEquals(self.remaining(dp)[1], [])
+        self.check_index(dp)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+import unittest
+import template
+
+def flow_add(ofp, xid=0, prio=1000, mac=[0, 1, 2, 3, 4, 5], vid=10, ip=0x0a000001):
+    return ofp.message.flow_add(
+        xid=xid,
+        table_id=50,
+        priority=prio,
+        match=ofp.match([
+            ofp.oxm.eth_dst(mac),
+            ofp.oxm.vlan_vid(ofp.OFPVID_PRESENT | vid),
+            ofp.oxm.eth_type(0x0800),
+            ofp.oxm.ipv4_dst(ip),
+        ]),
+        instructions=[
+            ofp.instruction.apply_actions([ofp.action.output(port=7)]),
+        ],
+        buffer_id=ofp.OFP_NO_BUFFER)
+
+FIELDS = {
+    'prio': 'priority',
+    'mac': 'match.oxm_list[0].value',
+    'vid': 'match.oxm_list[1].value',
+    'ip': 'match.oxm_list[3].value',
+}
+
+class TestMessageTemplate(unittest.TestCase):
+    def setUp(self):
+        import loxi.of13 as ofp
+        self.ofp = ofp
+        self.tmpl = template.MessageTemplate(flow_add(ofp), FIELDS)
+
+    def values(self, i):
+        return dict(xid=i + 1, prio=i * 3, mac=[0x00, 0x11, 0x22, 0x33, i >> 8, i & 0xff],
+                    vid=self.ofp.OFPVID_PRESENT | (i & 0xfff), ip=0x0a000000 + i)
+
+    def expected(self, i):
+        v = self.values(i)
+        return flow_add(self.ofp, xid=v['xid'], prio=v['prio'], mac=v['mac'],
+                        vid=v['vid'] & 0xfff, ip=v['ip']).pack()
+
+    def test_fields(self):
+        self.assertEquals(sorted(self.tmpl.fields), ['ip', 'mac', 'prio', 'vid', 'xid'])
+        self.assertEquals(self.tmpl.fields['xid'][:2], (4, 4))
+        self.assertEquals(self.tmpl.fields['prio'][1], 2)
+        self.assertEquals(self.tmpl.fields['mac'][1:], (6, None))
+
+    def test_template(self):
+        self.assertEquals(str(self.tmpl.buf), flow_add(self.ofp).pack())
+
+    def test_pack(self):
+        for i in [0, 1, 255, 256, 4095]:
+            self.assertEquals(self.tmpl.pack(**self.values(i)), self.expected(i))
+
+    def test_pack_some(self):
+        # Fields not given keep their last value
+        self.tmpl.pack(**self.values(5))
+        expected = flow_add(self.ofp, xid=9, prio=15, mac=self.values(5)['mac'],
+                            vid=5, ip=0x0a000005).pack()
+        self.assertEquals(self.tmpl.pack(xid=9), expected)
+
+    def test_pack_batch(self):
+        n = 300
+        columns = {}
+        for name in ['xid', 'prio', 'mac', 'vid', 'ip']:
+            columns[name] = [self.values(i)[name] for i in range(n)]
+        buf = self.tmpl.pack_batch(**columns)
+        self.assertEquals(buf, ''.join(self.expected(i) for i in range(n)))
+        # The template is unchanged
+        self.assertEquals(str(self.tmpl.buf), flow_add(self.ofp).pack())
+
+    def test_pack_batch_partial(self):
+        buf = self.tmpl.pack_batch(3, xid=[7, 8, 9])
+        self.assertEquals(buf, ''.join(flow_add(self.ofp, xid=x).pack() for x in [7, 8, 9]))
+
+    def test_pack_batch_lengths(self):
+        self.assertRaises(ValueError, self.tmpl.pack_batch, xid=[1, 2], prio=[1])
+        self.assertRaises(ValueError, self.tmpl.pack_batch, 3, xid=[1, 2])
+        self.assertRaises(ValueError, self.tmpl.pack_batch, mac=[[1, 2, 3]])
+
+    def test_bad_field(self):
+        import loxi.of13 as ofp
+        self.assertRaises(ValueError, template.MessageTemplate,
+                          flow_add(ofp), ['match.oxm_list[0]'])
+        self.assertRaises(ValueError, template.MessageTemplate,
+                          flow_add(ofp), ['match.oxm_list[x]'])
+
+if __name__ == '__main__':
+    unittest.main()
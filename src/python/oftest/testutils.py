@@ -7,6 +7,7 @@ import re
 import packet as scapy
 
 import oftest
+import oftest.columnar
 import oftest.controller
 import oftest.dataplane
 import oftest.parse
@@ -803,7 +804,8 @@ def port_config_set(controller, port_no, config, mask):
         mod.hw_addr = hw_addr
     mod.config = config
     mod.mask = mask
-    mod.advertise = 0 # No change
+    if ofp.OFP_VERSION < 5:
+        mod.advertise = 0 # No change
     controller.message_send(mod)
     return 0
 
@@ -829,10 +831,10 @@ def receive_pkt_check(dp, pkt, yes_ports, no_ports, assert_if):
             port_number=ofport, exp_pkt=exp_pkt_arg)
         assert_if.assertTrue(rcv_pkt is not None, 
                              "Did not receive pkt on " + str(ofport))
-        if not oftest.dataplane.match_exp_pkt(pkt, rcv_pkt):
+        if not oftest.dataplane.match_exp_pkt(pkt, rcv_pkt, dp.match_mode):
             logging.debug("Expected %s" % format_packet(pkt))
             logging.debug("Received %s" % format_packet(rcv_pkt))
-        assert_if.assertTrue(oftest.dataplane.match_exp_pkt(pkt, rcv_pkt),
+        assert_if.assertTrue(oftest.dataplane.match_exp_pkt(pkt, rcv_pkt, dp.match_mode),
                              "Received packet does not match expected packet " +
                              "on port " + str(ofport))
     if len(no_ports) > 0:
@@ -1559,18 +1561,16 @@ def get_stats(test, req):
     """
     Retrieve a list of stats entries. Handles OFPSF_REPLY_MORE.
     """
-    msgtype = ofp.OFPT_STATS_REPLY
-    more_flag = ofp.OFPSF_REPLY_MORE
-    stats = []
-    reply, _ = test.controller.transact(req)
-    test.assertTrue(reply is not None, "No response to stats request")
-    test.assertEquals(reply.type, msgtype, "Response had unexpected message type")
-    stats.extend(reply.entries)
-    while reply.flags & more_flag != 0:
-        reply, pkt = test.controller.poll(exp_msg=msgtype)
-        test.assertTrue(reply is not None, "No response to stats request")
-        stats.extend(reply.entries)
-    return stats
+    return list(iter_stats(test, req))
+
+def iter_stats(test, req):
+    """
+    Yield stats entries as each reply part is received.
+
+    Continuation parts are matched by XID. Stopping early discards the
+    remaining parts.
+    """
+    return test.controller.transact_multipart(req)
 
 def get_flow_stats(test, match, table_id=None,
                    out_port=None, out_group=None,
@@ -1578,6 +1578,33 @@ def get_flow_stats(test, match, table_id=None,
     """
     Retrieve a list of flow stats entries.
     """
+    req = flow_stats_request_create(match, table_id, out_port, out_group,
+                                    cookie, cookie_mask)
+    return get_stats(test, req)
+
+def get_flow_stats_columns(test, match, table_id=None,
+                           out_port=None, out_group=None,
+                           cookie=0, cookie_mask=0):
+    """
+    Retrieve flow stats as an oftest.columnar.FlowStatsColumns.
+
+    The fixed fields of the entries are decoded into one array per field
+    without building flow_stats_entry objects; use this to check the
+    counters of large flow tables.
+    """
+    req = flow_stats_request_create(match, table_id, out_port, out_group,
+                                    cookie, cookie_mask)
+    columns = oftest.columnar.FlowStatsColumns(ofp.OFP_VERSION)
+    for reply in test.controller.transact_multipart_replies(req):
+        columns.add_reply(reply)
+    return columns
+
+def flow_stats_request_create(match, table_id=None,
+                              out_port=None, out_group=None,
+                              cookie=0, cookie_mask=0):
+    """
+    Create a flow stats request, filling in wildcard defaults.
+    """
 
     if table_id == None:
         if ofp.OFP_VERSION <= 2:
@@ -1603,7 +1630,7 @@ def get_flow_stats(test, match, table_id=None,
         req.cookie = cookie
         req.cookie_mask = cookie_mask
 
-    return get_stats(test, req)
+    return req
 
 def get_port_stats(test, port_no):
     """
@@ -1765,9 +1792,9 @@ def packet_in_match(msg, data, in_port=None, reason=None):
     if ofp.OFP_VERSION <= 2:
         pkt_in_port = msg.in_port
     else:
-        oxms = { type(oxm): oxm for oxm in msg.match.oxm_list }
-        if ofp.oxm.in_port in oxms:
-            pkt_in_port = oxms[ofp.oxm.in_port].value
+        in_port_oxm = msg.match.get(ofp.oxm.in_port)
+        if in_port_oxm != None:
+            pkt_in_port = in_port_oxm.value
         else:
             logging.warn("Missing in_port in packet-in message")
             pkt_in_port = None
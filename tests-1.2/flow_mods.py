@@ -28,10 +28,13 @@ class FlowMod_ModifyStrict(base_tests.SimpleProtocol):
         fm_orig = testutils.flow_msg_create(self, pkt, 
                                             ing_port=ing_port, 
                                             egr_port=out_port1)
-        fm_new = testutils.flow_msg_create(self, pkt, 
+        fm_add = testutils.flow_msg_create(self, pkt, 
                                             ing_port=ing_port, 
                                             egr_port=out_port2)
-        fm_new.command = ofp.OFPFC_MODIFY_STRICT
+        fm_new = ofp.message.flow_modify_strict(match=fm_add.match,
+                                                buffer_id=fm_add.buffer_id,
+                                                table_id=fm_add.table_id,
+                                                instructions=fm_add.instructions)
         rv = self.controller.message_send(fm_orig)
         self.assertEqual(rv, 0, "Failed to insert 1st flow_mod")
         testutils.do_barrier(self.controller)
@@ -43,11 +46,7 @@ class FlowMod_ModifyStrict(base_tests.SimpleProtocol):
                          "Expected only one flow_mod")
         stat = flow_stats.entries[0]
 
-        def canonicalize_match(match):
-            match.oxm_list.sort(key=lambda x: x.type_len)
-
-        canonicalize_match(stat.match)
-        canonicalize_match(fm_new.match)
+        # Match equality ignores the order of the OXMs
         self.assertEqual(stat.match, fm_new.match)
         self.assertEqual(stat.instructions, fm_new.instructions)
         # @todo consider adding more tests here
@@ -223,7 +223,6 @@ class MatchIPv6TCP(base_tests.SimpleDataPlane):
         # Add entry match 
 
         request = ofp.message.flow_add()
-        request.match.type = ofp.OFPMT_OXM
         port = ofp.oxm.in_port(of_ports[0])
         eth_type = ofp.oxm.eth_type(IPV6_ETHERTYPE)
         ipv6_src = ofp.oxm.ipv6_src(oftest.parse.parse_ipv6('fe80::2420:52ff:fe8f:5189'))
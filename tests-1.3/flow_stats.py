@@ -108,7 +108,7 @@ class AllFlowStats(base_tests.SimpleDataPlane):
             self.assertEqual(entry.hard_timeout, flow.hard_timeout)
             self.assertEqual(entry.flags, flow.flags)
             self.assertEqual(entry.cookie, flow.cookie)
-            self.assertEqual(sorted(entry.match.oxm_list), sorted(flow.match.oxm_list))
+            self.assertEqual(entry.match, flow.match)
             self.assertEqual(sorted(entry.instructions), sorted(flow.instructions))
 
         self.assertEqual(seen_cookies, set([1,2,3]))
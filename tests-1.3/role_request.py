@@ -244,7 +244,7 @@ class RolePermissions(base_tests.SimpleDataPlane):
 
         err_count = 0
         while self.controller.packets:
-            msg = self.controller.packets.pop(0)[0]
+            msg = self.controller.packets.popleft()[0]
             if msg.type == ofp.OFPT_ERROR:
                 self.assertEquals(msg.err_type, ofp.OFPET_BAD_REQUEST)
                 self.assertEquals(msg.code, ofp.OFPBRC_IS_SLAVE)
@@ -464,6 +464,31 @@ class Flow_Cfg:
             result = result + (", tcp_dst=%d" % self.match.tcp_dst)
         return result
 
+    def key(self):
+        """
+        Hashable flow key: the priority and a copy of the match with the
+        wildcarded fields cleared, so key_equal() flows have equal keys
+        """
+        match = copy.copy(self.match)
+        wildcards = match.wildcards
+        for (w, field, value) in [(ofp.OFPFW_IN_PORT, "in_port", 0),
+                                  (ofp.OFPFW_DL_DST, "eth_dst", [0] * 6),
+                                  (ofp.OFPFW_DL_SRC, "eth_src", [0] * 6),
+                                  (ofp.OFPFW_DL_VLAN, "vlan_vid", 0),
+                                  (ofp.OFPFW_DL_VLAN_PCP, "vlan_pcp", 0),
+                                  (ofp.OFPFW_DL_TYPE, "eth_type", 0),
+                                  (ofp.OFPFW_NW_TOS, "ip_dscp", 0),
+                                  (ofp.OFPFW_NW_PROTO, "ip_proto", 0),
+                                  (ofp.OFPFW_TP_SRC, "tcp_src", 0),
+                                  (ofp.OFPFW_TP_DST, "tcp_dst", 0)]:
+            if wildcard_get(wildcards, w):
+                setattr(match, field, value)
+        n = min(wildcard_get(wildcards, ofp.OFPFW_NW_SRC_MASK), 32)
+        match.ipv4_src &= ~((1 << n) - 1) & 0xffffffff
+        n = min(wildcard_get(wildcards, ofp.OFPFW_NW_DST_MASK), 32)
+        match.ipv4_dst &= ~((1 << n) - 1) & 0xffffffff
+        return (self.priority, match)
+
     def __eq__(self, x):
         return (self.key_equal(x) and self.non_key_equal(x))
 
@@ -551,7 +576,7 @@ class Flow_Cfg:
                 act.nw_addr = fi.rand_ip_addr()
             elif a == ofp.OFPAT_SET_NW_TOS:
                 act = ofp.action.set_nw_tos()
-                act.ip_dscp = fi.rand_ip_tos()
+                act.nw_tos = fi.rand_ip_tos()
             elif a == ofp.OFPAT_SET_TP_SRC:
                 act = ofp.action.set_tp_src()
                 act.tp_port = fi.rand_l4_port()
@@ -666,7 +691,7 @@ class Flow_Cfg:
                 self.actions.append(act)
             elif a == ofp.OFPAT_SET_NW_TOS:
                 act = ofp.action.set_nw_tos()
-                act.ip_dscp = fi.rand_ip_tos()
+                act.nw_tos = fi.rand_ip_tos()
                 self.actions.append(act)
             elif a == ofp.OFPAT_SET_TP_SRC:
                 act = ofp.action.set_tp_src()
@@ -1152,13 +1177,13 @@ class Flow_Tbl:
         self.clear()
 
     def find(self, f):
-        return self.dict.get(f.key_str(), None)
+        return self.dict.get(f.key(), None)
 
     def insert(self, f):
-        self.dict[f.key_str()] = f
+        self.dict[f.key()] = f
 
     def delete(self, f):
-        del self.dict[f.key_str()]
+        del self.dict[f.key()]
 
     def values(self):
         return self.dict.values()
@@ -20,10 +20,12 @@ import unittest
 
 from oftest import config
 import oftest.controller as controller
+import oftest.ofutils as ofutils
 import ofp
 import oftest.dataplane as dataplane
 import oftest.parse as parse
 import oftest.base_tests as base_tests
+from oftest.template import MessageTemplate
 import time
 
 from oftest.testutils import *
@@ -173,12 +175,12 @@ class PacketOutLoad(base_tests.SimpleDataPlane):
                act.port = dp_port
                msg.actions.append(act)
                msg.buffer_id = 0xffffffff
+               tmpl = MessageTemplate(msg)
 
                logging.info("PacketOutLoad to: " + str(dp_port))
                for count in range(100):
-                   msg.xid = xid
+                   self.controller.message_send(tmpl.pack(xid=xid))
                    xid += 1
-                   self.controller.message_send(msg)
                    out_count += 1
 
                exp_pkt_arg = None
@@ -196,7 +198,7 @@ class FlowModLoad(base_tests.SimpleProtocol):
         msg, pkt = self.controller.transact(ofp.message.barrier_request(), timeout=60)
         self.assertNotEqual(msg, None, "Barrier failed")
         while self.controller.packets:
-           msg = self.controller.packets.pop(0)[0]
+           msg = self.controller.packets.popleft()[0]
            self.assertNotEqual(msg.type, ofp.OFPT_ERROR, "Error received")
 
     def runTest(self):
@@ -208,21 +210,25 @@ class FlowModLoad(base_tests.SimpleProtocol):
 
         logging.info("Creating %d flow-mods messages", num_flows)
 
+        match = ofp.match()
+        match.wildcards = ofp.OFPFW_ALL & ~ofp.OFPFW_DL_VLAN & ~ofp.OFPFW_DL_DST
+        match.vlan_vid = ofp.OFP_VLAN_NONE
+        act = ofp.action.output()
+        act.port = ofp.OFPP_CONTROLLER
+        request = ofp.message.flow_add()
+        request.buffer_id = 0xffffffff
+        request.out_port = ofp.OFPP_NONE
+        request.match = match
+        request.actions.append(act)
+        tmpl = MessageTemplate(request, {'priority': 'priority',
+                                         'eth_dst': 'match.eth_dst'})
+
+        # Packed flow-mods, patched from the template
         requests = []
         for i in range(num_flows):
-            match = ofp.match()
-            match.wildcards = ofp.OFPFW_ALL & ~ofp.OFPFW_DL_VLAN & ~ofp.OFPFW_DL_DST
-            match.vlan_vid = ofp.OFP_VLAN_NONE
-            match.eth_dst = [0, 1, 2, 3, i / 256, i % 256]
-            act = ofp.action.output()
-            act.port = ofp.OFPP_CONTROLLER
-            request = ofp.message.flow_add()
-            request.buffer_id = 0xffffffff
-            request.priority = num_flows - i
-            request.out_port = ofp.OFPP_NONE
-            request.match = match
-            request.actions.append(act)
-            requests.append(request)
+            requests.append(tmpl.pack(xid=ofutils.gen_xid(),
+                                      priority=num_flows - i,
+                                      eth_dst=[0, 1, 2, 3, i / 256, i % 256]))
 
         for i in range(3):
             logging.info("Iteration %d: delete all flows" % i)
@@ -249,7 +255,7 @@ class FlowRemovedLoad(base_tests.SimpleDataPlane):
         msg, pkt = self.controller.transact(ofp.message.barrier_request(), timeout=60)
         self.assertNotEqual(msg, None, "Barrier failed")
         while self.controller.packets:
-           msg = self.controller.packets.pop(0)[0]
+           msg = self.controller.packets.popleft()[0]
            self.assertNotEqual(msg.type, ofp.OFPT_ERROR, "Error received")
 
     def runTest(self):
@@ -8,9 +8,11 @@ import logging
 
 import unittest
 import random
+import struct
 
 from oftest import config
 import oftest.controller as controller
+import oftest.ofutils as ofutils
 import ofp
 import oftest.dataplane as dataplane
 import oftest.parse as parse
@@ -34,9 +36,10 @@ class HelloWithBody(base_tests.SimpleDataPlane):
 
         #Send Hello message
         logging.info("Sending Hello...")
-        request = ofp.message.hello()
-        request.data = 'OpenFlow Will Rule The World'
-        self.controller.message_send(request)
+        request = ofp.message.hello(xid=ofutils.gen_xid())
+        body = 'OpenFlow Will Rule The World'
+        hdr = request.pack()
+        self.controller.message_send(hdr[:2] + struct.pack("!H", len(hdr) + len(body)) + hdr[4:] + body)
 
         #Verify Hello message in response 
         logging.info("Waiting for a Hello on the control plane with same xid,version--1.0.0 and data field empty")
@@ -94,9 +97,9 @@ class ErrorMsg(base_tests.SimpleProtocol):
 
         #Send Echo Request
         logging.info("Sending a Echo request with a version which is not supported by the switch")
-        request=ofp.message.echo_request()
-        request.version=0  
-        self.controller.message_send(request)
+        request=ofp.message.echo_request(xid=ofutils.gen_xid())
+        # version is a class constant; patch it in the packed message
+        self.controller.message_send('\x00' + request.pack()[1:])
 
         logging.info("Waiting for a OFPT_ERROR msg on the control plane...") 
         (response, pkt) = self.controller.poll(exp_msg=ofp.OFPT_ERROR,         
@@ -77,7 +77,7 @@ class RolePermissions(base_tests.SimpleDataPlane):
 
         err_count = 0
         while self.controller.packets:
-            msg = self.controller.packets.pop(0)[0]
+            msg = self.controller.packets.popleft()[0]
             if msg.type == ofp.OFPT_ERROR:
                 self.assertEquals(msg.err_type, ofp.OFPET_BAD_REQUEST)
                 self.assertEquals(msg.code, ofp.OFPBRC_EPERM)
@@ -170,7 +170,7 @@ class RoleSwitch(unittest.TestCase):
 
         err_count = 0
         while con.packets:
-            msg = con.packets.pop(0)[0]
+            msg = con.packets.popleft()[0]
             if msg.type == ofp.OFPT_ERROR:
                 self.assertEquals(msg.err_type, ofp.OFPET_BAD_REQUEST)
                 self.assertEquals(msg.code, ofp.OFPBRC_EPERM)
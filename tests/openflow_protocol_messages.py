@@ -240,7 +240,7 @@ class PacketOut(base_tests.SimpleDataPlane):
                 logging.info("PacketOut: got pkt from " + str(of_port))
                 if of_port is not None:
                     self.assertEqual(of_port, dp_port, "Unexpected receive port")
-                if not dataplane.match_exp_pkt(outpkt, pkt):
+                if not dataplane.match_exp_pkt(outpkt, pkt, self.dataplane.match_mode):
                     logging.debug("Sent %s" % format_packet(outpkt))
                     logging.debug("Resp %s" % format_packet(
                             str(pkt)[:len(str(outpkt))]))
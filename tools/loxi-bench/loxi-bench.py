@@ -0,0 +1,227 @@
+#!/usr/bin/env python
+"""
+Microbenchmarks for the loxi OpenFlow codec
+
+Measures pack() and parse_message() throughput on representative message
+corpora for each OpenFlow version, without a switch. Results can be saved
+as JSON and compared with a previous run.
+"""
+
+import os
+import sys
+import time
+import gc
+import json
+import argparse
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.realpath(__file__))))
+sys.path.insert(0, os.path.join(ROOT_DIR, 'src', 'python'))
+
+import loxi
+
+MAX_MSG_LEN = 0xffff
+
+def mac(i):
+    return [0x00, 0x01, (i >> 24) & 0xff, (i >> 16) & 0xff, (i >> 8) & 0xff, i & 0xff]
+
+def match10(ofp, i):
+    """
+    Match on ten header fields
+    """
+    if ofp.OFP_VERSION <= 2:
+        return ofp.match(wildcards=0, in_port=i % 48 + 1, eth_src=mac(i),
+                         eth_dst=mac(i + 1), vlan_vid=i % 4094 + 1,
+                         eth_type=0x0800, ip_proto=6, ipv4_src=0x0a000000 + i,
+                         ipv4_dst=0x0b000000 + i, tcp_src=1024 + i % 1000,
+                         tcp_dst=80)
+    return ofp.match([
+        ofp.oxm.in_port(i % 48 + 1),
+        ofp.oxm.eth_dst(mac(i + 1)),
+        ofp.oxm.eth_src(mac(i)),
+        ofp.oxm.eth_type(0x0800),
+        ofp.oxm.vlan_vid(ofp.OFPVID_PRESENT | (i % 4094 + 1)),
+        ofp.oxm.ip_proto(6),
+        ofp.oxm.ipv4_src(0x0a000000 + i),
+        ofp.oxm.ipv4_dst(0x0b000000 + i),
+        ofp.oxm.tcp_src(1024 + i % 1000),
+        ofp.oxm.tcp_dst(80),
+    ])
+
+def output_actions(ofp, port):
+    return [ofp.action.output(port=port, max_len=128)]
+
+def flow_mods(ofp):
+    msgs = []
+    for i in range(1000):
+        msg = ofp.message.flow_add(xid=i, cookie=i, priority=1000,
+                                   buffer_id=0xffffffff,
+                                   match=match10(ofp, i))
+        if ofp.OFP_VERSION == 1:
+            msg.actions = output_actions(ofp, 2)
+        else:
+            msg.instructions = [
+                ofp.instruction.apply_actions(output_actions(ofp, 2))]
+        msgs.append(msg)
+    return msgs
+
+def flow_stats_replies(ofp):
+    entries = []
+    for i in range(1000):
+        entry = ofp.flow_stats_entry(table_id=0, priority=i, cookie=i,
+                                     packet_count=i * 10, byte_count=i * 640,
+                                     duration_sec=i)
+        if ofp.OFP_VERSION >= 3:
+            entry.match = ofp.match([ofp.oxm.in_port(i % 48 + 1)])
+        entries.append(entry)
+    # As many entries as fit in one message
+    length = len(ofp.message.flow_stats_reply(xid=1).pack())
+    count = 0
+    for entry in entries:
+        length += len(entry.pack())
+        if length > MAX_MSG_LEN:
+            break
+        count += 1
+    return [ofp.message.flow_stats_reply(xid=1, entries=entries[:count])] * 10
+
+def packet_ins(ofp):
+    msgs = []
+    for i in range(1000):
+        data = ''.join(chr((i + j) & 0xff) for j in range(1500))
+        msg = ofp.message.packet_in(xid=i, buffer_id=0xffffffff,
+                                    total_len=1500, data=data)
+        if ofp.OFP_VERSION == 1:
+            msg.in_port = i % 48 + 1
+        elif ofp.OFP_VERSION == 2:
+            msg.in_port = i % 48 + 1
+            msg.in_phy_port = i % 48 + 1
+        else:
+            msg.match = ofp.match([ofp.oxm.in_port(i % 48 + 1)])
+        msgs.append(msg)
+    return msgs
+
+def group_mods(ofp):
+    if ofp.OFP_VERSION < 2:
+        return None
+    msgs = []
+    for i in range(100):
+        buckets = [ofp.bucket(weight=1, watch_port=ofp.OFPP_ANY,
+                              watch_group=ofp.OFPG_ANY,
+                              actions=output_actions(ofp, j + 1))
+                   for j in range(64)]
+        msgs.append(ofp.message.group_add(xid=i, group_id=i,
+                                          group_type=ofp.OFPGT_SELECT,
+                                          buckets=buckets))
+    return msgs
+
+def gentable_entries(ofp):
+    if not hasattr(ofp.message, "bsn_gentable_entry_add"):
+        return None
+    msgs = []
+    for i in range(1000):
+        key = [ofp.bsn_tlv.port(i % 48 + 1),
+               ofp.bsn_tlv.vlan_vid(i % 4094 + 1),
+               ofp.bsn_tlv.mac(mac(i))]
+        value = [ofp.bsn_tlv.port(i % 48 + 2),
+                 ofp.bsn_tlv.idle_timeout(60)]
+        msgs.append(ofp.message.bsn_gentable_entry_add(
+            xid=i, table_id=1, checksum=i, key=key, value=value))
+    return msgs
+
+CORPORA = [
+    ("flow_mod", flow_mods),
+    ("flow_stats_reply", flow_stats_replies),
+    ("packet_in", packet_ins),
+    ("group_mod", group_mods),
+    ("bsn_gentable", gentable_entries),
+]
+
+def measure(fn, items, min_time):
+    """
+    Call fn on every item until min_time has passed
+    @retval Number of calls per second
+    """
+    count = 0
+    start = time.time()
+    while True:
+        for item in items:
+            fn(item)
+        count += len(items)
+        elapsed = time.time() - start
+        if elapsed >= min_time:
+            return count / elapsed
+
+def objects_per_message(parse, raws):
+    """
+    Number of garbage-collected objects kept alive by one parsed message
+    """
+    gc.collect()
+    before = len(gc.get_objects())
+    parsed = [parse(raw) for raw in raws]
+    after = len(gc.get_objects())
+    del parsed
+    return float(after - before - 1) / len(raws)
+
+def run_corpus(ofp, msgs, min_time):
+    raws = [msg.pack() for msg in msgs]
+    avg_len = float(sum(len(raw) for raw in raws)) / len(raws)
+    parse = ofp.message.parse_message
+    assert all(parse(raw) == msg for raw, msg in zip(raws, msgs))
+    encode = measure(lambda msg: msg.pack(), msgs, min_time)
+    decode = measure(parse, raws, min_time)
+    return {
+        "msg_bytes": avg_len,
+        "encode_msgs_per_sec": encode,
+        "encode_bytes_per_sec": encode * avg_len,
+        "decode_msgs_per_sec": decode,
+        "decode_bytes_per_sec": decode * avg_len,
+        "decode_objects_per_msg": objects_per_message(parse, raws),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument("-V", "--versions", default=",".join(sorted(loxi.version_names.values())),
+                        help="Comma separated OpenFlow versions (default %(default)s)")
+    parser.add_argument("-c", "--corpus", action="append",
+                        choices=[name for name, _ in CORPORA],
+                        help="Corpus to run; may be given multiple times (default all)")
+    parser.add_argument("-t", "--time", type=float, default=1.0,
+                        help="Seconds per measurement (default %(default)s)")
+    parser.add_argument("-o", "--output", help="Write results as JSON to this file")
+    parser.add_argument("--compare", help="JSON results of an earlier run to compare against")
+    args = parser.parse_args()
+
+    name_to_version = dict((v, k) for k, v in loxi.version_names.items())
+    baseline = json.load(open(args.compare)) if args.compare else {}
+    results = {}
+
+    print "%-26s %8s %12s %12s %12s %12s %8s" % (
+        "corpus", "bytes", "enc msg/s", "enc MB/s", "dec msg/s", "dec MB/s", "objs/msg")
+    for version in args.versions.split(","):
+        ofp = loxi.protocol(name_to_version[version])
+        for (name, build) in CORPORA:
+            if args.corpus and name not in args.corpus:
+                continue
+            msgs = build(ofp)
+            if not msgs:
+                continue
+            key = "%s/%s" % (version, name)
+            r = results[key] = run_corpus(ofp, msgs, args.time)
+            line = "%-26s %8d %12.0f %12.2f %12.0f %12.2f %8.1f" % (
+                key, r["msg_bytes"], r["encode_msgs_per_sec"],
+                r["encode_bytes_per_sec"] / 1e6, r["decode_msgs_per_sec"],
+                r["decode_bytes_per_sec"] / 1e6, r["decode_objects_per_msg"])
+            if key in baseline:
+                b = baseline[key]
+                line += "  enc x%.2f dec x%.2f" % (
+                    r["encode_msgs_per_sec"] / b["encode_msgs_per_sec"],
+                    r["decode_msgs_per_sec"] / b["decode_msgs_per_sec"])
+            print line
+            sys.stdout.flush()
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+
+if __name__ == "__main__":
+    main()